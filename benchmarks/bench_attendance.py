@@ -0,0 +1,90 @@
+"""
+Attendance Scaling Benchmark
+
+Saves the same games for a growing number of attendees and reports what
+each game costs: NBA API fetches, stat rows, database size and ingest
+time. With official data stored once per game and personal details on
+attendances, everything but the per-attendee rows stays flat as attendees
+are added.
+
+Usage:
+    python benchmarks/bench_attendance.py [--games 40] [--attendees 1 2 5 10 25]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.user_profile import create_user
+from src.data.database_models import Base
+from src.data.game_repository import save_game
+from tests.test_game_repository import GAME_DATA, FakeClient
+
+PERSONAL_TABLES = {'users', 'attendances'}
+
+
+def ingest(directory, games, attendees):
+    """Save every game once per attendee into a fresh database file and measure it."""
+    path = os.path.join(directory, f"attendees_{attendees}.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    client = FakeClient()
+    users = [create_user(session, f"fan{i}").id for i in range(attendees)]
+    session.commit()
+
+    first_ms = extra_ms = 0.0
+    for i in range(games):
+        game_data = dict(GAME_DATA, game_id=f"002{i:07d}", date=(date(2025, 1, 1) + timedelta(days=i)).isoformat())
+        for n, user_id in enumerate(users):
+            start = time.perf_counter()
+            save_game(session, client, game_data, {'notes': f"Game {i} with fan{n}"}, user_id=user_id)
+            session.commit()
+            elapsed = (time.perf_counter() - start) * 1000
+            if n == 0:
+                first_ms += elapsed
+            else:
+                extra_ms += elapsed
+
+    stat_rows = sum(
+        session.query(table).count() for table in Base.metadata.sorted_tables if table.name not in PERSONAL_TABLES
+    )
+    session.close()
+    engine.dispose()
+    return {
+        'fetches': sum(client.calls.values()) / games,
+        'stat_rows': stat_rows / games,
+        'kb': os.path.getsize(path) / 1024 / games,
+        'ingest_ms': (first_ms + extra_ms) / games,
+        'extra_ms': extra_ms / (games * (attendees - 1)) if attendees > 1 else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=40, help='Games saved per run')
+    parser.add_argument('--attendees', type=int, nargs='+', default=[1, 2, 5, 10, 25],
+                        help='Attendees per game in each run')
+    args = parser.parse_args()
+
+    print(f"{'attendees':>9} {'fetches/game':>13} {'stat rows/game':>15} {'KB/game':>8} "
+          f"{'ingest ms/game':>15} {'ms/extra attendee':>18}")
+    with tempfile.TemporaryDirectory() as directory:
+        for attendees in args.attendees:
+            result = ingest(directory, args.games, attendees)
+            extra = f"{result['extra_ms']:18.2f}" if result['extra_ms'] is not None else f"{'-':>18}"
+            print(f"{attendees:9d} {result['fetches']:13.1f} {result['stat_rows']:15.1f} {result['kb']:8.1f} "
+                  f"{result['ingest_ms']:15.2f} {extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+HTTP Session Benchmark
+
+Measures the per-request overhead saved by the pooled HTTP client compared to
+bare requests.get calls. A local fixture server serves a Basketball
+Reference-sized HTML page with an ETag, so the benchmark runs offline.
+
+Usage:
+    python benchmarks/bench_http_session.py [--requests 200]
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.http_session import HttpClient
+
+# Roughly the size of a box score page (~300 KB of table markup)
+FIXTURE_ROW = '<tr><th>Player Name</th>' + '<td class="right">12</td>' * 20 + '</tr>\n'
+FIXTURE_HTML = ('<html><body><table id="box-BOS-game-basic"><tbody>\n'
+                + FIXTURE_ROW * 600 + '</tbody></table></body></html>').encode()
+FIXTURE_GZIP = gzip.compress(FIXTURE_HTML)
+FIXTURE_ETAG = '"' + hashlib.sha1(FIXTURE_HTML).hexdigest() + '"'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the fixture page with keep-alive, gzip and ETag support."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == FIXTURE_ETAG:
+            self.send_response(304)
+            self.send_header('ETag', FIXTURE_ETAG)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        gzip_ok = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = FIXTURE_GZIP if gzip_ok else FIXTURE_HTML
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', FIXTURE_ETAG)
+        if gzip_ok:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def time_requests(label, fetch, url, count):
+    """Time count sequential fetches and print the per-request cost."""
+    fetch(url)  # warm up
+    start = time.perf_counter()
+    for _ in range(count):
+        fetch(url)
+    elapsed = time.perf_counter() - start
+    per_request_ms = elapsed / count * 1000
+    print(f"{label:38} {elapsed:7.3f}s total  {per_request_ms:7.3f} ms/request")
+    return per_request_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200, help='Requests per scenario')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/boxscores/202502120BOS.html"
+
+    print(f"Fixture page: {len(FIXTURE_HTML):,} bytes ({len(FIXTURE_GZIP):,} gzipped)")
+    print(f"Requests per scenario: {args.requests}\n")
+
+    try:
+        def bare_get(u):
+            response = requests.get(u)
+            response.raise_for_status()
+            return response.text
+
+        pooled = HttpClient()
+        unconditional = HttpClient()
+
+        baseline = time_requests("bare requests.get (no pooling)", bare_get, url, args.requests)
+        pooled_full = time_requests(
+            "pooled session (keep-alive)",
+            lambda u: unconditional.get(u, conditional=False).text, url, args.requests
+        )
+        pooled_304 = time_requests("pooled session, gzip + ETag (304)", pooled.get_text, url, args.requests)
+
+        print()
+        print(f"Saved by connection pooling:   {baseline - pooled_full:7.3f} ms/request")
+        print(f"Saved by conditional requests: {baseline - pooled_304:7.3f} ms/request")
+        print(f"Revalidated responses: {pooled.revalidated}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
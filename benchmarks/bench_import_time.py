@@ -0,0 +1,166 @@
+"""
+Streamlit Cold Start Benchmark
+
+Measures what the Streamlit app imports before it can draw anything, and
+the cost of a rerun once it is warm. Import costs come from fresh
+interpreters run with `-X importtime`: the entry point's shared imports
+(app_resources) are compared with each page's own imports and with the
+eager set the single-file app used to load up front. The app itself is then
+run headless with Streamlit's AppTest against a throwaway database to time
+the first run and the average rerun.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 3] [--reruns 10]
+"""
+
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the project root directory to the Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+APP_DIR = os.path.join(PROJECT_ROOT, 'streamlit')
+PAGES_DIR = os.path.join(APP_DIR, 'pages')
+
+# Modules imported on demand by the app_resources getters a page calls
+RESOURCE_IMPORTS = {
+    'get_api_client': ['src.data.nba_api_client'],
+    'get_prefetcher': ['src.data.nba_api_client', 'src.data.prefetch'],
+}
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def page_imports(path):
+    """
+    Return the modules a page script loads when it is visited.
+
+    Args:
+        path (str): Path to the page script
+
+    Returns:
+        list: Module names, including those behind the app_resources getters it calls
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+        elif isinstance(node, ast.Name) and node.id in RESOURCE_IMPORTS:
+            modules.extend(RESOURCE_IMPORTS[node.id])
+    return list(dict.fromkeys(modules))
+
+
+def import_time(modules, repeat):
+    """
+    Time importing modules in fresh interpreters with -X importtime.
+
+    Args:
+        modules (list): Module names to import, in order
+        repeat (int): Number of interpreters to run; the fastest is kept
+
+    Returns:
+        tuple: (milliseconds, number of modules loaded)
+    """
+    # Put the app directory on the path like Streamlit does (app_resources adds the project root)
+    # and run in a scratch directory, where importing app_resources creates its database
+    code = '; '.join(f"import {module}" for module in modules)
+    env = dict(os.environ, PYTHONPATH=APP_DIR)
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as workdir:
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', code],
+                cwd=workdir, env=env, capture_output=True, text=True, check=True
+            )
+        # Top-level entries (no indentation) carry the cumulative cost of everything below them
+        total_us, loaded = 0, 0
+        for match in IMPORTTIME_LINE.finditer(result.stderr):
+            loaded += 1
+            if match.group(3) == ' ':
+                total_us += int(match.group(2))
+        if best is None or total_us < best[0]:
+            best = (total_us, loaded)
+    return best[0] / 1000, best[1]
+
+
+def time_app(reruns):
+    """
+    Run the app headless and time its first run and reruns of every page.
+
+    Args:
+        reruns (int): Reruns per page
+
+    Returns:
+        tuple: (first run ms, {page: average rerun ms})
+    """
+    from streamlit.testing.v1 import AppTest
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # basketball_tracker.db is created here
+        try:
+            app = AppTest.from_file(os.path.join(APP_DIR, 'main_app.py'), default_timeout=120)
+            start = time.perf_counter()
+            app.run()
+            first_run_ms = (time.perf_counter() - start) * 1000
+
+            rerun_ms = {}
+            for page in sorted(os.listdir(PAGES_DIR)):
+                if not page.endswith('.py') or page in ('__init__.py', 'user_settings.py'):
+                    continue
+                app.switch_page(f"pages/{page}").run()  # first visit loads the page's imports
+                start = time.perf_counter()
+                for _ in range(reruns):
+                    app.run()
+                rerun_ms[page] = (time.perf_counter() - start) * 1000 / reruns
+        finally:
+            os.chdir(cwd)
+    return first_run_ms, rerun_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='Interpreters per import measurement')
+    parser.add_argument('--reruns', type=int, default=10, help='Reruns per page')
+    args = parser.parse_args()
+
+    pages = {
+        page: page_imports(os.path.join(PAGES_DIR, page))
+        for page in sorted(os.listdir(PAGES_DIR))
+        if page.endswith('.py') and page != '__init__.py'
+    }
+    shell = ['streamlit', 'app_resources']
+    eager = shell + [module for modules in pages.values() for module in modules]
+
+    print("Import cost in a fresh interpreter (-X importtime, best of "
+          f"{args.repeat}):\n")
+    shell_ms, shell_loaded = import_time(shell, args.repeat)
+    print(f"{'entry point (app_resources)':38} {shell_ms:8.1f} ms  {shell_loaded:5} modules")
+    for page, modules in pages.items():
+        if not modules:
+            continue
+        page_ms, page_loaded = import_time(shell + modules, args.repeat)
+        print(f"  + {page:34} {page_ms - shell_ms:+8.1f} ms  {page_loaded - shell_loaded:+5} modules")
+    eager_ms, eager_loaded = import_time(list(dict.fromkeys(eager)), args.repeat)
+    print(f"{'eager (every page up front)':38} {eager_ms:8.1f} ms  {eager_loaded:5} modules")
+    print(f"\nSaved on cold start: {eager_ms - shell_ms:7.1f} ms\n")
+
+    first_run_ms, rerun_ms = time_app(args.reruns)
+    print(f"{'first run (default page)':38} {first_run_ms:8.1f} ms")
+    for page, elapsed in rerun_ms.items():
+        print(f"{'rerun ' + page:38} {elapsed:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Game Search Benchmark
+
+Compares searching game memories with the FTS5 index against the LIKE
+'%..%' scans it replaces, over a synthetic archive of attended games with
+notes, companions, officials and box score players.
+
+Usage:
+    python benchmarks/bench_search.py [--games 20000] [--queries 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert, or_
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.game_search import rebuild_search_index, search_games
+from src.data.database_models import Attendance, Base, Game, Official, Player, PlayerBoxScore, User
+
+WORDS = ("buzzer beater comeback overtime rivalry blowout birthday rain traffic nachos dunk block "
+         "three pointer halftime show jersey giveaway courtside upper deck standing ovation").split()
+COMPANIONS = ["Dad", "Mom", "Maria", "Chris", "Sam", "Priya", "Uncle Joe", "the office", "Jordan"]
+OFFICIALS = ["Scott Foster", "Tony Brothers", "Ed Malloy", "Zach Zarba", "James Capers", "Marc Davis"]
+PLAYERS_PER_GAME = 20
+
+
+def populate(session, games):
+    """Insert synthetic attended games with officials and box score players."""
+    rng = random.Random(7)
+    players = [{'id': 1000 + i, 'first_name': f"First{i}", 'last_name': f"Player{i}"} for i in range(600)]
+    session.execute(insert(Player), players)
+    session.execute(insert(User), [{'id': 1, 'username': "fan"}])
+    game_rows, attendances, officials, box_scores = [], [], [], []
+    for i in range(games):
+        game_id = f"002{i:07d}"
+        game_rows.append({
+            'game_id': game_id, 'date': date(2000, 1, 1) + timedelta(days=i), 'season': "2024-2025",
+            'home_team': "Boston Celtics", 'away_team': "New York Knicks",
+        })
+        attendances.append({
+            'user_id': 1, 'game_id': game_id,
+            'attended_with': rng.choice(COMPANIONS), 'notes': ' '.join(rng.choices(WORDS, k=12)),
+        })
+        officials += [
+            {'game_id': game_id, 'official_id': j, 'name': name, 'jersey_num': j}
+            for j, name in enumerate(rng.sample(OFFICIALS, 3))
+        ]
+        box_scores += [
+            {'game_id': game_id, 'player_id': player['id'], 'team_id': 1}
+            for player in rng.sample(players, PLAYERS_PER_GAME)
+        ]
+    session.execute(insert(Game), game_rows)
+    session.execute(insert(Attendance), attendances)
+    session.execute(insert(Official), officials)
+    session.execute(insert(PlayerBoxScore), box_scores)
+    session.commit()
+
+
+def like_search(session, term, limit=20):
+    """The pre-index approach: LIKE scans over every searchable column."""
+    pattern = f"%{term}%"
+    matches = (
+        session.query(Game.game_id)
+        .join(Attendance, Attendance.game_id == Game.game_id)
+        .outerjoin(Official, Official.game_id == Game.game_id)
+        .outerjoin(PlayerBoxScore, PlayerBoxScore.game_id == Game.game_id)
+        .outerjoin(Player, Player.id == PlayerBoxScore.player_id)
+        .filter(or_(Attendance.notes.like(pattern), Attendance.attended_with.like(pattern),
+                    Official.name.like(pattern), Player.last_name.like(pattern)))
+        .distinct()
+    )
+    return matches.count(), matches.limit(limit).all()
+
+
+def time_queries(label, search, terms):
+    start = time.perf_counter()
+    for term in terms:
+        search(term)
+    per_query_ms = (time.perf_counter() - start) / len(terms) * 1000
+    print(f"{label:30} {per_query_ms:9.2f} ms/query")
+    return per_query_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=20000, help='Games in the synthetic archive')
+    parser.add_argument('--queries', type=int, default=50, help='Queries per approach')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        start = time.perf_counter()
+        populate(session, args.games)
+        print(f"Archive: {args.games:,} games, {args.games * PLAYERS_PER_GAME:,} box score rows "
+              f"(built in {time.perf_counter() - start:.1f}s)")
+        start = time.perf_counter()
+        rebuild_search_index(session)
+        session.commit()
+        print(f"Index built in {time.perf_counter() - start:.2f}s\n")
+
+        rng = random.Random(11)
+        terms = [rng.choice(WORDS + ["Foster", "Maria", "Player42"]) for _ in range(args.queries)]
+        like_ms = time_queries("LIKE scans", lambda term: like_search(session, term), terms)
+        fts_ms = time_queries("FTS5 (ranked, paged)", lambda term: search_games(session, term), terms)
+        print(f"\nSpeedup: {like_ms / fts_ms:.1f}x")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
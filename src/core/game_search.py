@@ -0,0 +1,195 @@
+"""
+Game Search Module
+
+This module maintains and queries the game_search SQLite FTS5 index over
+every game memory: the attendee's notes and who they went with, the players
+in the box score or inactive list, the officials and the teams and arena.
+There is one document per attendance, so one user's notes never surface in
+another's results; a game's documents are rewritten whenever it is saved or
+refreshed, so searches are ranked (BM25) index lookups instead of LIKE
+'%..%' scans over several tables, and stay fast however many games are
+stored. Every search term is matched as a prefix, so "tat bos" finds Tatum
+at the Celtics.
+
+Example:
+    index_game(session, "0022400773")  # after saving or editing a game
+    results, total = search_games(session, "foster jay", page=0, user_id=user.id)
+"""
+
+import re
+
+from sqlalchemy import text
+
+from src.data.database_models import Attendance, Game, InactivePlayer, Official, Player, PlayerBoxScore, VenueInfo
+
+__all__ = [
+    'SEARCH_COLUMNS', 'SEARCH_PAGE_SIZE', 'index_game', 'unindex_attendances', 'rebuild_search_index', 'search_games'
+]
+
+# Indexed column -> BM25 weight (a match in who you went with counts most)
+SEARCH_COLUMNS = {
+    'notes': 2.0,
+    'attended_with': 3.0,
+    'players': 1.0,
+    'officials': 1.0,
+    'teams': 0.5,
+}
+
+SEARCH_PAGE_SIZE = 20
+
+SNIPPET_TOKENS = 12
+
+_TERM = re.compile(r'\w+', re.UNICODE)
+
+
+def _documents(session, game_ids=None):
+    """Yield (attendances.id, column values) for every attendance, optionally of some games only."""
+    attendances = session.query(
+        Attendance.id, Attendance.notes, Attendance.attended_with, Game.game_id, Game.home_team, Game.away_team,
+        Game.home_team_abbrev, Game.away_team_abbrev, VenueInfo.arena
+    ).join(Game, Game.game_id == Attendance.game_id).outerjoin(VenueInfo, VenueInfo.game_id == Game.game_id)
+    if game_ids is not None:
+        attendances = attendances.filter(Attendance.game_id.in_(game_ids))
+    attendances = attendances.all()
+    if not attendances:
+        return
+    selected = list({attendance.game_id for attendance in attendances})
+
+    players = {}
+    for model in (PlayerBoxScore, InactivePlayer):
+        query = (
+            session.query(model.game_id, Player.first_name, Player.last_name)
+            .join(Player, Player.id == model.player_id)
+            .filter(model.game_id.in_(selected))
+        )
+        for game_id, first_name, last_name in query:
+            players.setdefault(game_id, []).append(f"{first_name or ''} {last_name or ''}".strip())
+    officials = {}
+    for game_id, name in session.query(Official.game_id, Official.name).filter(Official.game_id.in_(selected)):
+        officials.setdefault(game_id, []).append(name)
+
+    for attendance in attendances:
+        teams = [attendance.home_team, attendance.away_team, attendance.home_team_abbrev,
+                 attendance.away_team_abbrev, attendance.arena]
+        yield attendance.id, {
+            'notes': attendance.notes or '',
+            'attended_with': attendance.attended_with or '',
+            'players': ', '.join(players.get(attendance.game_id, [])),
+            'officials': ', '.join(officials.get(attendance.game_id, [])),
+            'teams': ' '.join(value for value in teams if value),
+        }
+
+
+def _write(session, documents):
+    columns = list(SEARCH_COLUMNS)
+    insert = text(
+        f"INSERT INTO game_search (rowid, {', '.join(columns)}) "
+        f"VALUES (:rowid, {', '.join(':' + column for column in columns)})"
+    )
+    rows = [dict(values, rowid=rowid) for rowid, values in documents]
+    if rows:
+        session.execute(text("DELETE FROM game_search WHERE rowid = :rowid"), [{'rowid': row['rowid']} for row in rows])
+        session.execute(insert, rows)
+    return len(rows)
+
+
+def index_game(session, game_id):
+    """
+    Rewrite the search documents of every attendance of one game.
+
+    Call after the game, its box scores or officials, or an attendance of it
+    is added or changed (before commit), so the index stays in the same
+    transaction.
+
+    Args:
+        session: SQLAlchemy session
+        game_id (str): NBA API game ID
+
+    Returns:
+        int: Number of documents written (0 if nobody attended the game)
+    """
+    session.flush()
+    return _write(session, _documents(session, [game_id]))
+
+
+def unindex_attendances(session, attendance_ids):
+    """Delete the search documents of attendances that are being removed."""
+    rows = [{'rowid': attendance_id} for attendance_id in attendance_ids]
+    if rows:
+        session.execute(text("DELETE FROM game_search WHERE rowid = :rowid"), rows)
+    return len(rows)
+
+
+def rebuild_search_index(session):
+    """
+    Rebuild the search index for every attendance.
+
+    Returns:
+        int: Number of documents written
+    """
+    session.flush()
+    session.execute(text("DELETE FROM game_search"))
+    return _write(session, _documents(session))
+
+
+def _match_expression(query):
+    """Turn free text into an FTS5 query: every word, as a prefix, must match."""
+    return ' '.join(f'"{term}"*' for term in _TERM.findall(query))
+
+
+def search_games(session, query, page=0, page_size=SEARCH_PAGE_SIZE, user_id=None):
+    """
+    Search game memories, best matches first.
+
+    Args:
+        session: SQLAlchemy session
+        query (str): Free text; each word matches as a prefix in any column
+        page (int): Zero-based page number
+        page_size (int): Results per page
+        user_id (int, optional): Only games this user attended
+
+    Returns:
+        tuple: (list of result dicts with game_id, the attendee's user_id,
+            date, teams, score and a snippet with matches in **bold**, total
+            number of matches)
+    """
+    match = _match_expression(query)
+    if not match:
+        return [], 0
+
+    where = "game_search MATCH :match"
+    params = {'match': match}
+    if user_id is not None:
+        where += " AND rowid IN (SELECT id FROM attendances WHERE user_id = :user_id)"
+        params['user_id'] = user_id
+
+    total = session.execute(text(f"SELECT count(*) FROM game_search WHERE {where}"), params).scalar()
+    if not total:
+        return [], 0
+
+    weights = ', '.join(str(weight) for weight in SEARCH_COLUMNS.values())
+    hits = session.execute(text(
+        f"SELECT rowid, snippet(game_search, -1, '**', '**', '…', {SNIPPET_TOKENS}) AS snippet, "
+        f"bm25(game_search, {weights}) AS score "
+        f"FROM game_search WHERE {where} ORDER BY score LIMIT :limit OFFSET :offset"
+    ), dict(params, limit=page_size, offset=page * page_size)).all()
+    games = {
+        game.id: game
+        for game in session.query(Attendance.id, Attendance.user_id, Game.game_id, Game.date, Game.home_team,
+                                  Game.away_team)
+        .join(Game, Game.game_id == Attendance.game_id)
+        .filter(Attendance.id.in_([hit.rowid for hit in hits]))
+    }
+
+    return [
+        {
+            'game_id': games[hit.rowid].game_id,
+            'user_id': games[hit.rowid].user_id,
+            'date': games[hit.rowid].date,
+            'home_team': games[hit.rowid].home_team,
+            'away_team': games[hit.rowid].away_team,
+            'snippet': hit.snippet,
+            'score': -hit.score,  # bm25 is lower-is-better
+        }
+        for hit in hits if hit.rowid in games
+    ], total
@@ -0,0 +1,446 @@
+"""
+Game Tracker Module
+
+This module computes attendance statistics from the perspective of any team.
+Attended games are loaded once into lightweight records, indexed by team id,
+and summarized per team (records, splits, streaks, scoring patterns and
+quarter analysis) so the dashboard can switch between followed teams without
+recomputing anything.
+
+Example:
+    engine = TeamStatsEngine(load_game_records(session, user_id=user.id))
+    summary = engine.summary(1610612738)  # Boston Celtics
+    playoffs = TeamStatsEngine(load_game_records(session, user_id=user.id, game_type=GameType.PLAYOFFS))
+    meetings = season_series(session, 1610612738, user_id=user.id)
+"""
+
+from collections import defaultdict
+from datetime import date
+from typing import NamedTuple
+
+from sqlalchemy import func, select
+
+from src.core.user_profile import attended_game_ids
+from src.data.database_models import Attendance, Game, GameFlow, GameType, QuarterScores, SeriesStats, VenueInfo
+from src.utils.game_calculations import reconstruct_series_progression
+
+__all__ = [
+    'GameRecord', 'TeamStatsEngine', 'load_game_records', 'season_series', 'data_version', 'game_type_counts',
+    'period_number'
+]
+
+CLOSE_GAME_MARGIN = 5
+BLOWOUT_MARGIN = 15
+SCORING_THRESHOLDS = (100, 110, 120)
+QUARTER_CHECKPOINTS = (('Q1', "After 1st"), ('Q2', "At Halftime"), ('Q3', "After 3rd"))
+
+
+class GameRecord(NamedTuple):
+    """Flat, picklable view of an attended game used for statistics."""
+    game_id: str
+    date: date
+    season: str
+    home_team_id: int
+    away_team_id: int
+    home_team: str
+    away_team: str
+    home_score: int
+    away_score: int
+    periods: tuple  # ((period, home_points, away_points), ...) in game order
+    arena: str
+    attendance: int
+    duration_minutes: int
+    home_max_lead: int = None  # from play-by-play, when stored
+    away_max_lead: int = None
+    game_type: str = None  # GameType value, e.g. "Playoffs"
+
+
+def period_number(period):
+    """
+    Convert a period label to its position in the game.
+
+    Examples:
+        >>> period_number("Q3")
+        3
+        >>> period_number("OT2")
+        6
+    """
+    if period.startswith('OT'):
+        return 4 + int(period[2:])
+    return int(period[1:])
+
+
+def data_version(session, user_id=None):
+    """
+    Return a cheap fingerprint of the stored game data.
+
+    The fingerprint changes whenever games or period scores are added or
+    removed, and whenever a stored game's statistics are rewritten (each
+    write stamps Game.updated_at), so it can key caches of derived statistics.
+
+    Args:
+        session: SQLAlchemy session
+        user_id (int, optional): Only consider this user's attended games
+
+    Returns:
+        tuple: (game count, highest game (or attendance) row id, period score count, latest game update)
+    """
+    if user_id is None:
+        game_count, max_id = session.query(func.count(Game.id), func.max(Game.id)).one()
+        period_count = session.query(func.count(QuarterScores.id)).scalar()
+        updated_at = session.query(func.max(Game.updated_at)).scalar()
+    else:
+        game_count, max_id = session.query(func.count(Attendance.id), func.max(Attendance.id)).filter(
+            Attendance.user_id == user_id
+        ).one()
+        period_count = session.query(func.count(QuarterScores.id)).filter(
+            QuarterScores.game_id.in_(attended_game_ids(user_id))
+        ).scalar()
+        updated_at = session.query(func.max(Game.updated_at)).filter(
+            Game.game_id.in_(attended_game_ids(user_id))
+        ).scalar()
+    return (game_count, max_id, period_count, updated_at)
+
+
+def game_type_counts(session, user_id=None):
+    """
+    Count stored games per game type, answered from the game type index.
+
+    Args:
+        session: SQLAlchemy session
+        user_id (int, optional): Only count this user's attended games
+
+    Returns:
+        dict: GameType -> number of games, in GameType order (unclassified games omitted)
+    """
+    query = session.query(Game.game_type, func.count(Game.id)).filter(Game.game_type.is_not(None))
+    if user_id is not None:
+        query = query.filter(Game.game_id.in_(attended_game_ids(user_id)))
+    counts = dict(query.group_by(Game.game_type))
+    return {game_type: counts[game_type] for game_type in GameType if game_type in counts}
+
+
+def load_game_records(session, user_id=None, game_type=None):
+    """
+    Load every attended game with its period scores and venue details.
+
+    Uses flat queries instead of lazy-loading relationships per game. True
+    max leads are read from the game-flow metrics stored with each game's
+    play-by-play.
+
+    Args:
+        session: SQLAlchemy session
+        user_id (int, optional): Only load this user's attended games
+        game_type (GameType, optional): Only load games of this type (an
+            index range scan on games)
+
+    Returns:
+        list: GameRecord objects sorted by date
+    """
+    def scoped(query, column):
+        if user_id is not None:
+            query = query.filter(column.in_(attended_game_ids(user_id)))
+        if game_type is not None:
+            query = query.filter(column.in_(select(Game.game_id).where(Game.game_type == game_type)))
+        return query
+
+    periods_by_game = defaultdict(list)
+    for game_id, period, home_points, away_points in scoped(session.query(
+        QuarterScores.game_id, QuarterScores.period, QuarterScores.home_score, QuarterScores.away_score
+    ), QuarterScores.game_id):
+        periods_by_game[game_id].append((period, home_points or 0, away_points or 0))
+
+    venues = {
+        game_id: (arena, attendance, duration)
+        for game_id, arena, attendance, duration in scoped(session.query(
+            VenueInfo.game_id, VenueInfo.arena, VenueInfo.attendance, VenueInfo.duration_minutes
+        ), VenueInfo.game_id)
+    }
+
+    max_leads = {
+        game_id: (home_lead, away_lead)
+        for game_id, home_lead, away_lead in scoped(session.query(
+            GameFlow.game_id, GameFlow.home_max_lead, GameFlow.away_max_lead
+        ).filter(GameFlow.home_max_lead.isnot(None)), GameFlow.game_id)
+    }
+
+    records = []
+    for game in scoped(session.query(Game), Game.game_id).order_by(Game.date, Game.id):
+        arena, attendance, duration = venues.get(game.game_id, (None, None, None))
+        home_max_lead, away_max_lead = max_leads.get(game.game_id, (None, None))
+        periods = sorted(periods_by_game.get(game.game_id, ()), key=lambda p: period_number(p[0]))
+        records.append(GameRecord(
+            game_id=game.game_id,
+            date=game.date,
+            season=game.season,
+            home_team_id=game.home_team_id,
+            away_team_id=game.away_team_id,
+            home_team=game.home_team,
+            away_team=game.away_team,
+            home_score=game.home_score or 0,
+            away_score=game.away_score or 0,
+            periods=tuple(periods),
+            arena=arena,
+            attendance=attendance,
+            duration_minutes=duration,
+            home_max_lead=home_max_lead,
+            away_max_lead=away_max_lead,
+            game_type=game.game_type.value if game.game_type else None,
+        ))
+    return records
+
+
+def season_series(session, team_id, user_id=None):
+    """
+    Return where each attended regular-season game sits in its season series.
+
+    Records come from the NBA API's postgame series record stored with each
+    game, so meetings that were not attended still count.
+
+    Args:
+        session: SQLAlchemy session
+        team_id (int): NBA team id
+        user_id (int, optional): Only this user's attended games
+
+    Returns:
+        list: Dicts with season, opponent, meeting number, meetings missed
+            since the previous attended one, and the team's series record
+            before and after, by season and opponent then date
+    """
+    import pandas as pd
+
+    columns = (Game.game_id, Game.date, Game.season, Game.home_team_id, Game.away_team_id, Game.home_team,
+               Game.away_team, Game.home_score, Game.away_score, Game.home_team_abbrev, Game.away_team_abbrev,
+               SeriesStats.postgame_home_team_series_wins.label('postgame_home_wins'),
+               SeriesStats.postgame_home_team_series_losses.label('postgame_home_losses'))
+    query = (
+        session.query(*columns)
+        .join(SeriesStats, SeriesStats.game_id == Game.game_id)
+        .filter(Game.game_type == GameType.REGULAR_SEASON,
+                (Game.home_team_id == team_id) | (Game.away_team_id == team_id),
+                SeriesStats.postgame_home_team_series_wins.isnot(None),
+                SeriesStats.postgame_home_team_series_losses.isnot(None))
+    )
+    if user_id is not None:
+        query = query.filter(Game.game_id.in_(attended_game_ids(user_id)))
+    games = pd.DataFrame(query.all(), columns=[column.key for column in columns])
+    if games.empty:
+        return []
+
+    opponents = dict(zip(games['game_id'], games['home_team'].where(games['away_team_id'] == team_id,
+                                                                      games['away_team'])))
+    meetings = []
+    for row in reconstruct_series_progression(games).itertuples(index=False):
+        home = row.home_team_id == team_id
+        before = (row.pregame_home_wins, row.pregame_home_losses)
+        after = (row.postgame_home_wins, row.postgame_home_losses)
+        meetings.append({
+            'game_id': row.game_id,
+            'season': row.season,
+            'opponent': opponents[row.game_id],
+            'meeting': int(row.meeting),
+            'missed_before': int(row.unseen_before),
+            'record_before': "{}-{}".format(*(before if home else before[::-1])),
+            'record_after': "{}-{}".format(*(after if home else after[::-1])),
+        })
+    return meetings
+
+
+class TeamStatsEngine:
+    """
+    Team-perspective statistics over a set of attended games.
+
+    Games are indexed by team id once; summaries are computed per team on first
+    request (or all at once with precompute) and memoized, so switching the
+    dashboard between teams is a dictionary lookup.
+    """
+
+    def __init__(self, records):
+        """
+        Build the team index.
+
+        Args:
+            records (iterable of GameRecord): Attended games
+        """
+        self.records = sorted(records, key=lambda record: (record.date, record.game_id))
+        self._games_by_team = defaultdict(list)
+        for record in self.records:
+            self._games_by_team[record.home_team_id].append(record)
+            self._games_by_team[record.away_team_id].append(record)
+        self._summaries = {}
+
+    def team_ids(self):
+        """Return ids of every team seen, most-attended first."""
+        return sorted(self._games_by_team, key=lambda team_id: -len(self._games_by_team[team_id]))
+
+    def games(self, team_id):
+        """Return a team's games in date order."""
+        return list(self._games_by_team.get(team_id, []))
+
+    def precompute(self, team_ids=None):
+        """
+        Compute and memoize summaries up front.
+
+        Args:
+            team_ids (iterable, optional): Teams to compute; defaults to every team seen
+        """
+        for team_id in (team_ids if team_ids is not None else self.team_ids()):
+            self.summary(team_id)
+        return self
+
+    def summary(self, team_id):
+        """
+        Return the statistics summary for one team.
+
+        Args:
+            team_id (int): NBA team id
+
+        Returns:
+            dict: Records, splits, streaks, scoring patterns and quarter analysis
+        """
+        summary = self._summaries.get(team_id)
+        if summary is None:
+            summary = self._summaries[team_id] = self._compute(team_id)
+        return summary
+
+    def _compute(self, team_id):
+        games = self._games_by_team.get(team_id, [])
+
+        record = [0, 0]
+        home_record = [0, 0]
+        away_record = [0, 0]
+        seasons = defaultdict(lambda: [0, 0])
+        game_types = defaultdict(lambda: [0, 0])
+        opponents = {}
+        durations = []
+        attendances = []
+        scoring = {label: [0, 0] for label in self._scoring_labels()}
+        quarters = {label: [0, 0] for _, label in QUARTER_CHECKPOINTS}
+        streak = longest_win = longest_loss = 0
+        biggest_comeback = biggest_lead_lost = 0
+
+        for game in games:
+            is_home = game.home_team_id == team_id
+            team_score, opponent_score = (
+                (game.home_score, game.away_score) if is_home else (game.away_score, game.home_score)
+            )
+            won = team_score > opponent_score
+            result = 0 if won else 1
+
+            record[result] += 1
+            (home_record if is_home else away_record)[result] += 1
+            seasons[game.season][result] += 1
+            if game.game_type:
+                game_types[game.game_type][result] += 1
+
+            opponent_id = game.away_team_id if is_home else game.home_team_id
+            opponent = opponents.setdefault(opponent_id, {
+                'opponent_id': opponent_id,
+                'opponent': game.away_team if is_home else game.home_team,
+                'games': 0, 'wins': 0, 'losses': 0,
+            })
+            opponent['games'] += 1
+            opponent['wins' if won else 'losses'] += 1
+
+            if game.duration_minutes is not None:
+                durations.append(game.duration_minutes)
+            if game.attendance:
+                attendances.append(game.attendance)
+
+            # Streaks (games are in date order)
+            if won:
+                streak = max(1, streak + 1)
+                longest_win = max(longest_win, streak)
+            else:
+                streak = min(-1, streak - 1)
+                longest_loss = max(longest_loss, -streak)
+
+            # Scoring patterns
+            for label in self._scoring_categories(game, team_score, opponent_score):
+                scoring[label][result] += 1
+
+            # Quarter analysis from running period scores
+            running_margin = 0
+            max_lead = max_deficit = 0
+            for period, home_points, away_points in game.periods:
+                if not period.startswith('Q'):
+                    continue
+                running_margin += (home_points - away_points) if is_home else (away_points - home_points)
+                max_lead = max(max_lead, running_margin)
+                max_deficit = max(max_deficit, -running_margin)
+                for checkpoint, label in QUARTER_CHECKPOINTS:
+                    if period == checkpoint and running_margin > 0:
+                        quarters[label][result] += 1
+
+            # Prefer true intra-game extremes from play-by-play over quarter-end scores
+            if game.home_max_lead is not None:
+                max_lead = game.home_max_lead if is_home else game.away_max_lead
+                max_deficit = game.away_max_lead if is_home else game.home_max_lead
+
+            if won:
+                biggest_comeback = max(biggest_comeback, max_deficit)
+            else:
+                biggest_lead_lost = max(biggest_lead_lost, max_lead)
+
+        return {
+            'team_id': team_id,
+            'games': len(games),
+            'record': tuple(record),
+            'home_record': tuple(home_record),
+            'away_record': tuple(away_record),
+            'seasons': [
+                {'season': season, 'wins': wins, 'losses': losses}
+                for season, (wins, losses) in sorted(seasons.items())
+            ],
+            'game_types': [
+                {'game_type': game_type.value, 'wins': game_types[game_type.value][0],
+                 'losses': game_types[game_type.value][1]}
+                for game_type in GameType if game_type.value in game_types
+            ],
+            'opponents': sorted(opponents.values(), key=lambda o: o['games'], reverse=True),
+            'duration': {
+                'games': len(durations),
+                'total_minutes': sum(durations),
+                'average_minutes': sum(durations) / len(durations),
+            } if durations else None,
+            'attendance': {
+                'total': sum(attendances),
+                'average': sum(attendances) / len(attendances),
+            } if attendances else None,
+            'streaks': {
+                'longest_win': longest_win,
+                'longest_loss': longest_loss,
+                'current': streak,  # positive for wins, negative for losses
+            },
+            'scoring': [
+                {'category': label, 'wins': wins, 'losses': losses, 'games': wins + losses}
+                for label, (wins, losses) in scoring.items() if wins + losses
+            ],
+            'quarters': [
+                {'period': label, 'wins': wins, 'losses': losses, 'games': wins + losses}
+                for label, (wins, losses) in quarters.items() if wins + losses
+            ],
+            'biggest_comeback': biggest_comeback,
+            'biggest_lead_lost': biggest_lead_lost,
+        }
+
+    @staticmethod
+    def _scoring_labels():
+        return (
+            [f"Close Games (≤{CLOSE_GAME_MARGIN} pts)", f"Blowouts (≥{BLOWOUT_MARGIN} pts)"]
+            + [f"Scoring {threshold}+" for threshold in SCORING_THRESHOLDS]
+            + ["Overtime Games"]
+        )
+
+    @staticmethod
+    def _scoring_categories(game, team_score, opponent_score):
+        point_diff = abs(team_score - opponent_score)
+        if point_diff <= CLOSE_GAME_MARGIN:
+            yield f"Close Games (≤{CLOSE_GAME_MARGIN} pts)"
+        if point_diff >= BLOWOUT_MARGIN:
+            yield f"Blowouts (≥{BLOWOUT_MARGIN} pts)"
+        for threshold in SCORING_THRESHOLDS:
+            if team_score >= threshold:
+                yield f"Scoring {threshold}+"
+        if any(period.startswith('OT') for period, _, _ in game.periods):
+            yield "Overtime Games"
@@ -0,0 +1,388 @@
+"""
+Job Queue Module
+
+This module provides a small background job queue stored in the application's
+SQLite database. Pages enqueue jobs (saving or refreshing games) and poll
+their status while a pool of worker processes claims and runs them, so slow
+NBA API responses never block the Streamlit script thread. Jobs are claimed
+with a single atomic UPDATE, retried with exponential backoff on failure, and
+survive app restarts: a worker refreshes its running job's heartbeat while the
+handler runs, and jobs whose heartbeat stops (their worker died) are re-queued.
+
+Example:
+    queue = JobQueue('sqlite:///basketball_tracker.db')
+    pool = WorkerPool('sqlite:///basketball_tracker.db', processes=2).start()
+    job_id = queue.enqueue('save_game', {'game_data': game}, dedupe_key=f"save_game:{game['game_id']}")
+    queue.status(job_id)['status']  # "queued", "running", "succeeded" or "failed"
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.data.database_models import Base, Job, JobStatus
+
+__all__ = ['JOB_HANDLERS', 'JobQueue', 'WorkerPool', 'run_worker', 'create_queue_engine']
+
+# Job kind -> "module:function" handler; any other kind is resolved as a handler path itself
+JOB_HANDLERS = {
+    'save_game': 'src.data.game_repository:save_game_job',
+    'refresh_game': 'src.data.game_repository:refresh_game_job',
+    'backfill_games': 'src.data.game_repository:backfill_games_job',
+    'backfill_game': 'src.data.game_repository:refresh_game_job',  # jobs queued before refresh_game
+}
+
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 300
+HEARTBEAT_SECONDS = 30
+STALE_AFTER = timedelta(minutes=2)  # four missed heartbeats
+
+
+def create_queue_engine(db_url):
+    """
+    Create an engine suited to several processes sharing one SQLite file.
+
+    Connections wait for locks instead of failing immediately, and the
+    database uses write-ahead logging so readers never block the writer.
+    """
+    engine = create_engine(db_url, connect_args={'timeout': 30})
+
+    @event.listens_for(engine, 'connect')
+    def _set_wal(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
+
+    return engine
+
+
+def _resolve_handler(kind):
+    """Import the handler function for a job kind."""
+    module_name, _, function_name = JOB_HANDLERS.get(kind, kind).partition(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+class JobQueue:
+    """
+    Database-backed job queue.
+
+    Each method uses its own short transaction, so a JobQueue can be shared
+    by Streamlit sessions and used from worker processes.
+    """
+
+    def __init__(self, db_url, engine=None, retry_base_seconds=RETRY_BASE_SECONDS,
+                 heartbeat_seconds=HEARTBEAT_SECONDS):
+        """
+        Connect to the queue's database, creating tables if needed.
+
+        Args:
+            db_url (str): SQLAlchemy database URL
+            engine (Engine, optional): Existing engine to reuse
+            retry_base_seconds (float): Delay before the first retry (doubles per attempt)
+            heartbeat_seconds (float): Interval between heartbeats of a running job
+        """
+        self.db_url = db_url
+        self.retry_base_seconds = retry_base_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.engine = engine if engine is not None else create_queue_engine(db_url)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+    def enqueue(self, kind, payload, dedupe_key=None, max_attempts=3):
+        """
+        Add a job, or return the existing job with the same dedupe key.
+
+        A failed job with the same dedupe key is reset and queued again.
+
+        Args:
+            kind (str): Key of JOB_HANDLERS or a "module:function" handler path
+            payload (dict): JSON-serializable handler arguments
+            dedupe_key (str, optional): Idempotency key (e.g. "save_game:<game_id>")
+            max_attempts (int): Attempts before the job is marked failed
+
+        Returns:
+            int: Job id
+        """
+        now = datetime.now()
+        with self.Session() as session:
+            if dedupe_key is not None:
+                existing = session.query(Job).filter(Job.dedupe_key == dedupe_key).first()
+                if existing is not None:
+                    if existing.status == JobStatus.FAILED:
+                        existing.status = JobStatus.QUEUED
+                        existing.attempts = 0
+                        existing.payload = json.dumps(payload)
+                        existing.run_after = existing.updated_at = now
+                        session.commit()
+                    return existing.id
+
+            job = Job(kind=kind, dedupe_key=dedupe_key, payload=json.dumps(payload),
+                      status=JobStatus.QUEUED, attempts=0, max_attempts=max_attempts,
+                      run_after=now, created_at=now, updated_at=now)
+            session.add(job)
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another session enqueued the same key first
+                session.rollback()
+                return session.query(Job.id).filter(Job.dedupe_key == dedupe_key).scalar()
+            return job.id
+
+    def claim(self, worker):
+        """
+        Atomically claim the oldest runnable job.
+
+        Args:
+            worker (str): Identifier recorded on the claimed job
+
+        Returns:
+            dict: The claimed job (id, kind, payload, attempts), or None if none is due
+        """
+        now = datetime.now()
+        candidate = (
+            select(Job.id)
+            .where(Job.status == JobStatus.QUEUED, Job.run_after <= now)
+            .order_by(Job.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        with self.Session() as session:
+            row = session.execute(
+                update(Job)
+                .where(Job.id == candidate, Job.status == JobStatus.QUEUED)
+                .values(status=JobStatus.RUNNING, attempts=Job.attempts + 1, claimed_at=now,
+                        worker=worker, updated_at=now)
+                .returning(Job.id, Job.kind, Job.payload, Job.attempts)
+            ).first()
+            session.commit()
+        if row is None:
+            return None
+        return {'id': row.id, 'kind': row.kind, 'payload': json.loads(row.payload), 'attempts': row.attempts}
+
+    def heartbeat(self, job_id, worker):
+        """
+        Record that a worker is still running a job by refreshing its claimed_at.
+
+        Returns:
+            bool: False if the job is no longer running under this worker
+        """
+        now = datetime.now()
+        with self.Session() as session:
+            count = session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == JobStatus.RUNNING, Job.worker == worker)
+                .values(claimed_at=now)
+            ).rowcount
+            session.commit()
+        return bool(count)
+
+    def complete(self, job_id, result=None):
+        """Mark a job as succeeded and store its JSON-serializable result."""
+        with self.Session() as session:
+            job = session.get(Job, job_id)
+            job.status = JobStatus.SUCCEEDED
+            job.result = json.dumps(result, default=str)
+            job.error = None
+            job.updated_at = datetime.now()
+            session.commit()
+
+    def fail(self, job_id, error):
+        """
+        Record a failed attempt, re-queueing with backoff until attempts run out.
+
+        Returns:
+            bool: True if the job will be retried
+        """
+        now = datetime.now()
+        with self.Session() as session:
+            job = session.get(Job, job_id)
+            job.error = error
+            job.updated_at = now
+            retry = job.attempts < job.max_attempts
+            if retry:
+                delay = min(self.retry_base_seconds * 2 ** (job.attempts - 1), RETRY_MAX_SECONDS)
+                job.status = JobStatus.QUEUED
+                job.run_after = now + timedelta(seconds=delay)
+            else:
+                job.status = JobStatus.FAILED
+            session.commit()
+        return retry
+
+    def recover_stale(self, stale_after=STALE_AFTER):
+        """
+        Re-queue jobs left running by a worker that died or an app that restarted.
+
+        A live worker refreshes its job's heartbeat every heartbeat_seconds
+        however long the handler runs, so only jobs whose worker has stopped
+        are re-queued, never one that is still running.
+
+        Args:
+            stale_after (timedelta): Minimum time since the job's last heartbeat
+
+        Returns:
+            int: Number of jobs re-queued
+        """
+        now = datetime.now()
+        with self.Session() as session:
+            count = session.execute(
+                update(Job)
+                .where(Job.status == JobStatus.RUNNING, Job.claimed_at <= now - stale_after)
+                .values(status=JobStatus.QUEUED, run_after=now, updated_at=now)
+            ).rowcount
+            session.commit()
+        return count
+
+    def run_next(self, worker):
+        """
+        Claim and run one job in this process.
+
+        The handler runs in its own session, which is committed if the
+        handler returns; any exception rolls back its uncommitted writes and
+        records a failed attempt. (A handler working through a batch, such as
+        backfill_games, commits each item itself so a retry keeps them.)
+        A background thread sends the job's heartbeat while the handler runs.
+
+        Returns:
+            int: Id of the job that ran, or None if no job was due
+        """
+        job = self.claim(worker)
+        if job is None:
+            return None
+
+        stopped = threading.Event()
+        heartbeat = threading.Thread(target=self._send_heartbeats, args=(job['id'], worker, stopped), daemon=True)
+        heartbeat.start()
+        session = self.Session()
+        try:
+            result = _resolve_handler(job['kind'])(session, job['payload'])
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            self.fail(job['id'], f"{e.__class__.__name__}: {e}\n{traceback.format_exc(limit=5)}")
+        else:
+            self.complete(job['id'], result)
+        finally:
+            stopped.set()
+            heartbeat.join()
+            session.close()
+        return job['id']
+
+    def _send_heartbeats(self, job_id, worker, stopped):
+        """Refresh a running job's heartbeat until stopped or the job leaves this worker (runs in a thread)."""
+        while not stopped.wait(self.heartbeat_seconds):
+            try:
+                if not self.heartbeat(job_id, worker):
+                    return
+            except OperationalError:
+                pass  # the handler holds the write lock; the next beat retries
+
+    def status(self, job_id):
+        """
+        Return a job's current state.
+
+        Returns:
+            dict: id, kind, status, attempts, result, error and timestamps; None if unknown
+        """
+        with self.Session() as session:
+            job = session.get(Job, job_id)
+            if job is None:
+                return None
+            return {
+                'id': job.id,
+                'kind': job.kind,
+                'status': job.status.value,
+                'attempts': job.attempts,
+                'max_attempts': job.max_attempts,
+                'result': json.loads(job.result) if job.result else None,
+                'error': job.error,
+                'created_at': job.created_at,
+                'updated_at': job.updated_at,
+            }
+
+
+def run_worker(db_url, worker, stop_event=None, poll_interval=0.5, exit_when_idle=False):
+    """
+    Run jobs until stopped (the entry point of each worker process).
+
+    Args:
+        db_url (str): SQLAlchemy database URL
+        worker (str): Identifier recorded on claimed jobs
+        stop_event (multiprocessing.Event, optional): Set to stop the loop
+        poll_interval (float): Seconds to sleep when no job is due
+        exit_when_idle (bool): Return as soon as no job is due
+    """
+    queue = JobQueue(db_url)
+    while stop_event is None or not stop_event.is_set():
+        if queue.run_next(worker) is None:
+            if exit_when_idle:
+                break
+            queue.recover_stale()
+            time.sleep(poll_interval)
+    queue.engine.dispose()
+
+
+class WorkerPool:
+    """Pool of worker processes running jobs from a JobQueue database."""
+
+    def __init__(self, db_url, processes=2, poll_interval=0.5):
+        """
+        Args:
+            db_url (str): SQLAlchemy database URL (must be a file, not :memory:)
+            processes (int): Number of worker processes
+            poll_interval (float): Seconds each idle worker waits between polls
+        """
+        self.db_url = db_url
+        self.processes = processes
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = None
+        self._workers = []
+        self._prefix = f"worker-{os.getpid()}-"
+
+    def start(self):
+        """
+        Start the workers, first re-queueing jobs orphaned by a previous run.
+
+        Workers of an earlier app process died with it and stopped sending
+        heartbeats, so their jobs are re-queued once stale; jobs still running
+        in another live app process keep their heartbeat and are left alone.
+        """
+        queue = JobQueue(self.db_url)
+        queue.recover_stale()
+        queue.engine.dispose()
+
+        self._stop_event = self._context.Event()
+        self._workers = [
+            self._context.Process(
+                target=run_worker,
+                args=(self.db_url, f"{self._prefix}{i}", self._stop_event, self.poll_interval),
+                daemon=True,
+            )
+            for i in range(self.processes)
+        ]
+        for process in self._workers:
+            process.start()
+        return self
+
+    def alive(self):
+        """Return True if any worker process is running."""
+        return any(process.is_alive() for process in self._workers)
+
+    def stop(self, timeout=10):
+        """Ask workers to finish their current job and exit."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        for process in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._workers = []
@@ -0,0 +1,163 @@
+"""
+Leaderboard Module
+
+This module maintains the leaderboard of best individual performances across
+attended games. Each played box score line is copied into LeaderboardEntry
+rows (one per tracked stat) tagged with season, team and opponent, so top-N
+queries by stat and any of those filters are bounded index scans instead of
+scanning every stats row in Python. Entries for a game are rebuilt when the
+game is saved. Entries are shared by every user who attended the game and
+filtered per user through their attendance records.
+
+Example:
+    record_game_performances(session, "0022400773")
+    top_performances(session, 'pie', limit=10, team_id=1610612738)
+"""
+
+from sqlalchemy import and_, insert
+
+from src.core.user_profile import attended_game_ids
+from src.data.database_models import Game, LeaderboardEntry, Player, PlayerAdvancedStats, PlayerBoxScore
+
+__all__ = ['LEADERBOARD_STATS', 'record_game_performances', 'rebuild_leaderboard', 'top_performances']
+
+# Leaderboard stat -> (source model, column name, display label)
+LEADERBOARD_STATS = {
+    'points': (PlayerBoxScore, 'points', "Points"),
+    'rebounds': (PlayerBoxScore, 'rebounds', "Rebounds"),
+    'assists': (PlayerBoxScore, 'assists', "Assists"),
+    'steals': (PlayerBoxScore, 'steals', "Steals"),
+    'blocks': (PlayerBoxScore, 'blocks', "Blocks"),
+    'three_pointers_made': (PlayerBoxScore, 'three_pointers_made', "3-Pointers Made"),
+    'plus_minus': (PlayerBoxScore, 'plus_minus', "Plus/Minus"),
+    'pie': (PlayerAdvancedStats, 'pie', "PIE"),
+    'net_rating': (PlayerAdvancedStats, 'net_rating', "Net Rating"),
+    'offensive_rating': (PlayerAdvancedStats, 'offensive_rating', "Offensive Rating"),
+    'true_shooting_percentage': (PlayerAdvancedStats, 'true_shooting_percentage', "True Shooting %"),
+    'usage_percentage': (PlayerAdvancedStats, 'usage_percentage', "Usage %"),
+}
+
+# Advanced ratings swing wildly in garbage time, so they need real minutes to qualify
+MIN_ADVANCED_SECONDS = 10 * 60
+
+
+def _entries(session, game_ids=None):
+    """Yield leaderboard rows for played box score lines, optionally for some games."""
+    for model in (PlayerBoxScore, PlayerAdvancedStats):
+        stats = [(stat, column) for stat, (source, column, _) in LEADERBOARD_STATS.items() if source is model]
+        query = session.query(
+            model.game_id, model.player_id, model.team_id, Game.season, Game.date,
+            Game.home_team_id, Game.away_team_id, *[getattr(model, column) for _, column in stats]
+        ).join(Game, Game.game_id == model.game_id)
+        if model is PlayerAdvancedStats:
+            # Qualify on the traditional line's seconds played for the same game
+            query = query.join(PlayerBoxScore, and_(
+                PlayerBoxScore.game_id == model.game_id, PlayerBoxScore.player_id == model.player_id
+            )).filter(PlayerBoxScore.seconds_played >= MIN_ADVANCED_SECONDS)
+        else:
+            query = query.filter(model.seconds_played.isnot(None))
+        if game_ids is not None:
+            query = query.filter(model.game_id.in_(game_ids))
+
+        for game_id, player_id, team_id, season, game_date, home_team_id, away_team_id, *values in query:
+            if player_id is None:
+                continue
+            opponent_id = away_team_id if team_id == home_team_id else home_team_id
+            for (stat, _), value in zip(stats, values):
+                if value is not None:
+                    yield {
+                        'stat': stat, 'value': float(value), 'game_id': game_id, 'player_id': player_id,
+                        'team_id': team_id, 'opponent_id': opponent_id, 'season': season, 'date': game_date,
+                    }
+
+
+def record_game_performances(session, game_id):
+    """
+    Rebuild the leaderboard entries for one game.
+
+    Call after the game's box scores are added (before commit); existing
+    entries for the game are replaced, so re-saving a game is safe.
+
+    Args:
+        session: SQLAlchemy session
+        game_id (str): NBA API game ID
+
+    Returns:
+        int: Number of entries written
+    """
+    session.flush()
+    session.query(LeaderboardEntry).filter(LeaderboardEntry.game_id == game_id).delete(synchronize_session=False)
+    rows = list(_entries(session, [game_id]))
+    if rows:
+        session.execute(insert(LeaderboardEntry), rows)
+    return len(rows)
+
+
+def rebuild_leaderboard(session):
+    """
+    Rebuild every leaderboard entry from the stored box scores.
+
+    Returns:
+        int: Number of entries written
+    """
+    session.flush()
+    session.query(LeaderboardEntry).delete(synchronize_session=False)
+    rows = list(_entries(session))
+    if rows:
+        session.execute(insert(LeaderboardEntry), rows)
+    return len(rows)
+
+
+def top_performances(session, stat, limit=10, team_id=None, season=None, opponent_id=None, lowest=False,
+                     user_id=None):
+    """
+    Return the best (or worst) single-game performances witnessed for a stat.
+
+    Args:
+        session: SQLAlchemy session
+        stat (str): Key of LEADERBOARD_STATS
+        limit (int): Maximum number of performances
+        team_id (int, optional): Only players on this team
+        season (str, optional): Only games in this season (e.g. "2024-2025")
+        opponent_id (int, optional): Only performances against this team
+        lowest (bool): Return the lowest values instead of the highest
+        user_id (int, optional): Only games this user attended
+
+    Returns:
+        list: Dicts with player, game, team, opponent and value, best first
+
+    Raises:
+        ValueError: If stat is not a leaderboard stat
+    """
+    if stat not in LEADERBOARD_STATS:
+        raise ValueError(f"Unknown leaderboard stat: {stat}")
+
+    query = (
+        session.query(LeaderboardEntry, Player.first_name, Player.last_name)
+        .join(Player, Player.id == LeaderboardEntry.player_id)
+        .filter(LeaderboardEntry.stat == stat)
+    )
+    if team_id is not None:
+        query = query.filter(LeaderboardEntry.team_id == team_id)
+    if season is not None:
+        query = query.filter(LeaderboardEntry.season == season)
+    if opponent_id is not None:
+        query = query.filter(LeaderboardEntry.opponent_id == opponent_id)
+    if user_id is not None:
+        query = query.filter(LeaderboardEntry.game_id.in_(attended_game_ids(user_id)))
+    order = LeaderboardEntry.value.asc() if lowest else LeaderboardEntry.value.desc()
+
+    return [
+        {
+            'player_id': entry.player_id,
+            'name': f"{first_name} {last_name}".strip(),
+            'stat': stat,
+            'value': entry.value,
+            'game_id': entry.game_id,
+            'date': entry.date,
+            'season': entry.season,
+            'team_id': entry.team_id,
+            'opponent_id': entry.opponent_id,
+        }
+        for entry, first_name, last_name in query.order_by(order, LeaderboardEntry.date).limit(limit)
+    ]
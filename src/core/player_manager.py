@@ -0,0 +1,257 @@
+"""
+Player Manager Module
+
+This module maintains the Player dimension table and each user's per-player
+career aggregates across their attended games. Players are registered once
+by NBA person id; aggregates (games seen, games played, DNPs, average PIE
+and net rating) are recomputed with grouped queries only for the users and
+players an attendance touches, so "players I've seen most" is a single
+indexed lookup (over every stored game, the same grouped queries run
+without the attendances). Single-game bests
+(most points, rebounds, ...) are top-N scans over indexed box score columns.
+
+Example:
+    ensure_players(session, [(1628369, "Jayson", "Tatum")])
+    refresh_player_aggregates(session, [1628369], user_ids=[user.id])
+    most_seen_players(session, limit=10, user_id=user.id)
+    top_box_scores(session, 'points', limit=10)
+"""
+
+from sqlalchemy import and_, case, distinct, func, select, union_all
+
+from src.data.database_models import (
+    Attendance, Game, InactivePlayer, Player, PlayerAdvancedStats, PlayerBoxScore, PlayerCareerAggregate
+)
+
+__all__ = ['ensure_players', 'refresh_player_aggregates', 'most_seen_players', 'top_box_scores', 'NO_MINUTES']
+
+# Minutes values stored for players who were listed in the box score but did not play
+NO_MINUTES = ('', '0:00', '00:00', 'PT00M00.00S')
+
+
+def ensure_players(session, players):
+    """
+    Register players in the dimension table, updating changed names.
+
+    Args:
+        session: SQLAlchemy session
+        players (iterable): (person_id, first_name, last_name) tuples
+
+    Returns:
+        dict: person_id -> Player for every player passed in
+    """
+    names = {}
+    for person_id, first_name, last_name in players:
+        if person_id:
+            names[int(person_id)] = (first_name, last_name)
+    if not names:
+        return {}
+
+    existing = {
+        player.id: player
+        for player in session.query(Player).filter(Player.id.in_(list(names)))
+    }
+    for person_id, (first_name, last_name) in names.items():
+        player = existing.get(person_id)
+        if player is None:
+            player = existing[person_id] = Player(id=person_id, first_name=first_name, last_name=last_name)
+            session.add(player)
+        elif (first_name, last_name) != (player.first_name, player.last_name) and first_name is not None:
+            player.first_name, player.last_name = first_name, last_name
+    return existing
+
+
+def _player_totals(session, player_ids=None, user_ids=None, by_user=True):
+    """
+    Compute career totals with grouped queries: per (user, player) over
+    attendances, or with by_user=False per player over every stored game.
+    """
+    def grouped(source, player_column, game_column, *aggregates):
+        keys = [Attendance.user_id, player_column] if by_user else [player_column]
+        query = session.query(*keys, *aggregates).select_from(source)
+        if by_user:
+            query = query.join(Attendance, Attendance.game_id == game_column)
+            if user_ids is not None:
+                query = query.filter(Attendance.user_id.in_(user_ids))
+        if player_ids is not None:
+            query = query.filter(player_column.in_(player_ids))
+        return query.group_by(*keys)
+
+    def key(row):
+        return tuple(row[:2]) if by_user else row[0]
+
+    # Distinct (player, game) appearances across box scores and inactive lists
+    appearances = union_all(
+        select(PlayerBoxScore.player_id, PlayerBoxScore.game_id),
+        select(PlayerAdvancedStats.player_id, PlayerAdvancedStats.game_id),
+        select(InactivePlayer.player_id, InactivePlayer.game_id),
+    ).subquery()
+    seen = grouped(
+        appearances, appearances.c.player_id, appearances.c.game_id,
+        func.count(distinct(appearances.c.game_id)), func.max(Game.date),
+    ).join(Game, Game.game_id == appearances.c.game_id)
+
+    played = and_(PlayerAdvancedStats.minutes.isnot(None), PlayerAdvancedStats.minutes.notin_(NO_MINUTES))
+    box_scores = grouped(
+        PlayerAdvancedStats, PlayerAdvancedStats.player_id, PlayerAdvancedStats.game_id,
+        func.sum(case((played, 1), else_=0)),
+        func.sum(case((played, 0), else_=1)),
+        func.avg(case((played, PlayerAdvancedStats.pie))),
+        func.avg(case((played, PlayerAdvancedStats.net_rating))),
+    )
+
+    inactive = grouped(
+        InactivePlayer, InactivePlayer.player_id, InactivePlayer.game_id,
+        func.count(distinct(InactivePlayer.game_id)),
+    )
+
+    width = 2 if by_user else 1
+    totals = {
+        key(row): {
+            'games_seen': row[width], 'games_played': 0, 'dnp_count': 0, 'inactive_count': 0,
+            'average_pie': None, 'average_net_rating': None, 'last_seen_date': row[width + 1],
+        }
+        for row in seen if row[width - 1] is not None
+    }
+    for row in box_scores:
+        if key(row) in totals:
+            games_played, dnp_count, average_pie, average_net_rating = row[width:]
+            totals[key(row)].update(
+                games_played=games_played or 0, dnp_count=dnp_count or 0,
+                average_pie=average_pie, average_net_rating=average_net_rating,
+            )
+    for row in inactive:
+        if key(row) in totals:
+            totals[key(row)]['inactive_count'] = row[width]
+    return totals
+
+
+def refresh_player_aggregates(session, player_ids=None, user_ids=None):
+    """
+    Recompute users' career aggregates from the box scores and inactive
+    lists of their attended games.
+
+    Args:
+        session: SQLAlchemy session
+        player_ids (iterable, optional): Players to refresh; defaults to all
+        user_ids (iterable, optional): Users to refresh; defaults to all
+
+    Returns:
+        int: Number of aggregate rows written
+    """
+    player_ids = None if player_ids is None else {int(player_id) for player_id in player_ids}
+    user_ids = None if user_ids is None else set(user_ids)
+    if (player_ids is not None and not player_ids) or (user_ids is not None and not user_ids):
+        return 0
+    totals = _player_totals(session, player_ids, user_ids)
+
+    aggregates = session.query(PlayerCareerAggregate)
+    if player_ids is not None:
+        aggregates = aggregates.filter(PlayerCareerAggregate.player_id.in_(player_ids))
+    if user_ids is not None:
+        aggregates = aggregates.filter(PlayerCareerAggregate.user_id.in_(user_ids))
+    existing = {(aggregate.user_id, aggregate.player_id): aggregate for aggregate in aggregates}
+    for key, aggregate in existing.items():
+        if key not in totals:
+            session.delete(aggregate)
+
+    for (user_id, player_id), values in totals.items():
+        aggregate = existing.get((user_id, player_id))
+        if aggregate is None:
+            aggregate = PlayerCareerAggregate(user_id=user_id, player_id=player_id)
+            session.add(aggregate)
+        for column, value in values.items():
+            setattr(aggregate, column, value)
+    return len(totals)
+
+
+def most_seen_players(session, limit=10, user_id=None):
+    """
+    Return the players seen in the most attended games.
+
+    A user's players are one indexed lookup of their precomputed
+    aggregates; over every stored game the same totals are computed with
+    grouped queries.
+
+    Args:
+        session: SQLAlchemy session
+        limit (int): Maximum number of players
+        user_id (int, optional): Only games this user attended
+
+    Returns:
+        list: Dicts with player_id, name and the aggregates
+    """
+    if user_id is None:
+        totals = sorted(_player_totals(session, by_user=False).items(),
+                        key=lambda item: (-item[1]['games_seen'], item[0]))[:limit]
+        players = {player.id: player for player in session.query(Player).filter(
+            Player.id.in_([player_id for player_id, _ in totals])
+        )}
+        return [
+            dict(values, player_id=player_id, name=players[player_id].full_name)
+            for player_id, values in totals if player_id in players
+        ]
+
+    rows = (
+        session.query(PlayerCareerAggregate, Player)
+        .join(Player, Player.id == PlayerCareerAggregate.player_id)
+        .filter(PlayerCareerAggregate.user_id == user_id)
+        .order_by(PlayerCareerAggregate.games_seen.desc(), PlayerCareerAggregate.player_id)
+        .limit(limit)
+    )
+    return [
+        {
+            'player_id': player.id,
+            'name': player.full_name,
+            'games_seen': aggregate.games_seen,
+            'games_played': aggregate.games_played,
+            'dnp_count': aggregate.dnp_count,
+            'inactive_count': aggregate.inactive_count,
+            'average_pie': aggregate.average_pie,
+            'average_net_rating': aggregate.average_net_rating,
+            'last_seen_date': aggregate.last_seen_date,
+        }
+        for aggregate, player in rows
+    ]
+
+
+def top_box_scores(session, stat='points', limit=10, user_id=None):
+    """
+    Return the best single-game performances seen for a counting stat.
+
+    Args:
+        session: SQLAlchemy session
+        stat (str): PlayerBoxScore counting column (e.g. 'points', 'rebounds')
+        limit (int): Maximum number of performances
+        user_id (int, optional): Only games this user attended
+
+    Returns:
+        list: Dicts with player, game and the stat value, best first
+
+    Raises:
+        ValueError: If stat is not a box score counting column
+    """
+    if stat not in PlayerBoxScore.STAT_FIELDS:
+        raise ValueError(f"Unknown box score stat: {stat}")
+    column = getattr(PlayerBoxScore, stat)
+    rows = (
+        session.query(PlayerBoxScore.player_id, Player.first_name, Player.last_name, column,
+                      Game.game_id, Game.date, Game.home_team, Game.away_team)
+        .join(Player, Player.id == PlayerBoxScore.player_id)
+        .join(Game, Game.game_id == PlayerBoxScore.game_id)
+        .filter(column.isnot(None))
+    )
+    if user_id is not None:
+        rows = rows.join(Attendance, Attendance.game_id == PlayerBoxScore.game_id).filter(Attendance.user_id == user_id)
+    rows = rows.order_by(column.desc(), Game.date).limit(limit)
+    return [
+        {
+            'player_id': player_id,
+            'name': f"{first_name} {last_name}".strip(),
+            stat: value,
+            'game_id': game_id,
+            'date': game_date,
+            'matchup': f"{away_team} @ {home_team}",
+        }
+        for player_id, first_name, last_name, value, game_id, game_date, home_team, away_team in rows
+    ]
@@ -0,0 +1,189 @@
+"""
+Team Manager Module
+
+This module provides the process-wide NBA team registry. The registry is built
+once at import from nba_api's static team data and offers O(1) lookups by team
+id, tricode, full name and historical franchise names, so callers can resolve
+teams once and compare integer team ids everywhere else.
+
+Example:
+    celtics = TEAMS.by_tricode("BOS")
+    TEAMS.by_name("Seattle SuperSonics").tricode  # "OKC"
+"""
+
+from types import MappingProxyType
+from typing import NamedTuple
+
+from nba_api.stats.static import teams as nba_static_teams
+
+__all__ = ['Team', 'TeamRegistry', 'TEAMS']
+
+
+class Team(NamedTuple):
+    """An NBA franchise as identified by the NBA stats API."""
+    id: int
+    tricode: str
+    full_name: str
+    nickname: str
+    city: str
+    state: str
+    year_founded: int
+
+
+# Former names of current franchises, keyed by current tricode
+HISTORICAL_NAMES = {
+    'ATL': ('St. Louis Hawks', 'Milwaukee Hawks', 'Tri-Cities Blackhawks'),
+    'BKN': ('New Jersey Nets', 'New York Nets'),
+    'CHA': ('Charlotte Bobcats',),
+    'DET': ('Fort Wayne Pistons',),
+    'GSW': ('San Francisco Warriors', 'Philadelphia Warriors'),
+    'HOU': ('San Diego Rockets',),
+    'LAC': ('LA Clippers', 'San Diego Clippers', 'Buffalo Braves'),
+    'LAL': ('Minneapolis Lakers',),
+    'MEM': ('Vancouver Grizzlies',),
+    'NOP': ('New Orleans Hornets', 'New Orleans/Oklahoma City Hornets'),
+    'OKC': ('Seattle SuperSonics',),
+    'PHI': ('Syracuse Nationals',),
+    'SAC': ('Kansas City Kings', 'Kansas City-Omaha Kings', 'Cincinnati Royals', 'Rochester Royals'),
+    'UTA': ('New Orleans Jazz',),
+    'WAS': ('Washington Bullets', 'Capital Bullets', 'Baltimore Bullets', 'Chicago Zephyrs', 'Chicago Packers'),
+}
+
+# Former and third-party (e.g. Basketball Reference) tricodes, keyed by alias
+ALTERNATE_TRICODES = {
+    'NJN': 'BKN', 'BRK': 'BKN',
+    'CHO': 'CHA', 'CHH': 'CHA',
+    'NOH': 'NOP', 'NOK': 'NOP',
+    'SEA': 'OKC',
+    'VAN': 'MEM',
+    'WSB': 'WAS',
+    'PHO': 'PHX',
+    'NOJ': 'UTA',
+    'SDC': 'LAC',
+    'KCK': 'SAC',
+}
+
+
+class TeamRegistry:
+    """
+    Immutable registry of NBA teams with constant-time lookups.
+
+    All indexes are built once in the constructor and exposed through
+    read-only mappings, so a single instance can be shared process-wide.
+    """
+
+    __slots__ = ('_teams', '_by_id', '_by_tricode', '_by_name', '_full_names')
+
+    def __init__(self, teams, historical_names=None, alternate_tricodes=None):
+        """
+        Build the registry.
+
+        Args:
+            teams (iterable of Team): Current franchises
+            historical_names (dict, optional): Current tricode -> former full names
+            alternate_tricodes (dict, optional): Alias tricode -> current tricode
+        """
+        teams = tuple(sorted(teams, key=lambda team: team.id))
+        by_id = {team.id: team for team in teams}
+        by_tricode = {team.tricode: team for team in teams}
+        by_name = {}
+        for team in teams:
+            by_name[team.full_name.casefold()] = team
+            by_name[team.nickname.casefold()] = team
+
+        for tricode, names in (historical_names or {}).items():
+            team = by_tricode.get(tricode)
+            if team is not None:
+                for name in names:
+                    by_name.setdefault(name.casefold(), team)
+
+        for alias, tricode in (alternate_tricodes or {}).items():
+            team = by_tricode.get(tricode)
+            if team is not None:
+                by_tricode.setdefault(alias, team)
+
+        self._teams = teams
+        self._by_id = MappingProxyType(by_id)
+        self._by_tricode = MappingProxyType(by_tricode)
+        self._by_name = MappingProxyType(by_name)
+        self._full_names = MappingProxyType({team.id: team.full_name for team in teams})
+
+    @classmethod
+    def from_nba_api(cls):
+        """Build the registry from nba_api's static team list."""
+        return cls(
+            (
+                Team(
+                    id=team['id'],
+                    tricode=team['abbreviation'],
+                    full_name=team['full_name'],
+                    nickname=team['nickname'],
+                    city=team['city'],
+                    state=team['state'],
+                    year_founded=team['year_founded'],
+                )
+                for team in nba_static_teams.get_teams()
+            ),
+            historical_names=HISTORICAL_NAMES,
+            alternate_tricodes=ALTERNATE_TRICODES,
+        )
+
+    def by_id(self, team_id):
+        """Return the Team for an NBA team id, or None."""
+        return self._by_id.get(team_id)
+
+    def by_tricode(self, tricode):
+        """Return the Team for a current or former tricode (case-insensitive), or None."""
+        if not tricode:
+            return None
+        return self._by_tricode.get(tricode.upper())
+
+    def by_name(self, name):
+        """Return the Team for a full, nick or historical name (case-insensitive), or None."""
+        if not name:
+            return None
+        return self._by_name.get(name.strip().casefold())
+
+    def lookup(self, value):
+        """
+        Resolve a team id, tricode or name to a Team.
+
+        Args:
+            value (int or str): Team id, tricode or name
+
+        Returns:
+            Team or None: The matching team
+        """
+        if isinstance(value, int):
+            return self.by_id(value)
+        return self.by_tricode(value) or self.by_name(value)
+
+    def id_for(self, value):
+        """
+        Resolve a team id, tricode or name to an integer team id.
+
+        Raises:
+            KeyError: If the team is unknown
+        """
+        team = self.lookup(value)
+        if team is None:
+            raise KeyError(f"Unknown team: {value!r}")
+        return team.id
+
+    @property
+    def full_names(self):
+        """Read-only mapping of team id to current full name."""
+        return self._full_names
+
+    def __iter__(self):
+        return iter(self._teams)
+
+    def __len__(self):
+        return len(self._teams)
+
+    def __contains__(self, team_id):
+        return team_id in self._by_id
+
+
+# Process-wide registry, built once at import
+TEAMS = TeamRegistry.from_nba_api()
@@ -0,0 +1,194 @@
+"""
+User Profile Module
+
+This module manages user profiles and their attendance records. Every NBA
+game, with everything fetched for it, is stored once and shared; a user's
+games are the Attendance rows pointing at it, which also hold their seat,
+companions and notes. Queries for "my games" filter
+through attended_game_ids, a subquery served by the (user_id, game_id)
+unique index, so one database serves many users without duplicating stats.
+Recording or removing an attendance refreshes the user's venue splits and
+player aggregates for that game's venue and players.
+
+A database created before profiles existed is adopted by the default user,
+who is given every stored game the first time it is created.
+
+Example:
+    user = create_user(session, "maria", "Maria")
+    record_attendance(session, user.id, "0022400773", {'seat_section': "Loge 12"})
+    games = session.query(Game).filter(Game.game_id.in_(attended_game_ids(user.id)))
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, func, insert, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.core.game_search import rebuild_search_index, unindex_attendances
+from src.core.player_manager import refresh_player_aggregates
+from src.core.venue_manager import refresh_venue_splits
+from src.data.database_models import (
+    Attendance, Game, InactivePlayer, PlayerAdvancedStats, PlayerBoxScore, User, VenueInfo
+)
+
+__all__ = [
+    'ATTENDANCE_FIELDS', 'DEFAULT_USERNAME', 'create_user', 'get_user', 'list_users', 'ensure_default_user',
+    'record_attendance', 'remove_attendance', 'attended_game_ids', 'attendance_counts'
+]
+
+# Personal details stored with each attendance
+ATTENDANCE_FIELDS = ('seat_section', 'seat_row', 'seat_number', 'attended_with', 'notes')
+
+DEFAULT_USERNAME = 'default'
+
+
+def create_user(session, username, display_name=None):
+    """
+    Create a user profile.
+
+    Args:
+        session: SQLAlchemy session
+        username (str): Unique login name (case-insensitive)
+        display_name (str, optional): Name shown in the app
+
+    Returns:
+        User: The new user
+
+    Raises:
+        ValueError: If the username is blank or already taken
+    """
+    username = (username or '').strip().lower()
+    if not username:
+        raise ValueError("Username is required")
+    if get_user(session, username) is not None:
+        raise ValueError(f"Username {username} is already taken")
+    user = User(username=username, display_name=(display_name or '').strip() or username,
+                created_at=datetime.now())
+    session.add(user)
+    session.flush()
+    return user
+
+
+def get_user(session, username):
+    """Return the user with a username, or None."""
+    return session.query(User).filter(User.username == username.strip().lower()).first()
+
+
+def list_users(session):
+    """Return every user, oldest first."""
+    return session.query(User).order_by(User.id).all()
+
+
+def ensure_default_user(session, index=True):
+    """
+    Return the default user, creating it on first use.
+
+    When it is created, every stored game nobody has attended yet (a
+    database from before profiles existed) is recorded as its attendance.
+
+    Args:
+        session: SQLAlchemy session
+        index (bool): Rebuild the search index and the user's aggregates for
+            adopted games (migrations defer this until the tables they read
+            are upgraded)
+
+    Returns:
+        User: The default user
+    """
+    user = get_user(session, DEFAULT_USERNAME)
+    if user is not None:
+        return user
+    user = create_user(session, DEFAULT_USERNAME, "Default")
+    unowned = select(Game.game_id, literal(user.id), literal(datetime.now(), DateTime)).where(
+        Game.game_id.notin_(select(Attendance.game_id))
+    )
+    adopted = session.execute(insert(Attendance).from_select(['game_id', 'user_id', 'added_at'], unowned))
+    if adopted.rowcount and index:
+        rebuild_search_index(session)
+        _refresh_aggregates(session, user.id)
+    return user
+
+
+def record_attendance(session, user_id, game_id, details=None):
+    """
+    Record that a user attended a stored game (idempotent).
+
+    An existing attendance is left as it is, details included.
+
+    Args:
+        session: SQLAlchemy session
+        user_id (int): User id
+        game_id (str): NBA API game ID of a stored game
+        details (dict, optional): Values for ATTENDANCE_FIELDS
+
+    Returns:
+        bool: Whether a new attendance was recorded
+    """
+    details = details or {}
+    statement = sqlite_insert(Attendance).values(
+        user_id=user_id, game_id=str(game_id), added_at=datetime.now(),
+        **{field: details.get(field) for field in ATTENDANCE_FIELDS}
+    )
+    statement = statement.on_conflict_do_nothing(index_elements=['user_id', 'game_id'])
+    recorded = session.execute(statement).rowcount > 0
+    if recorded:
+        _refresh_aggregates(session, user_id, [str(game_id)])
+    return recorded
+
+
+def remove_attendance(session, user_id, game_id):
+    """
+    Remove a game, and the user's details of it, from a user's games.
+
+    The shared game data is kept.
+
+    Returns:
+        bool: Whether an attendance was removed
+    """
+    attendances = session.query(Attendance).filter(
+        Attendance.user_id == user_id, Attendance.game_id == str(game_id)
+    )
+    unindex_attendances(session, [attendance_id for (attendance_id,) in attendances.with_entities(Attendance.id)])
+    removed = bool(attendances.delete(synchronize_session=False))
+    if removed:
+        _refresh_aggregates(session, user_id, [str(game_id)])
+    return removed
+
+
+def _refresh_aggregates(session, user_id, game_ids=None):
+    """Recompute a user's venue splits and player aggregates for some games' venues and players (default all)."""
+    venue_ids = player_ids = None
+    if game_ids is not None:
+        venue_ids = [venue_id for (venue_id,) in session.query(VenueInfo.venue_id).filter(
+            VenueInfo.game_id.in_(game_ids)
+        )]
+        player_ids = {
+            player_id
+            for model in (PlayerBoxScore, PlayerAdvancedStats, InactivePlayer)
+            for (player_id,) in session.query(model.player_id).filter(model.game_id.in_(game_ids))
+            if player_id is not None
+        }
+    refresh_venue_splits(session, venue_ids, user_ids=[user_id])
+    refresh_player_aggregates(session, player_ids, user_ids=[user_id])
+
+
+def attended_game_ids(user_id):
+    """
+    Return a subquery of the game_ids a user attended, for IN filters.
+
+    Example:
+        session.query(Game).filter(Game.game_id.in_(attended_game_ids(user_id)))
+    """
+    return select(Attendance.game_id).where(Attendance.user_id == user_id)
+
+
+def attendance_counts(session):
+    """
+    Return how many games each user attended.
+
+    Returns:
+        dict: user id -> number of attended games
+    """
+    return dict(
+        session.query(Attendance.user_id, func.count(Attendance.id)).group_by(Attendance.user_id)
+    )
@@ -0,0 +1,294 @@
+"""
+Venue Manager Module
+
+This module maintains the venue registry and the precomputed venue splits.
+Every arena name a game is reported under resolves, through a normalized
+alias table, to one canonical venue id, so renamed arenas (Staples Center
+and Crypto.com Arena) count as one venue. The current NBA arenas are seeded
+with coordinates and former names; any other arena (neutral sites, games
+abroad) is registered the first time a game there is saved. Each user's
+per-team splits at each venue are recomputed with grouped queries only for
+the users and venues an attendance touches, so every venue widget reads a
+single indexed query. Splits over every stored game run the same grouped
+query without the attendances.
+
+Example:
+    venue_id = resolve_venue(session, "Staples Center")
+    refresh_venue_splits(session, [venue_id], user_ids=[user.id])
+    venue_splits(session, team_id=1610612738, user_id=user.id)
+"""
+
+import re
+
+from sqlalchemy import case, func, select, union_all
+
+from src.core.team_manager import TEAMS
+from src.data.database_models import Attendance, Game, Venue, VenueAlias, VenueInfo, VenueSplit
+
+__all__ = [
+    'KNOWN_VENUES', 'venue_key', 'seed_venues', 'resolve_venue', 'refresh_venue_splits', 'rebuild_venues',
+    'venue_splits'
+]
+
+# Current NBA arenas: (name, city, home tricode, latitude, longitude, former names)
+KNOWN_VENUES = (
+    ("State Farm Arena", "Atlanta", 'ATL', 33.757, -84.396, ("Philips Arena",)),
+    ("TD Garden", "Boston", 'BOS', 42.366, -71.062, ("TD Banknorth Garden", "FleetCenter")),
+    ("Barclays Center", "Brooklyn", 'BKN', 40.683, -73.975, ()),
+    ("Spectrum Center", "Charlotte", 'CHA', 35.225, -80.839, ("Time Warner Cable Arena", "Charlotte Bobcats Arena")),
+    ("United Center", "Chicago", 'CHI', 41.881, -87.674, ()),
+    ("Rocket Arena", "Cleveland", 'CLE', 41.497, -81.688,
+     ("Rocket Mortgage FieldHouse", "Quicken Loans Arena", "Gund Arena")),
+    ("American Airlines Center", "Dallas", 'DAL', 32.790, -96.810, ()),
+    ("Ball Arena", "Denver", 'DEN', 39.749, -105.008, ("Pepsi Center",)),
+    ("Little Caesars Arena", "Detroit", 'DET', 42.341, -83.055, ()),
+    ("Chase Center", "San Francisco", 'GSW', 37.768, -122.388, ()),
+    ("Toyota Center", "Houston", 'HOU', 29.751, -95.362, ()),
+    ("Gainbridge Fieldhouse", "Indianapolis", 'IND', 39.764, -86.155, ("Bankers Life Fieldhouse", "Conseco Fieldhouse")),
+    ("Intuit Dome", "Inglewood", 'LAC', 33.945, -118.343, ()),
+    ("Crypto.com Arena", "Los Angeles", 'LAL', 34.043, -118.267, ("Staples Center",)),
+    ("FedExForum", "Memphis", 'MEM', 35.138, -90.051, ()),
+    ("Kaseya Center", "Miami", 'MIA', 25.781, -80.188, ("FTX Arena", "American Airlines Arena", "AmericanAirlines Arena")),
+    ("Fiserv Forum", "Milwaukee", 'MIL', 43.045, -87.917, ()),
+    ("Target Center", "Minneapolis", 'MIN', 44.980, -93.276, ()),
+    ("Smoothie King Center", "New Orleans", 'NOP', 29.949, -90.082, ("New Orleans Arena",)),
+    ("Madison Square Garden", "New York", 'NYK', 40.751, -73.993, ()),
+    ("Paycom Center", "Oklahoma City", 'OKC', 35.463, -97.515, ("Chesapeake Energy Arena", "Ford Center")),
+    ("Kia Center", "Orlando", 'ORL', 28.539, -81.384, ("Amway Center",)),
+    ("Xfinity Mobile Arena", "Philadelphia", 'PHI', 39.901, -75.172, ("Wells Fargo Center",)),
+    ("Footprint Center", "Phoenix", 'PHX', 33.446, -112.071,
+     ("PHX Arena", "Phoenix Suns Arena", "Talking Stick Resort Arena", "US Airways Center", "America West Arena")),
+    ("Moda Center", "Portland", 'POR', 45.532, -122.667, ("Rose Garden",)),
+    ("Golden 1 Center", "Sacramento", 'SAC', 38.580, -121.500, ()),
+    ("Frost Bank Center", "San Antonio", 'SAS', 29.427, -98.437, ("AT&T Center", "SBC Center")),
+    ("Scotiabank Arena", "Toronto", 'TOR', 43.643, -79.379, ("Air Canada Centre",)),
+    ("Delta Center", "Salt Lake City", 'UTA', 40.768, -111.901,
+     ("Vivint Arena", "Vivint Smart Home Arena", "EnergySolutions Arena")),
+    ("Capital One Arena", "Washington", 'WAS', 38.898, -77.021, ("Verizon Center", "MCI Center")),
+)
+
+
+def venue_key(name):
+    """
+    Normalize an arena name for alias lookups.
+
+    Examples:
+        >>> venue_key("Crypto.com Arena")
+        'cryptocomarena'
+        >>> venue_key(" AT&T  Center ")
+        'atandtcenter'
+    """
+    return re.sub(r'[^0-9a-z]+', '', name.casefold().replace('&', 'and'))
+
+
+def seed_venues(session):
+    """
+    Register KNOWN_VENUES with their details and former names (idempotent).
+
+    A venue already registered under one of its names (e.g. a former name,
+    before the registry knew the new one) is updated rather than duplicated.
+
+    Returns:
+        int: Number of venues added
+    """
+    venues_by_key = {
+        alias_key: venue
+        for alias_key, venue in session.query(VenueAlias.alias_key, Venue).join(Venue, Venue.id == VenueAlias.venue_id)
+    }
+    venues_by_key.update({venue_key(venue.name): venue for venue in session.query(Venue)})
+    known_aliases = {alias_key for (alias_key,) in session.query(VenueAlias.alias_key)}
+
+    added = 0
+    for name, city, tricode, latitude, longitude, former_names in KNOWN_VENUES:
+        names = (name,) + former_names
+        venue = next((venues_by_key[venue_key(alias)] for alias in names if venue_key(alias) in venues_by_key), None)
+        if venue is None:
+            venue = Venue(name=name)
+            session.add(venue)
+            added += 1
+        team = TEAMS.by_tricode(tricode)
+        details = (name, city, team.id if team else None, latitude, longitude)
+        if (venue.name, venue.city, venue.team_id, venue.latitude, venue.longitude) != details:
+            venue.name, venue.city, venue.team_id, venue.latitude, venue.longitude = details
+        session.flush()
+        for alias in names:
+            key = venue_key(alias)
+            if key not in known_aliases:
+                session.add(VenueAlias(venue_id=venue.id, alias=alias, alias_key=key))
+                known_aliases.add(key)
+    session.flush()
+    return added
+
+
+def resolve_venue(session, arena):
+    """
+    Return the canonical venue id for an arena name, registering it if unknown.
+
+    Args:
+        session: SQLAlchemy session
+        arena (str): Arena name as reported for a game
+
+    Returns:
+        int: Venue id, or None for a blank name
+    """
+    if not arena or not venue_key(arena):
+        return None
+    key = venue_key(arena)
+    lookup = session.query(VenueAlias.venue_id).filter(VenueAlias.alias_key == key)
+    venue_id = lookup.scalar()
+    if venue_id is None and seed_venues(session):
+        venue_id = lookup.scalar()
+    if venue_id is None:
+        venue = Venue(name=arena.strip())
+        session.add(venue)
+        session.flush()
+        session.add(VenueAlias(venue_id=venue.id, alias=arena.strip(), alias_key=key))
+        session.flush()
+        venue_id = venue.id
+    return venue_id
+
+
+def _split_totals(session, venue_ids=None, team_id=None, user_ids=None, by_user=True):
+    """
+    Group games into per-(user, venue, team) totals over attendances, or with
+    by_user=False into per-(venue, team) totals over every stored game.
+    """
+    def side(side_team_id, won):
+        columns = [VenueInfo.venue_id, side_team_id.label('team_id'), case((won, 1), else_=0).label('won'),
+                   VenueInfo.duration_minutes, VenueInfo.attendance, Game.date]
+        query = (
+            select(*([Attendance.user_id] if by_user else []), *columns)
+            .select_from(VenueInfo)
+            .join(Game, Game.game_id == VenueInfo.game_id)
+            .where(VenueInfo.venue_id.isnot(None), side_team_id.isnot(None))
+        )
+        if by_user:
+            query = query.join(Attendance, Attendance.game_id == Game.game_id)
+            if user_ids is not None:
+                query = query.where(Attendance.user_id.in_(user_ids))
+        if venue_ids is not None:
+            query = query.where(VenueInfo.venue_id.in_(venue_ids))
+        if team_id is not None:
+            query = query.where(side_team_id == team_id)
+        return query
+
+    # One row per team per game (per attendance): the home side and the away side
+    appearances = union_all(
+        side(Game.home_team_id, Game.home_score > Game.away_score),
+        side(Game.away_team_id, Game.away_score > Game.home_score),
+    ).subquery()
+    keys = ['user_id', 'venue_id', 'team_id'] if by_user else ['venue_id', 'team_id']
+    key_columns = [appearances.c[key] for key in keys]
+    totals = session.query(
+        *key_columns, func.count(), func.sum(appearances.c.won),
+        func.coalesce(func.sum(appearances.c.duration_minutes), 0), func.count(appearances.c.duration_minutes),
+        func.coalesce(func.sum(appearances.c.attendance), 0), func.count(appearances.c.attendance),
+        func.max(appearances.c.date),
+    ).group_by(*key_columns)
+    rows = []
+    for row in totals:
+        games, wins, total_minutes, duration_games, total_attendance, attendance_games, last_date = row[len(keys):]
+        rows.append(dict(
+            zip(keys, row[:len(keys)]), games=games, wins=wins, losses=games - wins,
+            total_minutes=total_minutes, duration_games=duration_games,
+            total_attendance=total_attendance, attendance_games=attendance_games, last_date=last_date,
+        ))
+    return rows
+
+
+def refresh_venue_splits(session, venue_ids=None, user_ids=None):
+    """
+    Recompute users' per-team splits at venues from their attended games.
+
+    Args:
+        session: SQLAlchemy session
+        venue_ids (iterable, optional): Venues to refresh; defaults to all
+        user_ids (iterable, optional): Users to refresh; defaults to all
+
+    Returns:
+        int: Number of split rows written
+    """
+    venue_ids = None if venue_ids is None else {venue_id for venue_id in venue_ids if venue_id is not None}
+    user_ids = None if user_ids is None else set(user_ids)
+    if (venue_ids is not None and not venue_ids) or (user_ids is not None and not user_ids):
+        return 0
+    session.flush()
+
+    rows = _split_totals(session, venue_ids, user_ids=user_ids)
+    stale = session.query(VenueSplit)
+    if venue_ids is not None:
+        stale = stale.filter(VenueSplit.venue_id.in_(venue_ids))
+    if user_ids is not None:
+        stale = stale.filter(VenueSplit.user_id.in_(user_ids))
+    stale.delete(synchronize_session=False)
+    if rows:
+        session.bulk_insert_mappings(VenueSplit, rows)
+    return len(rows)
+
+
+def rebuild_venues(session):
+    """
+    Resolve every stored game's arena to a venue and rebuild all splits.
+
+    Returns:
+        int: Number of split rows written
+    """
+    seed_venues(session)
+    for venue_info in session.query(VenueInfo).filter(VenueInfo.arena.isnot(None)):
+        venue_info.venue_id = resolve_venue(session, venue_info.arena)
+    return refresh_venue_splits(session)
+
+
+def venue_splits(session, team_id, user_id=None):
+    """
+    Return a team's record, durations and attendance at every venue.
+
+    A user's splits are one indexed lookup of their precomputed rows; the
+    splits over every stored game run the grouped query behind them.
+
+    Args:
+        session: SQLAlchemy session
+        team_id (int): NBA team id
+        user_id (int, optional): Only games this user attended
+
+    Returns:
+        list: Dicts with venue details (name, city, coordinates, whether it
+            is the team's home), games, wins, losses, average minutes and
+            average attendance, most-attended venue first
+    """
+    if user_id is not None:
+        query = (
+            session.query(VenueSplit, Venue)
+            .join(Venue, Venue.id == VenueSplit.venue_id)
+            .filter(VenueSplit.user_id == user_id, VenueSplit.team_id == team_id)
+            .order_by(VenueSplit.games.desc(), Venue.name)
+        )
+        columns = [column.name for column in VenueSplit.__table__.columns]
+        rows = [({column: getattr(split, column) for column in columns}, venue) for split, venue in query]
+    else:
+        totals = _split_totals(session, team_id=team_id, by_user=False)
+        venues = {venue.id: venue for venue in session.query(Venue).filter(
+            Venue.id.in_([row['venue_id'] for row in totals])
+        )}
+        rows = sorted(((row, venues[row['venue_id']]) for row in totals),
+                      key=lambda item: (-item[0]['games'], item[1].name))
+
+    return [
+        {
+            'venue_id': venue.id,
+            'venue': venue.name,
+            'city': venue.city,
+            'latitude': venue.latitude,
+            'longitude': venue.longitude,
+            'is_home': venue.team_id == team_id,
+            'games': row['games'],
+            'wins': row['wins'],
+            'losses': row['losses'],
+            'average_minutes': row['total_minutes'] / row['duration_games'] if row['duration_games'] else None,
+            'average_attendance': (
+                row['total_attendance'] / row['attendance_games'] if row['attendance_games'] else None
+            ),
+            'last_date': row['last_date'],
+        }
+        for row, venue in rows
+    ]
@@ -14,6 +14,7 @@ from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
 import time
+from src.data.http_session import get_http_client
 
 class BasketballReferenceScraper:
     """
@@ -24,11 +25,19 @@ class BasketballReferenceScraper:
     
     Attributes:
         base_url (str): The base URL for Basketball Reference website
+        http (HttpClient): Pooled HTTP client shared by all scraping code paths
     """
 
-    def __init__(self):
-        """Initialize the scraper with base URL."""
+    def __init__(self, http=None):
+        """
+        Initialize the scraper with base URL.
+        
+        Args:
+            http (HttpClient, optional): HTTP client to use. Defaults to the
+                process-wide pooled client.
+        """
         self.base_url = "https://www.basketball-reference.com"
+        self.http = http if http is not None else get_http_client()
     
     def fetch_html(self, url: str) -> str:
         """
@@ -44,9 +53,8 @@ class BasketballReferenceScraper:
             Exception: If the URL fetch fails or returns non-200 status
         """
         try:
-            response = requests.get(url)
-            response.raise_for_status()  # Raises HTTPError for bad responses (4xx, 5xx)
-            return response.text
+            # Raises HTTPError for bad responses (4xx, 5xx)
+            return self.http.get_text(url)
         except requests.RequestException as e:
             raise Exception(f"Failed to fetch data from {url}. Error: {str(e)}")
 
@@ -1,33 +1,39 @@
-from sqlalchemy import create_engine, Column, Integer, String, Date, Float, ForeignKey, Text, Time, Enum, CheckConstraint, Interval, Boolean
+from sqlalchemy import create_engine, event, DDL, Column, Integer, SmallInteger, String, Date, DateTime, Float, ForeignKey, Text, Time, Enum, CheckConstraint, Interval, Boolean, LargeBinary, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, validates
 import enum
-from src.utils.game_calculations import format_season
+from src.utils.date_helpers import season_label
 from datetime import timedelta, time
 
 Base = declarative_base()
 
 class GameType(enum.Enum):
+    """Game type, stored by value; see src.utils.date_helpers.GAME_ID_TYPES."""
     REGULAR_SEASON = "Regular Season"
     PLAY_IN = "Play-In"
     PLAYOFFS = "Playoffs"
     PRESEASON = "Preseason"
+    ALL_STAR = "All-Star"
+    NBA_CUP = "NBA Cup"
 
 class Game(Base):
     """
-    Represents a basketball game attended.
-    Stores both the game data and personal attendance details.
-    
-    This model combines official game data (scraped from Basketball Reference)
-    with personal details about attendance, creating a complete record of
-    each game experience.
+    Represents a basketball game, with its official data only.
+
+    Each game is stored once however many users attended it; everything
+    fetched for it hangs off this row, and each attendee's seat and notes
+    are kept in Attendance.
     """
     __tablename__ = 'games'
+    __table_args__ = (
+        Index('ix_games_game_type_date', 'game_type', 'date'),
+    )
 
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), unique=True, nullable=False)
     date = Column(Date, nullable=False)
-    season = Column(String(7))  # e.g., "2023-24"
+    season = Column(String(9))  # e.g., "2024-2025"
+    game_type = Column(Enum(GameType, values_callable=lambda types: [t.value for t in types]))  # from the game id
     
     # Team Information
     home_team = Column(String(50))
@@ -40,15 +46,12 @@ class Game(Base):
     # Score
     home_score = Column(Integer)
     away_score = Column(Integer)
-    
-    # Personal attendance details (keeping for now)
-    seat_section = Column(String(20))
-    seat_row = Column(String(10))
-    seat_number = Column(String(10))
-    attended_with = Column(String(200))
-    notes = Column(Text)
+
+    # When the game or any of its statistics were last written
+    updated_at = Column(DateTime)
     
     # Relationships
+    attendances = relationship("Attendance", back_populates="game")
     venue_info = relationship("VenueInfo", back_populates="game", uselist=False)
     game_flow = relationship("GameFlow", back_populates="game", uselist=False)
     team_stats = relationship("TeamStats", back_populates="game")
@@ -59,18 +62,17 @@ class Game(Base):
     inactive_players = relationship("InactivePlayer", back_populates="game")
     photos = relationship("Photo", back_populates="game")
     player_advanced_stats = relationship("PlayerAdvancedStats", back_populates="game")
+    player_box_scores = relationship("PlayerBoxScore", back_populates="game")
     team_advanced_stats = relationship("TeamAdvancedStats", back_populates="game")
+    play_by_play = relationship("PlayByPlay", back_populates="game", uselist=False)
 
     def __repr__(self):
         return f"<Game {self.date}: {self.away_team} @ {self.home_team}>"
 
     @validates('season')
     def validate_season(self, key, season):
-        """Ensure season is in YYYY-YYYY format"""
-        if '-' not in season:
-            # If just given a year, convert to full format
-            return format_season(season)
-        return season
+        """Ensure season is in YYYY-YYYY format (a precomputed label lookup)"""
+        return season_label(season) if season is not None else None
 
     @validates('duration_minutes')
     def validate_duration(self, key, duration_str):
@@ -83,42 +85,169 @@ class Game(Base):
                 return None
         return duration_str
 
+class User(Base):
+    """
+    A fan using the tracker.
+
+    Games and everything fetched for them are stored once and shared by
+    every user; which games a user attended is recorded in Attendance.
+    """
+    __tablename__ = 'users'
+
+    id = Column(Integer, primary_key=True)
+    username = Column(String(50), unique=True, nullable=False)
+    display_name = Column(String(100))
+    created_at = Column(DateTime)
+
+    attendances = relationship("Attendance", back_populates="user")
+
+    def __repr__(self):
+        return f"<User {self.id}: {self.username}>"
+
+class Attendance(Base):
+    """
+    One user's attendance of a stored game, with their personal details.
+
+    The (user_id, game_id) unique index is the user-scoped index every
+    "my games" query filters through.
+    """
+    __tablename__ = 'attendances'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'game_id', name='uq_attendances_user_game'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, index=True)
+    added_at = Column(DateTime)
+
+    # Personal attendance details
+    seat_section = Column(String(20))
+    seat_row = Column(String(10))
+    seat_number = Column(String(10))
+    attended_with = Column(String(200))
+    notes = Column(Text)
+
+    user = relationship("User", back_populates="attendances")
+    game = relationship("Game", back_populates="attendances")
+    photos = relationship("Photo", back_populates="attendance")
+
+    def __repr__(self):
+        return f"<Attendance user {self.user_id} at {self.game_id}>"
+
 class Photo(Base):
     """
     Stores photos from attended games.
     
     This model handles the storage of game photos, allowing multiple
-    photos per game with optional captions. The actual image files
-    are stored on disk, with this table storing the file paths.
+    photos per game with optional captions. Each photo belongs to the
+    attendance of the user who uploaded it, so it only appears in that
+    user's gallery. The actual image files are stored on disk by
+    src.data.photo_store, content-addressed by their SHA-256 hash (so
+    identical uploads, by any user, share one file and one set of
+    thumbnails), with this table storing the hash and file path.
     """
     __tablename__ = 'photos'
+    __table_args__ = (
+        UniqueConstraint('attendance_id', 'content_hash', name='uq_photos_attendance_hash'),
+    )
 
     id = Column(Integer, primary_key=True)
     game_id = Column(Integer, ForeignKey('games.id'), nullable=False)  # Links photo to specific game
+    attendance_id = Column(Integer, ForeignKey('attendances.id'), index=True)  # The uploader's attendance
     file_path = Column(String(500), nullable=False)    # Path to stored image file
     caption = Column(Text)                             # Optional photo description
+    content_hash = Column(String(64), index=True)      # SHA-256 of the image bytes
+    width = Column(Integer)
+    height = Column(Integer)
+    byte_size = Column(Integer)
+    uploaded_at = Column(DateTime)
     
-    # Relationship back to the game
+    # Relationships back to the game and the uploader's attendance
     game = relationship("Game", back_populates="photos")
+    attendance = relationship("Attendance", back_populates="photos")
 
     def __repr__(self):
         return f"<Photo {self.id} for Game {self.game_id}>"
 
+class Player(Base):
+    """
+    NBA player dimension, keyed by NBA person id.
+    
+    Box score and inactive list rows reference players by id instead of
+    repeating names in every row.
+    """
+    __tablename__ = 'players'
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)  # NBA person id
+    first_name = Column(String(50))
+    last_name = Column(String(50))
+    
+    aggregates = relationship("PlayerCareerAggregate", back_populates="player")
+    
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}".strip()
+    
+    def __repr__(self):
+        return f"<Player {self.id}: {self.full_name}>"
+
+class PlayerCareerAggregate(Base):
+    """
+    Precomputed per-player totals across one user's attended games.
+    
+    Maintained by src.core.player_manager.refresh_player_aggregates whenever
+    an attendance is recorded or removed or a game is refreshed, so "players
+    I've seen most" is an indexed lookup.
+    """
+    __tablename__ = 'player_career_aggregates'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'player_id', name='uq_player_career_aggregates_user_player'),
+        Index('ix_player_career_aggregates_user_games_seen', 'user_id', 'games_seen'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    player_id = Column(Integer, ForeignKey('players.id'), nullable=False)
+    games_seen = Column(Integer, nullable=False, default=0)  # box score or inactive list
+    games_played = Column(Integer, nullable=False, default=0)
+    dnp_count = Column(Integer, nullable=False, default=0)
+    inactive_count = Column(Integer, nullable=False, default=0)
+    average_pie = Column(Float, nullable=True)  # over games played
+    average_net_rating = Column(Float, nullable=True)  # over games played
+    last_seen_date = Column(Date, nullable=True)
+    
+    player = relationship("Player", back_populates="aggregates")
+
 class InactivePlayer(Base):
     __tablename__ = 'inactive_players'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'player_id', name='uq_inactive_players_game_player'),
+    )
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
-    first_name = Column(String(50))
-    last_name = Column(String(50))
+    player_id = Column(Integer, ForeignKey('players.id'), nullable=False, index=True)
     jersey_num = Column(Integer)
     team_id = Column(Integer, nullable=False)  # Changed from team_abbrev to team_id
     
     # Relationship to game using game_id
     game = relationship("Game", back_populates="inactive_players", foreign_keys=[game_id])
+    player = relationship("Player")
+    
+    @property
+    def first_name(self):
+        return self.player.first_name if self.player else None
+    
+    @property
+    def last_name(self):
+        return self.player.last_name if self.player else None
 
 class Official(Base):
     __tablename__ = 'officials'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'official_id', name='uq_officials_game_official'),
+    )
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
@@ -131,6 +260,9 @@ class Official(Base):
 
 class QuarterScores(Base):
     __tablename__ = 'quarter_scores'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'period', name='uq_quarter_scores_game_period'),
+    )
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
@@ -144,6 +276,9 @@ class QuarterScores(Base):
 
 class TeamStats(Base):
     __tablename__ = 'team_stats'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'team_id', name='uq_team_stats_game_team'),
+    )
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
@@ -162,7 +297,7 @@ class SeriesStats(Base):
     __tablename__ = 'series_stats'
     
     id = Column(Integer, primary_key=True)
-    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, unique=True)
     
     # Pre-game series data
     pregame_home_team_series_wins = Column(Integer, CheckConstraint('pregame_home_team_series_wins >= 0'))
@@ -182,7 +317,7 @@ class LastMeeting(Base):
     __tablename__ = 'last_meetings'
     
     id = Column(Integer, primary_key=True)
-    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, unique=True)
     last_meeting_game_id = Column(String)
     last_meeting_game_date = Column(Date)
     home_team_id = Column(Integer)  # Renamed from team1_id
@@ -192,12 +327,72 @@ class LastMeeting(Base):
     
     game = relationship("Game", back_populates="last_meeting")
 
+class Venue(Base):
+    """
+    An arena, with a canonical id that survives naming-rights changes.
+    
+    Maintained by src.core.venue_manager, which seeds the current NBA arenas
+    (with coordinates and former names) and registers any other arena the
+    first time a game there is saved.
+    """
+    __tablename__ = 'venues'
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True)  # current name
+    city = Column(String(50))
+    team_id = Column(Integer)  # home team, if any
+    latitude = Column(Float)
+    longitude = Column(Float)
+    
+    aliases = relationship("VenueAlias", back_populates="venue")
+
+class VenueAlias(Base):
+    """A name (current or former) an arena is reported under."""
+    __tablename__ = 'venue_aliases'
+    
+    id = Column(Integer, primary_key=True)
+    venue_id = Column(Integer, ForeignKey('venues.id'), nullable=False, index=True)
+    alias = Column(String(100), nullable=False)
+    alias_key = Column(String(100), nullable=False, unique=True)  # normalized for lookup
+    
+    venue = relationship("Venue", back_populates="aliases")
+
+class VenueSplit(Base):
+    """
+    Precomputed per-team totals for the games one user attended at one venue.
+    
+    Maintained by src.core.venue_manager.refresh_venue_splits for the users
+    and venues touched by each attendance, so every venue widget reads one
+    indexed query.
+    """
+    __tablename__ = 'venue_splits'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'venue_id', 'team_id', name='uq_venue_splits_user_venue_team'),
+        Index('ix_venue_splits_user_team_games', 'user_id', 'team_id', 'games'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    venue_id = Column(Integer, ForeignKey('venues.id'), nullable=False)
+    team_id = Column(Integer, nullable=False)
+    games = Column(Integer, nullable=False)
+    wins = Column(Integer, nullable=False)
+    losses = Column(Integer, nullable=False)
+    total_minutes = Column(Integer, nullable=False, default=0)
+    duration_games = Column(Integer, nullable=False, default=0)  # games with a known duration
+    total_attendance = Column(Integer, nullable=False, default=0)
+    attendance_games = Column(Integer, nullable=False, default=0)  # games with a known attendance
+    last_date = Column(Date)
+    
+    venue = relationship("Venue")
+
 class VenueInfo(Base):
     __tablename__ = 'venue_info'
     
     id = Column(Integer, primary_key=True)
-    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, unique=True)
     arena = Column(String(100))
+    venue_id = Column(Integer, ForeignKey('venues.id'), index=True)  # arena resolved to its canonical venue
     attendance = Column(Integer)
     duration_minutes = Column(Integer)
     national_tv = Column(String(20))  # 'Local' or network name
@@ -208,23 +403,35 @@ class GameFlow(Base):
     __tablename__ = 'game_flow'
     
     id = Column(Integer, primary_key=True)
-    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, unique=True)
     home_largest_lead = Column(Integer)
     away_largest_lead = Column(Integer)
     lead_changes = Column(Integer)
     times_tied = Column(Integer)
     
+    # Derived from play-by-play (None when no play-by-play is stored); see src.utils.game_flow.FLOW_COLUMNS
+    home_max_lead = Column(Integer)
+    away_max_lead = Column(Integer)
+    pbp_lead_changes = Column(Integer)
+    pbp_times_tied = Column(Integer)
+    home_longest_run = Column(Integer)
+    away_longest_run = Column(Integer)
+    home_time_leading = Column(Integer)  # seconds
+    away_time_leading = Column(Integer)  # seconds
+    time_tied = Column(Integer)  # seconds
+    
     game = relationship("Game", back_populates="game_flow")
 
 class PlayerAdvancedStats(Base):
     __tablename__ = 'player_advanced_stats'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'player_id', name='uq_player_advanced_stats_game_player'),
+    )
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
     team_id = Column(Integer)
-    player_id = Column(Integer)
-    first_name = Column(String(50))
-    last_name = Column(String(50))
+    player_id = Column(Integer, ForeignKey('players.id'), index=True)
     starting_position = Column(String(5), nullable=True)
     starter = Column(Boolean, default=False)
     status = Column(String(20), nullable=True)
@@ -256,9 +463,147 @@ class PlayerAdvancedStats(Base):
     pie = Column(Float, nullable=True)
     
     game = relationship("Game", back_populates="player_advanced_stats")
+    player = relationship("Player")
+    
+    @property
+    def first_name(self):
+        return self.player.first_name if self.player else None
+    
+    @property
+    def last_name(self):
+        return self.player.last_name if self.player else None
+
+class PlayerBoxScore(Base):
+    """
+    Traditional box score line for one player in one attended game.
+    
+    Counting stats are small integers and minutes are stored as seconds
+    played. The counting columns used for leaderboards are indexed so
+    top-N queries across all attended games are index scans.
+    """
+    __tablename__ = 'player_box_scores'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'player_id', name='uq_player_box_scores_game_player'),
+        Index('ix_player_box_scores_points', 'points'),
+        Index('ix_player_box_scores_rebounds', 'rebounds'),
+        Index('ix_player_box_scores_assists', 'assists'),
+    )
+    
+    # API statistics key for each counting column
+    STAT_FIELDS = {
+        'field_goals_made': 'fieldGoalsMade',
+        'field_goals_attempted': 'fieldGoalsAttempted',
+        'three_pointers_made': 'threePointersMade',
+        'three_pointers_attempted': 'threePointersAttempted',
+        'free_throws_made': 'freeThrowsMade',
+        'free_throws_attempted': 'freeThrowsAttempted',
+        'offensive_rebounds': 'reboundsOffensive',
+        'defensive_rebounds': 'reboundsDefensive',
+        'rebounds': 'reboundsTotal',
+        'assists': 'assists',
+        'steals': 'steals',
+        'blocks': 'blocks',
+        'turnovers': 'turnovers',
+        'personal_fouls': 'foulsPersonal',
+        'points': 'points',
+        'plus_minus': 'plusMinusPoints',
+    }
+    
+    id = Column(Integer, primary_key=True)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    player_id = Column(Integer, ForeignKey('players.id'), nullable=False, index=True)
+    team_id = Column(Integer, nullable=False)
+    starter = Column(Boolean, default=False)
+    seconds_played = Column(SmallInteger)  # None when the player did not play
+    
+    field_goals_made = Column(SmallInteger)
+    field_goals_attempted = Column(SmallInteger)
+    three_pointers_made = Column(SmallInteger)
+    three_pointers_attempted = Column(SmallInteger)
+    free_throws_made = Column(SmallInteger)
+    free_throws_attempted = Column(SmallInteger)
+    offensive_rebounds = Column(SmallInteger)
+    defensive_rebounds = Column(SmallInteger)
+    rebounds = Column(SmallInteger)
+    assists = Column(SmallInteger)
+    steals = Column(SmallInteger)
+    blocks = Column(SmallInteger)
+    turnovers = Column(SmallInteger)
+    personal_fouls = Column(SmallInteger)
+    points = Column(SmallInteger)
+    plus_minus = Column(SmallInteger)
+    
+    game = relationship("Game", back_populates="player_box_scores")
+    player = relationship("Player")
+    
+    @classmethod
+    def from_api(cls, game_id, player):
+        """
+        Create a row from a BoxScoreTraditionalV3 player entry.
+        
+        Args:
+            game_id (str): NBA API game ID
+            player (dict): Player dict from NBAApiClient.get_box_score
+        """
+        stats = player.get('statistics', {})
+        seconds = cls.parse_minutes(stats.get('minutes'))
+        return cls(
+            game_id=game_id,
+            player_id=player['personId'],
+            team_id=player['teamId'],
+            starter=bool(player.get('position')),
+            seconds_played=seconds,
+            **{
+                column: int(stats[key]) if seconds and stats.get(key) is not None else None
+                for column, key in cls.STAT_FIELDS.items()
+            }
+        )
+    
+    @staticmethod
+    def parse_minutes(minutes):
+        """Convert an "MM:SS" minutes string to seconds (None when not played)."""
+        if not minutes:
+            return None
+        try:
+            whole, _, seconds = str(minutes).partition(':')
+            total = int(float(whole)) * 60 + int(float(seconds or 0))
+        except ValueError:
+            return None
+        return total or None
+
+class LeaderboardEntry(Base):
+    """
+    One player's value for one leaderboard stat in one attended game.
+    
+    A tall, denormalized copy of box score and advanced stats (with season,
+    team and opponent) maintained by src.core.leaderboard. The composite
+    indexes let SQLite answer top-N by stat, optionally filtered by team,
+    season or opponent, with a bounded index scan.
+    """
+    __tablename__ = 'leaderboard_entries'
+    __table_args__ = (
+        Index('ix_leaderboard_stat_value', 'stat', 'value'),
+        Index('ix_leaderboard_stat_team_value', 'stat', 'team_id', 'value'),
+        Index('ix_leaderboard_stat_season_value', 'stat', 'season', 'value'),
+        Index('ix_leaderboard_stat_opponent_value', 'stat', 'opponent_id', 'value'),
+        Index('ix_leaderboard_game', 'game_id'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    stat = Column(String(40), nullable=False)
+    value = Column(Float, nullable=False)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    player_id = Column(Integer, ForeignKey('players.id'), nullable=False)
+    team_id = Column(Integer)
+    opponent_id = Column(Integer)
+    season = Column(String(9))
+    date = Column(Date)
 
 class TeamAdvancedStats(Base):
     __tablename__ = 'team_advanced_stats'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'team_id', name='uq_team_advanced_stats_game_team'),
+    )
     
     id = Column(Integer, primary_key=True)
     game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
@@ -289,6 +634,125 @@ class TeamAdvancedStats(Base):
     
     game = relationship("Game", back_populates="team_advanced_stats")
 
+class PlayByPlay(Base):
+    """
+    Stores a game's play-by-play events as one compressed columnar blob.
+    
+    Events are encoded by PlayByPlayEvents: integer-coded event types,
+    small-int clocks and scores, and dictionary-encoded player ids, giving
+    a few kilobytes per game instead of ~500 wide rows.
+    """
+    __tablename__ = 'play_by_play'
+    
+    id = Column(Integer, primary_key=True)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, unique=True)
+    format_version = Column(SmallInteger, nullable=False)
+    event_count = Column(Integer, nullable=False)
+    player_count = Column(Integer, nullable=False)
+    events_blob = Column(LargeBinary, nullable=False)
+    
+    game = relationship("Game", back_populates="play_by_play")
+    
+    @classmethod
+    def from_events(cls, game_id, events):
+        """Create a row from a PlayByPlayEvents container."""
+        from src.data.play_by_play import FORMAT_VERSION as PLAY_BY_PLAY_FORMAT_VERSION
+        return cls(
+            game_id=game_id,
+            format_version=PLAY_BY_PLAY_FORMAT_VERSION,
+            event_count=len(events),
+            player_count=len(events.player_ids),
+            events_blob=events.to_blob()
+        )
+    
+    @property
+    def events(self):
+        """Decode the stored blob into a PlayByPlayEvents container."""
+        from src.data.play_by_play import PlayByPlayEvents  # numpy is only needed once events are decoded
+        return PlayByPlayEvents.from_blob(self.events_blob, self.event_count, self.player_count, self.format_version)
+
+class JobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class Job(Base):
+    """
+    A background ingestion job (e.g., saving or backfilling a game).
+    
+    Jobs live in the application database so they survive restarts; see
+    src.core.job_queue for enqueueing, claiming and retries.
+    """
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        Index('ix_jobs_status_run_after', 'status', 'run_after'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(100), nullable=False)  # JOB_HANDLERS key or "module:function"
+    dedupe_key = Column(String(100), unique=True)  # enqueueing the same key twice returns the same job
+    payload = Column(Text, nullable=False)  # JSON
+    status = Column(Enum(JobStatus, values_callable=lambda statuses: [s.value for s in statuses]),
+                    nullable=False, default=JobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False)
+    claimed_at = Column(DateTime)
+    worker = Column(String(50))
+    result = Column(Text)  # JSON
+    error = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<Job {self.id} {self.kind} {self.status.value}>"
+
+class RenderedChart(Base):
+    """
+    A game chart rendered to Plotly figure JSON.
+
+    Maintained by src.visualization.game_charts: one row per game and chart
+    type, tagged with the version of the data it was rendered from, so a
+    game's charts are rebuilt only after its stats change.
+    """
+    __tablename__ = 'rendered_charts'
+    __table_args__ = (
+        UniqueConstraint('game_id', 'chart_type', name='uq_rendered_charts_game_chart'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False)
+    chart_type = Column(String(30), nullable=False)  # CHART_TYPES key
+    data_version = Column(String(40), nullable=False)
+    figure_json = Column(Text, nullable=False)
+    rendered_at = Column(DateTime, nullable=False)
+
+class QuarantinedGame(Base):
+    """
+    A stored game whose NBA API payload failed validation during a backfill.
+
+    Written by src.data.game_repository.backfill_games instead of aborting
+    the batch, and removed once the game backfills cleanly.
+    """
+    __tablename__ = 'quarantined_games'
+
+    id = Column(Integer, primary_key=True)
+    game_id = Column(String(20), ForeignKey('games.game_id'), unique=True, nullable=False)
+    endpoint = Column(String(50), nullable=False)  # endpoint whose payload was rejected
+    rejections = Column(Text, nullable=False)  # JSON {"RecordSet.FIELD": rejected values}
+    error = Column(Text)
+    quarantined_at = Column(DateTime, nullable=False)
+
+# Full-text index of game memories (rowid = attendances.id), maintained by src.core.game_search.
+# FTS5 tables have no declarative model, so create_all issues the DDL itself.
+GAME_SEARCH_DDL = DDL(
+    "CREATE VIRTUAL TABLE IF NOT EXISTS game_search USING fts5("
+    "notes, attended_with, players, officials, teams, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+event.listen(Base.metadata, 'after_create', GAME_SEARCH_DDL.execute_if(dialect='sqlite'))
+
 def init_db(db_path='sqlite:///basketball_tracker.db'):
     """
     Initialize the database and create all tables.
@@ -0,0 +1,300 @@
+"""
+Game Detail Module
+
+This module defines the typed in-memory model of a game's BoxScoreSummaryV2
+data, replacing the flat 80-key dictionary get_detailed_stats used to
+return. Every class is a slotted dataclass (no per-instance __dict__), team
+figures live on one TeamLine per side, and period scores are two compact
+integer arrays with one entry per period, overtimes included, so callers
+iterate periods instead of probing keys like 'home_ot3'.
+
+Example:
+    detail = client.get_detailed_stats("0022400773")
+    detail.home.paint_points, detail.away.abbrev
+    for label, home_points, away_points in detail.periods:
+        print(label, home_points, away_points)
+"""
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from src.utils.date_helpers import season_label
+from src.utils.game_calculations import calculate_series_stats
+
+__all__ = [
+    'GameDetail', 'TeamLine', 'PeriodScores', 'SeriesRecord', 'LastMeetingLine', 'OfficialLine',
+    'InactiveLine', 'period_label'
+]
+
+REGULATION_PERIODS = 4
+MAX_OVERTIMES = 10
+
+# BoxScoreSummaryV2 LineScore columns
+LINE_SCORE_RECORD = 7
+LINE_SCORE_FIRST_PERIOD = 8
+LINE_SCORE_POINTS = 22
+
+
+def period_label(index):
+    """Return the label of a zero-based period index ("Q1".."Q4", then "OT1", ...)."""
+    if index < REGULATION_PERIODS:
+        return f"Q{index + 1}"
+    return f"OT{index - REGULATION_PERIODS + 1}"
+
+
+def _jersey(value):
+    """Convert an API jersey string (often space-padded) to an int, or None when blank."""
+    value = str(value or '').strip()
+    return int(value) if value.isdigit() else None
+
+
+@dataclass(slots=True)
+class PeriodScores:
+    """Points per period for both teams, as unsigned 16-bit arrays."""
+    home: array
+    away: array
+
+    @classmethod
+    def from_line_scores(cls, home_row, away_row):
+        """
+        Build from the home and away LineScore rows.
+
+        Regulation quarters are always included; overtime columns are
+        included up to the last period either team scored in.
+        """
+        periods = REGULATION_PERIODS
+        for ot in range(MAX_OVERTIMES):
+            column = LINE_SCORE_FIRST_PERIOD + REGULATION_PERIODS + ot
+            if home_row[column] or away_row[column]:
+                periods = REGULATION_PERIODS + ot + 1
+        end = LINE_SCORE_FIRST_PERIOD + periods
+        return cls(
+            home=array('H', (int(points or 0) for points in home_row[LINE_SCORE_FIRST_PERIOD:end])),
+            away=array('H', (int(points or 0) for points in away_row[LINE_SCORE_FIRST_PERIOD:end])),
+        )
+
+    def __len__(self):
+        return len(self.home)
+
+    def __iter__(self):
+        """Yield (label, home points, away points) for each period."""
+        for index, (home_points, away_points) in enumerate(zip(self.home, self.away)):
+            yield period_label(index), home_points, away_points
+
+    @property
+    def labels(self):
+        return [period_label(index) for index in range(len(self))]
+
+    @property
+    def overtimes(self):
+        return len(self) - REGULATION_PERIODS
+
+
+@dataclass(slots=True)
+class TeamLine:
+    """One team's record and OtherStats line for the game."""
+    team_id: int
+    abbrev: str
+    wins: int
+    losses: int
+    points: int
+    paint_points: int
+    second_chance_points: int
+    fast_break_points: int
+    largest_lead: int
+    team_turnovers: int
+    total_turnovers: int
+    team_rebounds: int
+    points_off_to: int
+
+    @classmethod
+    def from_rows(cls, other_stats, line_score):
+        """Build from the team's OtherStats and LineScore rows."""
+        wins, _, losses = line_score[LINE_SCORE_RECORD].partition('-')
+        return cls(
+            team_id=other_stats[1],
+            abbrev=other_stats[2],
+            wins=int(wins),
+            losses=int(losses),
+            points=line_score[LINE_SCORE_POINTS],
+            paint_points=other_stats[4],
+            second_chance_points=other_stats[5],
+            fast_break_points=other_stats[6],
+            largest_lead=other_stats[7],
+            team_turnovers=other_stats[10],
+            total_turnovers=other_stats[11],
+            team_rebounds=other_stats[12],
+            points_off_to=other_stats[13],
+        )
+
+    @property
+    def record(self):
+        return f"{self.wins}-{self.losses}"
+
+
+@dataclass(slots=True)
+class SeriesRecord:
+    """Season series standing from the home team's point of view."""
+    home_wins: int
+    home_losses: int
+    leader: str
+
+    @property
+    def record(self):
+        return f"{self.home_wins}-{self.home_losses}"
+
+
+@dataclass(slots=True)
+class LastMeetingLine:
+    """The previous game between the two teams."""
+    game_id: str
+    game_date: date
+    home_team_id: int
+    home_city: str
+    home_name: str
+    home_abbrev: str
+    home_points: int
+    visitor_team_id: int
+    visitor_city: str
+    visitor_name: str
+    visitor_abbrev: str
+    visitor_points: int
+
+    @classmethod
+    def from_row(cls, row):
+        """Build from a LastMeeting row."""
+        return cls(
+            game_id=row[1],
+            game_date=datetime.strptime(row[2], '%Y-%m-%dT%H:%M:%S').date(),
+            home_team_id=row[3], home_city=row[4], home_name=row[5], home_abbrev=row[6], home_points=row[7],
+            visitor_team_id=row[8], visitor_city=row[9], visitor_name=row[10], visitor_abbrev=row[11],
+            visitor_points=row[12],
+        )
+
+
+@dataclass(slots=True)
+class OfficialLine:
+    """A game official."""
+    official_id: int
+    first_name: str
+    last_name: str
+    jersey_num: int
+
+    @property
+    def name(self):
+        return f"{self.first_name} {self.last_name}"
+
+
+@dataclass(slots=True)
+class InactiveLine:
+    """A player listed as inactive for the game."""
+    player_id: int
+    first_name: str
+    last_name: str
+    jersey_num: int
+    team_id: int
+    team_abbrev: str
+
+
+@dataclass(slots=True)
+class GameDetail:
+    """Decoded BoxScoreSummaryV2 data for one game."""
+    game_id: str
+    season: str  # season start year, e.g. "2024"
+    national_tv: str
+    attendance: int
+    duration: str  # "H:MM"
+    lead_changes: int
+    times_tied: int
+    home: TeamLine
+    away: TeamLine
+    periods: PeriodScores
+    officials: list
+    inactive_players: list
+    last_meeting: LastMeetingLine
+    series: SeriesRecord  # after this game
+    pregame_series: SeriesRecord
+
+    @classmethod
+    def from_summary(cls, game_id, box_data):
+        """
+        Decode a BoxScoreSummaryV2 response.
+
+        Args:
+            game_id (str): NBA API game ID
+            box_data (dict): The endpoint's get_dict() payload
+
+        Returns:
+            GameDetail: The decoded game
+        """
+        result_sets = box_data['resultSets']
+        game_summary = result_sets[0]['rowSet'][0]    # GameSummary
+        other_stats = result_sets[1]['rowSet']        # OtherStats
+        officials = result_sets[2]['rowSet']          # Officials
+        inactive_players = result_sets[3]['rowSet']   # InactivePlayers
+        game_info = result_sets[4]['rowSet'][0]       # GameInfo
+        line_score = result_sets[5]['rowSet']         # LineScore (visitor first)
+        last_meeting = result_sets[6]['rowSet'][0]    # LastMeeting
+        season_series = result_sets[7]['rowSet'][0]   # SeasonSeries
+
+        home_team_id, visitor_team_id = game_summary[6], game_summary[7]
+        home_stats = next(stats for stats in other_stats if stats[1] == home_team_id)
+        away_stats = next(stats for stats in other_stats if stats[1] == visitor_team_id)
+        home = TeamLine.from_rows(home_stats, line_score[1])
+        away = TeamLine.from_rows(away_stats, line_score[0])
+
+        series = SeriesRecord(home_wins=season_series[4], home_losses=season_series[5], leader=season_series[6])
+        pregame = calculate_series_stats(
+            home_score=home.points,
+            away_score=away.points,
+            postgame_home_wins=series.home_wins,
+            postgame_home_losses=series.home_losses,
+            postgame_leader=series.leader,
+            home_team_abbrev=home.abbrev,
+            away_team_abbrev=away.abbrev
+        )
+
+        return cls(
+            game_id=str(game_id),
+            season=game_summary[8],
+            national_tv=game_summary[11],
+            attendance=game_info[1],
+            duration=game_info[2],
+            lead_changes=home_stats[8],
+            times_tied=home_stats[9],
+            home=home,
+            away=away,
+            periods=PeriodScores.from_line_scores(line_score[1], line_score[0]),
+            officials=[
+                OfficialLine(official_id=row[0], first_name=row[1], last_name=row[2], jersey_num=_jersey(row[3]))
+                for row in officials
+            ],
+            inactive_players=[
+                InactiveLine(player_id=row[0], first_name=row[1], last_name=row[2], jersey_num=_jersey(row[3]),
+                             team_id=row[4], team_abbrev=row[7])
+                for row in inactive_players
+            ],
+            last_meeting=LastMeetingLine.from_row(last_meeting),
+            series=series,
+            pregame_series=SeriesRecord(
+                home_wins=pregame['pregame_home_wins'],
+                home_losses=pregame['pregame_home_losses'],
+                leader=pregame['pregame_leader'],
+            ),
+        )
+
+    @property
+    def season_label(self):
+        """Season in YYYY-YYYY format."""
+        return season_label(self.season)
+
+    @property
+    def duration_minutes(self):
+        """Game duration in minutes (from "H:MM")."""
+        hours, minutes = self.duration.split(':')[:2]
+        return int(hours) * 60 + int(minutes)
+
+    @property
+    def national_tv_label(self):
+        return self.national_tv if self.national_tv else 'Local'
@@ -0,0 +1,610 @@
+"""
+Game Repository Module
+
+This module saves attended games and their NBA API statistics to the
+database. All network fetches happen before any rows are written and every
+write for a game happens in the caller's transaction. Rows are upserted on
+their natural keys (e.g. game and team, game and period), and an upsert only
+rewrites a row whose values actually changed, so saving, backfilling and
+refreshing a game are all idempotent and safe to run from background jobs
+that may be retried.
+
+Example:
+    result = save_game(session, client, game_data, {'seat_section': "Loge 12"}, user_id=user.id)
+    refresh_game(session, client, result['game_id'], force=True)  # pick up stat corrections
+    backfill_games(session, client, game_ids)  # quarantines games with rejected payloads
+    refresh_pregame_series(session)  # no requests: derived from the stored postgame records
+    session.commit()
+"""
+
+import json
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import or_, tuple_
+from sqlalchemy.dialects.sqlite import insert
+
+from src.core.game_search import index_game
+from src.core.leaderboard import record_game_performances
+from src.core.player_manager import ensure_players, refresh_player_aggregates
+from src.core.user_profile import ATTENDANCE_FIELDS, ensure_default_user, record_attendance
+from src.core.venue_manager import refresh_venue_splits, resolve_venue
+from src.data.database_models import (
+    Game, GameFlow, GameType, InactivePlayer, LastMeeting, Official, PlayByPlay, PlayerAdvancedStats,
+    PlayerBoxScore, QuarantinedGame, QuarterScores, SeriesStats, TeamAdvancedStats, TeamStats, VenueInfo
+)
+from src.data.play_by_play import FORMAT_VERSION as PLAY_BY_PLAY_FORMAT_VERSION, PlayByPlayEvents
+from src.utils.data_validators import PayloadError
+from src.utils.date_helpers import game_type_for_game
+from src.utils.game_calculations import calculate_series_stats_batch
+from src.utils.game_flow import compute_flow_metrics, flow_columns
+
+__all__ = [
+    'ATTENDANCE_FIELDS', 'GAME_PARTS', 'NATURAL_KEYS', 'save_game', 'missing_parts', 'refresh_game',
+    'refresh_pregame_series', 'backfill_games', 'save_game_job', 'refresh_game_job', 'backfill_games_job'
+]
+
+# Independently fetched parts of a stored game
+GAME_PARTS = ('summary', 'box_scores', 'play_by_play')
+
+# Natural key of each game table (backed by a unique constraint)
+NATURAL_KEYS = {
+    Game: ('game_id',),
+    SeriesStats: ('game_id',),
+    LastMeeting: ('game_id',),
+    VenueInfo: ('game_id',),
+    GameFlow: ('game_id',),
+    TeamStats: ('game_id', 'team_id'),
+    QuarterScores: ('game_id', 'period'),
+    Official: ('game_id', 'official_id'),
+    InactivePlayer: ('game_id', 'player_id'),
+    PlayerBoxScore: ('game_id', 'player_id'),
+    PlayerAdvancedStats: ('game_id', 'player_id'),
+    TeamAdvancedStats: ('game_id', 'team_id'),
+    PlayByPlay: ('game_id',),
+    QuarantinedGame: ('game_id',),
+}
+
+
+def save_game(session, client, game_data, attendance=None, user_id=None):
+    """
+    Fetch a game's statistics and store it with the user's attendance details.
+
+    The game and its statistics are stored once; each attendee only adds an
+    Attendance row. Saving a game that is already stored (by any user)
+    returns without any network requests, only recording the user's
+    attendance; use refresh_game to update its statistics.
+
+    Args:
+        session: SQLAlchemy session (committed by the caller)
+        client (NBAApiClient): API client used for all fetches
+        game_data (dict): Game from NBAApiClient.get_games_for_date
+        attendance (dict, optional): Values for ATTENDANCE_FIELDS
+        user_id (int, optional): User who attended the game; defaults to the
+            default profile
+
+    Returns:
+        dict: game_id, whether the game was created, whether a new attendance
+            was recorded for the user, and non-fatal warnings
+    """
+    game_id = str(game_data['game_id'])
+    if user_id is None:
+        user_id = ensure_default_user(session).id
+    if session.query(Game.id).filter(Game.game_id == game_id).first():
+        attended = record_attendance(session, user_id, game_id, attendance)
+        if attended:
+            index_game(session, game_id)
+        return {'game_id': game_id, 'created': False, 'attended': attended, 'warnings': []}
+
+    # Fetch everything first so no rows are written if a request fails
+    detail = client.get_detailed_stats(game_id)
+    box_score_data, advanced_data = client.get_box_scores(game_id)
+    warnings = []
+    try:
+        events = PlayByPlayEvents.from_actions(client.get_play_by_play(game_id))
+    except Exception as e:
+        events = None
+        warnings.append(f"Play-by-play unavailable: {str(e)}")
+
+    game_date = datetime.strptime(game_data['date'], '%Y-%m-%d').date()
+    game_type = game_type_for_game(game_id, game_date)
+    game_row = {
+        'date': game_date,
+        'home_team': game_data['home_team'],
+        'away_team': game_data['away_team'],
+        'home_score': game_data['home_score'],
+        'away_score': game_data['away_score'],
+        'game_id': game_id,
+        'season': detail.season_label,
+        'game_type': GameType(game_type) if game_type else None,
+        'home_team_id': detail.home.team_id,
+        'away_team_id': detail.away.team_id,
+        'home_team_abbrev': detail.home.abbrev,
+        'away_team_abbrev': detail.away.abbrev,
+        'updated_at': datetime.now(),
+    }
+    _upsert(session, Game, [game_row])
+
+    changed = {}
+    _write_summary(session, game_id, game_data['arena'], detail, changed)
+    _write_box_scores(session, game_id, detail, box_score_data, advanced_data, changed)
+    if events is not None:
+        _write_play_by_play(session, game_id, events, changed)
+
+    # Update the leaderboard for everyone listed in this game; the attendance refreshes the user's aggregates
+    record_game_performances(session, game_id)
+    attended = record_attendance(session, user_id, game_id, attendance)
+    index_game(session, game_id)
+    return {'game_id': game_id, 'created': True, 'attended': attended, 'warnings': warnings}
+
+
+def missing_parts(session, game_id):
+    """
+    Return the parts of a stored game that have no rows yet.
+
+    Play-by-play stored in an older blob layout counts as missing, so a
+    backfill re-fetches it in the current FORMAT_VERSION.
+
+    Args:
+        session: SQLAlchemy session
+        game_id (str): NBA API game ID
+
+    Returns:
+        list: Names from GAME_PARTS, in order
+    """
+    present = {
+        'summary': session.query(VenueInfo.id).filter(VenueInfo.game_id == game_id).first(),
+        'box_scores': session.query(PlayerBoxScore.id).filter(PlayerBoxScore.game_id == game_id).first()
+                      and session.query(PlayerAdvancedStats.id).filter(PlayerAdvancedStats.game_id == game_id).first(),
+        'play_by_play': session.query(PlayByPlay.id).filter(
+            PlayByPlay.game_id == game_id, PlayByPlay.format_version == PLAY_BY_PLAY_FORMAT_VERSION
+        ).first(),
+    }
+    return [part for part in GAME_PARTS if not present[part]]
+
+
+def refresh_game(session, client, game_id, force=False):
+    """
+    Re-fetch a stored game's statistics and write only the rows that changed.
+
+    By default only missing parts are fetched (a backfill), and a game with
+    nothing missing returns before any network request. With force, every
+    part is re-fetched to pick up stat corrections; unchanged rows are left
+    untouched and rows the API no longer lists are removed. Refreshing the
+    summary also updates the game's scores and team ids. As in save_game,
+    play-by-play that cannot be fetched is a warning rather than an error.
+    Any write stamps the game's updated_at.
+
+    Args:
+        session: SQLAlchemy session (committed by the caller)
+        client (NBAApiClient): API client used for all fetches
+        game_id (str): NBA API game ID of a stored game
+        force (bool): Re-fetch every part, not just the missing ones
+
+    Returns:
+        dict: game_id, the parts refreshed, rows written per table and warnings
+
+    Raises:
+        ValueError: If the game is not stored
+    """
+    game_id = str(game_id)
+    if not session.query(Game.id).filter(Game.game_id == game_id).first():
+        raise ValueError(f"Game {game_id} is not stored")
+    parts = list(GAME_PARTS) if force else missing_parts(session, game_id)
+    if not parts:
+        return {'game_id': game_id, 'refreshed': [], 'changed': {}, 'warnings': []}
+
+    # Fetch everything first so no rows are written if a request fails
+    detail = client.get_detailed_stats(game_id) if 'summary' in parts or 'box_scores' in parts else None
+    box_scores = client.get_box_scores(game_id) if 'box_scores' in parts else None
+    warnings = []
+    events = None
+    if 'play_by_play' in parts:
+        try:
+            events = PlayByPlayEvents.from_actions(client.get_play_by_play(game_id))
+        except Exception as e:
+            parts.remove('play_by_play')
+            warnings.append(f"Play-by-play unavailable: {str(e)}")
+
+    changed = {}
+    if 'summary' in parts:
+        game_values = {
+            Game.season: detail.season_label,
+            Game.home_score: detail.home.points,
+            Game.away_score: detail.away.points,
+            Game.home_team_id: detail.home.team_id,
+            Game.away_team_id: detail.away.team_id,
+            Game.home_team_abbrev: detail.home.abbrev,
+            Game.away_team_abbrev: detail.away.abbrev,
+        }
+        changed[Game.__tablename__] = session.query(Game).filter(
+            Game.game_id == game_id, or_(*[column.is_not(value) for column, value in game_values.items()])
+        ).update(game_values, synchronize_session=False)
+        arena = session.query(VenueInfo.arena).filter(VenueInfo.game_id == game_id).scalar()
+        _write_summary(session, game_id, arena, detail, changed)
+        if changed.get(Game.__tablename__) or changed.get(VenueInfo.__tablename__):
+            refresh_venue_splits(session, [_venue_id(session, game_id)])
+    if box_scores is not None:
+        player_ids = _write_box_scores(session, game_id, detail, *box_scores, changed)
+        if any(changed.get(model.__tablename__) for model in (InactivePlayer, PlayerBoxScore, PlayerAdvancedStats)):
+            refresh_player_aggregates(session, player_ids)
+            record_game_performances(session, game_id)
+    if events is not None:
+        _write_play_by_play(session, game_id, events, changed)
+    if any(changed.get(model.__tablename__) for model in (Official, InactivePlayer, PlayerBoxScore, VenueInfo)):
+        index_game(session, game_id)
+
+    changed = {table: n for table, n in changed.items() if n}
+    if changed:
+        session.query(Game).filter(Game.game_id == game_id).update(
+            {Game.updated_at: datetime.now()}, synchronize_session=False
+        )
+    return {'game_id': game_id, 'refreshed': parts, 'changed': changed, 'warnings': warnings}
+
+
+def refresh_pregame_series(session, game_ids=None):
+    """
+    Derive stored games' pregame series records from their postgame records in one batch.
+
+    The postgame record is the NBA API's season series after the game, so
+    the pregame record is that record without the game's own result. No
+    request is made; only rows whose pregame columns differ are rewritten.
+
+    Args:
+        session: SQLAlchemy session (committed by the caller)
+        game_ids (iterable, optional): NBA API game IDs; defaults to every
+            stored game with a postgame record
+
+    Returns:
+        int: Number of series rows updated
+    """
+    query = (
+        session.query(SeriesStats.game_id, Game.home_score, Game.away_score,
+                      SeriesStats.postgame_home_team_series_wins, SeriesStats.postgame_home_team_series_losses,
+                      Game.home_team_abbrev, Game.away_team_abbrev)
+        .join(Game, Game.game_id == SeriesStats.game_id)
+        .filter(SeriesStats.postgame_home_team_series_wins.isnot(None),
+                SeriesStats.postgame_home_team_series_losses.isnot(None),
+                Game.home_score.isnot(None), Game.away_score.isnot(None))
+    )
+    if game_ids is not None:
+        query = query.filter(SeriesStats.game_id.in_([str(game_id) for game_id in game_ids]))
+    rows = query.all()
+    if not rows:
+        return 0
+    stored_ids, *columns = zip(*rows)
+    pregame = calculate_series_stats_batch(*columns)
+    return _upsert(session, SeriesStats, [
+        {
+            'game_id': game_id,
+            'pregame_home_team_series_wins': int(wins),
+            'pregame_home_team_series_losses': int(losses),
+            'pregame_series_leader': leader,
+            'pregame_series_record': record,
+        }
+        for game_id, (wins, losses, leader, record) in zip(stored_ids, pregame.itertuples(index=False))
+    ])
+
+
+def backfill_games(session, client, game_ids, force=False):
+    """
+    Refresh many stored games, quarantining those whose payloads are rejected.
+
+    A game whose NBA API payload fails validation is recorded in
+    quarantined_games and skipped instead of aborting the batch; refresh_game
+    fetches and validates before writing, so a rejected game writes nothing
+    else. A game that refreshes cleanly is released from quarantine. Each
+    game is committed as soon as it is written, so the database is never
+    locked while the next game is fetched, and when another error (e.g. a
+    network failure) propagates to retry the job, the games already
+    refreshed are kept and a retry skips them. The batch's pregame series
+    records are then derived together with refresh_pregame_series.
+
+    Args:
+        session: SQLAlchemy session, committed after each game
+        client (NBAApiClient): API client used for all fetches
+        game_ids (iterable): NBA API game IDs of stored games
+        force (bool): Re-fetch every part, not just the missing ones
+
+    Returns:
+        dict: 'refreshed' game ids, 'quarantined' rejections per game id, and
+            'rejections' counted per "Endpoint.RecordSet.FIELD" over the batch
+    """
+    game_ids = [str(game_id) for game_id in game_ids]
+    refreshed, quarantined, rejections = [], {}, Counter()
+    for game_id in game_ids:
+        try:
+            result = refresh_game(session, client, game_id, force=force)
+        except PayloadError as e:
+            quarantined[game_id] = e.rejections
+            rejections.update({f"{e.endpoint}.{field}": count for field, count in e.rejections.items()})
+            _upsert(session, QuarantinedGame, [{
+                'game_id': game_id,
+                'endpoint': e.endpoint,
+                'rejections': json.dumps(e.rejections),
+                'error': str(e),
+                'quarantined_at': datetime.now(),
+            }])
+        else:
+            if result['refreshed']:
+                refreshed.append(game_id)
+            session.query(QuarantinedGame).filter(QuarantinedGame.game_id == game_id).delete(synchronize_session=False)
+        session.commit()
+    refresh_pregame_series(session, game_ids)
+    session.commit()
+    return {'refreshed': refreshed, 'quarantined': quarantined, 'rejections': dict(rejections)}
+
+
+def save_game_job(session, payload):
+    """Job handler: payload holds 'game_data' and optional 'attendance' and 'user_id'."""
+    from src.data.nba_api_client import NBAApiClient
+    return save_game(session, NBAApiClient(), payload['game_data'], payload.get('attendance'), payload.get('user_id'))
+
+
+def refresh_game_job(session, payload):
+    """Job handler: payload holds the 'game_id' of a stored game and optional 'force'."""
+    from src.data.nba_api_client import NBAApiClient
+    return refresh_game(session, NBAApiClient(), payload['game_id'], force=payload.get('force', False))
+
+
+def backfill_games_job(session, payload):
+    """Job handler: payload holds the 'game_ids' of stored games and optional 'force'."""
+    from src.data.nba_api_client import NBAApiClient
+    return backfill_games(session, NBAApiClient(), payload['game_ids'], force=payload.get('force', False))
+
+
+def _upsert(session, model, rows, update_columns=None, prune_game_id=None):
+    """
+    Insert rows, updating existing rows on the model's natural key.
+
+    A conflicting row is only rewritten when one of its update columns
+    differs, so re-saving identical data writes nothing. With prune_game_id,
+    the game's rows whose natural key is not in rows are deleted.
+
+    Returns:
+        int: Number of rows inserted, updated or deleted
+    """
+    keys = NATURAL_KEYS[model]
+    table = model.__table__
+    written = 0
+    if rows:
+        statement = insert(table).values(rows)
+        if update_columns is None:
+            update_columns = [column for column in rows[0] if column not in keys]
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=keys,
+                set_={column: statement.excluded[column] for column in update_columns},
+                where=or_(*[table.c[column].is_not(statement.excluded[column]) for column in update_columns]),
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=keys)
+        written += session.execute(statement).rowcount
+
+    if prune_game_id is not None and len(keys) > 1:
+        stale = session.query(model).filter(model.game_id == prune_game_id)
+        if rows:
+            key_columns = [table.c[column] for column in keys[1:]]
+            kept = [tuple(row[column] for column in keys[1:]) for row in rows]
+            stale = stale.filter(tuple_(*key_columns).notin_(kept))
+        written += stale.delete(synchronize_session=False)
+    return written
+
+
+def _venue_id(session, game_id):
+    return session.query(VenueInfo.venue_id).filter(VenueInfo.game_id == game_id).scalar()
+
+
+def _row(instance):
+    """Return a model instance's column values (without the surrogate id) for an upsert."""
+    return {column.key: getattr(instance, column.key) for column in instance.__table__.columns if column.key != 'id'}
+
+
+def _write_summary(session, game_id, arena, detail, changed):
+    """Upsert series, last meeting, team stats, period scores, officials, venue and flow rows."""
+    def write(model, rows, prune=False):
+        written = _upsert(session, model, rows, prune_game_id=game_id if prune else None)
+        changed[model.__tablename__] = changed.get(model.__tablename__, 0) + written
+
+    # Series stats
+    write(SeriesStats, [{
+        'game_id': game_id,
+        # Pre-game series data (already derived by the decoder)
+        'pregame_home_team_series_wins': detail.pregame_series.home_wins,
+        'pregame_home_team_series_losses': detail.pregame_series.home_losses,
+        'pregame_series_leader': detail.pregame_series.leader,
+        'pregame_series_record': detail.pregame_series.record,
+        # Post-game series data
+        'postgame_home_team_series_wins': detail.series.home_wins,
+        'postgame_home_team_series_losses': detail.series.home_losses,
+        'postgame_series_leader': detail.series.leader,
+        'postgame_series_record': detail.series.record,
+    }])
+
+    # Last meeting
+    last_meeting = detail.last_meeting
+    write(LastMeeting, [{
+        'game_id': game_id,
+        'last_meeting_game_id': last_meeting.game_id,
+        'last_meeting_game_date': last_meeting.game_date,
+        'home_team_id': last_meeting.home_team_id,
+        'away_team_id': last_meeting.visitor_team_id,
+        'home_team_score': last_meeting.home_points,
+        'away_team_score': last_meeting.visitor_points,
+    }])
+
+    # Home and away team stats
+    write(TeamStats, [
+        {
+            'game_id': game_id,
+            'team_id': team.team_id,
+            'paint_points': team.paint_points,
+            'second_chance_points': team.second_chance_points,
+            'fast_break_points': team.fast_break_points,
+            'team_turnovers': team.team_turnovers,
+            'total_turnovers': team.total_turnovers,
+            'team_rebounds': team.team_rebounds,
+            'points_off_to': team.points_off_to,
+        }
+        for team in (detail.home, detail.away)
+    ], prune=True)
+
+    # Quarter scores, then overtime periods if they exist
+    write(QuarterScores, [
+        {
+            'game_id': game_id,
+            'period': period,
+            'home_team_id': detail.home.team_id,
+            'away_team_id': detail.away.team_id,
+            'home_score': home_points,
+            'away_score': away_points,
+        }
+        for period, home_points, away_points in detail.periods
+    ], prune=True)
+
+    # Officials
+    write(Official, [
+        {
+            'game_id': game_id,
+            'official_id': official.official_id,
+            'name': official.name,
+            'jersey_num': official.jersey_num,
+        }
+        for official in detail.officials
+    ], prune=True)
+
+    # Venue info
+    write(VenueInfo, [{
+        'game_id': game_id,
+        'arena': arena,
+        'venue_id': resolve_venue(session, arena),
+        'attendance': detail.attendance,
+        'duration_minutes': detail.duration_minutes,
+        'national_tv': detail.national_tv_label,
+    }])
+
+    # Game flow stats (play-by-play metrics are written by _write_play_by_play)
+    write(GameFlow, [{
+        'game_id': game_id,
+        'lead_changes': detail.lead_changes,
+        'times_tied': detail.times_tied,
+        'home_largest_lead': detail.home.largest_lead,
+        'away_largest_lead': detail.away.largest_lead,
+    }])
+
+
+def _write_box_scores(session, game_id, detail, box_score_data, advanced_data, changed):
+    """Upsert players, inactive players and traditional/advanced box scores; return player ids."""
+    def write(model, rows):
+        written = _upsert(session, model, rows, prune_game_id=game_id)
+        changed[model.__tablename__] = changed.get(model.__tablename__, 0) + written
+
+    # Register every player once in the player dimension
+    ensure_players(session, [
+        (player.player_id, player.first_name, player.last_name)
+        for player in detail.inactive_players
+    ] + [
+        (player['personId'], player['firstName'], player['familyName'])
+        for player in box_score_data['player_stats'] + advanced_data['player_stats']
+    ])
+    session.flush()
+
+    # Inactive players
+    write(InactivePlayer, [
+        {
+            'game_id': game_id,
+            'player_id': player.player_id,
+            'jersey_num': player.jersey_num,
+            'team_id': player.team_id,
+        }
+        for player in detail.inactive_players
+    ])
+
+    # Player traditional box scores
+    write(PlayerBoxScore, [_row(PlayerBoxScore.from_api(game_id, player)) for player in box_score_data['player_stats']])
+
+    # Player advanced stats
+    advanced_rows = []
+    for player in advanced_data['player_stats']:
+        stats = player.get('statistics', {})
+
+        # Get position from COMMENT field and determine if player was a starter
+        position = player.get('comment', '').strip()
+        starter = bool(position and position in ['F', 'G', 'C'])
+
+        advanced_rows.append({
+            'game_id': game_id,
+            'team_id': player['teamId'],
+            'player_id': player['personId'],
+            'starting_position': position if starter else None,  # Only set position if they started
+            'starter': starter,
+            'minutes': stats.get('minutes'),
+            'pie': stats.get('pie'),
+            'estimated_offensive_rating': stats.get('estimatedOffensiveRating'),
+            'offensive_rating': stats.get('offensiveRating'),
+            'estimated_defensive_rating': stats.get('estimatedDefensiveRating'),
+            'defensive_rating': stats.get('defensiveRating'),
+            'estimated_net_rating': stats.get('estimatedNetRating'),
+            'net_rating': stats.get('netRating'),
+            'assist_percentage': stats.get('assistPercentage'),
+            'assist_to_turnover': stats.get('assistToTurnover'),
+            'assist_ratio': stats.get('assistRatio'),
+            'offensive_rebound_percentage': stats.get('offensiveReboundPercentage'),
+            'defensive_rebound_percentage': stats.get('defensiveReboundPercentage'),
+            'rebound_percentage': stats.get('reboundPercentage'),
+            'turnover_ratio': stats.get('turnoverRatio'),
+            'effective_field_goal_percentage': stats.get('effectiveFieldGoalPercentage'),
+            'true_shooting_percentage': stats.get('trueShootingPercentage'),
+            'usage_percentage': stats.get('usagePercentage'),
+            'estimated_usage_percentage': stats.get('estimatedUsagePercentage'),
+            'estimated_pace': stats.get('estimatedPace'),
+            'pace': stats.get('pace'),
+            'pace_per40': stats.get('pacePer40'),
+            'possessions': int(stats.get('possessions')) if stats.get('possessions') else None,
+        })
+    write(PlayerAdvancedStats, advanced_rows)
+
+    # Team advanced stats
+    team_rows = []
+    for team in advanced_data['team_stats']:
+        stats = team.get('statistics', {})
+        team_rows.append({
+            'game_id': game_id,
+            'team_id': team['teamId'],
+            'estimated_offensive_rating': stats.get('estimatedOffensiveRating'),
+            'offensive_rating': stats.get('offensiveRating'),
+            'estimated_defensive_rating': stats.get('estimatedDefensiveRating'),
+            'defensive_rating': stats.get('defensiveRating'),
+            'estimated_net_rating': stats.get('estimatedNetRating'),
+            'net_rating': stats.get('netRating'),
+            'assist_percentage': stats.get('assistPercentage'),
+            'assist_to_turnover': stats.get('assistToTurnover'),
+            'assist_ratio': stats.get('assistRatio'),
+            'offensive_rebound_percentage': stats.get('offensiveReboundPercentage'),
+            'defensive_rebound_percentage': stats.get('defensiveReboundPercentage'),
+            'rebound_percentage': stats.get('reboundPercentage'),
+            'estimated_team_turnover_percentage': stats.get('estimatedTeamTurnoverPercentage'),
+            'turnover_ratio': stats.get('turnoverRatio'),
+            'effective_field_goal_percentage': stats.get('effectiveFieldGoalPercentage'),
+            'true_shooting_percentage': stats.get('trueShootingPercentage'),
+            'estimated_pace': stats.get('estimatedPace'),
+            'pace': stats.get('pace'),
+            'pace_per40': stats.get('pacePer40'),
+            'possessions': int(stats.get('possessions')) if stats.get('possessions') else None,
+            'pie': stats.get('PIE'),  # uppercase in the API
+        })
+    write(TeamAdvancedStats, team_rows)
+
+    return [player.player_id for player in detail.inactive_players] + [
+        player['personId'] for player in box_score_data['player_stats'] + advanced_data['player_stats']
+    ]
+
+
+def _write_play_by_play(session, game_id, events, changed):
+    """Upsert play-by-play as a compact columnar blob and its derived game-flow metrics."""
+    # Max leads, lead changes, ties, runs and time leading are stored so statistics never decode the blob
+    for model, rows in (
+        (PlayByPlay, [_row(PlayByPlay.from_events(game_id, events))]),
+        (GameFlow, [{'game_id': game_id, **flow_columns(compute_flow_metrics(events))}]),
+    ):
+        changed[model.__tablename__] = changed.get(model.__tablename__, 0) + _upsert(session, model, rows)
@@ -0,0 +1,191 @@
+"""
+HTTP Session Module
+
+This module provides the shared, connection-pooled HTTP client used by all
+scraping code paths. A single requests.Session keeps TCP/TLS connections alive
+between requests, negotiates gzip (and brotli when available) compression,
+applies connect/read timeouts and retries, and revalidates previously fetched
+pages with conditional requests (ETag / Last-Modified).
+
+Example:
+    http = get_http_client()
+    html = http.get_text("https://www.basketball-reference.com/boxscores/")
+"""
+
+import threading
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+__all__ = ['DEFAULT_TIMEOUT', 'HttpClient', 'build_session', 'get_http_client']
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 20)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; nba-game-tracker/1.0)',
+    'Accept': 'text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8',
+    'Connection': 'keep-alive',
+}
+
+
+def _accept_encoding():
+    """Return the Accept-Encoding header value urllib3 can actually decode."""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+
+def build_session(pool_connections=4, pool_maxsize=16, max_retries=3):
+    """
+    Create a requests.Session with connection pooling and retries.
+
+    Args:
+        pool_connections (int): Number of host pools to keep
+        pool_maxsize (int): Maximum keep-alive connections per host
+        max_retries (int): Retries for connection errors and 429/5xx responses
+
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET', 'HEAD'),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.headers['Accept-Encoding'] = _accept_encoding()
+    return session
+
+
+class HttpClient:
+    """
+    Pooled HTTP client with timeouts and conditional request support.
+
+    Responses carrying an ETag or Last-Modified header are remembered; the next
+    request for the same URL sends If-None-Match / If-Modified-Since and a
+    304 Not Modified answer is served from the remembered body.
+
+    Attributes:
+        session (requests.Session): Shared keep-alive session
+        timeout (tuple): (connect, read) timeouts in seconds
+        revalidated (int): Number of requests answered with 304 Not Modified
+    """
+
+    def __init__(self, session=None, timeout=DEFAULT_TIMEOUT, max_validators=256):
+        """
+        Initialize the client.
+
+        Args:
+            session (requests.Session, optional): Session to use; one is built if omitted
+            timeout (tuple): (connect, read) timeouts in seconds
+            max_validators (int): Maximum number of URLs to keep validators for
+        """
+        self.session = session if session is not None else build_session()
+        self.timeout = timeout
+        self.max_validators = max_validators
+        self.revalidated = 0
+        self._lock = threading.Lock()
+        self._validators = OrderedDict()  # url -> (etag, last_modified, text)
+
+    def get(self, url, conditional=True, **kwargs):
+        """
+        Issue a GET request through the pooled session.
+
+        Args:
+            url (str): URL to fetch
+            conditional (bool): Send validators from a previous response
+            **kwargs: Extra arguments passed to requests.Session.get
+
+        Returns:
+            requests.Response: The response (status 304 if not modified)
+        """
+        headers = dict(kwargs.pop('headers', None) or {})
+        if conditional:
+            with self._lock:
+                cached = self._validators.get(url)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, headers=headers, **kwargs)
+
+    def get_text(self, url):
+        """
+        Fetch a URL and return its decoded body.
+
+        Args:
+            url (str): URL to fetch
+
+        Returns:
+            str: Response body, served from the validator cache on 304
+
+        Raises:
+            requests.RequestException: If the request fails or returns 4xx/5xx
+        """
+        response = self.get(url)
+        if response.status_code == 304:
+            with self._lock:
+                cached = self._validators.get(url)
+                if cached is not None:
+                    self._validators.move_to_end(url)
+                    self.revalidated += 1
+                    return cached[2]
+            # Validators were evicted between request and response; fetch in full
+            response = self.get(url, conditional=False)
+
+        response.raise_for_status()
+        text = response.text
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._lock:
+                self._validators[url] = (etag, last_modified, text)
+                self._validators.move_to_end(url)
+                while len(self._validators) > self.max_validators:
+                    self._validators.popitem(last=False)
+        return text
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """
+    Return the process-wide pooled HTTP client, creating it on first use.
+
+    Returns:
+        HttpClient: Shared client used by every scraping code path
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
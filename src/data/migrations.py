@@ -0,0 +1,371 @@
+"""
+Schema Migrations Module
+
+This module upgrades a database created by an earlier version of the app to
+the current schema in place. create_all only adds missing tables, so
+changes to existing tables are applied here. Each migration checks the
+live schema and does nothing when it is already applied, so migrate() is
+safe to run on every start.
+
+Migrations:
+    attendance_details: moves the personal seat, companion and notes
+        columns from games to attendances. Each game's details go to its
+        earliest attendance (the default profile's for a database from
+        before profiles existed), then the columns are dropped from games.
+    player_names: registers the players named in box score rows from
+        before the players table existed, before the names are dropped.
+    schema: rebuilds every table that lacks a model column or one of the
+        natural-key unique constraints upserts rely on (SQLite cannot add
+        constraints in place): a new table is created from the model, the
+        rows are copied (the newest row wins where the old table held
+        duplicates, rows missing a now-required value are dropped), and
+        the model's indexes are created. Inactive players from before
+        player ids were stored are dropped; a backfill re-fetches them with
+        the box scores.
+    game_type: classifies every game without a game type from its game id
+        prefix and date.
+    game_flow: stores the play-by-play game-flow metrics (max leads, lead
+        changes, ties, runs and time leading) of every game whose
+        play-by-play was saved before they were kept in game_flow.
+    venue_ids: resolves the arena of every game without a venue to the
+        venue registry and rebuilds the venue splits.
+    user_aggregates: rebuilds every user's venue splits and player
+        aggregates when an attendance's venue or player has none, e.g.
+        after schema dropped the rows kept before they belonged to a user.
+    photo_owners: gives every photo from before photos belonged to an
+        attendance to its game's earliest attendance.
+    photo_files: hashes the original of every photo from before photos
+        were content-addressed, fills in its hash, size and dimensions and
+        moves the file under the store's originals/ (a second copy an
+        attendance already has is dropped). Photos whose file cannot be
+        found or read keep no hash and show as unavailable.
+    search_index: rebuilds the search index (one document per attendance)
+        when an attendance has no document, e.g. after attendance_details.
+
+Example:
+    Base.metadata.create_all(engine)
+    migrate(engine)
+"""
+
+import os
+
+from sqlalchemy import MetaData, UniqueConstraint, bindparam, delete, func, inspect, or_, select, text, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from src.core.game_search import rebuild_search_index
+from src.core.player_manager import refresh_player_aggregates
+from src.core.user_profile import ATTENDANCE_FIELDS, ensure_default_user
+from src.core.venue_manager import rebuild_venues, refresh_venue_splits
+from src.data.database_models import Attendance, Base, Game, GameFlow, GameType, Photo, PlayByPlay, VenueInfo
+from src.data.photo_store import PHOTO_ROOT, PhotoStore
+from src.data.play_by_play import FORMAT_VERSION as PLAY_BY_PLAY_FORMAT_VERSION
+from src.utils.date_helpers import game_types_for_games
+from src.utils.game_flow import FLOW_COLUMNS, compute_flow_metrics_batch, flow_columns
+
+__all__ = ['MIGRATIONS', 'migrate']
+
+
+def _columns(connection, table):
+    return {column['name'] for column in inspect(connection).get_columns(table)}
+
+
+def _move_attendance_details(connection):
+    """Move personal fields from games to attendances. Returns whether anything changed."""
+    legacy = [field for field in ATTENDANCE_FIELDS if field in _columns(connection, 'games')]
+    if not legacy:
+        return False
+
+    # An attendances table from before the details moved lacks their columns
+    existing = _columns(connection, 'attendances')
+    for column in Attendance.__table__.columns:
+        if column.name not in existing:
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(text(f"ALTER TABLE attendances ADD COLUMN {column.name} {column_type}"))
+
+    session = Session(bind=connection)
+    try:
+        ensure_default_user(session, index=False)  # adopts games nobody attended yet; search_index indexes them
+        session.flush()
+        # Each game's details belong to whoever saved it first: its earliest attendance
+        assignments = ', '.join(
+            f"{field} = COALESCE(attendances.{field}, "
+            f"(SELECT games.{field} FROM games WHERE games.game_id = attendances.game_id))"
+            for field in legacy
+        )
+        session.execute(text(
+            f"UPDATE attendances SET {assignments} "
+            f"WHERE id IN (SELECT min(id) FROM attendances GROUP BY game_id)"
+        ))
+        for field in legacy:
+            session.execute(text(f"ALTER TABLE games DROP COLUMN {field}"))
+        session.flush()
+    finally:
+        session.close()
+    return True
+
+
+def _register_player_names(connection):
+    """Add players named only in legacy player_advanced_stats rows. Returns whether anything changed."""
+    if 'first_name' not in _columns(connection, 'player_advanced_stats'):
+        return False
+    inserted = connection.execute(text(
+        "INSERT INTO players (id, first_name, last_name) "
+        "SELECT player_id, max(first_name), max(last_name) FROM player_advanced_stats "
+        "WHERE player_id IS NOT NULL AND player_id NOT IN (SELECT id FROM players) GROUP BY player_id"
+    ))
+    return inserted.rowcount > 0
+
+
+def _unique_keys(table):
+    """Column sets the model declares unique (constraints, unique columns and unique indexes)."""
+    keys = {frozenset(constraint.columns.keys()) for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)}
+    keys |= {frozenset([column.name]) for column in table.columns if column.unique}
+    keys |= {frozenset(index.columns.keys()) for index in table.indexes if index.unique}
+    return keys
+
+
+def _live_unique_keys(inspector, name):
+    keys = {frozenset(constraint['column_names']) for constraint in inspector.get_unique_constraints(name)}
+    keys |= {frozenset(index['column_names']) for index in inspector.get_indexes(name) if index['unique']}
+    return keys
+
+
+def _needs_rebuild(inspector, table):
+    """Whether a live table lacks a model column or unique key, or has a required column the model dropped."""
+    live = {column['name']: column for column in inspector.get_columns(table.name)}
+    if any(column.name not in live for column in table.columns):
+        return True
+    if any(not column['nullable'] and column['default'] is None and not column.get('primary_key')
+           and name not in table.columns for name, column in live.items()):
+        return True
+    return not _unique_keys(table) <= _live_unique_keys(inspector, table.name)
+
+
+def _rebuild_table(connection, table):
+    """Recreate a table from its model and copy its rows over (SQLite's documented table rebuild)."""
+    live = _columns(connection, table.name)
+    shared = [column.name for column in table.columns if column.name in live]
+    required = [column.name for column in table.columns if not column.nullable and not column.primary_key
+                and column.default is None and column.server_default is None]
+
+    # A copy of the model under a temporary name; foreign keys resolve against a copy of the metadata
+    metadata = MetaData()
+    for model_table in Base.metadata.sorted_tables:
+        model_table.to_metadata(metadata)
+    temporary = f"_rebuild_{table.name}"
+    connection.execute(CreateTable(table.to_metadata(metadata, name=temporary)))
+
+    # Later rows replace earlier ones that share a natural key; without a required column no row can be kept
+    if all(name in live for name in required):
+        columns = ', '.join(shared)
+        condition = ' AND '.join(f"{name} IS NOT NULL" for name in required) or '1'
+        connection.execute(text(
+            f"INSERT OR REPLACE INTO {temporary} ({columns}) SELECT {columns} FROM {table.name} "
+            f"WHERE {condition} ORDER BY rowid"
+        ))
+    connection.execute(text(f"DROP TABLE {table.name}"))
+    connection.execute(text(f"ALTER TABLE {temporary} RENAME TO {table.name}"))
+    for index in table.indexes:
+        index.create(connection, checkfirst=True)
+
+
+def _upgrade_tables(connection):
+    """Rebuild every table that does not match its model. Returns whether anything changed."""
+    inspector = inspect(connection)
+    existing = set(inspector.get_table_names())
+    stale = [table for table in Base.metadata.sorted_tables
+             if table.name in existing and _needs_rebuild(inspector, table)]
+    for table in stale:
+        _rebuild_table(connection, table)
+    return bool(stale)
+
+
+def _classify_game_types(connection):
+    """Fill in the game type of unclassified games. Returns whether anything changed."""
+    games = Game.__table__
+    unclassified = select(games.c.id, games.c.game_id, games.c.date).where(games.c.game_type.is_(None))
+    rows = connection.execute(unclassified).all()
+    if not rows:
+        return False
+    game_types = game_types_for_games([row.game_id for row in rows], [row.date for row in rows])
+    updates = [
+        {'row_id': row.id, 'game_type': GameType(game_type)}
+        for row, game_type in zip(rows, game_types) if game_type
+    ]
+    if updates:
+        connection.execute(
+            update(games).where(games.c.id == bindparam('row_id')).values(game_type=bindparam('game_type')), updates
+        )
+    return bool(updates)
+
+
+def _store_flow_metrics(connection):
+    """Compute the game-flow metrics of stored play-by-play that has none. Returns whether anything changed."""
+    session = Session(bind=connection)
+    try:
+        stored = (
+            session.query(PlayByPlay)
+            .outerjoin(GameFlow, GameFlow.game_id == PlayByPlay.game_id)
+            .filter(PlayByPlay.format_version == PLAY_BY_PLAY_FORMAT_VERSION,
+                    or_(GameFlow.id.is_(None), GameFlow.home_max_lead.is_(None)))
+            .all()
+        )
+        if not stored:
+            return False
+        flow = compute_flow_metrics_batch([row.events for row in stored])
+        rows = [{'game_id': row.game_id, **flow_columns(metrics)}
+                for row, (_, metrics) in zip(stored, flow.iterrows())]
+        statement = insert(GameFlow).values(rows)
+        session.execute(statement.on_conflict_do_update(
+            index_elements=['game_id'],
+            set_={column: statement.excluded[column] for column in FLOW_COLUMNS.values()}
+        ))
+        session.flush()
+    finally:
+        session.close()
+    return True
+
+
+def _resolve_venues(connection):
+    """Resolve games without a venue to the registry and rebuild the splits. Returns whether anything changed."""
+    session = Session(bind=connection)
+    try:
+        if not session.query(VenueInfo.id).filter(VenueInfo.arena.isnot(None), VenueInfo.venue_id.is_(None)).first():
+            return False
+        rebuild_venues(session)
+        session.flush()
+    finally:
+        session.close()
+    return True
+
+
+def _rebuild_user_aggregates(connection):
+    """Rebuild the per-user aggregates if an attendance is missing from them. Returns whether anything changed."""
+    missing = [
+        "SELECT 1 FROM attendances JOIN venue_info ON venue_info.game_id = attendances.game_id "
+        "JOIN games ON games.game_id = attendances.game_id "
+        "WHERE venue_info.venue_id IS NOT NULL "
+        "AND (games.home_team_id IS NOT NULL OR games.away_team_id IS NOT NULL) "
+        "AND NOT EXISTS (SELECT 1 FROM venue_splits WHERE venue_splits.user_id = attendances.user_id "
+        "AND venue_splits.venue_id = venue_info.venue_id) LIMIT 1"
+    ] + [
+        f"SELECT 1 FROM attendances JOIN {table} ON {table}.game_id = attendances.game_id "
+        f"WHERE {table}.player_id IS NOT NULL "
+        f"AND NOT EXISTS (SELECT 1 FROM player_career_aggregates "
+        f"WHERE player_career_aggregates.user_id = attendances.user_id "
+        f"AND player_career_aggregates.player_id = {table}.player_id) LIMIT 1"
+        for table in ('player_box_scores', 'player_advanced_stats', 'inactive_players')
+    ]
+    if not any(connection.execute(text(query)).first() for query in missing):
+        return False
+    session = Session(bind=connection)
+    try:
+        refresh_venue_splits(session)
+        refresh_player_aggregates(session)
+        session.flush()
+    finally:
+        session.close()
+    return True
+
+
+def _assign_photo_owners(connection):
+    """Give photos without an attendance to their game's earliest attendance. Returns whether anything changed."""
+    photos, games, attendances = Photo.__table__, Game.__table__, Attendance.__table__
+    earliest = (
+        select(func.min(attendances.c.id))
+        .select_from(attendances.join(games, attendances.c.game_id == games.c.game_id))
+        .where(games.c.id == photos.c.game_id)
+        .scalar_subquery()
+    )
+    assigned = connection.execute(
+        update(photos).where(photos.c.attendance_id.is_(None), earliest.is_not(None)).values(attendance_id=earliest)
+    ).rowcount
+    return bool(assigned)
+
+
+def _hash_legacy_photos(connection):
+    """Content-address photos stored without a hash. Returns whether anything changed."""
+    photos = Photo.__table__
+    legacy = connection.execute(
+        select(photos.c.id, photos.c.attendance_id, photos.c.file_path).where(photos.c.content_hash.is_(None))
+    ).all()
+    store = PhotoStore(PHOTO_ROOT)
+    adopted, moved = 0, set()
+    for photo_id, attendance_id, file_path in legacy:
+        # Stored relative to the store root, or to the app's directory
+        path = next((path for path in (os.path.join(PHOTO_ROOT, file_path), file_path) if os.path.isfile(path)), None)
+        if path is None:
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            stored = store.put(data)
+        except ValueError:
+            continue
+        duplicate = connection.execute(select(photos.c.id).where(
+            photos.c.attendance_id == attendance_id, photos.c.content_hash == stored['content_hash']
+        )).first() if attendance_id is not None else None
+        if duplicate:
+            connection.execute(delete(photos).where(photos.c.id == photo_id))
+        else:
+            connection.execute(update(photos).where(photos.c.id == photo_id).values(
+                **{column: stored[column] for column in ('content_hash', 'file_path', 'width', 'height', 'byte_size')}
+            ))
+        adopted += 1
+        if os.path.abspath(path) != os.path.abspath(os.path.join(PHOTO_ROOT, stored['file_path'])):
+            moved.add(path)
+    for path in moved:
+        os.remove(path)  # every row pointing at it now points at the stored original
+    return bool(adopted)
+
+
+def _index_attendances(connection):
+    """Rebuild the search index if an attendance has no document. Returns whether anything changed."""
+    unindexed = connection.execute(text(
+        "SELECT 1 FROM attendances WHERE id NOT IN (SELECT rowid FROM game_search) LIMIT 1"
+    )).first()
+    if not unindexed:
+        return False
+    session = Session(bind=connection)
+    try:
+        rebuild_search_index(session)
+        session.flush()
+    finally:
+        session.close()
+    return True
+
+
+# (name, migration) in the order they are applied
+MIGRATIONS = (
+    ('attendance_details', _move_attendance_details),
+    ('player_names', _register_player_names),
+    ('schema', _upgrade_tables),
+    ('game_type', _classify_game_types),
+    ('game_flow', _store_flow_metrics),
+    ('venue_ids', _resolve_venues),
+    ('user_aggregates', _rebuild_user_aggregates),
+    ('photo_owners', _assign_photo_owners),
+    ('photo_files', _hash_legacy_photos),
+    ('search_index', _index_attendances),
+)
+
+
+def migrate(engine):
+    """
+    Apply every pending migration, each in its own transaction.
+
+    Args:
+        engine: SQLAlchemy engine of a database whose tables exist (create_all)
+
+    Returns:
+        list: Names of the migrations applied
+    """
+    applied = []
+    for name, migration in MIGRATIONS:
+        with engine.begin() as connection:
+            if migration(connection):
+                applied.append(name)
+    return applied
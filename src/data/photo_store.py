@@ -0,0 +1,313 @@
+"""
+Photo Store Module
+
+This module stores game photos on disk content-addressed by the SHA-256 of
+their bytes: an upload that is already stored (for any game or user) reuses
+the same original and thumbnails. Photo rows belong to the uploader's
+attendance, so each user's gallery holds their own photos, each distinct
+photo once. When
+photos are uploaded, JPEG thumbnails in every THUMBNAIL_SIZES resolution are
+rendered in a process pool (each original is decoded once, downscaled from
+largest to smallest), so galleries serve small pre-rendered files a page at
+a time and never decode full-size images on a rerun.
+
+Layout under the store root:
+    originals/ab/abcdef....jpg
+    thumbnails/480/ab/abcdef....jpg
+
+Example:
+    store = PhotoStore('photos')
+    results = store.add_photos(session, attendance, [upload.getvalue() for upload in uploads])
+    photos, pages = photo_page(session, attendance, page=0)
+    st.image(store.thumbnail(photos[0], 'medium'))
+"""
+
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from src.data.database_models import Photo
+
+__all__ = ['PHOTO_ROOT', 'THUMBNAIL_SIZES', 'GALLERY_PAGE_SIZE', 'PhotoStore', 'photo_page']
+
+# Store root used by the app (relative to its working directory)
+PHOTO_ROOT = 'photos'
+
+# Thumbnail name -> longest edge in pixels
+THUMBNAIL_SIZES = {'small': 160, 'medium': 480, 'large': 1280}
+THUMBNAIL_QUALITY = 85
+
+GALLERY_PAGE_SIZE = 24
+
+# Pillow format -> file extension for stored originals
+ORIGINAL_EXTENSIONS = {'JPEG': 'jpg', 'PNG': 'png', 'GIF': 'gif', 'WEBP': 'webp', 'BMP': 'bmp', 'TIFF': 'tif',
+                       'MPO': 'jpg'}
+
+
+def _write_atomic(path, write):
+    """Write a file via a temporary name so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, 'wb') as f:
+            write(f)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def render_thumbnails(original_path, targets):
+    """
+    Render the thumbnails of one original (runs in a pool process).
+
+    The original is decoded once (JPEGs at a reduced scale when possible) and
+    downscaled progressively from the largest target to the smallest.
+
+    Args:
+        original_path (str): Path to the stored original
+        targets (list): (longest edge, output path) pairs
+
+    Returns:
+        int: Number of thumbnails written
+    """
+    from PIL import Image, ImageOps
+
+    targets = sorted(targets, reverse=True)
+    with Image.open(original_path) as image:
+        image.draft('RGB', (targets[0][0], targets[0][0]))
+        image = ImageOps.exif_transpose(image).convert('RGB')
+        for edge, path in targets:
+            image.thumbnail((edge, edge), Image.LANCZOS)
+            _write_atomic(path, lambda f: image.save(f, 'JPEG', quality=THUMBNAIL_QUALITY, optimize=True))
+    return len(targets)
+
+
+class PhotoStore:
+    """Content-addressed photo files with pre-rendered thumbnails."""
+
+    def __init__(self, root, processes=2):
+        """
+        Args:
+            root (str): Directory holding originals and thumbnails
+            processes (int): Thumbnail rendering processes (started on first upload)
+        """
+        self.root = root
+        self.processes = processes
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def original_path(self, photo):
+        """Absolute path of a photo's stored original."""
+        return os.path.join(self.root, photo.file_path)
+
+    def thumbnail_path(self, content_hash, size='medium'):
+        """Absolute path of a thumbnail (which may not be rendered yet)."""
+        return os.path.join(self.root, 'thumbnails', str(THUMBNAIL_SIZES[size]), content_hash[:2],
+                            f"{content_hash}.jpg")
+
+    def _missing_thumbnails(self, content_hash):
+        return [
+            (edge, self.thumbnail_path(content_hash, size)) for size, edge in THUMBNAIL_SIZES.items()
+            if not os.path.exists(self.thumbnail_path(content_hash, size))
+        ]
+
+    def put(self, data):
+        """
+        Store an image's bytes under their hash (once).
+
+        Only the image header is read to validate it and take its size.
+
+        Args:
+            data (bytes): Image file contents
+
+        Returns:
+            dict: content_hash, file_path (relative to the root), width,
+                height, byte_size and whether the file was newly written
+
+        Raises:
+            ValueError: If the data is not an image Pillow can read
+        """
+        return self._write(data, self._inspect(data))
+
+    def _inspect(self, data):
+        """Validate an image from its header and describe where it is stored, without writing anything."""
+        from PIL import Image, UnidentifiedImageError
+
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                image_format, (width, height) = image.format, image.size
+        except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+            raise ValueError("Not a supported image file") from e
+        if image_format not in ORIGINAL_EXTENSIONS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+
+        content_hash = hashlib.sha256(data).hexdigest()
+        file_path = os.path.join('originals', content_hash[:2], f"{content_hash}.{ORIGINAL_EXTENSIONS[image_format]}")
+        return {
+            'content_hash': content_hash, 'file_path': file_path, 'width': width, 'height': height,
+            'byte_size': len(data),
+        }
+
+    def _write(self, data, item):
+        path = os.path.join(self.root, item['file_path'])
+        created = not os.path.exists(path)
+        if created:
+            _write_atomic(path, lambda f: f.write(data))
+        return dict(item, created=created)
+
+    def _remove(self, item):
+        """Delete a stored original and its thumbnails."""
+        paths = [os.path.join(self.root, item['file_path'])]
+        paths += [self.thumbnail_path(item['content_hash'], size) for size in THUMBNAIL_SIZES]
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def render(self, photos):
+        """
+        Render any missing thumbnails for photos, in parallel in the process pool.
+
+        Args:
+            photos (iterable of Photo): Photos to check
+
+        Returns:
+            int: Number of thumbnails written
+        """
+        jobs = {}
+        for photo in photos:
+            if photo.content_hash is not None and photo.content_hash not in jobs:
+                targets = self._missing_thumbnails(photo.content_hash)
+                if targets:
+                    jobs[photo.content_hash] = (self.original_path(photo), targets)
+        if not jobs:
+            return 0
+        if len(jobs) == 1:
+            # Not worth a round trip to the pool
+            return render_thumbnails(*next(iter(jobs.values())))
+        futures = [self._pool().submit(render_thumbnails, path, targets) for path, targets in jobs.values()]
+        return sum(future.result() for future in futures)
+
+    def add_photos(self, session, attendance, images, caption=None):
+        """
+        Store a user's uploaded images for a game they attended and render their thumbnails.
+
+        Images the user already attached to the game (same bytes) are not
+        added again; the same image uploaded by another attendee gets its own
+        row but shares the stored files.
+        Every upload is validated before any file is written, and if an
+        original turns out to be undecodable while its thumbnails render, the
+        files written for this call are removed again. Call session.commit()
+        afterwards to keep the new rows.
+
+        Args:
+            session: SQLAlchemy session
+            attendance (Attendance): The uploader's attendance of the game
+            images (iterable of bytes): Uploaded image files
+            caption (str, optional): Caption for every new photo
+
+        Returns:
+            list: (Photo, created) pairs in upload order
+
+        Raises:
+            ValueError: If an upload is not a supported image (nothing is added)
+        """
+        from PIL import Image
+
+        images = list(images)
+        inspected = [self._inspect(data) for data in images]
+        existing = {
+            photo.content_hash: photo
+            for photo in session.query(Photo).filter(
+                Photo.attendance_id == attendance.id,
+                Photo.content_hash.in_([item['content_hash'] for item in inspected])
+            )
+        }
+
+        results = []
+        written = []
+        uploaded_at = datetime.now()
+        for data, item in zip(images, inspected):
+            photo = existing.get(item['content_hash'])
+            if photo is not None:
+                results.append((photo, False))
+                continue
+            stored = self._write(data, item)
+            if stored['created']:
+                written.append(stored)
+            photo = Photo(
+                game_id=attendance.game.id, attendance_id=attendance.id, file_path=item['file_path'], caption=caption,
+                content_hash=item['content_hash'], width=item['width'], height=item['height'],
+                byte_size=item['byte_size'], uploaded_at=uploaded_at,
+            )
+            existing[item['content_hash']] = photo
+            results.append((photo, True))
+
+        new_photos = [photo for photo, created in results if created]
+        try:
+            self.render(new_photos)
+        except (OSError, Image.DecompressionBombError) as e:
+            for item in written:
+                self._remove(item)
+            raise ValueError(f"Could not read an uploaded image: {e}") from e
+        session.add_all(new_photos)
+        return results
+
+    def thumbnail(self, photo, size='medium'):
+        """
+        Return the path of a photo's thumbnail, rendering it first if it is missing.
+
+        Args:
+            photo (Photo): A stored photo
+            size (str): Key of THUMBNAIL_SIZES
+
+        Returns:
+            str: Path to the JPEG thumbnail, or None for a photo without a
+                content hash (its original was never found by the
+                photo_files migration)
+        """
+        if photo.content_hash is None:
+            return None
+        path = self.thumbnail_path(photo.content_hash, size)
+        if not os.path.exists(path):
+            render_thumbnails(self.original_path(photo), self._missing_thumbnails(photo.content_hash))
+        return path
+
+    def shutdown(self):
+        """Stop the thumbnail processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+def photo_page(session, attendance, page=0, page_size=GALLERY_PAGE_SIZE):
+    """
+    Return one page of a user's photos of a game, oldest first.
+
+    Args:
+        session: SQLAlchemy session
+        attendance (Attendance): The user's attendance of the game
+        page (int): Zero-based page number
+        page_size (int): Photos per page
+
+    Returns:
+        tuple: (list of Photo, number of pages)
+    """
+    query = session.query(Photo).filter(Photo.attendance_id == attendance.id)
+    pages = math.ceil(query.count() / page_size)
+    photos = query.order_by(Photo.id).offset(page * page_size).limit(page_size).all()
+    return photos, pages
@@ -0,0 +1,251 @@
+"""
+Play-by-Play Module
+
+This module converts NBA API play-by-play actions into a compact columnar
+representation and back. Each game's ~500 events are stored as parallel NumPy
+arrays with integer-coded event types, small-int clocks and scores, and
+dictionary-encoded player ids, then serialized into a single compressed blob
+so whole attended-game histories can be analyzed without re-fetching.
+
+Example:
+    events = PlayByPlayEvents.from_actions(client.get_play_by_play(game_id))
+    blob = events.to_blob()
+    PlayByPlayEvents.from_blob(blob, len(events), len(events.player_ids), FORMAT_VERSION)
+"""
+
+import enum
+import re
+import zlib
+
+import numpy as np
+
+__all__ = ['EventType', 'Side', 'PlayByPlayEvents', 'FORMAT_VERSION', 'period_length_tenths']
+
+# Bump when the blob layout changes
+FORMAT_VERSION = 1
+
+REGULATION_PERIOD_TENTHS = 12 * 60 * 10
+OVERTIME_PERIOD_TENTHS = 5 * 60 * 10
+
+
+class EventType(enum.IntEnum):
+    """Integer codes for play-by-play event types."""
+    OTHER = 0
+    MADE_SHOT = 1
+    MISSED_SHOT = 2
+    FREE_THROW_MADE = 3
+    FREE_THROW_MISSED = 4
+    REBOUND = 5
+    TURNOVER = 6
+    FOUL = 7
+    VIOLATION = 8
+    SUBSTITUTION = 9
+    TIMEOUT = 10
+    JUMP_BALL = 11
+    EJECTION = 12
+    PERIOD_START = 13
+    PERIOD_END = 14
+    INSTANT_REPLAY = 15
+
+
+class Side(enum.IntEnum):
+    """Which team an event belongs to."""
+    NONE = 0
+    HOME = 1
+    AWAY = 2
+
+
+_ACTION_TYPES = {
+    'made shot': EventType.MADE_SHOT,
+    'missed shot': EventType.MISSED_SHOT,
+    'rebound': EventType.REBOUND,
+    'turnover': EventType.TURNOVER,
+    'foul': EventType.FOUL,
+    'violation': EventType.VIOLATION,
+    'substitution': EventType.SUBSTITUTION,
+    'timeout': EventType.TIMEOUT,
+    'jump ball': EventType.JUMP_BALL,
+    'ejection': EventType.EJECTION,
+    'instant replay': EventType.INSTANT_REPLAY,
+}
+
+_CLOCK_PATTERN = re.compile(r'PT(\d+)M(\d+(?:\.\d+)?)S')
+
+# Column name -> dtype, in blob order
+_COLUMNS = (
+    ('period', np.uint8),
+    ('clock', np.int16),        # tenths of a second remaining in the period
+    ('event_type', np.uint8),   # EventType
+    ('side', np.uint8),         # Side
+    ('player', np.uint16),      # 1-based index into player_ids, 0 = no player
+    ('home_score', np.int16),
+    ('away_score', np.int16),
+)
+
+
+def period_length_tenths(period):
+    """Length of a period in tenths of a second (12:00 quarters, 5:00 overtimes)."""
+    return np.where(np.asarray(period) <= 4, REGULATION_PERIOD_TENTHS, OVERTIME_PERIOD_TENTHS)
+
+
+def _parse_clock(clock):
+    """Convert an ISO-8601 period clock (e.g. "PT11M38.00S") to tenths of a second."""
+    match = _CLOCK_PATTERN.match(clock or '')
+    if not match:
+        return 0
+    return int(match.group(1)) * 600 + int(round(float(match.group(2)) * 10))
+
+
+def _event_type(action):
+    """Map a PlayByPlayV3 action to its EventType code."""
+    action_type = (action.get('actionType') or '').strip().lower()
+    if action_type == 'free throw':
+        made = action.get('shotResult') == 'Made' or (
+            not action.get('shotResult') and 'MISS' not in (action.get('description') or '')
+        )
+        return EventType.FREE_THROW_MADE if made else EventType.FREE_THROW_MISSED
+    if action_type == 'period':
+        sub_type = (action.get('subType') or '').lower()
+        return EventType.PERIOD_END if sub_type == 'end' else EventType.PERIOD_START
+    return _ACTION_TYPES.get(action_type, EventType.OTHER)
+
+
+def _score(value):
+    """Parse a score field, returning None when it is blank."""
+    if value in (None, ''):
+        return None
+    return int(value)
+
+
+class PlayByPlayEvents:
+    """
+    Struct-of-arrays container for one game's play-by-play events.
+
+    Attributes:
+        period (np.ndarray): Period number (1-4 quarters, 5+ overtimes)
+        clock (np.ndarray): Tenths of a second remaining in the period
+        event_type (np.ndarray): EventType codes
+        side (np.ndarray): Side codes (home, away or none)
+        player (np.ndarray): 1-based indexes into player_ids (0 = no player)
+        home_score (np.ndarray): Running home score after each event
+        away_score (np.ndarray): Running away score after each event
+        player_ids (np.ndarray): NBA person ids referenced by player
+    """
+
+    __slots__ = tuple(name for name, _ in _COLUMNS) + ('player_ids',)
+
+    def __init__(self, player_ids=None, **columns):
+        """
+        Build the container from column arrays.
+
+        Args:
+            player_ids (array-like): Dictionary of NBA person ids
+            **columns: One array per column (period, clock, event_type, side,
+                player, home_score, away_score)
+        """
+        for name, dtype in _COLUMNS:
+            setattr(self, name, np.asarray(columns.get(name, ()), dtype=dtype))
+        self.player_ids = np.asarray(player_ids if player_ids is not None else (), dtype=np.int32)
+
+    @classmethod
+    def from_actions(cls, actions):
+        """
+        Encode PlayByPlayV3 actions.
+
+        Running scores are forward-filled across non-scoring events and player
+        ids are dictionary-encoded in order of first appearance.
+
+        Args:
+            actions (list): Action dicts from the PlayByPlayV3 'actions' list
+
+        Returns:
+            PlayByPlayEvents: Encoded events in game order
+        """
+        count = len(actions)
+        columns = {name: np.zeros(count, dtype=dtype) for name, dtype in _COLUMNS}
+        player_codes = {}
+        home_score = away_score = 0
+
+        for i, action in enumerate(actions):
+            columns['period'][i] = action.get('period') or 0
+            columns['clock'][i] = _parse_clock(action.get('clock'))
+            columns['event_type'][i] = _event_type(action)
+
+            location = action.get('location')
+            columns['side'][i] = Side.HOME if location == 'h' else Side.AWAY if location == 'v' else Side.NONE
+
+            person_id = action.get('personId') or 0
+            if person_id:
+                columns['player'][i] = player_codes.setdefault(person_id, len(player_codes) + 1)
+
+            home = _score(action.get('scoreHome'))
+            away = _score(action.get('scoreAway'))
+            if home is not None and away is not None:
+                home_score, away_score = home, away
+            columns['home_score'][i] = home_score
+            columns['away_score'][i] = away_score
+
+        return cls(player_ids=list(player_codes), **columns)
+
+    @classmethod
+    def from_blob(cls, blob, event_count, player_count, format_version=FORMAT_VERSION):
+        """
+        Decode events serialized with to_blob.
+
+        Args:
+            blob (bytes): Compressed column data
+            event_count (int): Number of events
+            player_count (int): Number of entries in the player dictionary
+            format_version (int): FORMAT_VERSION the blob was written with
+
+        Returns:
+            PlayByPlayEvents: Decoded events
+
+        Raises:
+            ValueError: If the blob was written in another layout or its size
+                does not match the counts (re-fetch the game's play-by-play)
+        """
+        if format_version != FORMAT_VERSION:
+            raise ValueError(
+                f"Play-by-play blob has format version {format_version}, expected {FORMAT_VERSION}"
+            )
+        raw = memoryview(zlib.decompress(blob))
+        expected = sum(np.dtype(dtype).itemsize for _, dtype in _COLUMNS) * event_count + 4 * player_count
+        if len(raw) != expected:
+            raise ValueError(f"Play-by-play blob holds {len(raw)} bytes, expected {expected}")
+        offset = 0
+        columns = {}
+        for name, dtype in _COLUMNS:
+            size = np.dtype(dtype).itemsize * event_count
+            columns[name] = np.frombuffer(raw[offset:offset + size], dtype=dtype)
+            offset += size
+        player_ids = np.frombuffer(raw[offset:offset + 4 * player_count], dtype=np.int32)
+        return cls(player_ids=player_ids, **columns)
+
+    def to_blob(self):
+        """Serialize all columns and the player dictionary into one compressed blob."""
+        parts = [getattr(self, name).astype(dtype, copy=False).tobytes() for name, dtype in _COLUMNS]
+        parts.append(self.player_ids.astype(np.int32, copy=False).tobytes())
+        return zlib.compress(b''.join(parts), 6)
+
+    def __len__(self):
+        return len(self.period)
+
+    @property
+    def margin(self):
+        """Home minus away score after each event."""
+        return self.home_score.astype(np.int32) - self.away_score.astype(np.int32)
+
+    @property
+    def elapsed(self):
+        """Game time elapsed at each event, in tenths of a second."""
+        period = self.period.astype(np.int32)
+        regulation_periods = np.minimum(period - 1, 4)
+        overtime_periods = np.maximum(period - 5, 0)
+        period_start = regulation_periods * REGULATION_PERIOD_TENTHS + overtime_periods * OVERTIME_PERIOD_TENTHS
+        return period_start + period_length_tenths(period) - self.clock.astype(np.int32)
+
+    def person_ids(self):
+        """NBA person id for each event (0 when no player is involved)."""
+        lookup = np.concatenate(([0], self.player_ids)).astype(np.int32)
+        return lookup[self.player]
@@ -0,0 +1,141 @@
+"""
+Prefetch Module
+
+This module speculatively warms the shared NBA API response cache while the
+user is still choosing. The scoreboard is fetched as soon as a date is
+picked, and once games are listed their summary, box scores and play-by-play
+are fetched in the background, so "Find Games" and "Save Game" usually find
+everything already cached. A fixed-size thread pool caps how many requests
+are in flight, and work queued for a date the user has moved away from is
+cancelled. Only queued and in-flight work is tracked; whether a game still
+needs fetching once its requests finish is up to the response cache.
+
+Example:
+    prefetcher = Prefetcher(NBAApiClient(), max_workers=3)
+    prefetcher.prefetch_date("2025-02-12")          # on date change
+    games = prefetcher.games_for_date("2025-02-12")  # on "Find Games"
+    prefetcher.prefetch_games(games)
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+__all__ = ['Prefetcher', 'GAME_PREFETCH_METHODS']
+
+# NBAApiClient methods that warm every endpoint a game save needs
+GAME_PREFETCH_METHODS = ('get_detailed_stats', 'get_box_score', 'get_advanced_stats', 'get_play_by_play')
+
+
+class Prefetcher:
+    """Background warming of an NBAApiClient's response cache."""
+
+    def __init__(self, client, max_workers=3):
+        """
+        Args:
+            client (NBAApiClient): Client whose response cache is warmed
+            max_workers (int): Concurrency budget (simultaneous requests)
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prefetch')
+        self._lock = threading.RLock()  # re-entered by done callbacks of futures cancelled under it
+        self._current_date = None
+        self._date_futures = {}  # date -> scoreboard future, while queued or in flight
+        self._game_futures = {}  # (method, game_id) -> future, while queued or in flight
+
+    def prefetch_date(self, date_str):
+        """
+        Start fetching the scoreboard for a date.
+
+        A fetch already in flight for the date is reused; a finished one is
+        re-run, which is a cache hit unless the scoreboard's TTL expired.
+        When the date changes, queued game prefetches that have not started
+        are cancelled, since the user has moved on.
+
+        Args:
+            date_str (str): Date in YYYY-MM-DD format
+
+        Returns:
+            Future: Resolves to the list from get_games_for_date
+        """
+        with self._lock:
+            if date_str != self._current_date:
+                self._current_date = date_str
+                for game_future in list(self._game_futures.values()):
+                    game_future.cancel()
+            future = self._date_futures.get(date_str)
+            if future is None:
+                future = self._submit(self._date_futures, date_str, self.client.get_games_for_date, date_str)
+            return future
+
+    def games_for_date(self, date_str, timeout=None):
+        """
+        Return the games for a date, joining its prefetch if still in flight.
+
+        A finished prefetch has already populated the response cache, so the
+        client is simply asked again (a cache hit unless the TTL expired).
+
+        Args:
+            date_str (str): Date in YYYY-MM-DD format
+            timeout (float, optional): Seconds to wait for an in-flight prefetch
+
+        Returns:
+            list: Games from get_games_for_date
+
+        Raises:
+            Exception: Whatever get_games_for_date raised
+        """
+        with self._lock:
+            future = self._date_futures.get(date_str)
+        if future is not None and not future.done():
+            return future.result(timeout)
+        return self.client.get_games_for_date(date_str)
+
+    def prefetch_games(self, games):
+        """
+        Warm every per-game endpoint for the given games, in order.
+
+        Games whose endpoints are all in the client's response cache are
+        skipped, as are requests already queued or in flight; a game the cache
+        has since evicted is fetched again. Failures are ignored (saving will
+        simply fetch again).
+
+        Args:
+            games (list): Game dicts (with 'game_id') or game id strings
+
+        Returns:
+            int: Number of requests queued
+        """
+        queued = 0
+        with self._lock:
+            for game in games:
+                game_id = str(game['game_id'] if isinstance(game, dict) else game)
+                if self.client.is_game_cached(game_id):
+                    continue
+                for method in GAME_PREFETCH_METHODS:
+                    key = (method, game_id)
+                    if key not in self._game_futures:
+                        self._submit(self._game_futures, key, getattr(self.client, method), game_id)
+                        queued += 1
+        return queued
+
+    def pending(self):
+        """Return the number of prefetches queued or in flight."""
+        with self._lock:
+            return len(self._date_futures) + len(self._game_futures)
+
+    def _submit(self, futures, key, function, *args):
+        """Submit a request tracked in futures under key until it finishes or is cancelled."""
+        future = futures[key] = self._executor.submit(function, *args)
+
+        def forget(done):
+            with self._lock:
+                if futures.get(key) is done:
+                    del futures[key]
+
+        future.add_done_callback(forget)
+        return future
+
+    def shutdown(self):
+        """Cancel queued prefetches and stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,220 @@
+"""
+Request Cache Module
+
+This module provides in-flight request deduplication and a process-wide
+response memo for NBA API calls. Concurrent identical requests share a single
+network call, and completed responses are memoized by (endpoint, params) so
+that every Streamlit page and session in the process can reuse them.
+
+Example:
+    data = response_cache.get_or_fetch(
+        'BoxScoreSummaryV2', {'game_id': '0022400773'},
+        lambda: boxscoresummaryv2.BoxScoreSummaryV2(game_id='0022400773').get_dict()
+    )
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+__all__ = ['SingleFlight', 'ResponseCache', 'response_cache']
+
+
+class _Call:
+    """A single in-flight call that followers can wait on."""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running wait for that result instead of starting their own call.
+    """
+
+    def __init__(self):
+        """Initialize an empty table of in-flight calls."""
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """
+        Run fn() once for all concurrent callers sharing key.
+
+        Args:
+            key (hashable): Identity of the call
+            fn (callable): Zero-argument function performing the work
+
+        Returns:
+            The result of fn(), shared by every caller of this flight
+
+        Raises:
+            Exception: Whatever fn() raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def in_flight(self, key):
+        """Return True if a call for key is currently running."""
+        with self._lock:
+            return key in self._calls
+
+
+class ResponseCache:
+    """
+    Thread-safe memo of API responses keyed by (endpoint, params).
+
+    Entries are evicted least-recently-used once max_entries is reached and may
+    carry an optional time-to-live for data that can still change (e.g. the
+    scoreboard for a day whose games are not final yet). Misses go through a
+    SingleFlight so concurrent identical requests make one network call.
+
+    Attributes:
+        hits (int): Number of lookups answered from the memo
+        misses (int): Number of lookups that required a fetch
+    """
+
+    def __init__(self, max_entries=512):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of responses kept in memory
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at or None, value)
+        self._flight = SingleFlight()
+
+    @staticmethod
+    def make_key(endpoint, params):
+        """
+        Build a hashable cache key from an endpoint name and its parameters.
+
+        Args:
+            endpoint (str): Endpoint name (e.g., "BoxScoreSummaryV2")
+            params (dict): Request parameters
+
+        Returns:
+            tuple: (endpoint, sorted parameter items with stringified values)
+        """
+        return (endpoint, tuple(sorted((name, str(value)) for name, value in params.items())))
+
+    def get(self, endpoint, params):
+        """
+        Look up a memoized response without fetching.
+
+        Returns:
+            The cached response, or None if absent or expired
+        """
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            return self._lookup(key)
+
+    def contains(self, endpoint, params):
+        """Return True if a fresh response for (endpoint, params) is memoized."""
+        return self.get(endpoint, params) is not None
+
+    def get_or_fetch(self, endpoint, params, fetch, ttl=None):
+        """
+        Return the memoized response, fetching it once if needed.
+
+        Args:
+            endpoint (str): Endpoint name
+            params (dict): Request parameters
+            fetch (callable): Zero-argument function returning the response
+            ttl (float, optional): Seconds the response stays fresh; None keeps
+                it until evicted
+
+        Returns:
+            The response returned by fetch (shared; callers must not mutate it)
+        """
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        def fetch_and_store():
+            value = fetch()
+            self.put(endpoint, params, value, ttl=ttl)
+            return value
+
+        return self._flight.do(key, fetch_and_store)
+
+    def put(self, endpoint, params, value, ttl=None):
+        """Store a response for (endpoint, params)."""
+        key = self.make_key(endpoint, params)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint=None):
+        """
+        Drop memoized responses.
+
+        Args:
+            endpoint (str, optional): Only drop entries for this endpoint;
+                drops everything when omitted
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == endpoint]:
+                del self._entries[key]
+
+    def _lookup(self, key):
+        """Return a fresh entry and mark it recently used. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide memo shared by every NBAApiClient and Streamlit session
+response_cache = ResponseCache()
@@ -0,0 +1,336 @@
+"""
+Data Validators Module
+
+This module defines schema validators for the NBA API endpoint payloads the
+app decodes. Each schema lists the fields its decoder reads (by rowSet
+column for the V2 endpoints, by key path for the V3 ones) and is compiled
+once at import into flat (label, getter, check) triples. Validation runs
+each check over a whole result set in one pass and counts rejections per
+field instead of stopping at the first bad value, so a malformed response
+raises a single PayloadError naming every bad field before any decoding or
+database write happens.
+
+NBAApiClient validates every response as it is fetched, and the backfill in
+game_repository quarantines games whose payloads are rejected.
+
+Example:
+    SUMMARY.rejections(payload)  # {'LineScore.TEAM_WINS_LOSSES': 1}
+    try:
+        SCHEMAS['BoxScoreSummaryV2'].validate(payload, game_id="0022400773")
+    except PayloadError as e:
+        print(e.endpoint, e.rejections)
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+__all__ = [
+    'PayloadError', 'Field', 'RecordSet', 'Schema', 'SCOREBOARD', 'SUMMARY', 'BOX_SCORE_TRADITIONAL',
+    'BOX_SCORE_ADVANCED', 'PLAY_BY_PLAY', 'SCHEMAS'
+]
+
+_MISSING = object()
+
+
+class PayloadError(ValueError):
+    """An endpoint payload failed validation; rejections counts bad values per field."""
+
+    def __init__(self, endpoint, rejections, game_id=None):
+        self.endpoint = endpoint
+        self.rejections = dict(rejections)
+        self.game_id = game_id
+        fields = ', '.join(f"{field} ({count})" for field, count in self.rejections.items())
+        subject = f"{endpoint} payload for game {game_id}" if game_id else f"{endpoint} payload"
+        super().__init__(f"{subject} rejected: {fields}")
+
+
+# Value checks
+
+def is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_text(value):
+    return isinstance(value, str)
+
+
+def optional(check):
+    """Accept None (or an absent key) as well as values passing check."""
+    return lambda value: value is None or value is _MISSING or check(value)
+
+
+def matches(pattern):
+    """Accept strings fully matching a regular expression (compiled once)."""
+    compiled = re.compile(pattern)
+    return lambda value: isinstance(value, str) and compiled.fullmatch(value) is not None
+
+
+def is_score(value):
+    """A running score: blank on non-scoring events, else an int or digit string."""
+    return value in (None, '') or is_int(value) or (isinstance(value, str) and value.isdigit())
+
+
+def is_statistics(value):
+    """A V3 statistics object: numbers (or null) keyed by stat, with a "minutes" string."""
+    return isinstance(value, dict) and all(
+        stat is None or is_number(stat) or (key == 'minutes' and isinstance(stat, str))
+        for key, stat in value.items()
+    )
+
+
+is_game_id = matches(r'\d{10}')
+is_record = matches(r'\d+-\d+')            # "38-15"
+is_duration = matches(r'\d+:\d{2}')        # "2:14"
+is_timestamp = matches(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')
+is_season_year = matches(r'\d{4}')
+
+
+# Schemas
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """A decoded field: its label, rowSet column or key path, and value check."""
+    name: str
+    path: object  # int column, str key, or tuple of either
+    check: object
+
+
+@dataclass(frozen=True, slots=True)
+class RecordSet:
+    """A list of records in a payload, the fields read from each and its allowed length."""
+    name: str
+    locate: object  # payload -> list of records
+    fields: tuple
+    min_rows: int = 0
+    max_rows: int = None
+
+
+def _getter(path):
+    """Compile a column or key path into a function returning the value or _MISSING."""
+    keys = path if isinstance(path, tuple) else (path,)
+
+    def get(record):
+        for key in keys:
+            try:
+                record = record[key]
+            except (IndexError, KeyError, TypeError):
+                return _MISSING
+        return record
+    return get
+
+
+class Schema:
+    """
+    A compiled validator for one endpoint's payload.
+
+    Record set fields are flattened into (label, getter, check) triples when
+    the schema is built, so validating a payload is one pass per field over
+    each record set plus any cross-record checks.
+    """
+
+    def __init__(self, endpoint, record_sets, checks=()):
+        """
+        Compile a schema.
+
+        Args:
+            endpoint (str): Endpoint name (e.g. "BoxScoreSummaryV2")
+            record_sets (iterable): RecordSet definitions
+            checks (iterable, optional): (label, predicate) pairs run on the
+                whole payload once every record set is valid
+        """
+        self.endpoint = endpoint
+        self._record_sets = [
+            (record_set, [(f"{record_set.name}.{field.name}", _getter(field.path), field.check)
+                          for field in record_set.fields])
+            for record_set in record_sets
+        ]
+        self._checks = tuple(checks)
+
+    def rejections(self, payload):
+        """
+        Count the values that fail validation.
+
+        Args:
+            payload (dict): Endpoint get_dict() payload
+
+        Returns:
+            Counter: Rejected values per "RecordSet.FIELD" label (empty when valid)
+        """
+        rejected = Counter()
+        for record_set, fields in self._record_sets:
+            try:
+                records = record_set.locate(payload)
+            except (IndexError, KeyError, TypeError):
+                records = None
+            if not isinstance(records, list):
+                rejected[record_set.name] += 1
+                continue
+            if len(records) < record_set.min_rows or (
+                record_set.max_rows is not None and len(records) > record_set.max_rows
+            ):
+                rejected[f"{record_set.name}.rows"] += 1
+            for label, get, check in fields:
+                count = sum(1 for record in records if not check(get(record)))
+                if count:
+                    rejected[label] += count
+        if not rejected:
+            for label, check in self._checks:
+                try:
+                    valid = check(payload)
+                except (IndexError, KeyError, TypeError, StopIteration):
+                    valid = False
+                if not valid:
+                    rejected[label] += 1
+        return rejected
+
+    def validate(self, payload, game_id=None):
+        """
+        Validate a payload.
+
+        Args:
+            payload (dict): Endpoint get_dict() payload
+            game_id (str, optional): Game the payload belongs to, for the error
+
+        Returns:
+            dict: The payload, unchanged
+
+        Raises:
+            PayloadError: If any value is rejected
+        """
+        rejected = self.rejections(payload)
+        if rejected:
+            raise PayloadError(self.endpoint, rejected, game_id)
+        return payload
+
+
+def _row_set(index):
+    return lambda payload: payload['resultSets'][index]['rowSet']
+
+
+def _team_ids_match(payload):
+    """OtherStats has both teams of GameSummary and LineScore lists the visitor first."""
+    result_sets = payload['resultSets']
+    summary = result_sets[0]['rowSet'][0]
+    home_team_id, visitor_team_id = summary[6], summary[7]
+    other_stats_teams = {row[1] for row in result_sets[1]['rowSet']}
+    line_score_teams = [row[3] for row in result_sets[5]['rowSet']]
+    return {home_team_id, visitor_team_id} <= other_stats_teams and line_score_teams == [visitor_team_id, home_team_id]
+
+
+def _line_scores_per_game(payload):
+    """ScoreboardV2 LineScore has an away and a home row for every game."""
+    return len(payload['resultSets'][1]['rowSet']) == 2 * len(payload['resultSets'][0]['rowSet'])
+
+
+SCOREBOARD = Schema('ScoreboardV2', [
+    RecordSet('GameHeader', _row_set(0), (
+        Field('GAME_ID', 2, is_game_id),
+        Field('HOME_TEAM_ID', 6, is_int),
+        Field('VISITOR_TEAM_ID', 7, is_int),
+        Field('ARENA_NAME', 15, optional(is_text)),
+    )),
+    RecordSet('LineScore', _row_set(1), (
+        Field('PTS', 22, optional(is_int)),  # null until the game starts
+    )),
+], checks=[('LineScore.rows', _line_scores_per_game)])
+
+SUMMARY = Schema('BoxScoreSummaryV2', [
+    RecordSet('GameSummary', _row_set(0), (
+        Field('HOME_TEAM_ID', 6, is_int),
+        Field('VISITOR_TEAM_ID', 7, is_int),
+        Field('SEASON', 8, is_season_year),
+        Field('NATL_TV_BROADCASTER_ABBREVIATION', 11, optional(is_text)),
+    ), min_rows=1, max_rows=1),
+    RecordSet('OtherStats', _row_set(1), (
+        Field('TEAM_ID', 1, is_int),
+        Field('TEAM_ABBREVIATION', 2, is_text),
+        *(Field(name, column, is_int) for column, name in enumerate((
+            'PTS_PAINT', 'PTS_2ND_CHANCE', 'PTS_FB', 'LARGEST_LEAD', 'LEAD_CHANGES', 'TIMES_TIED',
+            'TEAM_TURNOVERS', 'TOTAL_TURNOVERS', 'TEAM_REBOUNDS', 'PTS_OFF_TO'
+        ), start=4)),
+    ), min_rows=2, max_rows=2),
+    RecordSet('Officials', _row_set(2), (
+        Field('OFFICIAL_ID', 0, is_int),
+        Field('FIRST_NAME', 1, is_text),
+        Field('LAST_NAME', 2, is_text),
+    )),
+    RecordSet('InactivePlayers', _row_set(3), (
+        Field('PLAYER_ID', 0, is_int),
+        Field('FIRST_NAME', 1, is_text),
+        Field('LAST_NAME', 2, is_text),
+        Field('TEAM_ID', 4, is_int),
+        Field('TEAM_ABBREVIATION', 7, is_text),
+    )),
+    RecordSet('GameInfo', _row_set(4), (
+        Field('ATTENDANCE', 1, is_int),
+        Field('GAME_TIME', 2, is_duration),
+    ), min_rows=1, max_rows=1),
+    RecordSet('LineScore', _row_set(5), (
+        Field('TEAM_ID', 3, is_int),
+        Field('TEAM_WINS_LOSSES', 7, is_record),
+        *(Field(f"PTS_QTR{quarter}", 7 + quarter, optional(is_int)) for quarter in range(1, 5)),
+        *(Field(f"PTS_OT{ot}", 11 + ot, optional(is_int)) for ot in range(1, 11)),
+        Field('PTS', 22, is_int),
+    ), min_rows=2, max_rows=2),
+    RecordSet('LastMeeting', _row_set(6), (
+        Field('LAST_GAME_ID', 1, is_game_id),
+        Field('LAST_GAME_DATE_EST', 2, is_timestamp),
+        Field('LAST_GAME_HOME_TEAM_ID', 3, is_int),
+        Field('LAST_GAME_HOME_TEAM_POINTS', 7, is_int),
+        Field('LAST_GAME_VISITOR_TEAM_ID', 8, is_int),
+        Field('LAST_GAME_VISITOR_TEAM_POINTS', 12, is_int),
+    ), min_rows=1, max_rows=1),
+    RecordSet('SeasonSeries', _row_set(7), (
+        Field('HOME_TEAM_WINS', 4, is_int),
+        Field('HOME_TEAM_LOSSES', 5, is_int),
+        Field('SERIES_LEADER', 6, optional(is_text)),
+    ), min_rows=1, max_rows=1),
+], checks=[('LineScore.TEAM_ID', _team_ids_match)])
+
+
+def _box_score_schema(endpoint, key):
+    """Schema for a V3 box score: both teams, their statistics and every player's."""
+    def teams(payload):
+        box_score = payload[key]
+        return [box_score['homeTeam'], box_score['awayTeam']]
+
+    def players(payload):
+        return [player for team in teams(payload) for player in team.get('players', [])]
+
+    return Schema(endpoint, [
+        RecordSet('teams', teams, (
+            Field('teamId', 'teamId', is_int),
+            Field('teamTricode', 'teamTricode', is_text),
+            Field('statistics', 'statistics', optional(is_statistics)),
+        )),
+        RecordSet('players', players, (
+            Field('personId', 'personId', is_int),
+            Field('firstName', 'firstName', is_text),
+            Field('familyName', 'familyName', is_text),
+            Field('statistics', 'statistics', optional(is_statistics)),
+        )),
+    ])
+
+
+BOX_SCORE_TRADITIONAL = _box_score_schema('BoxScoreTraditionalV3', 'boxScoreTraditional')
+BOX_SCORE_ADVANCED = _box_score_schema('BoxScoreAdvancedV3', 'boxScoreAdvanced')
+
+PLAY_BY_PLAY = Schema('PlayByPlayV3', [
+    RecordSet('actions', lambda payload: payload['game']['actions'], (
+        Field('period', 'period', optional(is_int)),
+        Field('clock', 'clock', optional(is_text)),
+        Field('personId', 'personId', optional(is_int)),
+        Field('scoreHome', 'scoreHome', optional(is_score)),
+        Field('scoreAway', 'scoreAway', optional(is_score)),
+    )),
+])
+
+# Endpoint name -> schema, as used by NBAApiClient
+SCHEMAS = {schema.endpoint: schema for schema in (
+    SCOREBOARD, SUMMARY, BOX_SCORE_TRADITIONAL, BOX_SCORE_ADVANCED, PLAY_BY_PLAY
+)}
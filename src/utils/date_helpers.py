@@ -0,0 +1,321 @@
+"""
+Date Helpers Module
+
+This module holds the NBA season calendar: for every season from 1946-47 to
+LAST_SEASON, the dates its preseason, regular season, play-in tournament,
+playoffs and Finals start and the day it ends. The calendar is precomputed
+once as a sorted table of phase start dates, so classifying a date is a
+binary search: bisect for a single date, and one np.searchsorted call for a
+whole array of dates (a pandas column, a NumPy array or a list), with no
+per-row Python.
+
+Seasons listed in SEASON_DATES (every season since 1996-97, when
+play-by-play data starts) use their actual dates where they differ from the
+typical ones that earlier and future seasons use (preseason from October 1,
+regular season from October 20, play-in from April 14 since 2020-21,
+playoffs from April 18, Finals from June 3, last day June 30). A season runs from July 1, or from
+the day after the previous season ended when that was later (2019-20).
+Dates between a season's last day and the next preseason have no game type.
+
+A game's type comes from its NBA game id prefix (GAME_ID_TYPES), which also
+identifies All-Star and NBA Cup final games the calendar cannot; the
+calendar is the fallback for ids with an unknown prefix.
+
+Example:
+    season_for_date(date(2025, 4, 16))     # "2024-2025"
+    game_type_for_date(date(2025, 4, 16))  # "Play-In"
+    game_type_for_game("0042400101", date(2025, 4, 20))  # "Playoffs"
+    df['Season'] = seasons(df['Date'])
+    df['Game Type'] = game_types(df['Date'])
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from functools import cache
+
+__all__ = [
+    'FIRST_SEASON', 'LAST_SEASON', 'PRESEASON', 'REGULAR_SEASON', 'PLAY_IN', 'PLAYOFFS', 'FINALS', 'PHASES',
+    'ALL_STAR', 'NBA_CUP', 'GAME_ID_TYPES', 'SEASON_DATES', 'season_label', 'season_for_date', 'phase_for_date',
+    'game_type_for_date', 'game_type_for_game', 'seasons', 'season_phases', 'game_types', 'game_types_for_games'
+]
+
+FIRST_SEASON = 1946
+LAST_SEASON = 2035
+
+# Season phases in calendar order; each is also a game type except the Finals (playoff games)
+PRESEASON = "Preseason"
+REGULAR_SEASON = "Regular Season"
+PLAY_IN = "Play-In"
+PLAYOFFS = "Playoffs"
+FINALS = "Finals"
+PHASES = (PRESEASON, REGULAR_SEASON, PLAY_IN, PLAYOFFS, FINALS)
+END = "end"  # key of a season's last day in SEASON_DATES
+
+# Game types that only a game id identifies
+ALL_STAR = "All-Star"
+NBA_CUP = "NBA Cup"
+
+# NBA game id prefix ("0022400773" -> "002") -> game type
+GAME_ID_TYPES = {
+    '001': PRESEASON,
+    '002': REGULAR_SEASON,
+    '003': ALL_STAR,
+    '004': PLAYOFFS,
+    '005': PLAY_IN,
+    '006': NBA_CUP,
+}
+
+# Season start year -> actual phase start dates (and last day) that differ from the typical ones;
+# every season since 1996-97 (the play-by-play era) is listed
+SEASON_DATES = {
+    1996: {REGULAR_SEASON: date(1996, 11, 1), PLAYOFFS: date(1997, 4, 24), FINALS: date(1997, 6, 1),
+           END: date(1997, 6, 13)},
+    1997: {REGULAR_SEASON: date(1997, 10, 31), PLAYOFFS: date(1998, 4, 23), FINALS: date(1998, 6, 3),
+           END: date(1998, 6, 14)},
+    1998: {PRESEASON: date(1999, 1, 21), REGULAR_SEASON: date(1999, 2, 5), PLAYOFFS: date(1999, 5, 8),
+           FINALS: date(1999, 6, 16), END: date(1999, 6, 25)},
+    1999: {REGULAR_SEASON: date(1999, 11, 2), PLAYOFFS: date(2000, 4, 22), FINALS: date(2000, 6, 7),
+           END: date(2000, 6, 19)},
+    2000: {REGULAR_SEASON: date(2000, 10, 31), PLAYOFFS: date(2001, 4, 21), FINALS: date(2001, 6, 6),
+           END: date(2001, 6, 15)},
+    2001: {REGULAR_SEASON: date(2001, 10, 30), PLAYOFFS: date(2002, 4, 20), FINALS: date(2002, 6, 5),
+           END: date(2002, 6, 12)},
+    2002: {REGULAR_SEASON: date(2002, 10, 29), PLAYOFFS: date(2003, 4, 19), FINALS: date(2003, 6, 4),
+           END: date(2003, 6, 15)},
+    2003: {REGULAR_SEASON: date(2003, 10, 28), PLAYOFFS: date(2004, 4, 17), FINALS: date(2004, 6, 6),
+           END: date(2004, 6, 15)},
+    2004: {REGULAR_SEASON: date(2004, 11, 2), PLAYOFFS: date(2005, 4, 23), FINALS: date(2005, 6, 9),
+           END: date(2005, 6, 23)},
+    2005: {REGULAR_SEASON: date(2005, 11, 1), PLAYOFFS: date(2006, 4, 22), FINALS: date(2006, 6, 8),
+           END: date(2006, 6, 20)},
+    2006: {REGULAR_SEASON: date(2006, 10, 31), PLAYOFFS: date(2007, 4, 21), FINALS: date(2007, 6, 7),
+           END: date(2007, 6, 14)},
+    2007: {REGULAR_SEASON: date(2007, 10, 30), PLAYOFFS: date(2008, 4, 19), FINALS: date(2008, 6, 5),
+           END: date(2008, 6, 17)},
+    2008: {REGULAR_SEASON: date(2008, 10, 28), PLAYOFFS: date(2009, 4, 18), FINALS: date(2009, 6, 4),
+           END: date(2009, 6, 14)},
+    2009: {REGULAR_SEASON: date(2009, 10, 27), PLAYOFFS: date(2010, 4, 17), FINALS: date(2010, 6, 3),
+           END: date(2010, 6, 17)},
+    2010: {REGULAR_SEASON: date(2010, 10, 26), PLAYOFFS: date(2011, 4, 16), FINALS: date(2011, 5, 31),
+           END: date(2011, 6, 12)},
+    2011: {PRESEASON: date(2011, 12, 16), REGULAR_SEASON: date(2011, 12, 25), PLAYOFFS: date(2012, 4, 28),
+           FINALS: date(2012, 6, 12), END: date(2012, 6, 21)},
+    2012: {REGULAR_SEASON: date(2012, 10, 30), PLAYOFFS: date(2013, 4, 20), FINALS: date(2013, 6, 6),
+           END: date(2013, 6, 20)},
+    2013: {REGULAR_SEASON: date(2013, 10, 29), PLAYOFFS: date(2014, 4, 19), FINALS: date(2014, 6, 5),
+           END: date(2014, 6, 15)},
+    2014: {REGULAR_SEASON: date(2014, 10, 28), PLAYOFFS: date(2015, 4, 18), FINALS: date(2015, 6, 4),
+           END: date(2015, 6, 16)},
+    2015: {REGULAR_SEASON: date(2015, 10, 27), PLAYOFFS: date(2016, 4, 16), FINALS: date(2016, 6, 2),
+           END: date(2016, 6, 19)},
+    2016: {REGULAR_SEASON: date(2016, 10, 25), PLAYOFFS: date(2017, 4, 15), FINALS: date(2017, 6, 1),
+           END: date(2017, 6, 12)},
+    2017: {REGULAR_SEASON: date(2017, 10, 17), PLAYOFFS: date(2018, 4, 14), FINALS: date(2018, 5, 31),
+           END: date(2018, 6, 8)},
+    2018: {REGULAR_SEASON: date(2018, 10, 16), PLAYOFFS: date(2019, 4, 13), FINALS: date(2019, 5, 30),
+           END: date(2019, 6, 13)},
+    2019: {REGULAR_SEASON: date(2019, 10, 22), PLAY_IN: date(2020, 8, 15), PLAYOFFS: date(2020, 8, 17),
+           FINALS: date(2020, 9, 30), END: date(2020, 10, 11)},
+    2020: {PRESEASON: date(2020, 12, 11), REGULAR_SEASON: date(2020, 12, 22), PLAY_IN: date(2021, 5, 18),
+           PLAYOFFS: date(2021, 5, 22), FINALS: date(2021, 7, 6), END: date(2021, 7, 20)},
+    2021: {REGULAR_SEASON: date(2021, 10, 19), PLAY_IN: date(2022, 4, 12), PLAYOFFS: date(2022, 4, 16),
+           FINALS: date(2022, 6, 2), END: date(2022, 6, 16)},
+    2022: {REGULAR_SEASON: date(2022, 10, 18), PLAY_IN: date(2023, 4, 11), PLAYOFFS: date(2023, 4, 15),
+           FINALS: date(2023, 6, 1), END: date(2023, 6, 12)},
+    2023: {REGULAR_SEASON: date(2023, 10, 24), PLAY_IN: date(2024, 4, 16), PLAYOFFS: date(2024, 4, 20),
+           FINALS: date(2024, 6, 6), END: date(2024, 6, 17)},
+    2024: {REGULAR_SEASON: date(2024, 10, 22), PLAY_IN: date(2025, 4, 15), PLAYOFFS: date(2025, 4, 19),
+           FINALS: date(2025, 6, 5), END: date(2025, 6, 22)},
+    2025: {REGULAR_SEASON: date(2025, 10, 21), PLAY_IN: date(2026, 4, 14), PLAYOFFS: date(2026, 4, 18)},
+}
+
+
+def _typical_dates(year):
+    """Phase start dates and last day of a season without actual dates."""
+    return {
+        PRESEASON: date(year, 10, 1),
+        REGULAR_SEASON: date(year, 10, 20),
+        PLAY_IN: date(year + 1, 4, 14) if year >= 2020 else None,
+        PLAYOFFS: date(year + 1, 4, 18),
+        FINALS: date(year + 1, 6, 3),
+        END: date(year + 1, 6, 30),
+    }
+
+
+def _build_calendar():
+    """Return the sorted (start date, season start year, phase) segments of every season."""
+    segments = []
+    previous_end = None
+    for year in range(FIRST_SEASON, LAST_SEASON + 1):
+        dates = {**_typical_dates(year), **SEASON_DATES.get(year, {})}
+        season_start = date(year, 7, 1)
+        if previous_end is not None and previous_end >= season_start:
+            season_start = previous_end + timedelta(days=1)
+        segments.append((season_start, year, None))  # offseason before the preseason
+        segments += [(dates[phase], year, phase) for phase in PHASES if dates[phase] is not None]
+        segments.append((dates[END] + timedelta(days=1), year, None))  # offseason after the Finals
+        previous_end = dates[END]
+    segments.append((date(LAST_SEASON + 1, 7, 1), None, None))  # after the calendar
+    starts = [start for start, _, _ in segments]
+    assert starts == sorted(starts), "season calendar phases overlap"
+    return segments
+
+
+_CALENDAR = _build_calendar()
+_STARTS = [start for start, _, _ in _CALENDAR]
+_SEASON_LABELS = {str(year): f"{year}-{year + 1}" for year in range(FIRST_SEASON, LAST_SEASON + 1)}
+
+
+def season_label(season):
+    """
+    Normalize a season to "YYYY-YYYY" format.
+
+    Args:
+        season (str or int): Start year (2024 or "2024") or a short or full
+            label ("2024-25", "2024-2025")
+
+    Returns:
+        str: Season label (e.g., "2024-2025")
+    """
+    start_year = str(season)[:4]
+    label = _SEASON_LABELS.get(start_year)
+    return label if label is not None else f"{start_year}-{int(start_year) + 1}"
+
+
+def _segment(value):
+    """Return the calendar segment containing a date, or None outside the calendar."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    elif isinstance(value, datetime):
+        value = value.date()
+    index = bisect_right(_STARTS, value) - 1
+    return _CALENDAR[index] if 0 <= index < len(_CALENDAR) - 1 else None
+
+
+def season_for_date(value):
+    """
+    Return the season a date falls in.
+
+    Args:
+        value (date, datetime or str): Date (str in YYYY-MM-DD format)
+
+    Returns:
+        str: Season label (e.g., "2024-2025"), or None outside FIRST_SEASON..LAST_SEASON
+    """
+    segment = _segment(value)
+    return _SEASON_LABELS[str(segment[1])] if segment else None
+
+
+def phase_for_date(value):
+    """Return the PHASES entry a date falls in, or None in the offseason."""
+    segment = _segment(value)
+    return segment[2] if segment else None
+
+
+def game_type_for_date(value):
+    """
+    Return the type of a game played on a date.
+
+    Args:
+        value (date, datetime or str): Date (str in YYYY-MM-DD format)
+
+    Returns:
+        str: "Preseason", "Regular Season", "Play-In" or "Playoffs" (Finals
+            included), or None in the offseason
+    """
+    phase = phase_for_date(value)
+    return PLAYOFFS if phase == FINALS else phase
+
+
+def game_type_for_game(game_id, game_date):
+    """
+    Return a game's type from its game id prefix, or its date when the prefix is unknown.
+
+    Args:
+        game_id (str): NBA API game ID (e.g., "0042400101")
+        game_date (date, datetime or str): Date the game was played
+
+    Returns:
+        str: A GAME_ID_TYPES value, or None for an unknown prefix in the offseason
+    """
+    game_type = GAME_ID_TYPES.get(str(game_id)[:3])
+    return game_type if game_type is not None else game_type_for_date(game_date)
+
+
+@cache
+def _calendar_arrays():
+    """The calendar as NumPy arrays: segment starts, season labels and phases ('' in the offseason)."""
+    import numpy as np
+
+    starts = np.array(_STARTS, dtype='datetime64[D]')
+    labels = np.array([_SEASON_LABELS.get(str(year), '') for _, year, _ in _CALENDAR])
+    phases = np.array([phase or '' for _, _, phase in _CALENDAR])
+    return starts, labels, phases
+
+
+def _lookup(dates, column):
+    """Map dates to a calendar column ('season' or 'phase') with one searchsorted call; '' outside it."""
+    import numpy as np
+
+    starts, labels, phases = _calendar_arrays()
+    days = np.asarray(dates).astype('datetime64[D]', copy=False)
+    index = np.searchsorted(starts, days, side='right') - 1
+    known = (index >= 0) & ~np.isnat(days)
+    table = labels if column == 'season' else phases
+    return np.where(known, table[np.maximum(index, 0)], '')
+
+
+def seasons(dates):
+    """
+    Map an array of dates to season labels.
+
+    Args:
+        dates (array-like): Dates as a pandas Series, NumPy datetime64 array,
+            or list of date objects or YYYY-MM-DD strings
+
+    Returns:
+        np.ndarray: Season label per date ('' for missing dates and dates outside the calendar)
+    """
+    return _lookup(dates, 'season')
+
+
+def season_phases(dates):
+    """Map an array of dates to PHASES entries ('' in the offseason); see seasons for accepted input."""
+    return _lookup(dates, 'phase')
+
+
+def game_types(dates):
+    """
+    Map an array of dates to game types.
+
+    Args:
+        dates (array-like): Dates (see seasons)
+
+    Returns:
+        np.ndarray: "Preseason", "Regular Season", "Play-In" or "Playoffs"
+            (Finals included) per date ('' in the offseason)
+    """
+    import numpy as np
+
+    phases = season_phases(dates)
+    return np.where(phases == FINALS, PLAYOFFS, phases)
+
+
+def game_types_for_games(game_ids, dates):
+    """
+    Map arrays of game ids and dates to game types (see game_type_for_game).
+
+    Args:
+        game_ids (array-like): NBA API game IDs
+        dates (array-like): Game dates (see seasons)
+
+    Returns:
+        np.ndarray: Game type per game ('' for an unknown prefix in the offseason)
+    """
+    import numpy as np
+
+    prefixes = np.asarray(game_ids, dtype='U3')
+    result = game_types(dates).astype('U14')
+    for prefix, game_type in GAME_ID_TYPES.items():
+        result[prefixes == prefix] = game_type
+    return result
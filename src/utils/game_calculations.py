@@ -6,7 +6,12 @@ of game data, including series records, team performance metrics,
 and other statistical calculations.
 """
 
-__all__ = ['format_season', 'calculate_series_stats']
+from src.utils.date_helpers import season_label
+
+# numpy and pandas are imported by the batch functions only, so importing
+# format_season stays cheap
+__all__ = ['format_season', 'calculate_series_stats', 'calculate_series_stats_batch',
+           'reconstruct_series_progression']
 
 def format_season(season_start_year):
     """
@@ -24,9 +29,7 @@ def format_season(season_start_year):
         >>> format_season(2023)
         "2023-2024"
     """
-    start_year = str(season_start_year)
-    end_year = str(int(start_year) + 1)
-    return f"{start_year}-{end_year}"
+    return season_label(season_start_year)
 
 def calculate_series_stats(home_score, away_score, postgame_home_wins, postgame_home_losses, postgame_leader,
                          home_team_abbrev, away_team_abbrev):
@@ -76,4 +79,124 @@ def calculate_series_stats(home_score, away_score, postgame_home_wins, postgame_
         'pregame_home_losses': pregame_home_losses,
         'pregame_leader': pregame_leader,
         'pregame_series_record': pregame_series_record
-    } 
\ No newline at end of file
+    }
+
+
+def calculate_series_stats_batch(home_scores, away_scores, postgame_home_wins, postgame_home_losses,
+                                 home_team_abbrevs, away_team_abbrevs):
+    """
+    Vectorized version of calculate_series_stats for many games at once.
+    
+    Args:
+        home_scores (array-like): Final home team scores
+        away_scores (array-like): Final away team scores
+        postgame_home_wins (array-like): Home team series wins after each game
+        postgame_home_losses (array-like): Home team series losses after each game
+        home_team_abbrevs (array-like): Home team abbreviations
+        away_team_abbrevs (array-like): Away team abbreviations
+        
+    Returns:
+        pd.DataFrame: One row per game with columns pregame_home_wins,
+            pregame_home_losses, pregame_leader and pregame_series_record
+            
+    Examples:
+        >>> calculate_series_stats_batch([149], [148], [2], [2], ["NYK"], ["ATL"]).iloc[0].tolist()
+        [1, 2, 'ATL', '1-2']
+    """
+    import numpy as np
+    import pandas as pd
+    
+    home_scores = np.asarray(home_scores)
+    away_scores = np.asarray(away_scores)
+    postgame_home_wins = np.asarray(postgame_home_wins, dtype=np.int64)
+    postgame_home_losses = np.asarray(postgame_home_losses, dtype=np.int64)
+    
+    # Remove this game's result where it is already included in the postgame stats
+    home_won = home_scores > away_scores
+    away_won = away_scores > home_scores
+    pregame_home_wins = postgame_home_wins - (home_won & (postgame_home_wins > 0))
+    pregame_home_losses = postgame_home_losses - (away_won & (postgame_home_losses > 0))
+    
+    pregame_leader = np.select(
+        [pregame_home_wins > pregame_home_losses, pregame_home_wins < pregame_home_losses],
+        [np.asarray(home_team_abbrevs, dtype=object), np.asarray(away_team_abbrevs, dtype=object)],
+        default="Tied"
+    )
+    
+    result = pd.DataFrame({
+        'pregame_home_wins': pregame_home_wins,
+        'pregame_home_losses': pregame_home_losses,
+        'pregame_leader': pregame_leader,
+    })
+    result['pregame_series_record'] = (
+        result['pregame_home_wins'].astype(str) + '-' + result['pregame_home_losses'].astype(str)
+    )
+    return result
+
+def reconstruct_series_progression(games):
+    """
+    Lay out season series from the API's postgame series records in one vectorized pass.
+    
+    Each game's postgame record comes from the NBA API and counts every
+    meeting of the season, not only the stored ones, so the pregame record
+    is that record without the game itself. Games are grouped by (season,
+    team pair) and ordered by date; the meeting number is the game's place
+    in the whole series, and unseen_before counts the meetings since the
+    previous stored game of the series that are not stored.
+    
+    Args:
+        games (pd.DataFrame): Columns game_id, date, season, home_team_id,
+            away_team_id, home_score, away_score, postgame_home_wins,
+            postgame_home_losses (the API's record from the home team's
+            perspective), home_team_abbrev and away_team_abbrev
+            
+    Returns:
+        pd.DataFrame: game_id, season, home_team_id, away_team_id, meeting,
+            unseen_before and the pregame_/postgame_ home wins, losses,
+            leader and series record, ordered by series and date
+    """
+    import numpy as np
+    import pandas as pd
+    
+    home_abbrevs = games['home_team_abbrev'].to_numpy(dtype=object)
+    away_abbrevs = games['away_team_abbrev'].to_numpy(dtype=object)
+    pregame = calculate_series_stats_batch(
+        games['home_score'].to_numpy(), games['away_score'].to_numpy(),
+        games['postgame_home_wins'].to_numpy(), games['postgame_home_losses'].to_numpy(),
+        home_abbrevs, away_abbrevs,
+    )
+    
+    result = pd.DataFrame({
+        'game_id': games['game_id'].to_numpy(),
+        'season': games['season'].to_numpy(),
+        'home_team_id': games['home_team_id'].to_numpy(),
+        'away_team_id': games['away_team_id'].to_numpy(),
+        'date': games['date'].to_numpy(),
+    })
+    for column in pregame.columns:
+        result[column] = pregame[column].to_numpy()
+    result['postgame_home_wins'] = games['postgame_home_wins'].to_numpy(dtype=np.int64)
+    result['postgame_home_losses'] = games['postgame_home_losses'].to_numpy(dtype=np.int64)
+    wins, losses = result['postgame_home_wins'].to_numpy(), result['postgame_home_losses'].to_numpy()
+    result['postgame_leader'] = np.select([wins > losses, wins < losses], [home_abbrevs, away_abbrevs],
+                                          default="Tied")
+    result['postgame_series_record'] = (
+        result['postgame_home_wins'].astype(str) + '-' + result['postgame_home_losses'].astype(str)
+    )
+    
+    # Both directions of a pairing share a series; the API's totals place each game in it
+    result['low_id'] = np.minimum(result['home_team_id'], result['away_team_id'])
+    result['high_id'] = np.maximum(result['home_team_id'], result['away_team_id'])
+    pregame_total = result['pregame_home_wins'] + result['pregame_home_losses']
+    result['meeting'] = pregame_total + 1
+    result = result.sort_values(['season', 'low_id', 'high_id', 'date'], kind='stable')
+    previous_total = (
+        (result['postgame_home_wins'] + result['postgame_home_losses'])
+        .groupby([result['season'], result['low_id'], result['high_id']]).shift(1, fill_value=0)
+    )
+    result['unseen_before'] = (pregame_total.loc[result.index] - previous_total).clip(lower=0)
+    
+    columns = ['game_id', 'season', 'home_team_id', 'away_team_id', 'meeting', 'unseen_before']
+    columns += [f'{stage}_{column}' for stage in ('pregame', 'postgame')
+                for column in ('home_wins', 'home_losses', 'leader', 'series_record')]
+    return result[columns].reset_index(drop=True)
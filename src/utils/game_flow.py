@@ -0,0 +1,145 @@
+"""
+Game Flow Module
+
+This module derives game-flow metrics from play-by-play score series. All
+metrics (max leads, lead changes, ties, scoring runs and time leading) are
+computed with NumPy in one vectorized pass, and many games are processed
+together by concatenating their events and reducing per game.
+
+Metrics are stored in the GameFlow table when play-by-play is saved
+(FLOW_COLUMNS maps each metric to its column), so statistics read them
+without decoding events again.
+
+Example:
+    flow = compute_flow_metrics_batch([pbp.events for pbp in stored_games])
+    flow.loc[0, 'home_max_lead']
+    flow_columns(compute_flow_metrics(events))  # GameFlow column values
+"""
+
+import numpy as np
+import pandas as pd
+
+__all__ = ['FLOW_METRICS', 'FLOW_COLUMNS', 'compute_flow_metrics', 'compute_flow_metrics_batch', 'flow_columns']
+
+# Columns returned for each game (leads and runs in points, times in seconds)
+FLOW_METRICS = (
+    'home_max_lead', 'away_max_lead', 'lead_changes', 'times_tied',
+    'home_longest_run', 'away_longest_run',
+    'home_time_leading', 'away_time_leading', 'time_tied',
+)
+
+# Metric -> GameFlow column (lead_changes and times_tied hold the API's counts)
+FLOW_COLUMNS = {
+    **{metric: metric for metric in FLOW_METRICS},
+    'lead_changes': 'pbp_lead_changes',
+    'times_tied': 'pbp_times_tied',
+}
+
+
+def flow_columns(metrics):
+    """Map one game's metrics (a compute_flow_metrics dict or batch row) to GameFlow column values."""
+    return {column: int(metrics[metric]) for metric, column in FLOW_COLUMNS.items()}
+
+
+def compute_flow_metrics(events):
+    """
+    Compute game-flow metrics for a single game.
+
+    Args:
+        events (PlayByPlayEvents): The game's play-by-play events
+
+    Returns:
+        dict: Metric name -> value for every name in FLOW_METRICS
+    """
+    return compute_flow_metrics_batch([events]).iloc[0].to_dict()
+
+
+def compute_flow_metrics_batch(games):
+    """
+    Compute game-flow metrics for many games in one vectorized pass.
+
+    Every game is prefixed with a 0-0 tip-off state, then all score series are
+    concatenated and reduced per game with ufunc.reduceat / bincount.
+
+    Args:
+        games (list): PlayByPlayEvents (or any objects exposing home_score,
+            away_score and elapsed arrays), one per game
+
+    Returns:
+        pd.DataFrame: One row per input game (same order) with FLOW_METRICS columns
+    """
+    game_count = len(games)
+    if game_count == 0:
+        return pd.DataFrame(columns=list(FLOW_METRICS), dtype=np.int64)
+
+    lengths = np.array([len(game.home_score) + 1 for game in games], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    game_index = np.repeat(np.arange(game_count), lengths)
+    zero = np.zeros(1, dtype=np.int32)
+
+    home = np.concatenate([np.concatenate((zero, game.home_score.astype(np.int32))) for game in games])
+    away = np.concatenate([np.concatenate((zero, game.away_score.astype(np.int32))) for game in games])
+    elapsed = np.concatenate([np.concatenate((zero, np.asarray(game.elapsed, dtype=np.int32))) for game in games])
+
+    margin = home - away
+    state = np.sign(margin)
+    same_game = np.ones(len(margin), dtype=bool)
+    same_game[starts] = False  # first entry of each game has no predecessor
+
+    # Max leads from the margin extremes
+    home_max_lead = np.maximum.reduceat(margin, starts)
+    away_max_lead = -np.minimum.reduceat(margin, starts)
+
+    # Ties: moving into a tie from a non-tied state (the 0-0 tip-off is not counted)
+    previous_state = np.roll(state, 1)
+    tied = same_game & (state == 0) & (previous_state != 0)
+    times_tied = np.bincount(game_index[tied], minlength=game_count)
+
+    # Lead changes: the leader differs from the last non-tied leader in the same game
+    leading = state != 0
+    leader = state[leading]
+    leader_game = game_index[leading]
+    changed = np.zeros(len(leader), dtype=bool)
+    changed[1:] = (leader[1:] != leader[:-1]) & (leader_game[1:] == leader_game[:-1])
+    lead_changes = np.bincount(leader_game[changed], minlength=game_count)
+
+    # Time spent in each state, attributed to the state at the start of each interval
+    duration = np.where(same_game, elapsed - np.roll(elapsed, 1), 0).clip(min=0)
+    interval_state = np.where(same_game, previous_state, 0)
+    interval_game = game_index
+    home_time = np.bincount(interval_game, weights=duration * (interval_state > 0), minlength=game_count)
+    away_time = np.bincount(interval_game, weights=duration * (interval_state < 0), minlength=game_count)
+    tied_time = np.bincount(interval_game, weights=duration * (same_game & (interval_state == 0)),
+                            minlength=game_count)
+
+    # Scoring runs: consecutive scoring events by the same team
+    home_points = np.where(same_game, home - np.roll(home, 1), 0).clip(min=0)
+    away_points = np.where(same_game, away - np.roll(away, 1), 0).clip(min=0)
+    scoring = (home_points + away_points) > 0
+    home_longest_run = np.zeros(game_count, dtype=np.int64)
+    away_longest_run = np.zeros(game_count, dtype=np.int64)
+    if scoring.any():
+        scorer_is_home = home_points[scoring] > 0
+        points = np.where(scorer_is_home, home_points[scoring], away_points[scoring])
+        scorer_game = game_index[scoring]
+        run_start = np.ones(len(points), dtype=bool)
+        run_start[1:] = (scorer_is_home[1:] != scorer_is_home[:-1]) | (scorer_game[1:] != scorer_game[:-1])
+        run_starts = np.flatnonzero(run_start)
+        run_points = np.add.reduceat(points, run_starts)
+        run_game = scorer_game[run_starts]
+        run_is_home = scorer_is_home[run_starts]
+        np.maximum.at(home_longest_run, run_game[run_is_home], run_points[run_is_home])
+        np.maximum.at(away_longest_run, run_game[~run_is_home], run_points[~run_is_home])
+
+    tenths_to_seconds = 10
+    return pd.DataFrame({
+        'home_max_lead': home_max_lead.astype(np.int64),
+        'away_max_lead': away_max_lead.astype(np.int64),
+        'lead_changes': lead_changes.astype(np.int64),
+        'times_tied': times_tied.astype(np.int64),
+        'home_longest_run': home_longest_run,
+        'away_longest_run': away_longest_run,
+        'home_time_leading': (home_time // tenths_to_seconds).astype(np.int64),
+        'away_time_leading': (away_time // tenths_to_seconds).astype(np.int64),
+        'time_tied': (tied_time // tenths_to_seconds).astype(np.int64),
+    })
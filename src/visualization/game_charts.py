@@ -0,0 +1,289 @@
+"""
+Game Charts Module
+
+This module builds the per-game charts shown with a game's memories:
+quarter-by-quarter scoring, the score margin over the course of the game and
+a side-by-side team comparison. Each figure is built from columnar inputs
+(one sequence per series) rather than ORM rows, and rendered charts are
+cached by (game_id, chart_type, data_version): in memory for the process and
+as Plotly figure JSON in the rendered_charts table. The data version is a
+fingerprint of the rows a chart is drawn from, so reopening a game reuses
+the stored figure and only a stats refresh that changes those rows causes
+a rebuild.
+
+Example:
+    figure = game_chart(session, "0022400773", 'margin')
+    st.plotly_chart(figure)
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy.dialects.sqlite import insert
+
+from src.data.database_models import Game, PlayByPlay, QuarterScores, RenderedChart, TeamStats
+
+__all__ = [
+    'CHART_TYPES', 'TEAM_COMPARISON_STATS', 'quarter_scores_figure', 'margin_figure', 'team_comparison_figure',
+    'chart_data_version', 'game_chart', 'clear_chart_cache'
+]
+
+# Bump when the figure builders change so stored renderings are replaced
+RENDER_VERSION = 1
+
+# Rendered figures kept in memory per process (the table holds the rest)
+MAX_CACHED_FIGURES = 64
+
+HOME_COLOR = '#007A33'
+AWAY_COLOR = '#8C8C8C'
+
+# TeamStats column -> label, in display order
+TEAM_COMPARISON_STATS = {
+    'paint_points': "Points in Paint",
+    'second_chance_points': "Second Chance Points",
+    'fast_break_points': "Fast Break Points",
+    'points_off_to': "Points off Turnovers",
+    'team_rebounds': "Team Rebounds",
+    'total_turnovers': "Turnovers",
+}
+
+_figures = OrderedDict()  # (game_id, chart_type, data_version) -> figure dict
+
+
+def quarter_scores_figure(periods, home_points, away_points, home_name, away_name):
+    """
+    Build a grouped bar chart of points per period.
+
+    Args:
+        periods (list): Period labels ("Q1".."Q4", "OT1", ...)
+        home_points (sequence): Home points per period
+        away_points (sequence): Away points per period
+        home_name (str): Home team name
+        away_name (str): Away team name
+
+    Returns:
+        plotly.graph_objects.Figure: The chart
+    """
+    import plotly.graph_objects as go
+
+    figure = go.Figure([
+        go.Bar(name=away_name, x=list(periods), y=list(away_points), marker_color=AWAY_COLOR),
+        go.Bar(name=home_name, x=list(periods), y=list(home_points), marker_color=HOME_COLOR),
+    ])
+    figure.update_layout(title="Points by Period", barmode='group', yaxis_title="Points", legend_title_text="")
+    return figure
+
+
+def margin_figure(minutes, margin, home_name, away_name):
+    """
+    Build a step chart of the home team's lead over the course of the game.
+
+    Args:
+        minutes (sequence): Game minutes elapsed at each event
+        margin (sequence): Home minus away score after each event
+        home_name (str): Home team name
+        away_name (str): Away team name
+
+    Returns:
+        plotly.graph_objects.Figure: The chart
+    """
+    import plotly.graph_objects as go
+
+    figure = go.Figure(go.Scatter(
+        x=list(minutes), y=list(margin), mode='lines', line_shape='hv', line_color=HOME_COLOR,
+        fill='tozeroy', hovertemplate="%{x:.1f} min: %{y:+d}<extra></extra>"
+    ))
+    figure.add_hline(y=0, line_color=AWAY_COLOR, line_width=1)
+    figure.update_layout(
+        title="Score Margin", xaxis_title="Minutes",
+        yaxis_title=f"{home_name} lead (negative: {away_name} lead)"
+    )
+    return figure
+
+
+def team_comparison_figure(stats, home_values, away_values, home_name, away_name):
+    """
+    Build a horizontal grouped bar chart comparing team stats.
+
+    Args:
+        stats (list): Stat labels
+        home_values (sequence): Home value per stat
+        away_values (sequence): Away value per stat
+        home_name (str): Home team name
+        away_name (str): Away team name
+
+    Returns:
+        plotly.graph_objects.Figure: The chart
+    """
+    import plotly.graph_objects as go
+
+    figure = go.Figure([
+        go.Bar(name=away_name, y=list(stats), x=list(away_values), orientation='h', marker_color=AWAY_COLOR),
+        go.Bar(name=home_name, y=list(stats), x=list(home_values), orientation='h', marker_color=HOME_COLOR),
+    ])
+    figure.update_layout(title="Team Comparison", barmode='group', legend_title_text="",
+                         yaxis={'autorange': 'reversed'})
+    return figure
+
+
+def _quarter_scores_rows(session, game_id):
+    return (
+        session.query(QuarterScores.period, QuarterScores.home_score, QuarterScores.away_score)
+        .filter(QuarterScores.game_id == game_id)
+        .order_by(QuarterScores.id)
+        .all()
+    )
+
+
+def _quarter_scores_chart(rows, game):
+    periods, home_points, away_points = zip(*rows)
+    return quarter_scores_figure(periods, home_points, away_points, game.home_team, game.away_team)
+
+
+def _margin_rows(session, game_id):
+    from src.data.play_by_play import FORMAT_VERSION
+
+    # The compressed blob stands in for every event, so it is fingerprinted without decoding. A blob in
+    # an older layout counts as missing until a refresh re-fetches it.
+    return (
+        session.query(PlayByPlay.event_count, PlayByPlay.player_count, PlayByPlay.events_blob)
+        .filter(PlayByPlay.game_id == game_id, PlayByPlay.format_version == FORMAT_VERSION)
+        .all()
+    )
+
+
+def _margin_chart(rows, game):
+    from src.data.play_by_play import PlayByPlayEvents
+
+    events = PlayByPlayEvents.from_blob(rows[0].events_blob, rows[0].event_count, rows[0].player_count)
+    return margin_figure(events.elapsed / 600, events.margin, game.home_team, game.away_team)
+
+
+def _team_comparison_rows(session, game_id):
+    return (
+        session.query(TeamStats.team_id, *[getattr(TeamStats, column) for column in TEAM_COMPARISON_STATS])
+        .filter(TeamStats.game_id == game_id)
+        .order_by(TeamStats.team_id)
+        .all()
+    )
+
+
+def _team_comparison_chart(rows, game):
+    home = next((row[1:] for row in rows if row[0] == game.home_team_id), None)
+    away = next((row[1:] for row in rows if row[0] != game.home_team_id), None)
+    if home is None or away is None:
+        return None
+    return team_comparison_figure(
+        list(TEAM_COMPARISON_STATS.values()),
+        [value or 0 for value in home], [value or 0 for value in away], game.home_team, game.away_team
+    )
+
+
+# chart_type -> (query for the source rows, builder taking those rows and the game's teams)
+CHART_TYPES = {
+    'quarter_scores': (_quarter_scores_rows, _quarter_scores_chart),
+    'margin': (_margin_rows, _margin_chart),
+    'team_comparison': (_team_comparison_rows, _team_comparison_chart),
+}
+
+
+def _fingerprint(rows):
+    digest = hashlib.sha1(str(RENDER_VERSION).encode())
+    for row in rows:
+        for value in row:
+            digest.update(value if isinstance(value, bytes) else repr(value).encode())
+            digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+def chart_data_version(session, game_id, chart_type):
+    """
+    Return the fingerprint of the rows a game chart is drawn from.
+
+    Args:
+        session: SQLAlchemy session
+        game_id (str): NBA API game ID
+        chart_type (str): Key of CHART_TYPES
+
+    Returns:
+        str: Hex digest that changes whenever the chart's source rows change
+
+    Raises:
+        ValueError: If chart_type is not a chart type
+    """
+    if chart_type not in CHART_TYPES:
+        raise ValueError(f"Unknown chart type: {chart_type}")
+    query, _ = CHART_TYPES[chart_type]
+    return _fingerprint(query(session, game_id))
+
+
+def _remember(key, figure):
+    _figures[key] = figure
+    _figures.move_to_end(key)
+    while len(_figures) > MAX_CACHED_FIGURES:
+        _figures.popitem(last=False)
+
+
+def game_chart(session, game_id, chart_type):
+    """
+    Return a game chart, rendering and storing it only if its data changed.
+
+    Lookups go to the in-memory cache, then the rendered_charts table, and
+    only then to the builder. A new rendering replaces the game's stored
+    chart of that type (commit the session to keep it).
+
+    Args:
+        session: SQLAlchemy session
+        game_id (str): NBA API game ID
+        chart_type (str): Key of CHART_TYPES
+
+    Returns:
+        dict: Plotly figure (as accepted by st.plotly_chart), or None if the
+            game has no data for the chart
+
+    Raises:
+        ValueError: If chart_type is not a chart type
+    """
+    if chart_type not in CHART_TYPES:
+        raise ValueError(f"Unknown chart type: {chart_type}")
+    query, build = CHART_TYPES[chart_type]
+    rows = query(session, game_id)
+    if not rows:
+        return None
+    data_version = _fingerprint(rows)
+    key = (game_id, chart_type, data_version)
+
+    if key in _figures:
+        _figures.move_to_end(key)
+        return _figures[key]
+
+    stored = (
+        session.query(RenderedChart.figure_json)
+        .filter_by(game_id=game_id, chart_type=chart_type, data_version=data_version)
+        .scalar()
+    )
+    if stored is None:
+        game = session.query(Game.home_team, Game.away_team, Game.home_team_id).filter_by(game_id=game_id).one()
+        figure = build(rows, game)
+        if figure is None:
+            return None
+        stored = figure.to_json()
+        statement = insert(RenderedChart).values(
+            game_id=game_id, chart_type=chart_type, data_version=data_version, figure_json=stored,
+            rendered_at=datetime.now()
+        )
+        session.execute(statement.on_conflict_do_update(
+            index_elements=['game_id', 'chart_type'],
+            set_={column: statement.excluded[column] for column in ('data_version', 'figure_json', 'rendered_at')},
+        ))
+
+    figure = json.loads(stored)
+    _remember(key, figure)
+    return figure
+
+
+def clear_chart_cache():
+    """Forget the figures cached in memory (stored renderings are kept)."""
+    _figures.clear()
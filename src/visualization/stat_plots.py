@@ -0,0 +1,220 @@
+"""
+Stat Plots Module
+
+This module draws trend plots across a whole attendance history. Series are
+aggregated server-side with NumPy before anything is handed to Plotly:
+trailing rolling means, per-season bins, and Largest-Triangle-Three-Buckets
+(LTTB) downsampling that keeps the visual shape of a long series (peaks,
+troughs and turning points) with at most MAX_PLOT_POINTS points per trace.
+Plots over thousands of games therefore send a bounded payload to the
+browser and stay interactive.
+
+Example:
+    series = team_series(engine.games(team_id), team_id)
+    figure = trend_figure(series['date'], series['margin'], "Margin", window=10)
+    st.plotly_chart(figure)
+"""
+
+import numpy as np
+
+from src.utils.date_helpers import seasons
+
+__all__ = [
+    'MAX_PLOT_POINTS', 'TREND_STATS', 'team_series', 'rolling_mean', 'season_bins', 'lttb_indices',
+    'trend_figure', 'season_figure'
+]
+
+# Most points sent to the frontend per trace
+MAX_PLOT_POINTS = 1000
+
+# team_series column -> label
+TREND_STATS = {
+    'points': "Points Scored",
+    'opponent_points': "Points Allowed",
+    'margin': "Point Margin",
+    'total_points': "Total Points",
+}
+
+
+def team_series(games, team_id):
+    """
+    Convert a team's games into column arrays from the team's point of view.
+
+    Args:
+        games (list of GameRecord): The team's games in date order
+        team_id (int): NBA team id
+
+    Returns:
+        dict: NumPy arrays 'date' (datetime64[D]), 'season' (from the season
+            calendar where a game has none stored), 'points',
+            'opponent_points', 'margin', 'total_points' and 'won'
+    """
+    is_home = np.fromiter((game.home_team_id == team_id for game in games), dtype=bool, count=len(games))
+    home_score = np.fromiter((game.home_score or 0 for game in games), dtype=np.int32, count=len(games))
+    away_score = np.fromiter((game.away_score or 0 for game in games), dtype=np.int32, count=len(games))
+    points = np.where(is_home, home_score, away_score)
+    opponent_points = np.where(is_home, away_score, home_score)
+    dates = np.array([game.date for game in games], dtype='datetime64[D]')
+    stored_seasons = np.array([game.season or '' for game in games])
+    return {
+        'date': dates,
+        'season': np.where(stored_seasons == '', seasons(dates), stored_seasons),
+        'points': points,
+        'opponent_points': opponent_points,
+        'margin': points - opponent_points,
+        'total_points': points + opponent_points,
+        'won': points > opponent_points,
+    }
+
+
+def rolling_mean(values, window):
+    """
+    Compute a trailing rolling mean in O(n) with cumulative sums.
+
+    The first window - 1 positions average the values available so far,
+    like pandas' rolling(window, min_periods=1).mean().
+
+    Args:
+        values (array-like): Series values
+        window (int): Window length in points
+
+    Returns:
+        np.ndarray: Rolling means (float64), same length as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    totals = np.cumsum(values)
+    totals[window:] = totals[window:] - totals[:-window]
+    counts = np.minimum(np.arange(1, len(values) + 1), window)
+    return totals / counts
+
+
+def season_bins(seasons, values, statistic='mean'):
+    """
+    Aggregate values per season.
+
+    Args:
+        seasons (array-like): Season label per value (e.g. "2024-25")
+        values (array-like): Series values
+        statistic (str): 'mean', 'sum' or 'count'
+
+    Returns:
+        tuple: (season labels in order, aggregated values as np.ndarray)
+
+    Raises:
+        ValueError: If statistic is not supported
+    """
+    if statistic not in ('mean', 'sum', 'count'):
+        raise ValueError(f"Unknown statistic: {statistic}")
+    labels, index = np.unique(np.asarray(seasons), return_inverse=True)
+    counts = np.bincount(index, minlength=len(labels))
+    if statistic == 'count':
+        return labels, counts
+    sums = np.bincount(index, weights=np.asarray(values, dtype=np.float64), minlength=len(labels))
+    return labels, (sums if statistic == 'sum' else sums / counts)
+
+
+def lttb_indices(x, y, max_points=MAX_PLOT_POINTS):
+    """
+    Select the points of a series to keep with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into max_points - 2 buckets, and from each bucket the point
+    forming the largest triangle with the previously kept point and the
+    average of the next bucket is kept. Bucket averages and triangle areas
+    are computed with NumPy; the only Python loop is over buckets.
+
+    Args:
+        x (array-like): Increasing x values (numbers or datetime64)
+        y (array-like): y values
+        max_points (int): Most points to keep (at least 3)
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[s]').astype(np.int64)
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    count = len(x)
+    if count <= max_points or max_points < 3:
+        return np.arange(count)
+
+    buckets = max_points - 2
+    edges = np.linspace(1, count - 1, buckets + 1).astype(np.intp)
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[:count - 1], edges[:-1]) / sizes
+    mean_y = np.add.reduceat(y[:count - 1], edges[:-1]) / sizes
+    # Each bucket looks ahead to the next bucket's average (the last point for the final bucket)
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    kept = np.empty(max_points, dtype=np.intp)
+    kept[0], kept[-1] = 0, count - 1
+    previous = 0
+    for bucket in range(buckets):
+        start, end = edges[bucket], edges[bucket + 1]
+        area = np.abs(
+            (x[previous] - next_x[bucket]) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y[bucket] - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def trend_figure(dates, values, label, window=10, max_points=MAX_PLOT_POINTS):
+    """
+    Plot a per-game series with its rolling mean, both downsampled.
+
+    Args:
+        dates (np.ndarray): Game dates (datetime64), in order
+        values (np.ndarray): Value per game
+        label (str): Series label
+        window (int): Rolling window in games
+        max_points (int): Most points per trace
+
+    Returns:
+        plotly.graph_objects.Figure: The chart
+    """
+    import plotly.graph_objects as go
+
+    dates = np.asarray(dates)
+    values = np.asarray(values)
+    trend = rolling_mean(values, window)
+    raw = lttb_indices(dates, values, max_points)
+    smooth = lttb_indices(dates, trend, max_points)
+
+    figure = go.Figure([
+        go.Scatter(x=dates[raw], y=values[raw], mode='markers', name=label,
+                   marker={'size': 5, 'opacity': 0.4}),
+        go.Scatter(x=dates[smooth], y=trend[smooth], mode='lines', name=f"{window}-game average"),
+    ])
+    figure.update_layout(yaxis_title=label, legend_title_text="")
+    if len(raw) < len(values):
+        figure.update_layout(title=f"{label} ({len(values):,} games, {len(raw):,} points shown)")
+    return figure
+
+
+def season_figure(seasons, values, label, statistic='mean'):
+    """
+    Plot a series aggregated per season as bars.
+
+    Args:
+        seasons (array-like): Season label per value
+        values (array-like): Series values
+        label (str): Series label
+        statistic (str): 'mean', 'sum' or 'count' (see season_bins)
+
+    Returns:
+        plotly.graph_objects.Figure: The chart
+    """
+    import plotly.graph_objects as go
+
+    labels, aggregated = season_bins(seasons, values, statistic)
+    figure = go.Figure(go.Bar(x=labels, y=aggregated, name=label))
+    figure.update_layout(xaxis_title="Season", yaxis_title=f"{label} ({statistic} per season)",
+                         xaxis={'type': 'category'})
+    return figure
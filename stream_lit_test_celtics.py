@@ -3,17 +3,21 @@ import importlib.util
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import re
 import time
+from src.data.http_session import get_http_client
+from src.utils.date_helpers import PLAY_IN, PLAYOFFS, game_type_for_date, seasons
+
+http = get_http_client()
 
 def fetch_html_for_date(date):
     formatted_date = datetime.strptime(date, "%Y-%m-%d")
     url = f"https://www.basketball-reference.com/boxscores/?month={formatted_date.month}&day={formatted_date.day}&year={formatted_date.year}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch data for {date}. Status code: {response.status_code}")
-    return response.text
+    try:
+        return http.get_text(url)
+    except requests.RequestException as e:
+        raise Exception(f"Failed to fetch data for {date}. Error: {e}")
 
 def parse_celtics_games(html):
     soup = BeautifulSoup(html, 'html.parser')
@@ -116,40 +120,46 @@ def parse_inactive_players_section(html):
 
     return inactive_data
 
-def fetch_game_details(url):
+BOX_SCORE_DATE = re.compile(r'/boxscores/(\d{4})(\d{2})(\d{2})')
+POSTSEASON_MARGIN = timedelta(days=7)  # how far the calendar's postseason start may be off
+PLAYOFF_ROUND = re.compile(
+    r'(NBA Finals|Conference Finals|First Round|Second Round|Play-In Tournament),?\s*Game (\d+)', re.IGNORECASE
+)
+
+def fetch_game_details(url, html=None):
     """
-    Fetch and parse game details to determine if it's a playoff game
-    and extract the round and game number if applicable.
+    Classify a box score's game type from its date and, for play-in and
+    playoff games, extract the round and game number.
+
+    The type comes from the season calendar, so regular season games need no
+    page at all; only postseason pages are fetched and searched for the round.
+    A page already in hand is also searched when the date falls within
+    POSTSEASON_MARGIN of the postseason start, and a round found there makes
+    it a postseason game, so a calendar that is a few days off does not
+    misclassify it.
     """
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch data. Status code: {response.status_code}")
-    
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Extract the top section of the page where the date and game info is located
-    top_text = soup.text.strip()  # Get the entire page text
-    playoff_match = re.search(
-        r'(NBA Finals|Conference Finals|First Round|Second Round|Play-In Tournament),?\s*Game (\d+)', 
-        top_text, 
-        re.IGNORECASE
-    )
-
+    year, month, day = BOX_SCORE_DATE.search(url).groups()
+    game_date = date(int(year), int(month), int(day))
+    game_type = game_type_for_date(game_date)
+    details = {"game_type": game_type, "is_playoff": game_type in (PLAY_IN, PLAYOFFS), "round": None,
+               "game_number": None}
+    near_postseason = game_type_for_date(game_date + POSTSEASON_MARGIN) in (PLAY_IN, PLAYOFFS)
+    if not details["is_playoff"] and not (near_postseason and html is not None):
+        return details
+
+    if html is None:
+        try:
+            html = http.get_text(url)
+        except requests.RequestException as e:
+            raise Exception(f"Failed to fetch data. Error: {e}")
+
+    playoff_match = PLAYOFF_ROUND.search(html)
     if playoff_match:
-        round_info = playoff_match.group(1)
-        game_number = int(playoff_match.group(2))
-        return {
-            "is_playoff": True,
-            "round": round_info,
-            "game_number": game_number
-        }
-    
-    # If no playoff information is found
-    return {
-        "is_playoff": False,
-        "round": None,
-        "game_number": None
-    }
+        details["round"] = playoff_match.group(1)
+        details["game_number"] = int(playoff_match.group(2))
+        details["game_type"] = PLAY_IN if playoff_match.group(1).lower() == "play-in tournament" else PLAYOFFS
+        details["is_playoff"] = True
+    return details
 
 def parse_team_totals(soup, team_abbr, table_id):
     """
@@ -169,16 +179,17 @@ def parse_team_totals(soup, team_abbr, table_id):
     return totals
 
 def parse_box_score(url):
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch box score. Status code: {response.status_code}")
+    try:
+        html = http.get_text(url)
+    except requests.RequestException as e:
+        raise Exception(f"Failed to fetch box score. Error: {e}")
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
     all_team_data = []
     team_totals = []
     
     # Get team abbreviations from line score DataFrame
-    line_score_df, _ = parse_line_score_and_four_factors(response.text)
+    line_score_df, _ = parse_line_score_and_four_factors(html)
 
     if line_score_df.empty:
         print("Warning: Line score DataFrame is empty. Cannot proceed.")
@@ -342,25 +353,26 @@ def parse_box_score_with_inactives_and_team_stats(url):
     stats_df, team_totals_df = parse_box_score(url)
 
     # Fetch the HTML content
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch box score. Status code: {response.status_code}")
+    try:
+        html = http.get_text(url)
+    except requests.RequestException as e:
+        raise Exception(f"Failed to fetch box score. Error: {e}")
     
     # Parse line score and four factors
-    line_score_df, four_factors_df = parse_line_score_and_four_factors(response.text)
+    line_score_df, four_factors_df = parse_line_score_and_four_factors(html)
 
     # Fetch playoff details and add to team_totals_df
-    playoff_details = fetch_game_details(url)
+    playoff_details = fetch_game_details(url, html)
     if "playoff_info" not in team_totals_df.columns:
         playoff_info = (
             f"{playoff_details['round']} Game {playoff_details['game_number']}"
-            if playoff_details["is_playoff"]
-            else "Regular Season"
+            if playoff_details["round"]
+            else playoff_details["game_type"] or "Regular Season"
         )
         team_totals_df["playoff_info"] = playoff_info
 
     # Extract inactive players
-    inactive_players = parse_inactive_players_section(response.text)
+    inactive_players = parse_inactive_players_section(html)
     inactive_df = pd.DataFrame(inactive_players)
 
     # Add missing columns to inactive players DataFrame
@@ -373,7 +385,7 @@ def parse_box_score_with_inactives_and_team_stats(url):
     full_data = pd.concat([stats_df, inactive_df], ignore_index=True)
 
     # Extract metadata
-    metadata = extract_game_metadata_with_regex(response.text)
+    metadata = extract_game_metadata_with_regex(html)
 
     # Separate active and inactive players
     active_players = full_data[full_data["role"] != "Inactive"].copy()
@@ -482,21 +494,6 @@ def get_celtics_games_and_stats(date):
     
     return pd.concat(all_stats, ignore_index=True)
 
-def determine_year_range(date):
-    """
-    Determine the NBA season year range based on the date.
-    """
-    if date.month >= 10:  # October, November, December
-        start_year = date.year
-        end_year = date.year + 1
-    elif date.month <= 6:  # January through June
-        start_year = date.year - 1
-        end_year = date.year
-    else:  # July, August, September
-        start_year = date.year
-        end_year = date.year + 1
-    return f"{start_year}-{end_year}"
-
 def process_dates(dates):
     """
     Process multiple dates to fetch and prepare Celtics game stats.
@@ -520,8 +517,8 @@ def process_dates(dates):
         # Add the current date as a column
         df['Date'] = pd.to_datetime(date)
 
-        # Add a Year Range column
-        df['Year'] = df['Date'].apply(determine_year_range)
+        # Add a Year Range column (season from the calendar, for the whole column at once)
+        df['Year'] = seasons(df['Date'])
         
         # Process game results
         if 'line_score_total' in df.columns:
@@ -0,0 +1,152 @@
+"""
+Shared resources for the Streamlit pages.
+
+Streamlit re-executes the entry script and the current page script on every
+rerun, but this module is imported once per app process. The database
+engine, API client, prefetcher, job queue and worker pool are therefore
+created once, and heavy dependencies (nba_api, pandas) are only imported
+by the resources and pages that use them.
+
+Example:
+    from app_resources import Session, get_api_client
+    client = get_api_client()  # imports nba_api on first use
+"""
+
+import gc
+import os
+import sys
+import time
+
+import streamlit as st
+from sqlalchemy.orm import close_all_sessions, sessionmaker
+
+# Add the project root to the Python path (once, not on every rerun)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from src.core.job_queue import JobQueue, WorkerPool, create_queue_engine
+from src.core.user_profile import ensure_default_user
+from src.data.database_models import Base
+from src.data.migrations import migrate
+from src.data.photo_store import PHOTO_ROOT, PhotoStore
+
+__all__ = [
+    'DATABASE_PATH', 'DATABASE_URL', 'PHOTO_ROOT', 'engine', 'Session', 'get_api_client', 'get_prefetcher',
+    'get_job_queue', 'get_worker_pool', 'get_photo_store', 'current_user_id', 'recreate_database'
+]
+
+# Initialize database connection
+DATABASE_PATH = 'basketball_tracker.db'
+DATABASE_URL = f'sqlite:///{DATABASE_PATH}'
+engine = create_queue_engine(DATABASE_URL)  # shared with background workers
+Base.metadata.create_all(engine)
+migrate(engine)  # upgrade tables created by earlier versions
+Session = sessionmaker(bind=engine)
+
+@st.cache_resource
+def get_api_client():
+    """
+    Return the NBA API client shared by every page and session.
+
+    The client's response cache is process-wide, so data fetched by
+    "Find Games" or "Test API" is reused when saving a game.
+    """
+    from src.data.nba_api_client import NBAApiClient
+    return NBAApiClient()
+
+@st.cache_resource
+def get_prefetcher():
+    """Return the background prefetcher that warms the shared API client's cache."""
+    from src.data.prefetch import Prefetcher
+    return Prefetcher(get_api_client(), max_workers=3)
+
+@st.cache_resource
+def get_job_queue():
+    """Return the background job queue stored in the app database."""
+    return JobQueue(DATABASE_URL, engine=engine)
+
+@st.cache_resource(on_release=WorkerPool.stop)
+def get_worker_pool():
+    """
+    Start the worker processes that run queued jobs (once per app process).
+
+    Jobs orphaned by a previous run of the app are re-queued on start, and
+    the workers are stopped when the cached pool is cleared.
+    """
+    return WorkerPool(DATABASE_URL, processes=2).start()
+
+@st.cache_resource
+def get_photo_store():
+    """Return the photo store (its thumbnail processes start on the first upload)."""
+    return PhotoStore(PHOTO_ROOT, processes=2)
+
+def current_user_id():
+    """
+    Return the id of the profile this browser session is using.
+
+    Starts on the default profile, which is created (and given any games
+    saved before profiles existed) on first use.
+    """
+    if 'user_id' not in st.session_state:
+        session = Session()
+        try:
+            st.session_state.user_id = ensure_default_user(session).id
+            session.commit()
+        finally:
+            session.close()
+    return st.session_state.user_id
+
+def recreate_database():
+    """
+    Recreate the database with the latest schema.
+    TODO: Remove this function before moving to production.
+    Only for development use to handle schema changes.
+
+    The workers and the cached job queue are released first so nothing
+    holds the old file; it is removed with its WAL files and rebuilt the
+    way the app builds it on start, on the shared WAL engine.
+    """
+    try:
+        # Stop the workers (on_release) and drop the queue bound to the old file
+        get_worker_pool.clear()
+        get_job_queue.clear()
+
+        # Close all sessions and connections
+        close_all_sessions()
+        engine.dispose()
+
+        # Sleep briefly to ensure connections are closed
+        time.sleep(1)
+
+        # Force Python garbage collection
+        gc.collect()
+
+        # Remove the existing database and its write-ahead log
+        for path in (DATABASE_PATH, f"{DATABASE_PATH}-wal", f"{DATABASE_PATH}-shm"):
+            if not os.path.exists(path):
+                continue
+            try:
+                os.remove(path)
+            except PermissionError:
+                st.error("Could not remove database - please close any other applications using it")
+                return
+            except Exception as e:
+                st.error(f"Error removing database: {str(e)}")
+                return
+        st.success("Existing database removed")
+
+        # Create the new database as on start; the engine reconnects to the new file
+        Base.metadata.create_all(engine)
+        migrate(engine)
+        st.success("New database created with updated schema")
+
+        # Forget ids that pointed into the old database
+        for key in ('user_id', 'backfill_job', 'pending_jobs'):
+            st.session_state.pop(key, None)
+
+        # Refresh the page to ensure clean state
+        st.rerun()
+
+    except Exception as e:
+        st.error(f"Error recreating database: {str(e)}")
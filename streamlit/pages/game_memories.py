@@ -0,0 +1,126 @@
+"""
+My Games page: the games you've attended with your seat and notes.
+"""
+
+import math
+from datetime import datetime
+
+import streamlit as st
+
+from app_resources import Session, current_user_id, get_job_queue, get_photo_store, get_worker_pool
+from src.core.game_search import SEARCH_PAGE_SIZE, search_games
+from src.data.database_models import Attendance, Game
+from src.data.photo_store import photo_page
+from src.visualization.game_charts import game_chart
+
+CHART_TABS = {'quarter_scores': "By Period", 'margin': "Margin", 'team_comparison': "Team Comparison"}
+
+def show_game_charts(session, game_id):
+    """Display a game's charts, reusing stored renderings when its data is unchanged."""
+    tabs = st.tabs(list(CHART_TABS.values()))
+    for tab, chart_type in zip(tabs, CHART_TABS):
+        with tab:
+            figure = game_chart(session, game_id, chart_type)
+            if figure is None:
+                st.info("No data for this chart yet")
+            else:
+                st.plotly_chart(figure, key=f"{chart_type}_{game_id}")
+    session.commit()  # keep any new renderings
+
+def show_game_photos(session, attendance):
+    """Upload your photos of a game you attended and browse them a page of thumbnails at a time."""
+    store = get_photo_store()
+    uploads = st.file_uploader(
+        "Add photos", type=['jpg', 'jpeg', 'png', 'gif', 'webp'], accept_multiple_files=True,
+        key=f"upload_{attendance.game_id}"
+    )
+    if uploads and st.button("Upload", key=f"upload_button_{attendance.game_id}"):
+        try:
+            with st.spinner("Creating thumbnails..."):
+                results = store.add_photos(session, attendance, [upload.getvalue() for upload in uploads])
+            session.commit()
+        except ValueError as e:
+            session.rollback()
+            st.error(str(e))
+        else:
+            added = sum(created for _, created in results)
+            st.success(f"Added {added} photos" + (f" ({len(results) - added} already here)" if added < len(results) else ""))
+
+    photos, pages = photo_page(session, attendance, page=0)
+    if pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, key=f"photo_page_{attendance.game_id}")
+        photos, _ = photo_page(session, attendance, page=page - 1)
+    if not photos:
+        st.info("No photos yet")
+        return
+    # Only this page's small thumbnails are sent; originals are never decoded here
+    columns = st.columns(4)
+    for index, photo in enumerate(photos):
+        with columns[index % 4]:
+            thumbnail = store.thumbnail(photo, 'medium')
+            if thumbnail is None:
+                st.caption(f"Photo unavailable: {photo.caption or photo.file_path}")
+            else:
+                st.image(thumbnail, caption=photo.caption)
+
+def show_search_results(session, query):
+    """Display ranked search results over notes, companions, players and officials."""
+    results, total = search_games(session, query, user_id=current_user_id())
+    if not total:
+        st.info("No games match your search")
+        return
+    pages = math.ceil(total / SEARCH_PAGE_SIZE)
+    if pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, key="search_page")
+        results, _ = search_games(session, query, page=page - 1, user_id=current_user_id())
+    st.caption(f"{total} matching games")
+    for result in results:
+        st.markdown(f"**{result['date']}: {result['home_team']} vs {result['away_team']}**  \n{result['snippet']}")
+
+def show_my_games():
+    """Display list of games you've attended."""
+    st.header("My Games")
+    
+    session = Session()
+    try:
+        query = st.text_input("Search", placeholder="Notes, companions, players, officials...")
+        if query.strip():
+            show_search_results(session, query)
+            return
+
+        games = (
+            session.query(Game, Attendance)
+            .join(Attendance, Attendance.game_id == Game.game_id)
+            .filter(Attendance.user_id == current_user_id())
+            .order_by(Game.date.desc())
+            .all()
+        )
+        
+        if games:
+            for game, attendance in games:
+                with st.expander(f"{game.date}: {game.home_team} vs {game.away_team}"):
+                    st.write(f"Score: {game.home_score} - {game.away_score}")
+                    st.write(f"Seat: Section {attendance.seat_section}, Row {attendance.seat_row}, "
+                             f"Seat {attendance.seat_number}")
+                    st.write(f"Attended with: {attendance.attended_with}")
+                    if attendance.notes:
+                        st.write(f"Notes: {attendance.notes}")
+                    if st.checkbox("Show charts", key=f"charts_{game.game_id}"):
+                        show_game_charts(session, game.game_id)
+                    if st.checkbox("Show photos", key=f"photos_{game.game_id}"):
+                        show_game_photos(session, attendance)
+                    if st.button("Refresh Stats", key=f"refresh_{game.game_id}"):
+                        # Picks up stat corrections; unchanged rows are not rewritten
+                        get_worker_pool()
+                        get_job_queue().enqueue(
+                            'refresh_game',
+                            {'game_id': game.game_id, 'force': True},
+                            dedupe_key=f"refresh_game:{game.game_id}:{datetime.now():%Y-%m-%d}"
+                        )
+                        st.success("Stats refresh queued")
+        else:
+            st.info("No games added yet. Use the 'Add Game' page to start tracking your games!")
+    finally:
+        session.close()
+
+show_my_games()
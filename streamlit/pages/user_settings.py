@@ -0,0 +1,54 @@
+"""
+Profiles page: create profiles and switch between them.
+
+Every profile sees only the games it attended; the games and their stats
+are stored once and shared by everyone who was there.
+"""
+
+import streamlit as st
+
+from app_resources import Session, current_user_id
+from src.core.user_profile import attendance_counts, create_user, list_users
+
+def show_profiles():
+    """List profiles and create new ones."""
+    st.header("Profiles")
+
+    session = Session()
+    try:
+        users = list_users(session)
+        counts = attendance_counts(session)
+    finally:
+        session.close()
+
+    user_id = current_user_id()
+    for user in users:
+        games = counts.get(user.id, 0)
+        label = f"**{user.display_name}** (@{user.username}): {games} game{'s' if games != 1 else ''}"
+        if user.id == user_id:
+            st.markdown(f"{label} (current)")
+        else:
+            col1, col2 = st.columns([4, 1])
+            col1.markdown(label)
+            if col2.button("Switch", key=f"switch_{user.id}"):
+                st.session_state.user_id = user.id
+                st.rerun()
+
+    st.subheader("New Profile")
+    with st.form("new_profile", clear_on_submit=True):
+        username = st.text_input("Username")
+        display_name = st.text_input("Display Name")
+        if st.form_submit_button("Create Profile"):
+            session = Session()
+            try:
+                user = create_user(session, username, display_name)
+                session.commit()
+                st.session_state.user_id = user.id
+                st.rerun()
+            except ValueError as e:
+                session.rollback()
+                st.error(str(e))
+            finally:
+                session.close()
+
+show_profiles()
@@ -0,0 +1,303 @@
+"""
+Statistics page: team records, trends and the best performances witnessed.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from app_resources import Session, current_user_id
+from src.core.game_tracker import TeamStatsEngine, load_game_records, season_series, data_version, game_type_counts
+from src.core.leaderboard import LEADERBOARD_STATS, top_performances
+from src.core.player_manager import most_seen_players
+from src.core.team_manager import TEAMS
+from src.core.venue_manager import venue_splits
+from src.visualization.stat_plots import TREND_STATS, season_figure, team_series, trend_figure
+
+@st.cache_resource(max_entries=8)
+def get_stats_engine(user_id, version, game_type=None):
+    """
+    Build the team statistics engine for a user's games, precomputed per team.
+    
+    Cached per (user, data version, game type) and shared across reruns and
+    sessions, so switching teams is a lookup and a new save invalidates the
+    cache.
+    """
+    session = Session()
+    try:
+        engine = TeamStatsEngine(load_game_records(session, user_id=user_id, game_type=game_type))
+    finally:
+        session.close()
+    return engine.precompute()
+
+@st.cache_resource(max_entries=8)
+def get_season_series(user_id, version, team_id):
+    """Where each of the user's regular-season games for a team sits in its season series, cached like the engine."""
+    session = Session()
+    try:
+        return season_series(session, team_id, user_id=user_id)
+    finally:
+        session.close()
+
+def format_record(wins, losses):
+    """Format a win-loss record with its win percentage."""
+    games = wins + losses
+    return f"{wins}-{losses}", f"{(wins / games * 100 if games else 0):.1f}%"
+
+def show_statistics():
+    """Show a team-focused statistics dashboard about attended games."""
+    user_id = current_user_id()
+    session = Session()
+    try:
+        version = data_version(session, user_id=user_id)
+        type_counts = game_type_counts(session, user_id=user_id)
+    finally:
+        session.close()
+    
+    if not version[0]:
+        st.header("Statistics Dashboard")
+        st.info("Add some games to see statistics!")
+        return
+    
+    col1, col2 = st.columns(2)
+    with col2:
+        game_type = st.selectbox(
+            "Game Type",
+            options=[None, *type_counts],
+            format_func=lambda gt: "All games" if gt is None else f"{gt.value} ({type_counts[gt]})"
+        )
+    engine = get_stats_engine(user_id, version, game_type)
+    team_ids = engine.team_ids()
+    with col1:
+        team_id = st.selectbox(
+            "Team",
+            options=team_ids,
+            format_func=lambda tid: TEAMS.full_names.get(tid, f"Team ID: {tid}")
+        )
+    summary = engine.summary(team_id)
+    team_name = TEAMS.full_names.get(team_id, "Team")
+    
+    st.header(f"{team_name} Games Statistics Dashboard")
+
+    # Overall Records Section
+    st.subheader("Records")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        record, pct = format_record(*summary['record'])
+        st.metric("Overall Record", record)
+        st.metric("Win Percentage", pct)
+    
+    with col2:
+        record, pct = format_record(*summary['home_record'])
+        st.metric("Home Record", record)
+        st.metric("Home Win %", pct)
+        
+    with col3:
+        record, pct = format_record(*summary['away_record'])
+        st.metric("Away Record", record)
+        st.metric("Away Win %", pct)
+
+    # Season Records
+    st.subheader("Record by Season")
+    st.table(pd.DataFrame([
+        {
+            "Season": season['season'],
+            "Wins": season['wins'],
+            "Losses": season['losses'],
+            "Win %": format_record(season['wins'], season['losses'])[1]
+        }
+        for season in summary['seasons']
+    ]))
+
+    # Game Type Records (regular season vs play-in vs playoffs, ...)
+    if len(summary['game_types']) > 1:
+        st.subheader("Record by Game Type")
+        st.table(pd.DataFrame([
+            {
+                "Game Type": game_type_record['game_type'],
+                "Wins": game_type_record['wins'],
+                "Losses": game_type_record['losses'],
+                "Win %": format_record(game_type_record['wins'], game_type_record['losses'])[1]
+            }
+            for game_type_record in summary['game_types']
+        ]))
+
+    # Trends across games and seasons (aggregated and downsampled server-side)
+    st.subheader("Trends")
+    series = team_series(engine.games(team_id), team_id)
+    col1, col2 = st.columns(2)
+    with col1:
+        trend_stat = st.selectbox("Trend", options=list(TREND_STATS), format_func=TREND_STATS.get, key="trend_stat")
+    with col2:
+        window = st.slider("Rolling window (games)", min_value=1, max_value=50, value=10)
+    st.plotly_chart(trend_figure(series['date'], series[trend_stat], TREND_STATS[trend_stat], window=window))
+    st.plotly_chart(season_figure(series['season'], series[trend_stat], TREND_STATS[trend_stat]))
+
+    # Most Common Opponents
+    st.subheader("Most Common Opponents")
+    st.table(pd.DataFrame([
+        {
+            "Opponent": opponent['opponent'],
+            "Games": opponent['games'],
+            "Record": f"{opponent['wins']}-{opponent['losses']}",
+            "Win %": format_record(opponent['wins'], opponent['losses'])[1]
+        }
+        for opponent in summary['opponents']
+    ]))
+
+    # Season series (the NBA's record, so games not attended still count)
+    meetings = get_season_series(user_id, version, team_id)
+    if meetings:
+        st.subheader("Season Series")
+        st.table(pd.DataFrame([
+            {
+                "Season": meeting['season'],
+                "Opponent": meeting['opponent'],
+                "Meeting": meeting['meeting'],
+                "Missed Before": meeting['missed_before'],
+                "Series Before": meeting['record_before'],
+                "Series After": meeting['record_after'],
+            }
+            for meeting in meetings
+        ]))
+
+    # Venues (this profile's record, minutes and attendance at each arena)
+    st.subheader("Venues")
+    session = Session()
+    try:
+        venues = venue_splits(session, team_id, user_id=user_id)
+    finally:
+        session.close()
+    if venues:
+        st.table(pd.DataFrame([
+            {
+                "Venue": venue['venue'],
+                "City": venue['city'] or "",
+                "": "Home" if venue['is_home'] else "Away",
+                "Games": venue['games'],
+                "Record": f"{venue['wins']}-{venue['losses']}",
+                "Win %": format_record(venue['wins'], venue['losses'])[1],
+                "Avg Minutes": f"{venue['average_minutes']:.0f}" if venue['average_minutes'] is not None else "",
+                "Avg Attendance": (
+                    f"{venue['average_attendance']:,.0f}" if venue['average_attendance'] is not None else ""
+                ),
+            }
+            for venue in venues
+        ]))
+        located = [venue for venue in venues if venue['latitude'] is not None]
+        if located:
+            st.map(pd.DataFrame([
+                {'lat': venue['latitude'], 'lon': venue['longitude'], 'size': 20000 + 5000 * venue['games']}
+                for venue in located
+            ]), size='size')
+    else:
+        st.info("No venue details for this team's games yet.")
+
+    # Game Duration Stats
+    st.subheader("Game Duration Statistics")
+    if summary['duration']:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Minutes Watched", f"{summary['duration']['total_minutes']:,.0f}")
+        with col2:
+            st.metric("Average Game Duration", f"{summary['duration']['average_minutes']:.0f} minutes")
+
+    # Attendance Stats
+    st.subheader("Attendance Statistics")
+    if summary['attendance']:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Average Attendance", f"{summary['attendance']['average']:,.0f}")
+        with col2:
+            st.metric("Total Attendance", f"{summary['attendance']['total']:,.0f}")
+
+    # Streaks and Patterns
+    st.subheader("Streaks and Patterns")
+    streaks = summary['streaks']
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Longest Win Streak", str(streaks['longest_win']))
+    with col2:
+        st.metric("Longest Losing Streak", str(streaks['longest_loss']))
+    with col3:
+        current = streaks['current']
+        streak_text = f"{current} wins" if current > 0 else f"{-current} losses"
+        st.metric("Current Streak", streak_text)
+
+    # Scoring Patterns
+    st.subheader("Scoring Patterns")
+    st.table(pd.DataFrame([
+        {
+            "Category": category['category'],
+            "Record": f"{category['wins']}-{category['losses']}",
+            "Games": category['games'],
+            "Win %": format_record(category['wins'], category['losses'])[1]
+        }
+        for category in summary['scoring']
+    ]))
+
+    # Quarter Analysis
+    st.subheader("Quarter Analysis")
+    st.table(pd.DataFrame([
+        {
+            "When Leading": quarter['period'],
+            "Record": f"{quarter['wins']}-{quarter['losses']}",
+            "Games": quarter['games'],
+            "Win %": format_record(quarter['wins'], quarter['losses'])[1]
+        }
+        for quarter in summary['quarters']
+    ]))
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Biggest Comeback Win", f"{summary['biggest_comeback']} pts")
+    with col2:
+        st.metric("Biggest Lead Lost", f"{summary['biggest_lead_lost']} pts")
+
+    # Players seen most (career totals over this profile's games) and best single games
+    session = Session()
+    try:
+        players = most_seen_players(session, limit=10, user_id=user_id)
+    finally:
+        session.close()
+    if players:
+        st.subheader("Players Seen Most")
+        st.table(pd.DataFrame([
+            {
+                "Player": player['name'],
+                "Games Seen": player['games_seen'],
+                "Played": player['games_played'],
+                "DNP": player['dnp_count'],
+                "Inactive": player['inactive_count'],
+                "Avg PIE": f"{player['average_pie']:.3f}" if player['average_pie'] is not None else "-",
+                "Avg Net Rtg": f"{player['average_net_rating']:.1f}" if player['average_net_rating'] is not None else "-",
+            }
+            for player in players
+        ]))
+
+    # Best individual performances witnessed for this team
+    st.subheader("Best Performances Witnessed")
+    stat = st.selectbox(
+        "Stat",
+        options=list(LEADERBOARD_STATS),
+        format_func=lambda key: LEADERBOARD_STATS[key][2]
+    )
+    session = Session()
+    try:
+        performances = top_performances(session, stat, limit=10, team_id=team_id, user_id=user_id)
+    finally:
+        session.close()
+    if performances:
+        st.table(pd.DataFrame([
+            {
+                "Player": performance['name'],
+                LEADERBOARD_STATS[stat][2]: round(performance['value'], 3),
+                "Date": performance['date'],
+                "Opponent": TEAMS.full_names.get(performance['opponent_id'], "-"),
+            }
+            for performance in performances
+        ]))
+    else:
+        st.info("No box scores stored for this team yet.")
+
+show_statistics()
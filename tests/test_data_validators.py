@@ -0,0 +1,92 @@
+import sys
+import os
+import unittest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.nba_api_client import NBAApiClient
+from src.data.request_cache import ResponseCache
+from src.utils.data_validators import BOX_SCORE_TRADITIONAL, PLAY_BY_PLAY, SUMMARY, PayloadError
+from tests.test_game_detail import summary_payload
+from tests.test_play_by_play import make_actions
+
+def traditional_payload():
+    """Build a BoxScoreTraditionalV3 get_dict() payload with two players per team."""
+    def team(team_id, tricode, first_player_id):
+        return {
+            'teamId': team_id, 'teamTricode': tricode, 'teamCity': "City", 'teamName': "Name", 'teamSlug': "slug",
+            'statistics': {'minutes': "240:00", 'points': 110},
+            'players': [
+                {'personId': first_player_id + i, 'firstName': "First", 'familyName': f"Player{i}",
+                 'statistics': {'minutes': "30:00", 'points': 10 + i, 'reboundsTotal': 4}}
+                for i in range(2)
+            ],
+        }
+    return {'boxScoreTraditional': {'homeTeam': team(1610612738, "BOS", 100), 'awayTeam': team(1610612752, "NYK", 200)}}
+
+class TestDataValidators(unittest.TestCase):
+    """Test cases for the compiled endpoint payload validators."""
+
+    def test_valid_payloads(self):
+        """Test that well-formed payloads pass untouched."""
+        payload = summary_payload()
+        self.assertIs(SUMMARY.validate(payload), payload)
+        self.assertEqual(BOX_SCORE_TRADITIONAL.rejections(traditional_payload()), {})
+        self.assertEqual(PLAY_BY_PLAY.rejections({'game': {'actions': make_actions(100)}}), {})
+
+    def test_rejections_are_counted_per_field(self):
+        """Test that every bad value in a result set is counted, not just the first."""
+        payload = summary_payload()
+        for row in payload['resultSets'][5]['rowSet']:
+            row[7] = "n/a"  # both teams' records
+        payload['resultSets'][1]['rowSet'][0][4] = "52"  # paint points as text
+        payload['resultSets'][2]['rowSet'][1] = [2, "Tony"]  # official row cut short
+        self.assertEqual(SUMMARY.rejections(payload), {
+            'LineScore.TEAM_WINS_LOSSES': 2, 'OtherStats.PTS_PAINT': 1, 'Officials.LAST_NAME': 1
+        })
+
+        box_score = traditional_payload()
+        del box_score['boxScoreTraditional']['awayTeam']['players'][0]['personId']
+        box_score['boxScoreTraditional']['homeTeam']['players'][1]['statistics']['points'] = "12"
+        self.assertEqual(BOX_SCORE_TRADITIONAL.rejections(box_score), {'players.personId': 1, 'players.statistics': 1})
+
+        actions = make_actions(50)
+        actions[3]['scoreHome'] = "12a"
+        self.assertEqual(PLAY_BY_PLAY.rejections({'game': {'actions': actions}}), {'actions.scoreHome': 1})
+
+    def test_structural_rejections(self):
+        """Test missing result sets, unexpected row counts and inconsistent teams."""
+        payload = summary_payload()
+        del payload['resultSets'][7]
+        payload['resultSets'][4]['rowSet'] = []
+        self.assertEqual(SUMMARY.rejections(payload), {'SeasonSeries': 1, 'GameInfo.rows': 1})
+
+        swapped = summary_payload()
+        swapped['resultSets'][5]['rowSet'].reverse()  # home team listed first
+        with self.assertRaises(PayloadError) as raised:
+            SUMMARY.validate(swapped, game_id="0022400773")
+        self.assertEqual(raised.exception.rejections, {'LineScore.TEAM_ID': 1})
+        self.assertIn("game 0022400773", str(raised.exception))
+
+    def test_client_does_not_cache_rejected_payloads(self):
+        """Test that the client validates each response and only memoizes valid ones."""
+        responses = [summary_payload(), summary_payload()]
+        responses[0]['resultSets'][5]['rowSet'][0][7] = None
+
+        class BoxScoreSummaryV2:
+            def __init__(self, **params):
+                self.payload = responses.pop(0)
+
+            def get_dict(self):
+                return self.payload
+
+        client = NBAApiClient(cache=ResponseCache())
+        with self.assertRaises(PayloadError):
+            client._fetch(BoxScoreSummaryV2, game_id="0022400773")
+        payload = client._fetch(BoxScoreSummaryV2, game_id="0022400773")
+        self.assertIs(client._fetch(BoxScoreSummaryV2, game_id="0022400773"), payload)
+        self.assertEqual(responses, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import sys
+import os
+import unittest
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.date_helpers import (
+    ALL_STAR, FINALS, NBA_CUP, PLAY_IN, PLAYOFFS, PRESEASON, REGULAR_SEASON, SEASON_DATES, game_type_for_date,
+    game_type_for_game, game_types, game_types_for_games, phase_for_date, season_for_date, season_label,
+    season_phases, seasons
+)
+
+class TestDateHelpers(unittest.TestCase):
+    """Test cases for the precomputed NBA season calendar."""
+
+    def test_season_label(self):
+        """Test normalizing start years and short or full labels."""
+        for season in (2024, "2024", "2024-25", "2024-2025"):
+            self.assertEqual(season_label(season), "2024-2025")
+        self.assertEqual(season_label(2050), "2050-2051")  # beyond the calendar
+
+    def test_phases_of_a_season(self):
+        """Test each phase boundary of the 2024-25 season."""
+        cases = [
+            (date(2024, 10, 10), PRESEASON), (date(2024, 10, 22), REGULAR_SEASON),
+            (date(2025, 4, 13), REGULAR_SEASON), (date(2025, 4, 15), PLAY_IN), (date(2025, 4, 19), PLAYOFFS),
+            (date(2025, 6, 5), FINALS), (date(2025, 6, 22), FINALS), (date(2025, 6, 23), None),
+        ]
+        for day, phase in cases:
+            self.assertEqual(phase_for_date(day), phase, day)
+            self.assertEqual(season_for_date(day), "2024-2025", day)
+        self.assertEqual(game_type_for_date("2025-06-10"), PLAYOFFS)
+        self.assertEqual(season_for_date(datetime(2025, 7, 1, 19, 30)), "2025-2026")
+
+    def test_irregular_seasons(self):
+        """Test the bubble and lockout seasons and the calendar's ends."""
+        self.assertEqual(season_for_date(date(2020, 10, 1)), "2019-2020")
+        self.assertEqual(phase_for_date(date(2020, 10, 1)), FINALS)
+        self.assertEqual(season_for_date(date(2020, 10, 20)), "2020-2021")
+        self.assertIsNone(game_type_for_date(date(2020, 10, 20)))
+        self.assertEqual(game_type_for_date(date(2012, 5, 1)), PLAYOFFS)
+        self.assertEqual(game_type_for_date(date(2012, 4, 20)), REGULAR_SEASON)
+        self.assertEqual(game_type_for_date(date(2016, 4, 15)), REGULAR_SEASON)  # no play-in before 2020-21
+        self.assertIsNone(season_for_date(date(1940, 1, 1)))
+        self.assertIsNone(season_for_date(date(2050, 1, 1)))
+
+    def test_actual_playoff_starts(self):
+        """Test the playoff boundaries of seasons whose playoffs started before the typical April 18."""
+        for day in ("2016-04-16", "2017-04-15", "2018-04-14", "2019-04-13", "2011-04-16"):
+            self.assertEqual(game_type_for_date(day), PLAYOFFS, day)
+        for day in ("2016-04-15", "2017-04-14", "2018-04-13", "2019-04-12", "1999-05-07"):
+            self.assertEqual(game_type_for_date(day), REGULAR_SEASON, day)
+        self.assertEqual(phase_for_date("2018-05-31"), FINALS)
+        self.assertIsNone(game_type_for_date("2019-06-14"))  # the day after the 2019 Finals
+
+    def test_every_play_by_play_season_has_actual_dates(self):
+        """Test that each season since 1996-97 switches phase exactly on its listed dates."""
+        for year in range(1996, 2025):
+            dates = SEASON_DATES[year]
+            self.assertTrue({REGULAR_SEASON, PLAYOFFS, FINALS} <= set(dates), year)
+            for phase, start in dates.items():
+                if phase in (REGULAR_SEASON, PLAY_IN, PLAYOFFS, FINALS):
+                    self.assertEqual(phase_for_date(start), phase, start)
+                    self.assertNotEqual(phase_for_date(start - timedelta(days=1)), phase, start)
+
+    def test_vectorized_matches_scalar(self):
+        """Test that array mapping agrees with the single-date functions for every day of several seasons."""
+        days = pd.Series(pd.date_range("2018-07-01", "2026-06-30", freq="D"))
+        expected_seasons = [season_for_date(day) for day in days]
+        expected_types = [game_type_for_date(day) or '' for day in days]
+        self.assertEqual(list(seasons(days)), expected_seasons)
+        self.assertEqual(list(game_types(days.to_numpy())), expected_types)
+        self.assertEqual(list(season_phases([date(2025, 6, 10), "2025-04-16"])), [FINALS, PLAY_IN])
+
+    def test_missing_and_out_of_range_dates(self):
+        """Test that missing dates and dates outside the calendar map to ''."""
+        days = pd.to_datetime(pd.Series(["2025-01-15", None, "1900-01-01"]))
+        self.assertEqual(list(seasons(days)), ["2024-2025", "", ""])
+        self.assertEqual(list(game_types(np.array(["2025-08-01"], dtype='datetime64[D]'))), [""])
+
+    def test_game_types_from_game_ids(self):
+        """Test that the game id prefix decides the type and the calendar covers unknown prefixes."""
+        self.assertEqual(game_type_for_game("0042400101", "2025-04-20"), PLAYOFFS)
+        self.assertEqual(game_type_for_game("0032400001", date(2025, 2, 16)), ALL_STAR)
+        self.assertEqual(game_type_for_game("0062400001", date(2024, 12, 17)), NBA_CUP)
+        self.assertEqual(game_type_for_game("9992400001", date(2025, 4, 16)), PLAY_IN)
+        self.assertIsNone(game_type_for_game("9992400001", date(2025, 8, 1)))
+
+        game_ids = ["0022400773", "0052400201", "0032400001", "9992400001", "9992400002"]
+        days = pd.Series(pd.to_datetime(["2025-01-31", "2025-04-16", "2025-02-16", "2025-05-01", "2025-08-01"]))
+        self.assertEqual(list(game_types_for_games(game_ids, days)),
+                         [REGULAR_SEASON, PLAY_IN, ALL_STAR, PLAYOFFS, ""])
+
+if __name__ == '__main__':
+    unittest.main()
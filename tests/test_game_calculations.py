@@ -0,0 +1,92 @@
+import sys
+import os
+import unittest
+from datetime import date
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.game_calculations import (
+    calculate_series_stats, calculate_series_stats_batch, format_season, reconstruct_series_progression
+)
+
+KNICKS_ID = 1610612752
+HAWKS_ID = 1610612737
+
+class TestSeriesCalculations(unittest.TestCase):
+    """Test cases for season series calculations."""
+
+    def series(self, home_score, away_score, wins, losses):
+        """Pregame series stats for a NYK (home) vs ATL (away) game."""
+        return calculate_series_stats(
+            home_score=home_score, away_score=away_score, postgame_home_wins=wins, postgame_home_losses=losses,
+            postgame_leader=None, home_team_abbrev="NYK", away_team_abbrev="ATL"
+        )
+
+    def test_game_result_is_removed_from_postgame_record(self):
+        """Test that the game's own result is taken out of the postgame record."""
+        self.assertEqual(self.series(149, 148, 2, 2), {
+            'pregame_home_wins': 1, 'pregame_home_losses': 2, 'pregame_leader': "ATL", 'pregame_series_record': "1-2"
+        })
+        self.assertEqual(self.series(100, 110, 1, 1)['pregame_leader'], "NYK")
+        self.assertEqual(self.series(100, 110, 0, 1)['pregame_series_record'], "0-0")
+
+    def test_uncounted_game_keeps_postgame_record(self):
+        """Test a postgame record that does not include the game yet."""
+        self.assertEqual(self.series(120, 100, 0, 0)['pregame_leader'], "Tied")
+        self.assertEqual(self.series(90, 100, 2, 0)['pregame_series_record'], "2-0")
+
+    def test_batch_matches_scalar(self):
+        """Test that the vectorized variant agrees with the scalar one on random games."""
+        rng = np.random.default_rng(7)
+        count = 5000
+        home_scores = rng.integers(80, 140, count)
+        away_scores = rng.integers(80, 140, count)
+        wins = rng.integers(0, 4, count)
+        losses = rng.integers(0, 4, count)
+
+        batch = calculate_series_stats_batch(home_scores, away_scores, wins, losses, ["NYK"] * count, ["ATL"] * count)
+
+        for i in range(0, count, 97):
+            expected = self.series(home_scores[i], away_scores[i], wins[i], losses[i])
+            self.assertEqual(batch.iloc[i].to_dict(), expected)
+
+    def test_series_progression_from_api_records(self):
+        """Test placing stored games in their season series from the API's postgame records."""
+        def game(game_id, game_date, season, home_id, home_score, away_score, wins, losses):
+            home, away = ('NYK', 'ATL') if home_id == KNICKS_ID else ('ATL', 'NYK')
+            return {'game_id': game_id, 'date': game_date, 'season': season, 'home_team_id': home_id,
+                    'away_team_id': HAWKS_ID if home_id == KNICKS_ID else KNICKS_ID,
+                    'home_score': home_score, 'away_score': away_score, 'home_team_abbrev': home,
+                    'away_team_abbrev': away, 'postgame_home_wins': wins, 'postgame_home_losses': losses}
+
+        games = pd.DataFrame([
+            # Stored out of date order; the second meeting (an ATL home win) was not stored
+            game('4', date(2025, 2, 12), '2024-2025', KNICKS_ID, 149, 148, 1, 2),
+            game('1', date(2024, 11, 6), '2024-2025', HAWKS_ID, 121, 116, 1, 0),
+            game('5', date(2025, 11, 1), '2025-2026', KNICKS_ID, 90, 100, 0, 1),
+        ])
+
+        result = reconstruct_series_progression(games)
+
+        self.assertEqual(result['game_id'].tolist(), ['1', '4', '5'])
+        result = result.set_index('game_id')
+        self.assertEqual(result.loc['1', 'pregame_series_record'], '0-0')
+        self.assertEqual(result.loc['1', 'postgame_leader'], 'ATL')
+        self.assertEqual(result.loc['4', 'meeting'], 3)
+        self.assertEqual(result.loc['4', 'unseen_before'], 1)  # the second meeting was not stored
+        self.assertEqual(result.loc['4', 'pregame_series_record'], '0-2')
+        self.assertEqual(result.loc['4', 'pregame_leader'], 'ATL')
+        self.assertEqual(result.loc['4', 'postgame_series_record'], '1-2')
+        self.assertEqual((result.loc['5', 'meeting'], result.loc['5', 'unseen_before']), (1, 0))
+        self.assertEqual(result.loc['5', 'postgame_leader'], 'ATL')
+
+    def test_format_season(self):
+        """Test formatting a season start year."""
+        self.assertEqual(format_season("2024"), "2024-2025")
+        self.assertEqual(format_season(2023), "2023-2024")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import unittest
+from unittest import mock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import Base, QuarterScores, RenderedChart
+from src.data.game_repository import save_game
+from src.visualization import game_charts
+from src.visualization.game_charts import chart_data_version, clear_chart_cache, game_chart
+from tests.test_game_repository import GAME_DATA, FakeClient
+
+GAME_ID = GAME_DATA['game_id']
+
+class TestGameCharts(unittest.TestCase):
+    """Test cases for the cached game charts."""
+
+    def setUp(self):
+        """Set up an in-memory database with one saved game."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        save_game(self.session, FakeClient(), GAME_DATA)
+        self.session.commit()
+        clear_chart_cache()
+
+    def tearDown(self):
+        """Clean up database connections."""
+        self.session.close()
+        clear_chart_cache()
+
+    def test_charts_render(self):
+        """Test that every chart type renders from the saved game."""
+        quarters = game_chart(self.session, GAME_ID, 'quarter_scores')
+        self.assertEqual(quarters['data'][1]['name'], "Boston Celtics")
+        self.assertEqual(list(quarters['data'][1]['y']), [30, 28, 31, 29])
+
+        margin = game_chart(self.session, GAME_ID, 'margin')
+        self.assertEqual(len(margin['data'][0]['x']), 200)
+
+        comparison = game_chart(self.session, GAME_ID, 'team_comparison')
+        self.assertEqual(list(comparison['data'][1]['x'])[0], 52)  # home points in the paint
+        self.assertEqual(self.session.query(RenderedChart).count(), 3)
+
+    def test_stored_rendering_is_reused(self):
+        """Test that a stored chart is served without rebuilding the figure."""
+        first = game_chart(self.session, GAME_ID, 'quarter_scores')
+        self.session.commit()
+        clear_chart_cache()
+
+        with mock.patch.object(game_charts, 'quarter_scores_figure', side_effect=AssertionError("rebuilt")):
+            self.assertEqual(game_chart(self.session, GAME_ID, 'quarter_scores'), first)
+
+    def test_changed_data_rerenders(self):
+        """Test that a stat correction replaces the stored chart."""
+        game_chart(self.session, GAME_ID, 'quarter_scores')
+        version = chart_data_version(self.session, GAME_ID, 'quarter_scores')
+
+        self.session.query(QuarterScores).filter_by(game_id=GAME_ID, period="Q4").update({'home_score': 33})
+        self.assertNotEqual(chart_data_version(self.session, GAME_ID, 'quarter_scores'), version)
+        figure = game_chart(self.session, GAME_ID, 'quarter_scores')
+        self.assertEqual(list(figure['data'][1]['y'])[-1], 33)
+
+        stored = self.session.query(RenderedChart).filter_by(chart_type='quarter_scores').one()
+        self.assertEqual(stored.data_version, chart_data_version(self.session, GAME_ID, 'quarter_scores'))
+
+    def test_missing_data(self):
+        """Test that games without data for a chart return None and unknown charts raise."""
+        self.assertIsNone(game_chart(self.session, "0029999999", 'margin'))
+        with self.assertRaises(ValueError):
+            game_chart(self.session, GAME_ID, 'shot_chart')
+
+if __name__ == '__main__':
+    unittest.main()
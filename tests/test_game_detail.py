@@ -0,0 +1,80 @@
+import sys
+import os
+import unittest
+from datetime import date
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.game_detail import GameDetail, PeriodScores, TeamLine, period_label
+
+CELTICS_ID = 1610612738
+KNICKS_ID = 1610612752
+
+def summary_payload(home_periods=(30, 28, 31, 29), away_periods=(25, 27, 26, 27)):
+    """Build a BoxScoreSummaryV2 get_dict() payload shaped like the real endpoint."""
+    def line_score(team_id, abbrev, record, periods):
+        overtimes = list(periods[4:]) + [0] * (10 - len(periods[4:]))
+        return ["2025-02-12", 1, "0022400773", team_id, abbrev, "City", "Name", record,
+                *periods[:4], *overtimes, sum(periods)]
+
+    def other_stats(team_id, abbrev, paint_points, largest_lead):
+        return ["00", team_id, abbrev, "City", paint_points, 12, 15, largest_lead, 3, 2, 1, 14, 9, 18]
+
+    rows = [
+        [["2025-02-12", 1, "0022400773", 3, "Final", "20250212/NYKBOS", CELTICS_ID, KNICKS_ID, "2024", 4, "", "TNT", "", 0]],
+        [other_stats(CELTICS_ID, "BOS", 52, 20), other_stats(KNICKS_ID, "NYK", 40, 5)],
+        [[1, "Scott", "Foster", " 48"], [2, "Tony", "Brothers", "25 "]],
+        [[1629057, "Robert", "Williams", "44", CELTICS_ID, "Boston", "Celtics", "BOS"]],
+        [["2025-02-12", 19156, "2:14"]],
+        [line_score(KNICKS_ID, "NYK", "33-19", away_periods), line_score(CELTICS_ID, "BOS", "38-15", home_periods)],
+        [["0022400773", "0022400100", "2024-10-22T00:00:00", CELTICS_ID, "Boston", "Celtics", "BOS", 132,
+          KNICKS_ID, "New York", "Knicks", "NYK", 109]],
+        [["0022400773", CELTICS_ID, KNICKS_ID, "2025-02-12", 2, 0, "BOS"]],
+    ]
+    return {'resultSets': [{'rowSet': row_set} for row_set in rows]}
+
+class TestGameDetail(unittest.TestCase):
+    """Test cases for decoding BoxScoreSummaryV2 into the typed game model."""
+
+    def test_decode_summary(self):
+        """Test team lines, series records and last meeting decoding."""
+        detail = GameDetail.from_summary("0022400773", summary_payload())
+        self.assertEqual(detail.home.team_id, CELTICS_ID)
+        self.assertEqual(detail.away.abbrev, "NYK")
+        self.assertEqual(detail.home.paint_points, 52)
+        self.assertEqual(detail.away.largest_lead, 5)
+        self.assertEqual(detail.home.record, "38-15")
+        self.assertEqual(detail.home.points, 118)
+        self.assertEqual(detail.season_label, "2024-2025")
+        self.assertEqual(detail.duration_minutes, 134)
+        self.assertEqual(detail.series.record, "2-0")
+        self.assertEqual(detail.pregame_series.record, "1-0")
+        self.assertEqual(detail.last_meeting.game_date, date(2024, 10, 22))
+        self.assertEqual([official.jersey_num for official in detail.officials], [48, 25])
+        self.assertEqual(detail.inactive_players[0].team_id, CELTICS_ID)
+
+    def test_period_scores(self):
+        """Test that overtimes are included and iterated with their labels."""
+        detail = GameDetail.from_summary("0022400773", summary_payload(
+            home_periods=(30, 28, 31, 29, 10, 8), away_periods=(25, 27, 26, 40, 10, 5)
+        ))
+        self.assertEqual(len(detail.periods), 6)
+        self.assertEqual(detail.periods.overtimes, 2)
+        self.assertEqual(list(detail.periods)[-1], ("OT2", 8, 5))
+        self.assertEqual(detail.periods.home.typecode, 'H')
+
+        regulation = GameDetail.from_summary("0022400773", summary_payload()).periods
+        self.assertEqual(regulation.labels, ["Q1", "Q2", "Q3", "Q4"])
+        self.assertEqual(period_label(4), "OT1")
+
+    def test_slotted(self):
+        """Test that the models carry no per-instance dictionary."""
+        detail = GameDetail.from_summary("0022400773", summary_payload())
+        for instance in (detail, detail.home, detail.periods, detail.last_meeting, detail.officials[0]):
+            self.assertFalse(hasattr(instance, '__dict__'))
+        self.assertIsInstance(detail.home, TeamLine)
+        self.assertIsInstance(detail.periods, PeriodScores)
+
+if __name__ == '__main__':
+    unittest.main()
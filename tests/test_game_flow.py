@@ -0,0 +1,105 @@
+import sys
+import os
+import unittest
+from datetime import date
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.game_tracker import TeamStatsEngine, load_game_records
+from src.data.database_models import Base, Game, GameFlow, PlayByPlay, QuarterScores
+from src.data.play_by_play import PlayByPlayEvents
+from src.data.migrations import migrate
+from src.utils.game_flow import compute_flow_metrics, compute_flow_metrics_batch, flow_columns
+
+CELTICS_ID = 1610612738
+KNICKS_ID = 1610612752
+
+def make_events(scores, period=1):
+    """Build events from (seconds elapsed, home score, away score) tuples within one quarter."""
+    count = len(scores)
+    return PlayByPlayEvents(
+        period=[period] * count,
+        event_type=[0] * count,
+        side=[0] * count,
+        player=[0] * count,
+        clock=[7200 - seconds * 10 for seconds, _, _ in scores],
+        home_score=[home for _, home, _ in scores],
+        away_score=[away for _, _, away in scores],
+    )
+
+class TestGameFlow(unittest.TestCase):
+    """Test cases for vectorized game-flow metrics."""
+
+    def test_single_game_metrics(self):
+        """Test leads, ties, lead changes, runs and time leading for one game."""
+        events = make_events([(10, 2, 0), (20, 2, 3), (30, 5, 3), (40, 5, 5), (50, 5, 7), (720, 5, 7)])
+        flow = compute_flow_metrics(events)
+
+        self.assertEqual(flow['home_max_lead'], 2)
+        self.assertEqual(flow['away_max_lead'], 2)
+        self.assertEqual(flow['lead_changes'], 3)
+        self.assertEqual(flow['times_tied'], 1)
+        self.assertEqual(flow['home_longest_run'], 3)
+        self.assertEqual(flow['away_longest_run'], 4)
+        self.assertEqual(flow['home_time_leading'], 20)
+        self.assertEqual(flow['away_time_leading'], 680)
+        self.assertEqual(flow['time_tied'], 20)
+
+    def test_batch_matches_single_games(self):
+        """Test that batching games gives the same results as one game at a time."""
+        rng = np.random.default_rng(11)
+        games = []
+        for _ in range(20):
+            steps = rng.integers(0, 4, size=(200, 2)) * (rng.random((200, 1)) < 0.5)
+            home, away = np.cumsum(steps, axis=0).T
+            games.append(make_events(list(zip(np.linspace(0, 719, 200).astype(int), home, away))))
+
+        batch = compute_flow_metrics_batch(games)
+        for i, game in enumerate(games):
+            self.assertEqual(batch.iloc[i].to_dict(), compute_flow_metrics(game))
+
+    def test_comeback_uses_play_by_play(self):
+        """Test that the dashboard comeback uses true in-game deficits when available."""
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        session.add(Game(game_id="1", date=date(2025, 1, 1), season="2024-2025",
+                         home_team_id=CELTICS_ID, away_team_id=KNICKS_ID,
+                         home_team="Boston Celtics", away_team="New York Knicks",
+                         home_score=101, away_score=100))
+        session.add(QuarterScores(game_id="1", period="Q1", home_team_id=CELTICS_ID, away_team_id=KNICKS_ID,
+                                  home_score=30, away_score=28))
+        # Celtics trailed by 12 mid-quarter even though they led after it
+        events = make_events([(60, 0, 12), (700, 30, 28)])
+        session.add(PlayByPlay.from_events("1", events))
+        session.add(GameFlow(game_id="1", **flow_columns(compute_flow_metrics(events))))
+        session.commit()
+
+        summary = TeamStatsEngine(load_game_records(session)).summary(CELTICS_ID)
+        self.assertEqual(summary['biggest_comeback'], 12)
+        session.close()
+
+    def test_metrics_of_earlier_saves_are_stored(self):
+        """Test that the migration stores metrics for play-by-play saved before they were kept."""
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add(Game(game_id="1", date=date(2025, 1, 1), season="2024-2025"))
+        session.add(GameFlow(game_id="1", lead_changes=7))  # API counts only
+        session.add(PlayByPlay.from_events("1", make_events([(60, 0, 12), (300, 14, 12), (700, 30, 28)])))
+        session.commit()
+
+        self.assertIn('game_flow', migrate(engine))
+        flow = session.query(GameFlow).one()
+        self.assertEqual((flow.home_max_lead, flow.away_max_lead, flow.pbp_lead_changes), (2, 12, 1))
+        self.assertEqual(flow.lead_changes, 7)
+        self.assertNotIn('game_flow', migrate(engine))
+        session.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,267 @@
+import sys
+import os
+import copy
+import unittest
+from collections import Counter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import (
+    Attendance, Base, Game, GameFlow, GameType, Official, PlayByPlay, PlayerBoxScore, QuarantinedGame, QuarterScores,
+    SeriesStats, TeamStats
+)
+from src.data.game_detail import GameDetail
+from src.data.game_repository import backfill_games, missing_parts, refresh_game, refresh_pregame_series, save_game
+from src.data.play_by_play import FORMAT_VERSION
+from src.core.game_tracker import data_version
+from src.utils.data_validators import SUMMARY
+from tests.test_game_detail import summary_payload
+from tests.test_play_by_play import make_actions
+
+CELTICS_ID = 1610612738
+KNICKS_ID = 1610612752
+TATUM_ID = 1628369
+BRUNSON_ID = 1628973
+
+GAME_DATA = {
+    'game_id': "0022400773", 'date': "2025-02-12", 'home_team': "Boston Celtics", 'away_team': "New York Knicks",
+    'home_score': 118, 'away_score': 105, 'arena': "TD Garden",
+}
+
+def box_scores():
+    """Build get_box_scores (traditional, advanced) results for two players."""
+    players = [(TATUM_ID, "Jayson", "Tatum", CELTICS_ID, 41), (BRUNSON_ID, "Jalen", "Brunson", KNICKS_ID, 30)]
+    traditional = {'player_stats': [
+        {'personId': person_id, 'firstName': first, 'familyName': last, 'teamId': team_id, 'position': "F",
+         'statistics': {'minutes': "38:00", 'points': points, 'reboundsTotal': 8, 'assists': 5}}
+        for person_id, first, last, team_id, points in players
+    ], 'team_stats': []}
+    advanced = {'player_stats': [
+        {'personId': person_id, 'firstName': first, 'familyName': last, 'teamId': team_id, 'comment': "F",
+         'statistics': {'minutes': "38:00", 'pie': 0.2, 'netRating': 10.0}}
+        for person_id, first, last, team_id, _ in players
+    ], 'team_stats': [
+        {'teamId': team_id, 'statistics': {'offensiveRating': 115.0, 'PIE': 0.5}}
+        for team_id in (CELTICS_ID, KNICKS_ID)
+    ]}
+    return traditional, advanced
+
+class FakeClient:
+    """Stand-in for NBAApiClient returning canned (validated) responses and counting calls."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.summary = summary_payload()
+        self.summaries = {}  # per-game overrides of summary
+        self.box_scores = box_scores()
+        self.actions = make_actions(200)
+        self.play_by_play_error = None
+
+    def get_detailed_stats(self, game_id):
+        self.calls['get_detailed_stats'] += 1
+        return GameDetail.from_summary(game_id, SUMMARY.validate(self.summaries.get(game_id, self.summary), game_id))
+
+    def get_box_scores(self, game_id):
+        self.calls['get_box_scores'] += 1
+        return copy.deepcopy(self.box_scores)
+
+    def get_play_by_play(self, game_id):
+        self.calls['get_play_by_play'] += 1
+        if self.play_by_play_error:
+            raise self.play_by_play_error
+        return self.actions
+
+class TestGameRepository(unittest.TestCase):
+    """Test cases for idempotent game saving and refreshing."""
+
+    def setUp(self):
+        """Set up an in-memory database."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.client = FakeClient()
+
+    def tearDown(self):
+        """Clean up database connections."""
+        self.session.close()
+
+    def test_save_game_is_idempotent(self):
+        """Test that re-saving a stored game makes no requests and writes nothing."""
+        result = save_game(self.session, self.client, GAME_DATA, {'seat_section': "Loge 12"})
+        self.session.commit()
+        self.assertTrue(result['created'])
+        self.assertEqual(self.session.query(QuarterScores).count(), 4)
+        self.assertEqual(self.session.query(TeamStats).count(), 2)
+        self.assertIsNotNone(self.session.query(GameFlow).one().home_max_lead)
+        self.assertEqual(self.session.query(Game).one().game_type, GameType.REGULAR_SEASON)
+
+        calls = sum(self.client.calls.values())
+        result = save_game(self.session, self.client, GAME_DATA)
+        self.assertFalse(result['created'])
+        self.assertEqual(sum(self.client.calls.values()), calls)
+        self.assertEqual(self.session.query(Attendance).one().seat_section, "Loge 12")
+
+    def test_refresh_skips_network_when_complete(self):
+        """Test that refreshing a complete game returns before any request."""
+        save_game(self.session, self.client, GAME_DATA)
+        self.session.commit()
+        self.assertEqual(missing_parts(self.session, GAME_DATA['game_id']), [])
+
+        self.client.calls.clear()
+        result = refresh_game(self.session, self.client, GAME_DATA['game_id'])
+        self.assertEqual(result['refreshed'], [])
+        self.assertEqual(sum(self.client.calls.values()), 0)
+
+    def test_forced_refresh_rewrites_only_changed_rows(self):
+        """Test that a stat correction updates one row and removes stale ones."""
+        save_game(self.session, self.client, GAME_DATA)
+        self.session.commit()
+
+        # Unchanged data writes nothing
+        result = refresh_game(self.session, self.client, GAME_DATA['game_id'], force=True)
+        self.assertEqual(result['changed'], {})
+
+        # Tatum is credited one more point and the official is replaced
+        self.client.box_scores[0]['player_stats'][0]['statistics']['points'] = 42
+        self.client.summary['resultSets'][2]['rowSet'] = [[3, "Ed", "Malloy", "14"]]
+        result = refresh_game(self.session, self.client, GAME_DATA['game_id'], force=True)
+        self.session.commit()
+        self.assertEqual(result['changed']['player_box_scores'], 1)
+        self.assertEqual(result['changed']['officials'], 3)  # one insert, two deletes
+        self.assertEqual(self.session.query(PlayerBoxScore.points).filter_by(player_id=TATUM_ID).scalar(), 42)
+        self.assertEqual([name for (name,) in self.session.query(Official.name)], ["Ed Malloy"])
+        self.assertEqual(self.session.query(PlayerBoxScore).count(), 2)
+
+    def test_refresh_backfills_missing_parts(self):
+        """Test that only missing parts are fetched and written."""
+        save_game(self.session, self.client, GAME_DATA)
+        self.session.query(PlayerBoxScore).delete()
+        self.session.commit()
+        self.assertEqual(missing_parts(self.session, GAME_DATA['game_id']), ['box_scores'])
+
+        self.client.calls.clear()
+        result = refresh_game(self.session, self.client, GAME_DATA['game_id'])
+        self.assertEqual(result['refreshed'], ['box_scores'])
+        self.assertEqual(self.client.calls['get_play_by_play'], 0)
+        self.assertEqual(self.session.query(PlayerBoxScore).count(), 2)
+
+        self.session.query(PlayByPlay).update({'format_version': 0})  # written in an older layout
+        self.assertEqual(missing_parts(self.session, GAME_DATA['game_id']), ['play_by_play'])
+        refresh_game(self.session, self.client, GAME_DATA['game_id'])
+        self.assertEqual(self.session.query(PlayByPlay).one().format_version, FORMAT_VERSION)
+
+    def test_refresh_updates_scores_and_data_version(self):
+        """Test that a score correction rewrites the game row and changes the statistics fingerprint."""
+        save_game(self.session, self.client, GAME_DATA)
+        self.session.commit()
+        version = data_version(self.session)
+
+        self.client.summary['resultSets'][5]['rowSet'][1][22] = 119  # the home team's points
+        result = refresh_game(self.session, self.client, GAME_DATA['game_id'], force=True)
+        self.session.commit()
+        self.assertEqual(result['changed']['games'], 1)
+        self.assertEqual(self.session.query(Game.home_score).scalar(), 119)
+        self.assertNotEqual(data_version(self.session), version)
+
+        # An in-place statistics correction changes it too, though no row is added
+        version = data_version(self.session)
+        self.client.box_scores[0]['player_stats'][0]['statistics']['points'] = 42
+        refresh_game(self.session, self.client, GAME_DATA['game_id'], force=True)
+        self.session.commit()
+        self.assertNotEqual(data_version(self.session), version)
+
+    def test_refresh_without_play_by_play(self):
+        """Test that play-by-play that cannot be fetched is a warning, as when saving."""
+        self.client.play_by_play_error = ConnectionError("timed out")
+        result = save_game(self.session, self.client, GAME_DATA)
+        self.session.query(PlayerBoxScore).delete()
+        self.session.commit()
+        self.assertEqual(len(result['warnings']), 1)
+
+        result = refresh_game(self.session, self.client, GAME_DATA['game_id'])
+        self.session.commit()
+        self.assertEqual(result['refreshed'], ['box_scores'])
+        self.assertEqual(result['warnings'], ["Play-by-play unavailable: timed out"])
+        self.assertEqual(self.session.query(PlayerBoxScore).count(), 2)
+        self.assertEqual(self.session.query(PlayByPlay).count(), 0)
+
+    def test_backfill_quarantines_rejected_games(self):
+        """Test that a game with a malformed payload is quarantined without aborting the batch."""
+        other_game = dict(GAME_DATA, game_id="0022400900", date="2025-03-01")
+        for game_data in (GAME_DATA, other_game):
+            save_game(self.session, self.client, game_data)
+        self.session.query(PlayerBoxScore).delete()
+        self.session.commit()
+
+        bad_summary = copy.deepcopy(self.client.summary)
+        bad_summary['resultSets'][5]['rowSet'][1][7] = "38 - 15"  # the home team's record
+        bad_summary['resultSets'][4]['rowSet'][0][1] = None  # attendance
+        self.client.summaries[GAME_DATA['game_id']] = bad_summary
+        report = backfill_games(self.session, self.client, [GAME_DATA['game_id'], other_game['game_id']])
+        self.session.commit()
+        self.assertEqual(report['refreshed'], [other_game['game_id']])
+        self.assertEqual(report['rejections'], {
+            'BoxScoreSummaryV2.LineScore.TEAM_WINS_LOSSES': 1, 'BoxScoreSummaryV2.GameInfo.ATTENDANCE': 1
+        })
+        self.assertEqual(self.session.query(QuarantinedGame.game_id).scalar(), GAME_DATA['game_id'])
+        self.assertEqual(missing_parts(self.session, GAME_DATA['game_id']), ['box_scores'])
+
+        # Once the API serves valid data the game backfills and leaves quarantine
+        del self.client.summaries[GAME_DATA['game_id']]
+        report = backfill_games(self.session, self.client, [GAME_DATA['game_id'], other_game['game_id']])
+        self.assertEqual((report['refreshed'], report['quarantined']), ([GAME_DATA['game_id']], {}))
+        self.assertEqual(self.session.query(QuarantinedGame).count(), 0)
+
+    def test_backfill_keeps_games_refreshed_before_a_failure(self):
+        """Test that a network error part-way through a backfill keeps the games already written."""
+        other_game = dict(GAME_DATA, game_id="0022400900", date="2025-03-01")
+        for game_data in (GAME_DATA, other_game):
+            save_game(self.session, self.client, game_data)
+        self.session.query(PlayerBoxScore).delete()
+        self.session.commit()
+
+        get_box_scores = self.client.get_box_scores
+        def fail_second_game(game_id):
+            if game_id == other_game['game_id']:
+                raise ConnectionError("timed out")
+            return get_box_scores(game_id)
+        self.client.get_box_scores = fail_second_game
+        with self.assertRaises(ConnectionError):
+            backfill_games(self.session, self.client, [GAME_DATA['game_id'], other_game['game_id']])
+        self.session.rollback()  # as the job queue does before retrying
+        self.assertEqual(missing_parts(self.session, GAME_DATA['game_id']), [])
+        self.assertEqual(missing_parts(self.session, other_game['game_id']), ['box_scores'])
+
+        # The retry only fetches the game that is still missing
+        self.client.get_box_scores = get_box_scores
+        self.client.calls.clear()
+        report = backfill_games(self.session, self.client, [GAME_DATA['game_id'], other_game['game_id']])
+        self.assertEqual(report['refreshed'], [other_game['game_id']])
+        self.assertEqual(self.client.calls['get_box_scores'], 1)
+
+    def test_backfill_derives_missing_pregame_series(self):
+        """Test that a backfill fills pregame series records from the stored postgame records in one batch."""
+        save_game(self.session, self.client, GAME_DATA)
+        stored = self.session.query(SeriesStats).one()
+        pregame = (stored.pregame_series_record, stored.pregame_series_leader)
+        self.session.query(SeriesStats).update({'pregame_series_record': None, 'pregame_series_leader': None,
+                                                'pregame_home_team_series_wins': None})
+        self.session.commit()
+
+        self.client.calls.clear()
+        backfill_games(self.session, self.client, [GAME_DATA['game_id']])
+        self.session.refresh(stored)
+        self.assertEqual((stored.pregame_series_record, stored.pregame_series_leader), pregame)
+        self.assertEqual(sum(self.client.calls.values()), 0)  # nothing was missing: no request
+        self.assertEqual(refresh_pregame_series(self.session), 0)  # unchanged rows are not rewritten
+
+    def test_refresh_unknown_game(self):
+        """Test that refreshing a game that is not stored raises ValueError."""
+        with self.assertRaises(ValueError):
+            refresh_game(self.session, self.client, "0029999999")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.game_search import index_game, rebuild_search_index, search_games
+from src.data.database_models import Attendance, Base
+from src.data.game_repository import refresh_game, save_game
+from tests.test_game_repository import GAME_DATA, FakeClient
+
+OTHER_GAME = dict(GAME_DATA, game_id="0022400900", date="2025-03-01")
+
+class TestGameSearch(unittest.TestCase):
+    """Test cases for the full-text search over game memories."""
+
+    def setUp(self):
+        """Set up an in-memory database with two saved games."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.client = FakeClient()
+        save_game(self.session, self.client, GAME_DATA,
+                  {'attended_with': "Dad", 'notes': "Tatum hit a buzzer beater, Dad was thrilled"})
+        save_game(self.session, self.client, OTHER_GAME, {'attended_with': "Maria", 'notes': "Quiet night"})
+        self.session.commit()
+
+    def tearDown(self):
+        """Clean up database connections."""
+        self.session.close()
+
+    def game_ids(self, query):
+        return [result['game_id'] for result in search_games(self.session, query)[0]]
+
+    def test_prefix_search_across_columns(self):
+        """Test that players, officials, companions and notes are all searchable by prefix."""
+        self.assertEqual(self.game_ids("buzz"), [GAME_DATA['game_id']])
+        self.assertEqual(self.game_ids("mari"), [OTHER_GAME['game_id']])
+        self.assertEqual(sorted(self.game_ids("fost")), sorted([GAME_DATA['game_id'], OTHER_GAME['game_id']]))
+        self.assertEqual(len(self.game_ids("bruns knicks")), 2)
+        self.assertEqual(self.game_ids("tatum quiet"), [OTHER_GAME['game_id']])  # every word must match
+
+    def test_ranking_and_snippet(self):
+        """Test that companion matches outrank other columns and snippets highlight matches."""
+        results, total = search_games(self.session, "dad")
+        self.assertEqual(total, 1)
+        self.assertIn("**Dad**", results[0]['snippet'])
+        self.assertEqual(str(results[0]['date']), GAME_DATA['date'])
+
+    def test_index_follows_updates(self):
+        """Test that edits and stat refreshes are reflected after reindexing."""
+        attendance = self.session.query(Attendance).filter_by(game_id=OTHER_GAME['game_id']).one()
+        attendance.notes = "Overtime thriller"
+        index_game(self.session, attendance.game_id)
+        self.assertEqual(sorted(self.game_ids("thrill")), [GAME_DATA['game_id'], OTHER_GAME['game_id']])
+        self.assertEqual(self.game_ids("overtime"), [OTHER_GAME['game_id']])
+        self.assertEqual(self.game_ids("quiet"), [])
+
+        self.client.summary['resultSets'][2]['rowSet'] = [[3, "Ed", "Malloy", "14"]]
+        refresh_game(self.session, self.client, GAME_DATA['game_id'], force=True)
+        self.assertEqual(self.game_ids("malloy"), [GAME_DATA['game_id']])
+        self.assertEqual(self.game_ids("foster"), [OTHER_GAME['game_id']])
+
+        self.assertEqual(rebuild_search_index(self.session), 2)
+        self.assertEqual(self.game_ids("malloy"), [GAME_DATA['game_id']])
+
+    def test_paging_and_odd_queries(self):
+        """Test paging and that punctuation in queries cannot break the FTS syntax."""
+        results, total = search_games(self.session, "celtics", page=1, page_size=1)
+        self.assertEqual((len(results), total), (1, 2))
+        self.assertEqual(search_games(self.session, '"*-(:'), ([], 0))
+        self.assertEqual(search_games(self.session, 'O"Neal AND'), ([], 0))
+
+if __name__ == '__main__':
+    unittest.main()
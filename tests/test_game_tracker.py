@@ -0,0 +1,120 @@
+import sys
+import os
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import Base, Game, GameType, QuarterScores, SeriesStats, VenueInfo
+from src.core.game_tracker import TeamStatsEngine, load_game_records, season_series, data_version, game_type_counts
+from src.utils.date_helpers import game_type_for_game
+
+CELTICS_ID = 1610612738
+HEAT_ID = 1610612748
+KNICKS_ID = 1610612752
+
+class TestTeamStatsEngine(unittest.TestCase):
+    """Test cases for team-perspective statistics."""
+
+    def setUp(self):
+        """Set up an in-memory database with three attended games."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        games = [
+            # (game_id, date, home, away, home_score, away_score, quarters)
+            ("0022400001", date(2024, 11, 1), (CELTICS_ID, "Boston Celtics"), (HEAT_ID, "Miami Heat"),
+             110, 98, [(30, 20), (25, 25), (30, 28), (25, 25)]),
+            ("0062400002", date(2024, 12, 1), (KNICKS_ID, "New York Knicks"), (CELTICS_ID, "Boston Celtics"),
+             120, 115, [(20, 35), (30, 25), (35, 30), (35, 25)]),
+            ("0022400003", date(2025, 1, 5), (HEAT_ID, "Miami Heat"), (CELTICS_ID, "Boston Celtics"),
+             100, 104, [(30, 20), (20, 25), (25, 25), (25, 34)]),
+        ]
+        for game_id, game_date, home, away, home_score, away_score, quarters in games:
+            self.session.add(Game(
+                game_id=game_id, date=game_date, season="2024-2025",
+                game_type=GameType(game_type_for_game(game_id, game_date)),
+                home_team_id=home[0], home_team=home[1], away_team_id=away[0], away_team=away[1],
+                home_score=home_score, away_score=away_score
+            ))
+            for number, (home_points, away_points) in enumerate(quarters, start=1):
+                self.session.add(QuarterScores(
+                    game_id=game_id, period=f"Q{number}", home_team_id=home[0], away_team_id=away[0],
+                    home_score=home_points, away_score=away_points
+                ))
+            self.session.add(VenueInfo(game_id=game_id, arena="Arena", attendance=19000, duration_minutes=130))
+        self.session.commit()
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def test_records_from_each_perspective(self):
+        """Test that records are computed for whichever team is selected."""
+        engine = TeamStatsEngine(load_game_records(self.session)).precompute()
+
+        celtics = engine.summary(CELTICS_ID)
+        self.assertEqual(celtics['record'], (2, 1))
+        self.assertEqual(celtics['home_record'], (1, 0))
+        self.assertEqual(celtics['away_record'], (1, 1))
+        self.assertEqual(celtics['streaks'], {'longest_win': 1, 'longest_loss': 1, 'current': 1})
+        self.assertEqual(celtics['duration']['total_minutes'], 390)
+
+        heat = engine.summary(HEAT_ID)
+        self.assertEqual(heat['record'], (0, 2))
+        self.assertEqual(heat['opponents'][0]['opponent'], "Boston Celtics")
+        self.assertEqual(engine.team_ids()[0], CELTICS_ID)
+
+    def test_quarter_analysis_and_comebacks(self):
+        """Test leads after each quarter and comeback/blown-lead margins."""
+        celtics = TeamStatsEngine(load_game_records(self.session)).summary(CELTICS_ID)
+
+        quarters = {quarter['period']: quarter for quarter in celtics['quarters']}
+        self.assertEqual((quarters["After 1st"]['wins'], quarters["After 1st"]['losses']), (1, 1))
+        self.assertEqual(celtics['biggest_comeback'], 10)
+        self.assertEqual(celtics['biggest_lead_lost'], 15)
+
+    def test_game_type_filter_and_split(self):
+        """Test loading one game type and the per-type record split."""
+        self.assertEqual(game_type_counts(self.session), {GameType.REGULAR_SEASON: 2, GameType.NBA_CUP: 1})
+
+        cup = load_game_records(self.session, game_type=GameType.NBA_CUP)
+        self.assertEqual([(record.game_id, record.game_type) for record in cup], [("0062400002", "NBA Cup")])
+
+        celtics = TeamStatsEngine(load_game_records(self.session)).summary(CELTICS_ID)
+        self.assertEqual(celtics['game_types'], [
+            {'game_type': "Regular Season", 'wins': 2, 'losses': 0},
+            {'game_type': "NBA Cup", 'wins': 0, 'losses': 1},
+        ])
+
+    def test_season_series_counts_games_not_attended(self):
+        """Test that season series records come from the stored API records, not only attended games."""
+        self.session.add_all([
+            SeriesStats(game_id="0022400001", postgame_home_team_series_wins=1, postgame_home_team_series_losses=0),
+            # The Heat hosted the third meeting; the second one was not attended
+            SeriesStats(game_id="0022400003", postgame_home_team_series_wins=0, postgame_home_team_series_losses=3),
+        ])
+        self.session.commit()
+
+        meetings = season_series(self.session, CELTICS_ID)
+        self.assertEqual([(m['opponent'], m['meeting'], m['missed_before'], m['record_before'], m['record_after'])
+                          for m in meetings], [
+            ("Miami Heat", 1, 0, "0-0", "1-0"),
+            ("Miami Heat", 3, 1, "2-0", "3-0"),
+        ])
+        self.assertEqual(season_series(self.session, KNICKS_ID), [])
+
+    def test_data_version_changes_on_save(self):
+        """Test that the cache fingerprint changes when a game is added."""
+        before = data_version(self.session)
+        self.session.add(Game(game_id="0022400004", date=date(2025, 2, 1), season="2024-2025"))
+        self.session.commit()
+        self.assertNotEqual(data_version(self.session), before)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.http_session import HttpClient
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = b'<html>box score</html>'
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestHttpSession(unittest.TestCase):
+    """Test cases for the pooled HTTP client."""
+
+    def setUp(self):
+        """Start a local fixture server."""
+        _FixtureHandler.requests_seen = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/boxscores/"
+        self.client = HttpClient()
+
+    def tearDown(self):
+        """Stop the fixture server."""
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_conditional_request_served_from_cache(self):
+        """Test that a 304 response returns the previously fetched body."""
+        first = self.client.get_text(self.url)
+        second = self.client.get_text(self.url)
+
+        self.assertEqual(first, '<html>box score</html>')
+        self.assertEqual(second, first)
+        self.assertEqual(self.client.revalidated, 1)
+        self.assertEqual(_FixtureHandler.requests_seen[1].get('If-None-Match'), '"v1"')
+
+    def test_compression_and_timeouts(self):
+        """Test that compression is negotiated and a timeout is always applied."""
+        self.client.get_text(self.url)
+        self.assertIn('gzip', _FixtureHandler.requests_seen[0].get('Accept-Encoding'))
+        self.assertEqual(len(self.client.timeout), 2)
+
+if __name__ == '__main__':
+    unittest.main()
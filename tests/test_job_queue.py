@@ -0,0 +1,122 @@
+import sys
+import os
+import time
+import tempfile
+import threading
+import unittest
+from datetime import date, timedelta
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.job_queue import JobQueue, WorkerPool
+from src.data.database_models import Game, Player
+from src.data.game_repository import save_game
+
+FAILURES = {'remaining': 0}
+
+def flaky_job(session, payload):
+    """Test handler that fails a configurable number of times before succeeding."""
+    if FAILURES['remaining']:
+        FAILURES['remaining'] -= 1
+        raise ConnectionError("stats.nba.com timed out")
+    session.add(Player(id=payload['player_id'], first_name="Test", last_name="Player"))
+    return {'player_id': payload['player_id']}
+
+def slow_job(session, payload):
+    """Test handler that runs for longer than a job stays fresh without heartbeats."""
+    time.sleep(payload['seconds'])
+    return {}
+
+class TestJobQueue(unittest.TestCase):
+    """Test cases for the database-backed job queue."""
+
+    def setUp(self):
+        """Create a queue in a temporary database file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.directory.name, 'jobs.db')}"
+        self.queue = JobQueue(self.db_url, retry_base_seconds=0)
+
+    def tearDown(self):
+        self.queue.engine.dispose()
+        self.directory.cleanup()
+
+    def test_dedupe_and_retry(self):
+        """Test idempotent enqueueing, retries with rolled-back writes, and final success."""
+        kind = 'tests.test_job_queue:flaky_job'
+        job_id = self.queue.enqueue(kind, {'player_id': 1}, dedupe_key="player:1", max_attempts=2)
+        self.assertEqual(self.queue.enqueue(kind, {'player_id': 1}, dedupe_key="player:1"), job_id)
+
+        FAILURES['remaining'] = 1
+        self.assertEqual(self.queue.run_next("test"), job_id)
+        status = self.queue.status(job_id)
+        self.assertEqual((status['status'], status['attempts']), ('queued', 1))
+        self.assertIn("ConnectionError", status['error'])
+
+        self.queue.run_next("test")
+        status = self.queue.status(job_id)
+        self.assertEqual(status['status'], 'succeeded')
+        self.assertEqual(status['result'], {'player_id': 1})
+        self.assertIsNone(self.queue.run_next("test"))
+
+    def test_failed_after_max_attempts_and_requeue(self):
+        """Test that exhausted jobs fail and can be re-enqueued by dedupe key."""
+        kind = 'tests.test_job_queue:flaky_job'
+        job_id = self.queue.enqueue(kind, {'player_id': 2}, dedupe_key="player:2", max_attempts=1)
+        FAILURES['remaining'] = 1
+        self.queue.run_next("test")
+        self.assertEqual(self.queue.status(job_id)['status'], 'failed')
+
+        self.assertEqual(self.queue.enqueue(kind, {'player_id': 2}, dedupe_key="player:2"), job_id)
+        self.assertEqual(self.queue.status(job_id)['status'], 'queued')
+
+    def test_recover_stale_running_jobs(self):
+        """Test that jobs claimed by a worker that died are re-queued."""
+        job_id = self.queue.enqueue('tests.test_job_queue:flaky_job', {'player_id': 3})
+        self.assertEqual(self.queue.claim("worker-1-0")['id'], job_id)
+        self.assertEqual(self.queue.recover_stale(stale_after=timedelta(0)), 1)
+        self.assertEqual(self.queue.status(job_id)['status'], 'queued')
+
+    def test_heartbeat_keeps_long_jobs_running(self):
+        """Test that a job running past the stale threshold is not re-queued while its worker is alive."""
+        queue = JobQueue(self.db_url, heartbeat_seconds=0.05)
+        job_id = queue.enqueue('tests.test_job_queue:slow_job', {'seconds': 1.0})
+        worker = threading.Thread(target=queue.run_next, args=("worker-1-0",))
+        worker.start()
+        try:
+            time.sleep(0.6)
+            self.assertEqual(queue.recover_stale(stale_after=timedelta(seconds=0.4)), 0)
+            self.assertEqual(queue.status(job_id)['status'], 'running')
+        finally:
+            worker.join()
+            queue.engine.dispose()
+        self.assertEqual(self.queue.status(job_id)['status'], 'succeeded')
+        self.assertEqual(self.queue.status(job_id)['attempts'], 1)
+
+    def test_worker_pool_runs_jobs(self):
+        """Test that worker processes drain the queue."""
+        FAILURES['remaining'] = 0
+        job_ids = [self.queue.enqueue('tests.test_job_queue:flaky_job', {'player_id': 10 + i}) for i in range(4)]
+        pool = WorkerPool(self.db_url, processes=2, poll_interval=0.05).start()
+        try:
+            deadline = time.time() + 60
+            while time.time() < deadline:
+                if all(self.queue.status(job_id)['status'] == 'succeeded' for job_id in job_ids):
+                    break
+                time.sleep(0.1)
+        finally:
+            pool.stop()
+        self.assertEqual([self.queue.status(job_id)['status'] for job_id in job_ids], ['succeeded'] * 4)
+        with self.queue.Session() as session:
+            self.assertEqual(session.query(Player).count(), 4)
+
+    def test_save_game_is_idempotent(self):
+        """Test that saving an already stored game does no fetching or writing."""
+        with self.queue.Session() as session:
+            session.add(Game(game_id="0022400773", date=date(2025, 2, 12), season="2024-2025"))
+            session.commit()
+            result = save_game(session, None, {'game_id': "0022400773"})
+        self.assertEqual(result, {'game_id': "0022400773", 'created': False, 'attended': False, 'warnings': []})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import sys
+import os
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import Base, Game, LeaderboardEntry, PlayerAdvancedStats, PlayerBoxScore
+from src.core.leaderboard import record_game_performances, rebuild_leaderboard, top_performances
+from src.core.player_manager import ensure_players
+
+CELTICS_ID = 1610612738
+KNICKS_ID = 1610612752
+TATUM_ID = 1628369
+BRUNSON_ID = 1628973
+
+class TestLeaderboard(unittest.TestCase):
+    """Test cases for the best-performances leaderboard."""
+
+    def setUp(self):
+        """Set up an in-memory database with two Celtics-Knicks games."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        ensure_players(self.session, [(TATUM_ID, "Jayson", "Tatum"), (BRUNSON_ID, "Jalen", "Brunson")])
+        games = [
+            ("1", date(2024, 11, 1), "2024-2025", {TATUM_ID: 41, BRUNSON_ID: 30}),
+            ("2", date(2025, 11, 1), "2025-2026", {TATUM_ID: 22, BRUNSON_ID: 44}),
+        ]
+        for game_id, game_date, season, points in games:
+            self.session.add(Game(game_id=game_id, date=game_date, season=season,
+                                  home_team_id=CELTICS_ID, away_team_id=KNICKS_ID))
+            for player_id, team_id in ((TATUM_ID, CELTICS_ID), (BRUNSON_ID, KNICKS_ID)):
+                self.session.add(PlayerBoxScore(game_id=game_id, player_id=player_id, team_id=team_id,
+                                                seconds_played=2000, points=points[player_id], rebounds=5))
+                self.session.add(PlayerAdvancedStats(game_id=game_id, player_id=player_id, team_id=team_id,
+                                                     pie=points[player_id] / 200))
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_incremental_and_filtered(self):
+        """Test per-game maintenance and filtering by team, season and opponent."""
+        record_game_performances(self.session, "1")
+        self.session.commit()
+        self.assertEqual([p['value'] for p in top_performances(self.session, 'points')], [41, 30])
+
+        record_game_performances(self.session, "2")
+        record_game_performances(self.session, "2")  # re-saving a game replaces its entries
+        self.session.commit()
+
+        top = top_performances(self.session, 'points', limit=2)
+        self.assertEqual([(p['name'], p['value']) for p in top], [("Jalen Brunson", 44), ("Jayson Tatum", 41)])
+        self.assertEqual(top[0]['opponent_id'], CELTICS_ID)
+
+        celtics = top_performances(self.session, 'points', team_id=CELTICS_ID)
+        self.assertEqual([p['value'] for p in celtics], [41, 22])
+        self.assertEqual([p['value'] for p in top_performances(self.session, 'pie', season="2024-2025")],
+                         [0.205, 0.15])
+        self.assertEqual([p['value'] for p in top_performances(self.session, 'points', opponent_id=KNICKS_ID,
+                                                                 lowest=True)], [22, 41])
+
+    def test_rebuild_and_index_usage(self):
+        """Test a full rebuild and that top-N queries use the composite index."""
+        self.assertEqual(rebuild_leaderboard(self.session), 4 * 3)
+        self.session.commit()
+        self.assertEqual(self.session.query(LeaderboardEntry).filter_by(stat='points').count(), 4)
+
+        plan = self.session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM leaderboard_entries "
+            "WHERE stat = 'points' AND team_id = :team ORDER BY value DESC LIMIT 10"
+        ), {'team': CELTICS_ID}).fetchall()
+        self.assertIn('ix_leaderboard_stat_team_value', ' '.join(str(row) for row in plan))
+
+        with self.assertRaises(ValueError):
+            top_performances(self.session, 'minutes')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,271 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.game_search import search_games
+from src.core.user_profile import DEFAULT_USERNAME
+from src.data.database_models import (
+    Attendance, Base, Game, GameType, InactivePlayer, Photo, Player, PlayerCareerAggregate, QuarterScores, SeriesStats,
+    User, VenueInfo
+)
+from src.data.game_repository import refresh_game, save_game
+from src.data import migrations
+from src.data.migrations import migrate
+from src.data.photo_store import PhotoStore
+from tests.test_game_repository import GAME_DATA, TATUM_ID, FakeClient
+from tests.test_photo_store import make_image
+
+# games as created before attendance details moved to attendances
+LEGACY_GAMES = """
+CREATE TABLE games (
+    id INTEGER PRIMARY KEY, game_id VARCHAR(20) NOT NULL UNIQUE, date DATE NOT NULL, season VARCHAR(7),
+    home_team VARCHAR(50), away_team VARCHAR(50), home_team_id INTEGER, away_team_id INTEGER,
+    home_team_abbrev VARCHAR(3), away_team_abbrev VARCHAR(3), home_score INTEGER, away_score INTEGER,
+    seat_section VARCHAR(20), seat_row VARCHAR(10), seat_number VARCHAR(10), attended_with VARCHAR(200), notes TEXT
+)
+"""
+
+# The other tables of the first released schema, with no natural-key unique constraints
+BASELINE_TABLES = """
+CREATE TABLE game_flow (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, home_largest_lead INTEGER, away_largest_lead INTEGER,
+    lead_changes INTEGER, times_tied INTEGER, PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE inactive_players (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, first_name VARCHAR(50), last_name VARCHAR(50),
+    jersey_num INTEGER, team_id INTEGER NOT NULL, PRIMARY KEY (id),
+    FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE last_meetings (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, last_meeting_game_id VARCHAR, last_meeting_game_date DATE,
+    home_team_id INTEGER, away_team_id INTEGER, home_team_score INTEGER, away_team_score INTEGER,
+    PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE officials (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, official_id INTEGER NOT NULL, name VARCHAR(100) NOT NULL,
+    jersey_num INTEGER NOT NULL, PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE photos (
+    id INTEGER NOT NULL, game_id INTEGER NOT NULL, file_path VARCHAR(500) NOT NULL, caption TEXT,
+    PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (id)
+);
+CREATE TABLE player_advanced_stats (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, team_id INTEGER, player_id INTEGER,
+    first_name VARCHAR(50), last_name VARCHAR(50), starting_position VARCHAR(5), starter BOOLEAN,
+    status VARCHAR(20), status_reason VARCHAR(50), minutes VARCHAR(8), estimated_offensive_rating FLOAT,
+    offensive_rating FLOAT, estimated_defensive_rating FLOAT, defensive_rating FLOAT, estimated_net_rating FLOAT,
+    net_rating FLOAT, assist_percentage FLOAT, assist_to_turnover FLOAT, assist_ratio FLOAT,
+    offensive_rebound_percentage FLOAT, defensive_rebound_percentage FLOAT, rebound_percentage FLOAT,
+    turnover_ratio FLOAT, effective_field_goal_percentage FLOAT, true_shooting_percentage FLOAT,
+    usage_percentage FLOAT, estimated_usage_percentage FLOAT, estimated_pace FLOAT, pace FLOAT, pace_per40 FLOAT,
+    possessions INTEGER, pie FLOAT, PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE quarter_scores (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, period VARCHAR(3) NOT NULL, home_team_id INTEGER NOT NULL,
+    away_team_id INTEGER NOT NULL, home_score INTEGER CHECK (home_score >= 0),
+    away_score INTEGER CHECK (away_score >= 0), PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE series_stats (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL,
+    pregame_home_team_series_wins INTEGER CHECK (pregame_home_team_series_wins >= 0),
+    pregame_home_team_series_losses INTEGER CHECK (pregame_home_team_series_losses >= 0),
+    pregame_series_leader VARCHAR(3), pregame_series_record VARCHAR(10),
+    postgame_home_team_series_wins INTEGER CHECK (postgame_home_team_series_wins >= 0),
+    postgame_home_team_series_losses INTEGER CHECK (postgame_home_team_series_losses >= 0),
+    postgame_series_leader VARCHAR(3), postgame_series_record VARCHAR(10), PRIMARY KEY (id),
+    FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE team_advanced_stats (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, team_id INTEGER, estimated_offensive_rating FLOAT,
+    offensive_rating FLOAT, estimated_defensive_rating FLOAT, defensive_rating FLOAT, estimated_net_rating FLOAT,
+    net_rating FLOAT, assist_percentage FLOAT, assist_to_turnover FLOAT, assist_ratio FLOAT,
+    offensive_rebound_percentage FLOAT, defensive_rebound_percentage FLOAT, rebound_percentage FLOAT,
+    estimated_team_turnover_percentage FLOAT, turnover_ratio FLOAT, effective_field_goal_percentage FLOAT,
+    true_shooting_percentage FLOAT, estimated_pace FLOAT, pace FLOAT, pace_per40 FLOAT, possessions INTEGER,
+    pie FLOAT, PRIMARY KEY (id), FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE team_stats (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, team_id INTEGER NOT NULL,
+    paint_points INTEGER CHECK (paint_points >= 0),
+    second_chance_points INTEGER CHECK (second_chance_points >= 0),
+    fast_break_points INTEGER CHECK (fast_break_points >= 0), team_turnovers INTEGER CHECK (team_turnovers >= 0),
+    total_turnovers INTEGER CHECK (total_turnovers >= 0), team_rebounds INTEGER CHECK (team_rebounds >= 0),
+    points_off_to INTEGER CHECK (points_off_to >= 0), PRIMARY KEY (id),
+    FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+CREATE TABLE venue_info (
+    id INTEGER NOT NULL, game_id VARCHAR(20) NOT NULL, arena VARCHAR(100), attendance INTEGER,
+    duration_minutes INTEGER, national_tv VARCHAR(20), PRIMARY KEY (id),
+    FOREIGN KEY(game_id) REFERENCES games (game_id)
+);
+"""
+
+class TestMigrations(unittest.TestCase):
+    """Test cases for upgrading databases created by earlier versions."""
+
+    def setUp(self):
+        """Set up an in-memory database with the legacy games table and two games."""
+        self.engine = create_engine('sqlite:///:memory:')
+        with self.engine.begin() as connection:
+            connection.execute(text(LEGACY_GAMES))
+            connection.execute(text(
+                "INSERT INTO games (game_id, date, season, home_team, away_team, seat_section, attended_with, notes) "
+                "VALUES ('0022400773', '2025-02-12', '2024-2025', 'Boston Celtics', 'New York Knicks', "
+                "'Loge 12', 'Dad', 'Buzzer beater'), "
+                "('0022400900', '2025-03-01', '2024-2025', 'Boston Celtics', 'Miami Heat', NULL, 'Maria', NULL)"
+            ))
+        self.session = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        """Clean up database connections."""
+        self.session.close()
+
+    def test_details_move_to_the_default_profile(self):
+        """Test that a database from before profiles keeps every detail, now on attendances."""
+        Base.metadata.create_all(self.engine)
+        self.assertEqual(migrate(self.engine), ['attendance_details', 'schema', 'game_type', 'search_index'])
+        self.assertEqual(migrate(self.engine), [])
+
+        game_columns = {column['name'] for column in inspect(self.engine).get_columns('games')}
+        self.assertNotIn('notes', game_columns)
+        default = self.session.query(User).filter_by(username=DEFAULT_USERNAME).one()
+        details = {
+            attendance.game_id: (attendance.user_id, attendance.seat_section, attendance.attended_with)
+            for attendance in self.session.query(Attendance)
+        }
+        self.assertEqual(details, {
+            '0022400773': (default.id, "Loge 12", "Dad"),
+            '0022400900': (default.id, None, "Maria"),
+        })
+        results, total = search_games(self.session, "buzzer", user_id=default.id)
+        self.assertEqual((total, results[0]['game_id']), (1, '0022400773'))
+
+    def test_legacy_photos_are_content_addressed(self):
+        """Test that photos saved before content addressing are hashed and moved under originals/."""
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        os.makedirs(os.path.join(root, 'legacy'))
+        with open(os.path.join(root, 'legacy', 'tip-off.jpg'), 'wb') as f:
+            f.write(make_image('red', size=(640, 480)))
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE photos (id INTEGER NOT NULL, game_id INTEGER NOT NULL, "
+                "file_path VARCHAR(500) NOT NULL, caption TEXT, PRIMARY KEY (id))"
+            ))
+            connection.execute(text("INSERT INTO photos (game_id, file_path, caption) VALUES "
+                                    "(1, 'legacy/tip-off.jpg', 'Tip-off'), (1, 'legacy/missing.jpg', 'Lost')"))
+        Base.metadata.create_all(self.engine)
+        with mock.patch.object(migrations, 'PHOTO_ROOT', root):
+            self.assertIn('photo_files', migrate(self.engine))
+            self.assertEqual(migrate(self.engine), [])
+
+        photos = {photo.caption: photo for photo in self.session.query(Photo)}
+        adopted, lost = photos["Tip-off"], photos["Lost"]
+        self.assertEqual((adopted.width, adopted.height), (640, 480))
+        self.assertTrue(adopted.file_path.startswith('originals'))
+        self.assertTrue(os.path.exists(os.path.join(root, adopted.file_path)))
+        self.assertFalse(os.path.exists(os.path.join(root, 'legacy', 'tip-off.jpg')))
+        self.assertEqual(adopted.attendance.user.username, DEFAULT_USERNAME)
+
+        # The gallery renders the adopted photo and skips the one whose file is gone
+        store = PhotoStore(root)
+        self.assertTrue(os.path.exists(store.thumbnail(adopted)))
+        self.assertIsNone(lost.content_hash)
+        self.assertIsNone(store.thumbnail(lost))
+        self.assertEqual(store.render([lost]), 0)
+
+    def test_details_go_to_the_first_attendee(self):
+        """Test upgrading a database that already has profiles but not the attendance detail columns."""
+        with self.engine.begin() as connection:
+            connection.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(50) NOT NULL UNIQUE, "
+                                    "display_name VARCHAR(100), created_at DATETIME)"))
+            connection.execute(text("CREATE TABLE attendances (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                                    "game_id VARCHAR(20) NOT NULL, added_at DATETIME)"))
+            connection.execute(text("INSERT INTO users (id, username) VALUES (1, 'default'), (2, 'maria'), (3, 'sam')"))
+            connection.execute(text("INSERT INTO attendances (user_id, game_id) VALUES "
+                                    "(2, '0022400773'), (3, '0022400773'), (1, '0022400900')"))
+        Base.metadata.create_all(self.engine)
+        migrate(self.engine)
+
+        details = dict(self.session.query(Attendance.user_id, Attendance.notes).filter_by(game_id='0022400773'))
+        self.assertEqual(details, {2: "Buzzer beater", 3: None})
+        self.assertEqual(self.session.query(Attendance).count(), 3)
+
+    def test_game_types_are_backfilled(self):
+        """Test that existing games are classified by game id prefix, falling back to the calendar."""
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO games (game_id, date, season) VALUES ('0042400101', '2025-04-20', '2024-2025'), "
+                "('0032400001', '2025-02-16', '2024-2025'), ('1234567890', '2025-04-16', '2024-2025'), "
+                "('9999999999', '2025-08-01', '2025-2026')"
+            ))
+        Base.metadata.create_all(self.engine)
+        migrate(self.engine)
+
+        indexes = {index['name'] for index in inspect(self.engine).get_indexes('games')}
+        self.assertIn('ix_games_game_type_date', indexes)
+        game_types = dict(self.session.query(Game.game_id, Game.game_type))
+        self.assertEqual(game_types, {
+            '0022400773': GameType.REGULAR_SEASON, '0022400900': GameType.REGULAR_SEASON,
+            '0042400101': GameType.PLAYOFFS, '0032400001': GameType.ALL_STAR,
+            '1234567890': GameType.PLAY_IN,  # unknown prefix: classified by date
+            '9999999999': None,  # unknown prefix in the offseason
+        })
+        self.assertEqual(migrate(self.engine), [])
+
+    def test_baseline_database_upgrades_and_saves(self):
+        """Test that a database with the first released schema gains its natural keys and can save games."""
+        with self.engine.begin() as connection:
+            for statement in BASELINE_TABLES.split(';')[:-1]:
+                connection.exec_driver_sql(statement)
+            connection.execute(text(
+                "INSERT INTO quarter_scores (game_id, period, home_team_id, away_team_id, home_score, away_score) "
+                "VALUES ('0022400773', 'Q1', 1610612738, 1610612752, 20, 30), "
+                "('0022400773', 'Q1', 1610612738, 1610612752, 31, 29)"  # duplicate left by a partial save
+            ))
+            connection.execute(text("INSERT INTO series_stats (game_id, postgame_series_record) "
+                                    "VALUES ('0022400773', '1-0')"))
+            connection.execute(text(f"INSERT INTO player_advanced_stats (game_id, team_id, player_id, first_name, "
+                                    f"last_name) VALUES ('0022400773', 1610612738, {TATUM_ID}, 'Jayson', 'Tatum')"))
+            connection.execute(text("INSERT INTO inactive_players (game_id, first_name, last_name, team_id) "
+                                    "VALUES ('0022400773', 'Sam', 'Hauser', 1610612738)"))
+            connection.execute(text("INSERT INTO venue_info (game_id, arena) VALUES ('0022400773', 'TD Garden')"))
+            connection.execute(text("INSERT INTO photos (game_id, file_path) VALUES (1, 'originals/ab/abc.jpg')"))
+        Base.metadata.create_all(self.engine)
+        self.assertEqual(migrate(self.engine), [
+            'attendance_details', 'player_names', 'schema', 'game_type', 'venue_ids', 'user_aggregates',
+            'photo_owners', 'search_index'
+        ])
+        self.assertEqual(migrate(self.engine), [])
+
+        unique_keys = {tuple(constraint['column_names'])
+                       for constraint in inspect(self.engine).get_unique_constraints('quarter_scores')}
+        self.assertIn(('game_id', 'period'), unique_keys)
+        self.assertEqual(self.session.query(QuarterScores.home_score).scalar(), 31)  # the newest duplicate
+        self.assertEqual(self.session.get(Player, TATUM_ID).full_name, "Jayson Tatum")
+        self.assertEqual(self.session.query(InactivePlayer).count(), 0)  # no player id: re-fetched by a backfill
+        self.assertIsNotNone(self.session.query(VenueInfo.venue_id).scalar())
+        aggregate = self.session.query(PlayerCareerAggregate).one()
+        self.assertEqual(self.session.get(User, aggregate.user_id).username, DEFAULT_USERNAME)
+        self.assertEqual(aggregate.player_id, TATUM_ID)
+        self.assertEqual(self.session.query(Photo).one().attendance.user.username, DEFAULT_USERNAME)
+
+        client = FakeClient()
+        refresh_game(self.session, client, GAME_DATA['game_id'], force=True)
+        save_game(self.session, client, dict(GAME_DATA, game_id="0022400950"))
+        self.session.commit()
+        self.assertEqual(self.session.query(QuarterScores).filter_by(game_id=GAME_DATA['game_id']).count(), 4)
+        self.assertEqual(self.session.query(SeriesStats).count(), 2)
+        self.assertEqual(self.session.query(InactivePlayer).filter_by(game_id=GAME_DATA['game_id']).count(),
+                         self.session.query(InactivePlayer).filter_by(game_id="0022400950").count())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import sys
 import os
 from nba_api.stats.static import teams
 from nba_api.stats.endpoints import scoreboardv2, boxscoresummaryv2
+from dataclasses import asdict
 from datetime import datetime
 from pprint import pprint
 
@@ -614,7 +615,7 @@ def test_play_in_game():
             
             print("\nDetailed stats retrieved successfully")
             print("\nAll fields in detailed_stats:")
-            for key, value in sorted(detailed_stats.items()):
+            for key, value in sorted(asdict(detailed_stats).items()):
                 print(f"  {key}: {value} (type: {type(value)})")
             
             # Try to create Game object
@@ -623,16 +624,16 @@ def test_play_in_game():
             print("Game object created successfully")
             
             # Try to create LastMeeting object if data exists
-            if 'last_meeting_game_id' in detailed_stats:
+            if detailed_stats.last_meeting is not None:
                 print("\nAttempting to create LastMeeting object...")
                 last_meeting_data = {
                     'game_id': play_in_game_id,
-                    'last_meeting_game_id': detailed_stats.get('last_meeting_game_id'),
-                    'last_meeting_game_date': detailed_stats.get('last_meeting_game_date'),
-                    'home_team_id': detailed_stats.get('last_meeting_home_team_id'),
-                    'away_team_id': detailed_stats.get('last_meeting_visitor_team_id'),
-                    'home_team_score': detailed_stats.get('last_meeting_home_points'),
-                    'away_team_score': detailed_stats.get('last_meeting_visitor_points')
+                    'last_meeting_game_id': detailed_stats.last_meeting.game_id,
+                    'last_meeting_game_date': detailed_stats.last_meeting.game_date,
+                    'home_team_id': detailed_stats.last_meeting.home_team_id,
+                    'away_team_id': detailed_stats.last_meeting.visitor_team_id,
+                    'home_team_score': detailed_stats.last_meeting.home_points,
+                    'away_team_score': detailed_stats.last_meeting.visitor_points
                 }
                 last_meeting = LastMeeting(**last_meeting_data)
                 print("LastMeeting object created successfully")
@@ -640,7 +641,7 @@ def test_play_in_game():
             # Try to save to database
             print("\nAttempting to save to database...")
             session.add(game)
-            if 'last_meeting_game_id' in detailed_stats:
+            if detailed_stats.last_meeting is not None:
                 session.add(last_meeting)
             session.commit()
             print("Game saved successfully")
@@ -0,0 +1,137 @@
+import sys
+import os
+import io
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import Attendance, Base, Game, Photo, User
+from src.data.photo_store import THUMBNAIL_SIZES, PhotoStore, photo_page
+
+def make_image(color, size=(2000, 1500), image_format='JPEG'):
+    """Encode a solid-color image."""
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, image_format)
+    return buffer.getvalue()
+
+class TestPhotoStore(unittest.TestCase):
+    """Test cases for content-addressed photo storage and thumbnails."""
+
+    def setUp(self):
+        """Set up an in-memory database with two games, two attendees and a temporary store."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.games = [
+            Game(game_id=game_id, date=date(2025, 2, 12), season="2024-2025")
+            for game_id in ("0022400773", "0022400774")
+        ]
+        maria, sam = User(username="maria"), User(username="sam")
+        self.session.add_all(self.games + [maria, sam])
+        self.session.flush()
+        # Maria attended both games, Sam the first
+        self.attendances = [
+            Attendance(user_id=user.id, game_id=game.game_id)
+            for user, game in ((maria, self.games[0]), (maria, self.games[1]), (sam, self.games[0]))
+        ]
+        self.session.add_all(self.attendances)
+        self.session.commit()
+        self.root = tempfile.mkdtemp()
+        self.store = PhotoStore(self.root, processes=2)
+
+    def tearDown(self):
+        """Clean up the store, its processes and database connections."""
+        self.store.shutdown()
+        shutil.rmtree(self.root)
+        self.session.close()
+
+    def test_thumbnails_rendered(self):
+        """Test that every thumbnail size is rendered with the right longest edge."""
+        images = [make_image(color) for color in ('red', 'green', 'blue')]
+        results = self.store.add_photos(self.session, self.attendances[0], images, caption="Tip-off")
+        self.session.commit()
+
+        self.assertTrue(all(created for _, created in results))
+        for photo, _ in results:
+            self.assertEqual((photo.width, photo.height), (2000, 1500))
+            for size, edge in THUMBNAIL_SIZES.items():
+                with Image.open(self.store.thumbnail_path(photo.content_hash, size)) as thumbnail:
+                    self.assertEqual(max(thumbnail.size), edge)
+
+    def test_duplicates(self):
+        """Test that identical uploads share one file and are attached to an attendance once."""
+        image = make_image('green', image_format='PNG')
+        results = self.store.add_photos(self.session, self.attendances[0], [image, image])
+        self.session.commit()
+        self.assertEqual([created for _, created in results], [True, False])
+        self.assertIs(results[0][0], results[1][0])
+
+        again = self.store.add_photos(self.session, self.attendances[0], [image])
+        self.assertFalse(again[0][1])
+        other_game = self.store.add_photos(self.session, self.attendances[1], [image])
+        self.session.commit()
+        self.assertTrue(other_game[0][1])
+
+        self.assertEqual(self.session.query(Photo).count(), 2)
+        self.assertEqual(len({photo.file_path for photo in self.session.query(Photo)}), 1)
+        self.assertTrue(results[0][0].file_path.endswith('.png'))
+
+    def test_galleries_are_per_attendee(self):
+        """Test that a photo only appears in its uploader's gallery, while other attendees share its files."""
+        image = make_image('red', size=(300, 200))
+        self.store.add_photos(self.session, self.attendances[0], [image])
+        self.session.commit()
+        self.assertEqual(photo_page(self.session, self.attendances[2])[1], 0)
+
+        (photo, created), = self.store.add_photos(self.session, self.attendances[2], [image])
+        self.session.commit()
+        self.assertTrue(created)
+        self.assertEqual([photo.id for photo in photo_page(self.session, self.attendances[2])[0]], [photo.id])
+        self.assertEqual(len(photo_page(self.session, self.attendances[0])[0]), 1)
+        self.assertEqual(len(self.stored_files()), 1 + len(THUMBNAIL_SIZES))
+
+    def test_missing_thumbnail_is_rerendered(self):
+        """Test that serving a photo whose thumbnail was deleted renders it again."""
+        (photo, _), = self.store.add_photos(self.session, self.attendances[0], [make_image('red', size=(300, 200))])
+        path = self.store.thumbnail_path(photo.content_hash, 'small')
+        os.remove(path)
+        self.assertEqual(self.store.thumbnail(photo, 'small'), path)
+        self.assertTrue(os.path.exists(path))
+
+    def stored_files(self):
+        return [name for _, _, names in os.walk(self.root) for name in names]
+
+    def test_invalid_upload(self):
+        """Test that a non-image upload raises ValueError and adds nothing, not even the valid uploads' files."""
+        with self.assertRaises(ValueError):
+            self.store.add_photos(self.session, self.attendances[0], [make_image('red'), b"not an image"])
+        self.assertEqual(self.session.query(Photo).count(), 0)
+        self.assertEqual(self.stored_files(), [])
+
+    def test_undecodable_upload(self):
+        """Test that an image whose header is valid but whose data is truncated raises ValueError."""
+        truncated = make_image('blue')[:2000]
+        with self.assertRaises(ValueError):
+            self.store.add_photos(self.session, self.attendances[0], [make_image('red'), truncated])
+        self.assertEqual(self.session.query(Photo).count(), 0)
+        self.assertEqual(self.stored_files(), [])
+
+    def test_photo_page(self):
+        """Test gallery paging."""
+        images = [make_image((index * 50, 0, 0), size=(40, 30)) for index in range(5)]
+        self.store.add_photos(self.session, self.attendances[0], images)
+        self.session.commit()
+        photos, pages = photo_page(self.session, self.attendances[0], page=1, page_size=2)
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(photos), 2)
+        self.assertEqual(photo_page(self.session, self.attendances[1])[1], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import sys
+import os
+import unittest
+import zlib
+from datetime import date
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import Base, Game, PlayByPlay
+from src.data.play_by_play import FORMAT_VERSION, PlayByPlayEvents, EventType, Side
+
+def make_actions(count=500, seed=3):
+    """Build synthetic PlayByPlayV3 actions shaped like the real endpoint."""
+    rng = np.random.default_rng(seed)
+    players = [1628369, 1627759, 201950, 1629057, 203935, 1630202, 1628401, 1626179]
+    actions = []
+    home = away = 0
+    for i in range(count):
+        period = min(4, i * 4 // count + 1)
+        seconds_left = 720 - (i % (count // 4)) * 720 / (count // 4)
+        location = 'h' if i % 2 else 'v'
+        made = rng.random() < 0.45
+        if made:
+            points = int(rng.integers(2, 4))
+            if location == 'h':
+                home += points
+            else:
+                away += points
+        actions.append({
+            'actionNumber': i + 1,
+            'clock': f"PT{int(seconds_left // 60):02d}M{seconds_left % 60:05.2f}S",
+            'period': period,
+            'location': location,
+            'personId': players[int(rng.integers(0, len(players)))],
+            'actionType': 'Made Shot' if made else 'Missed Shot',
+            'subType': 'Jump Shot',
+            'shotResult': 'Made' if made else 'Missed',
+            'scoreHome': str(home) if made else '',
+            'scoreAway': str(away) if made else '',
+            'description': '',
+        })
+    return actions
+
+class TestPlayByPlayEncoding(unittest.TestCase):
+    """Test cases for compact play-by-play storage."""
+
+    def test_encode_actions(self):
+        """Test event codes, clocks, forward-filled scores and player dictionary."""
+        actions = [
+            {'period': 1, 'clock': 'PT12M00.00S', 'actionType': 'period', 'subType': 'start',
+             'location': '', 'personId': 0, 'scoreHome': '0', 'scoreAway': '0'},
+            {'period': 1, 'clock': 'PT11M38.50S', 'actionType': 'Made Shot', 'location': 'h',
+             'personId': 1628369, 'scoreHome': '3', 'scoreAway': '0'},
+            {'period': 1, 'clock': 'PT11M20.00S', 'actionType': 'Rebound', 'location': 'v',
+             'personId': 201950, 'scoreHome': '', 'scoreAway': ''},
+            {'period': 1, 'clock': 'PT11M02.00S', 'actionType': 'Free Throw', 'location': 'v',
+             'personId': 201950, 'shotResult': 'Missed', 'scoreHome': '', 'scoreAway': ''},
+        ]
+        events = PlayByPlayEvents.from_actions(actions)
+
+        self.assertEqual(list(events.event_type), [
+            EventType.PERIOD_START, EventType.MADE_SHOT, EventType.REBOUND, EventType.FREE_THROW_MISSED
+        ])
+        self.assertEqual(list(events.clock), [7200, 6985, 6800, 6620])
+        self.assertEqual(list(events.side), [Side.NONE, Side.HOME, Side.AWAY, Side.AWAY])
+        self.assertEqual(list(events.home_score), [0, 3, 3, 3])
+        self.assertEqual(list(events.player_ids), [1628369, 201950])
+        self.assertEqual(list(events.person_ids()), [0, 1628369, 201950, 201950])
+        self.assertEqual(list(events.elapsed), [0, 215, 400, 580])
+
+    def test_blob_round_trip_is_compact(self):
+        """Test that a full game round-trips through a small database blob."""
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        events = PlayByPlayEvents.from_actions(make_actions())
+        session.add(Game(game_id="0022400773", date=date(2025, 2, 12), season="2024-2025"))
+        session.add(PlayByPlay.from_events("0022400773", events))
+        session.commit()
+
+        stored = session.query(PlayByPlay).one()
+        decoded = stored.events
+        self.assertEqual(stored.event_count, 500)
+        self.assertLess(len(stored.events_blob), 500 * 11)
+        for name in ('period', 'clock', 'event_type', 'side', 'player', 'home_score', 'away_score', 'player_ids'):
+            np.testing.assert_array_equal(getattr(decoded, name), getattr(events, name))
+
+        stored.format_version = FORMAT_VERSION + 1
+        with self.assertRaises(ValueError):
+            stored.events
+        session.close()
+
+    def test_mismatched_blobs_are_rejected(self):
+        """Test that a blob whose size does not match its counts is not misread."""
+        events = PlayByPlayEvents.from_actions(make_actions(20))
+        blob = events.to_blob()
+        with self.assertRaises(ValueError):
+            PlayByPlayEvents.from_blob(blob, 21, len(events.player_ids))
+        with self.assertRaises(ValueError):
+            PlayByPlayEvents.from_blob(zlib.compress(zlib.decompress(blob)[:-4]), 20, len(events.player_ids))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import sys
+import os
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.database_models import (
+    Attendance, Base, Game, InactivePlayer, Player, PlayerAdvancedStats, PlayerBoxScore, PlayerCareerAggregate, User
+)
+from src.core.player_manager import ensure_players, refresh_player_aggregates, most_seen_players, top_box_scores
+
+CELTICS_ID = 1610612738
+TATUM_ID = 1628369
+BROWN_ID = 1627759
+PORZINGIS_ID = 204001
+
+class TestPlayerManager(unittest.TestCase):
+    """Test cases for the player dimension and career aggregates."""
+
+    def setUp(self):
+        """Set up an in-memory database with two attended games."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        self.user = User(username="maria")
+        self.other = User(username="sam")
+        self.session.add_all([self.user, self.other])
+        self.session.flush()
+        ensure_players(self.session, [
+            (TATUM_ID, "Jayson", "Tatum"), (BROWN_ID, "Jaylen", "Brown"), (PORZINGIS_ID, "Kristaps", "Porzingis"),
+        ])
+        for game_id, game_date in (("1", date(2024, 11, 1)), ("2", date(2024, 12, 1))):
+            self.session.add(Game(game_id=game_id, date=game_date, season="2024-2025"))
+            self.session.add(Attendance(user_id=self.user.id, game_id=game_id))
+            self.session.add(PlayerAdvancedStats(game_id=game_id, team_id=CELTICS_ID, player_id=TATUM_ID,
+                                                 minutes="38:12", pie=0.2, net_rating=10.0))
+        self.session.add(PlayerAdvancedStats(game_id="1", team_id=CELTICS_ID, player_id=BROWN_ID,
+                                             minutes="35:00", pie=0.1, net_rating=-4.0))
+        self.session.add(PlayerAdvancedStats(game_id="2", team_id=CELTICS_ID, player_id=BROWN_ID,
+                                             minutes="", pie=None, net_rating=None))
+        self.session.add(InactivePlayer(game_id="2", player_id=PORZINGIS_ID, jersey_num=8, team_id=CELTICS_ID))
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_names_come_from_dimension(self):
+        """Test that rows reference players by id and resolve names through the dimension."""
+        inactive = self.session.query(InactivePlayer).one()
+        self.assertEqual((inactive.first_name, inactive.last_name), ("Kristaps", "Porzingis"))
+
+        ensure_players(self.session, [(TATUM_ID, "Jayson", "Tatum"), (TATUM_ID, "Jayson", "Tatum")])
+        self.session.commit()
+        self.assertEqual(self.session.query(Player).count(), 3)
+
+    def test_aggregates(self):
+        """Test games seen, DNPs, inactive counts and averages over games played."""
+        self.assertEqual(refresh_player_aggregates(self.session), 3)
+        self.session.commit()
+
+        players = most_seen_players(self.session, user_id=self.user.id)
+        self.assertEqual(most_seen_players(self.session), players)  # every stored game: the same two
+        self.assertEqual(most_seen_players(self.session, user_id=self.other.id), [])
+        self.assertEqual([player['player_id'] for player in players], [BROWN_ID, TATUM_ID, PORZINGIS_ID])
+
+        brown = players[0]
+        self.assertEqual((brown['games_seen'], brown['games_played'], brown['dnp_count']), (2, 1, 1))
+        self.assertAlmostEqual(brown['average_pie'], 0.1)
+        self.assertEqual(brown['last_seen_date'], date(2024, 12, 1))
+
+        porzingis = players[2]
+        self.assertEqual((porzingis['games_seen'], porzingis['inactive_count']), (1, 1))
+        self.assertIsNone(porzingis['average_pie'])
+
+    def test_incremental_refresh(self):
+        """Test that refreshing a subset of players leaves the others untouched."""
+        refresh_player_aggregates(self.session)
+        self.session.add(Game(game_id="3", date=date(2025, 1, 5), season="2024-2025"))
+        self.session.add(Attendance(user_id=self.user.id, game_id="3"))
+        self.session.add(Attendance(user_id=self.other.id, game_id="3"))
+        self.session.add(PlayerAdvancedStats(game_id="3", team_id=CELTICS_ID, player_id=TATUM_ID,
+                                             minutes="40:00", pie=0.5, net_rating=4.0))
+        refresh_player_aggregates(self.session, [TATUM_ID])
+        self.session.commit()
+
+        aggregates = {(a.user_id, a.player_id): a for a in self.session.query(PlayerCareerAggregate)}
+        self.assertEqual(aggregates[self.user.id, TATUM_ID].games_seen, 3)
+        self.assertAlmostEqual(aggregates[self.user.id, TATUM_ID].average_pie, 0.3)
+        self.assertEqual(aggregates[self.user.id, BROWN_ID].games_seen, 2)
+        self.assertEqual(aggregates[self.other.id, TATUM_ID].games_seen, 1)
+        self.assertNotIn((self.other.id, BROWN_ID), aggregates)
+
+    def test_box_scores_and_top_performances(self):
+        """Test traditional box score rows and the single-game points leaderboard."""
+        def box_score_player(person_id, minutes, points):
+            return {'personId': person_id, 'teamId': CELTICS_ID, 'position': 'F',
+                    'statistics': {'minutes': minutes, 'points': points, 'reboundsTotal': 8, 'assists': 4}}
+
+        row = PlayerBoxScore.from_api("1", box_score_player(TATUM_ID, "38:12", 41))
+        self.assertEqual((row.seconds_played, row.points, row.rebounds, row.starter), (2292, 41, 8, True))
+        dnp = PlayerBoxScore.from_api("1", box_score_player(PORZINGIS_ID, "", 0))
+        self.assertIsNone(dnp.seconds_played)
+        self.assertIsNone(dnp.points)
+
+        self.session.add_all([row, dnp, PlayerBoxScore.from_api("2", box_score_player(TATUM_ID, "30:00", 22)),
+                              PlayerBoxScore.from_api("2", box_score_player(BROWN_ID, "35:00", 30))])
+        self.session.commit()
+
+        top = top_box_scores(self.session, 'points', limit=2)
+        self.assertEqual([(p['name'], p['points']) for p in top], [("Jayson Tatum", 41), ("Jaylen Brown", 30)])
+        with self.assertRaises(ValueError):
+            top_box_scores(self.session, 'pie')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from collections import Counter
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.nba_api_client import GAME_ENDPOINTS, NBAApiClient
+from src.data.prefetch import GAME_PREFETCH_METHODS, Prefetcher
+from src.data.request_cache import ResponseCache
+
+class FakeClient:
+    """Stand-in for NBAApiClient that counts calls instead of hitting the network."""
+
+    def __init__(self, block=None):
+        self.calls = Counter()
+        self.block = block
+        self.lock = threading.Lock()
+        self.cached = set()  # game ids whose endpoints are all "cached"
+
+    def _record(self, method, arg):
+        if self.block is not None:
+            self.block.wait(5)
+        with self.lock:
+            self.calls[(method, arg)] += 1
+
+    def is_game_cached(self, game_id):
+        return game_id in self.cached
+
+    def get_games_for_date(self, date_str):
+        self._record('get_games_for_date', date_str)
+        return [{'game_id': f"{date_str}-1"}, {'game_id': f"{date_str}-2"}]
+
+    def get_detailed_stats(self, game_id):
+        self._record('get_detailed_stats', game_id)
+
+    def get_box_score(self, game_id):
+        self._record('get_box_score', game_id)
+
+    def get_advanced_stats(self, game_id):
+        self._record('get_advanced_stats', game_id)
+
+    def get_play_by_play(self, game_id):
+        self._record('get_play_by_play', game_id)
+
+class TestPrefetch(unittest.TestCase):
+    """Test cases for speculative prefetching of API responses."""
+
+    def test_games_for_date_reuses_prefetch(self):
+        """Test that finding games joins the in-flight scoreboard prefetch."""
+        block = threading.Event()
+        client = FakeClient(block=block)
+        prefetcher = Prefetcher(client, max_workers=2)
+        try:
+            prefetcher.prefetch_date("2025-02-12")
+            threading.Timer(0.1, block.set).start()
+            games = prefetcher.games_for_date("2025-02-12", timeout=5)
+            self.assertEqual(len(games), 2)
+            self.assertEqual(client.calls[('get_games_for_date', "2025-02-12")], 1)
+        finally:
+            prefetcher.shutdown()
+
+    def test_prefetch_games_warms_every_endpoint_once(self):
+        """Test that each game's endpoints are requested once while in flight or cached."""
+        block = threading.Event()
+        client = FakeClient(block=block)
+        prefetcher = Prefetcher(client, max_workers=2)
+        try:
+            games = [{'game_id': "1"}, {'game_id': "2"}]
+            self.assertEqual(prefetcher.prefetch_games(games), 2 * len(GAME_PREFETCH_METHODS))
+            self.assertEqual(prefetcher.prefetch_games(games), 0)
+            block.set()
+            prefetcher._executor.shutdown(wait=True)
+            self.assertEqual(prefetcher.pending(), 0)
+
+            client.cached.update({"1", "2"})
+            self.assertEqual(prefetcher.prefetch_games(games), 0)
+            for game_id in ("1", "2"):
+                for method in GAME_PREFETCH_METHODS:
+                    self.assertEqual(client.calls[(method, game_id)], 1)
+        finally:
+            prefetcher.shutdown()
+
+    def test_finished_prefetches_are_forgotten(self):
+        """Test that a game the cache evicted after its prefetch finished is prefetched again."""
+        client = FakeClient()
+        prefetcher = Prefetcher(client, max_workers=2)
+        try:
+            for _ in range(2):
+                self.assertEqual(prefetcher.prefetch_games(["1"]), len(GAME_PREFETCH_METHODS))
+                deadline = time.time() + 5
+                while prefetcher.pending() and time.time() < deadline:
+                    time.sleep(0.01)
+                self.assertEqual(prefetcher._game_futures, {})
+            self.assertEqual(client.calls[('get_play_by_play', "1")], 2)
+        finally:
+            prefetcher.shutdown()
+
+    def test_date_change_cancels_queued_game_prefetches(self):
+        """Test that moving to another date drops work not yet started."""
+        block = threading.Event()
+        client = FakeClient(block=block)
+        prefetcher = Prefetcher(client, max_workers=1)
+        try:
+            prefetcher.prefetch_date("2025-02-12")
+            prefetcher.prefetch_games(["1"])
+            prefetcher.prefetch_date("2025-02-13")
+            block.set()
+            prefetcher._executor.shutdown(wait=True)
+            self.assertEqual(sum(count for (_, arg), count in client.calls.items() if arg == "1"), 0)
+            self.assertEqual(client.calls[('get_games_for_date', "2025-02-13")], 1)
+        finally:
+            prefetcher.shutdown()
+
+    def test_is_game_cached(self):
+        """Test that a game counts as cached only once every endpoint is memoized."""
+        cache = ResponseCache()
+        client = NBAApiClient(cache=cache)
+        for endpoint_class in GAME_ENDPOINTS[:-1]:
+            cache.put(endpoint_class.__name__, {'game_id': "0022400773"}, {})
+        self.assertFalse(client.is_game_cached("0022400773"))
+        cache.put(GAME_ENDPOINTS[-1].__name__, {'game_id': "0022400773"}, {})
+        self.assertTrue(client.is_game_cached("0022400773"))
+        self.assertFalse(client.is_game_cached("0022400774"))
+
+if __name__ == '__main__':
+    unittest.main()
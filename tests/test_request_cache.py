@@ -0,0 +1,81 @@
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.request_cache import ResponseCache
+
+class TestRequestCache(unittest.TestCase):
+    """Test cases for request deduplication and response memoization."""
+
+    def test_concurrent_requests_share_one_call(self):
+        """Test that concurrent identical requests make a single fetch."""
+        cache = ResponseCache()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'resultSets': []}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                cache.get_or_fetch('BoxScoreSummaryV2', {'game_id': '0022400773'}, slow_fetch)
+            ))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_memo_keyed_by_endpoint_and_params(self):
+        """Test that responses are memoized per (endpoint, params)."""
+        cache = ResponseCache()
+        cache.get_or_fetch('BoxScoreSummaryV2', {'game_id': '1'}, lambda: 'summary 1')
+        cache.get_or_fetch('BoxScoreAdvancedV3', {'game_id': '1'}, lambda: 'advanced 1')
+
+        self.assertEqual(cache.get_or_fetch('BoxScoreSummaryV2', {'game_id': '1'}, lambda: 'refetched'), 'summary 1')
+        self.assertEqual(cache.get('BoxScoreAdvancedV3', {'game_id': '1'}), 'advanced 1')
+        self.assertIsNone(cache.get('BoxScoreSummaryV2', {'game_id': '2'}))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_ttl_and_eviction(self):
+        """Test that expired and least-recently-used entries are dropped."""
+        cache = ResponseCache(max_entries=2)
+        cache.put('ScoreboardV2', {'game_date': 'today'}, 'live', ttl=0)
+        self.assertIsNone(cache.get('ScoreboardV2', {'game_date': 'today'}))
+
+        cache.put('A', {}, 'a')
+        cache.put('B', {}, 'b')
+        cache.get('A', {})
+        cache.put('C', {}, 'c')
+        self.assertEqual(cache.get('A', {}), 'a')
+        self.assertIsNone(cache.get('B', {}))
+
+    def test_errors_are_not_memoized(self):
+        """Test that a failed fetch propagates and the next call retries."""
+        cache = ResponseCache()
+        key = cache.make_key('ScoreboardV2', {'game_date': '2025-02-10'})
+
+        def failing_fetch():
+            self.assertTrue(cache._flight.in_flight(key))
+            raise ConnectionError("stats.nba.com timed out")
+
+        with self.assertRaises(ConnectionError):
+            cache.get_or_fetch('ScoreboardV2', {'game_date': '2025-02-10'}, failing_fetch)
+        self.assertEqual(cache.get_or_fetch('ScoreboardV2', {'game_date': '2025-02-10'}, lambda: 'ok'), 'ok')
+        self.assertFalse(cache._flight.in_flight(key))
+
+if __name__ == '__main__':
+    unittest.main()
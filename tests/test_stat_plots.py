@@ -0,0 +1,87 @@
+import sys
+import os
+import unittest
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.game_tracker import GameRecord
+from src.visualization.stat_plots import (
+    lttb_indices, rolling_mean, season_bins, season_figure, team_series, trend_figure
+)
+
+CELTICS_ID = 1610612738
+KNICKS_ID = 1610612752
+
+def make_games(count):
+    """Build alternating home/away Celtics-Knicks games, one per day."""
+    rng = np.random.default_rng(7)
+    games = []
+    for i in range(count):
+        game_date = date(2015, 10, 1) + timedelta(days=i)
+        season = f"{game_date.year - (game_date.month < 10)}-{str(game_date.year + (game_date.month >= 10))[2:]}"
+        home, away = (CELTICS_ID, KNICKS_ID) if i % 2 == 0 else (KNICKS_ID, CELTICS_ID)
+        games.append(GameRecord(
+            game_id=f"{i:010d}", date=game_date, season=season, home_team_id=home, away_team_id=away,
+            home_team="Home", away_team="Away", home_score=int(rng.integers(90, 130)),
+            away_score=int(rng.integers(90, 130)), periods=(), arena=None, attendance=None, duration_minutes=None
+        ))
+    return games
+
+class TestStatPlots(unittest.TestCase):
+    """Test cases for server-side aggregation and downsampling."""
+
+    def test_team_series(self):
+        """Test that scores are taken from the team's point of view."""
+        games = make_games(4)
+        series = team_series(games, CELTICS_ID)
+        self.assertEqual(series['points'][0], games[0].home_score)
+        self.assertEqual(series['points'][1], games[1].away_score)
+        np.testing.assert_array_equal(series['margin'], series['points'] - series['opponent_points'])
+        self.assertEqual(series['date'].dtype, np.dtype('datetime64[D]'))
+
+    def test_rolling_mean_matches_pandas(self):
+        """Test the cumulative-sum rolling mean against pandas."""
+        values = np.random.default_rng(1).normal(size=500)
+        expected = pd.Series(values).rolling(10, min_periods=1).mean().to_numpy()
+        np.testing.assert_allclose(rolling_mean(values, 10), expected)
+        np.testing.assert_allclose(rolling_mean(values, 1), values)
+
+    def test_season_bins(self):
+        """Test per-season means, sums and counts."""
+        seasons = ["2023-24", "2024-25", "2023-24"]
+        labels, means = season_bins(seasons, [100, 110, 120])
+        self.assertEqual(list(labels), ["2023-24", "2024-25"])
+        np.testing.assert_allclose(means, [110, 110])
+        self.assertEqual(list(season_bins(seasons, [1, 2, 3], 'count')[1]), [2, 1])
+        with self.assertRaises(ValueError):
+            season_bins(seasons, [1, 2, 3], 'median')
+
+    def test_lttb_keeps_shape(self):
+        """Test that downsampling caps points and keeps endpoints and spikes."""
+        x = np.arange(10_000)
+        y = np.sin(x / 500)
+        y[4321] = 50  # a spike must survive
+        kept = lttb_indices(x, y, 200)
+        self.assertEqual(len(kept), 200)
+        self.assertEqual((kept[0], kept[-1]), (0, 9999))
+        self.assertIn(4321, kept)
+        self.assertTrue(np.all(np.diff(kept) > 0))
+        np.testing.assert_array_equal(lttb_indices(x[:50], y[:50], 200), np.arange(50))
+
+    def test_figures_are_capped(self):
+        """Test that plots of thousands of games send a bounded number of points."""
+        games = make_games(3000)
+        series = team_series(games, CELTICS_ID)
+        figure = trend_figure(series['date'], series['margin'], "Margin", window=20, max_points=500)
+        self.assertTrue(all(len(trace.x) <= 500 for trace in figure.data))
+        self.assertEqual(figure.data[0].x[0], series['date'][0])
+
+        bars = season_figure(series['season'], series['points'], "Points")
+        self.assertEqual(len(bars.data[0].x), len(set(series['season'])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import sys
+import os
+import unittest
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.team_manager import TEAMS
+
+CELTICS_ID = 1610612738
+THUNDER_ID = 1610612760
+
+class TestTeamRegistry(unittest.TestCase):
+    """Test cases for the process-wide team registry."""
+
+    def test_lookup_by_id_tricode_and_name(self):
+        """Test that every lookup path resolves to the same team."""
+        celtics = TEAMS.by_id(CELTICS_ID)
+        self.assertEqual(celtics.full_name, "Boston Celtics")
+        self.assertIs(TEAMS.by_tricode("bos"), celtics)
+        self.assertIs(TEAMS.by_name("Boston Celtics"), celtics)
+        self.assertIs(TEAMS.by_name("celtics"), celtics)
+        self.assertEqual(len(TEAMS), 30)
+
+    def test_historical_names_and_tricodes(self):
+        """Test that former franchise names and tricodes map to current teams."""
+        self.assertEqual(TEAMS.id_for("Seattle SuperSonics"), THUNDER_ID)
+        self.assertEqual(TEAMS.id_for("SEA"), THUNDER_ID)
+        self.assertEqual(TEAMS.by_tricode("BRK").tricode, "BKN")
+        self.assertEqual(TEAMS.by_name("New Jersey Nets").tricode, "BKN")
+        self.assertEqual(TEAMS.by_name("LA Clippers").tricode, "LAC")
+        with self.assertRaises(KeyError):
+            TEAMS.id_for("Boston Bruins")
+
+    def test_registry_is_read_only(self):
+        """Test that the shared mappings cannot be modified."""
+        with self.assertRaises(TypeError):
+            TEAMS.full_names[CELTICS_ID] = "Celtics"
+        with self.assertRaises(AttributeError):
+            TEAMS.extra = True
+
+if __name__ == '__main__':
+    unittest.main()
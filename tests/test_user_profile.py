@@ -0,0 +1,134 @@
+import sys
+import os
+import unittest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.game_search import search_games
+from src.core.game_tracker import data_version, load_game_records
+from src.core.leaderboard import top_performances
+from src.core.player_manager import most_seen_players, top_box_scores
+from src.core.user_profile import (
+    DEFAULT_USERNAME, attendance_counts, create_user, ensure_default_user, get_user, record_attendance,
+    remove_attendance
+)
+from src.core.venue_manager import venue_splits
+from src.data.database_models import Attendance, Base, Game, PlayerBoxScore
+from src.data.game_repository import save_game
+from tests.test_game_repository import GAME_DATA, FakeClient
+
+CELTICS = 1610612738
+OTHER_GAME = dict(GAME_DATA, game_id="0022400900", date="2025-03-01")
+
+class TestUserProfile(unittest.TestCase):
+    """Test cases for user profiles and per-user views of shared game data."""
+
+    def setUp(self):
+        """Set up an in-memory database with two users."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.client = FakeClient()
+        self.maria = create_user(self.session, "Maria", "Maria")
+        self.sam = create_user(self.session, "sam")
+
+    def tearDown(self):
+        """Clean up database connections."""
+        self.session.close()
+
+    def test_create_user(self):
+        """Test username normalization and uniqueness."""
+        self.assertEqual(get_user(self.session, " MARIA ").id, self.maria.id)
+        self.assertEqual(self.sam.display_name, "sam")
+        with self.assertRaises(ValueError):
+            create_user(self.session, "maria")
+        with self.assertRaises(ValueError):
+            create_user(self.session, "  ")
+
+    def test_shared_game_is_fetched_once(self):
+        """Test that a second attendee records attendance without fetching or storing the game again."""
+        first = save_game(self.session, self.client, GAME_DATA, user_id=self.maria.id)
+        box_score_rows = self.session.query(PlayerBoxScore).count()
+        second = save_game(self.session, self.client, GAME_DATA, user_id=self.sam.id)
+        again = save_game(self.session, self.client, GAME_DATA, user_id=self.sam.id)
+
+        self.assertEqual((first['created'], first['attended']), (True, True))
+        self.assertEqual((second['created'], second['attended']), (False, True))
+        self.assertFalse(again['attended'])
+        self.assertEqual(self.client.calls['get_detailed_stats'], 1)
+        self.assertEqual(self.session.query(Game).count(), 1)
+        self.assertEqual(self.session.query(PlayerBoxScore).count(), box_score_rows)
+        self.assertEqual(attendance_counts(self.session), {self.maria.id: 1, self.sam.id: 1})
+
+    def test_views_are_scoped_to_the_user(self):
+        """Test that records, search, leaderboards and splits only cover the user's games."""
+        save_game(self.session, self.client, GAME_DATA, {'notes': "Buzzer beater"}, user_id=self.maria.id)
+        save_game(self.session, self.client, OTHER_GAME, user_id=self.sam.id)
+        self.session.commit()
+
+        self.assertEqual([r.game_id for r in load_game_records(self.session, user_id=self.maria.id)],
+                         [GAME_DATA['game_id']])
+        self.assertEqual(len(load_game_records(self.session)), 2)
+        self.assertEqual(data_version(self.session, user_id=self.sam.id)[0], 1)
+
+        self.assertEqual(search_games(self.session, "buzzer", user_id=self.maria.id)[1], 1)
+        self.assertEqual(search_games(self.session, "buzzer", user_id=self.sam.id), ([], 0))
+        self.assertEqual(search_games(self.session, "celtics", user_id=self.sam.id)[1], 1)
+
+        for user in (self.maria, self.sam):
+            game_ids = {p['game_id'] for p in top_performances(self.session, 'points', limit=50, user_id=user.id)}
+            self.assertEqual(len(game_ids), 1)
+            self.assertEqual(len({p['game_id'] for p in top_box_scores(self.session, limit=50, user_id=user.id)}), 1)
+            self.assertEqual(venue_splits(self.session, CELTICS, user_id=user.id)[0]['games'], 1)
+        self.assertEqual(venue_splits(self.session, CELTICS)[0]['games'], 2)
+
+        seen = most_seen_players(self.session, user_id=self.maria.id)
+        self.assertTrue(seen)
+        self.assertEqual({player['games_seen'] for player in seen}, {1})
+        self.assertEqual(most_seen_players(self.session)[0]['games_seen'], 2)
+
+        # Removing an attendance keeps the shared game for everyone else
+        self.assertTrue(remove_attendance(self.session, self.maria.id, GAME_DATA['game_id']))
+        self.assertEqual(load_game_records(self.session, user_id=self.maria.id), [])
+        self.assertEqual(search_games(self.session, "buzzer"), ([], 0))
+        self.assertEqual(venue_splits(self.session, CELTICS, user_id=self.maria.id), [])
+        self.assertEqual(most_seen_players(self.session, user_id=self.maria.id), [])
+        self.assertEqual(self.session.query(Game).count(), 2)
+
+    def test_attendance_details_are_per_user(self):
+        """Test that each attendee of a shared game keeps their own seat and notes."""
+        save_game(self.session, self.client, GAME_DATA, {'seat_section': "Loge 12", 'notes': "Buzzer beater"},
+                  user_id=self.maria.id)
+        save_game(self.session, self.client, GAME_DATA, {'seat_section': "Balcony 310", 'notes': "Great view"},
+                  user_id=self.sam.id)
+        self.session.commit()
+
+        details = dict(self.session.query(Attendance.user_id, Attendance.seat_section))
+        self.assertEqual(details, {self.maria.id: "Loge 12", self.sam.id: "Balcony 310"})
+        self.assertEqual(search_games(self.session, "buzzer", user_id=self.sam.id), ([], 0))
+        results, total = search_games(self.session, "view", user_id=self.sam.id)
+        self.assertEqual((total, results[0]['user_id']), (1, self.sam.id))
+        self.assertEqual(search_games(self.session, "celtics")[1], 2)  # one document per attendee
+
+    def test_default_user_adopts_existing_games(self):
+        """Test that games saved before profiles existed go to the default user, once."""
+        for game_data in (GAME_DATA, OTHER_GAME):
+            self.session.add(Game(game_id=game_data['game_id'], date=date.fromisoformat(game_data['date']),
+                                  season="2024-2025"))
+        record_attendance(self.session, self.maria.id, GAME_DATA['game_id'])
+
+        default = ensure_default_user(self.session)
+        self.assertEqual(default.username, DEFAULT_USERNAME)
+        self.assertEqual(
+            [game_id for (game_id,) in self.session.query(Attendance.game_id).filter_by(user_id=default.id)],
+            [OTHER_GAME['game_id']]
+        )
+        self.assertEqual(ensure_default_user(self.session).id, default.id)
+        self.assertEqual(self.session.query(Attendance).count(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
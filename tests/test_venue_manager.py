@@ -0,0 +1,103 @@
+import sys
+import os
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.user_profile import ensure_default_user
+from src.core.venue_manager import rebuild_venues, resolve_venue, seed_venues, venue_key, venue_splits
+from src.data.database_models import Base, Venue, VenueAlias, VenueInfo, VenueSplit
+from src.data.game_repository import refresh_game, save_game
+from tests.test_game_repository import GAME_DATA, FakeClient
+
+CELTICS, KNICKS = 1610612738, 1610612752
+AWAY_GAME = dict(GAME_DATA, game_id="0022400900", date="2025-03-01", arena="Madison Square Garden")
+
+class TestVenueManager(unittest.TestCase):
+    """Test cases for the venue registry and precomputed venue splits."""
+
+    def setUp(self):
+        """Set up an in-memory database."""
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        """Clean up database connections."""
+        self.session.close()
+
+    def test_aliases_resolve_to_one_venue(self):
+        """Test that former names and spelling variants resolve to the canonical venue."""
+        venue_id = resolve_venue(self.session, "Staples Center")
+        self.assertEqual(resolve_venue(self.session, "Crypto.com Arena"), venue_id)
+        self.assertEqual(resolve_venue(self.session, " crypto.com  arena "), venue_id)
+        self.assertEqual(resolve_venue(self.session, "AT&T Center"), resolve_venue(self.session, "AT and T Center"))
+        venue = self.session.get(Venue, venue_id)
+        self.assertEqual((venue.name, venue.city, venue.team_id), ("Crypto.com Arena", "Los Angeles", 1610612747))
+        self.assertIsNone(resolve_venue(self.session, ""))
+        self.assertEqual(venue_key("Crypto.com Arena"), 'cryptocomarena')
+
+    def test_unknown_arena_is_registered(self):
+        """Test that a neutral site is registered once and keeps resolving to the same id."""
+        venue_id = resolve_venue(self.session, "Accor Arena")
+        self.assertEqual(self.session.query(Venue).count(), 31)  # the seeded arenas plus this one
+        self.assertEqual(resolve_venue(self.session, "ACCOR ARENA"), venue_id)
+        venue = self.session.get(Venue, venue_id)
+        self.assertEqual((venue.name, venue.team_id, venue.latitude), ("Accor Arena", None, None))
+
+    def test_seed_renames_venue_known_by_former_name(self):
+        """Test that seeding updates a venue first registered under an old name instead of duplicating it."""
+        old = Venue(name="Staples Center")
+        self.session.add(old)
+        self.session.flush()
+        self.session.add(VenueAlias(venue_id=old.id, alias="Staples Center", alias_key=venue_key("Staples Center")))
+        self.session.flush()
+
+        seed_venues(self.session)
+        self.assertEqual(seed_venues(self.session), 0)
+        self.assertEqual(resolve_venue(self.session, "Crypto.com Arena"), old.id)
+        self.assertEqual(self.session.get(Venue, old.id).name, "Crypto.com Arena")
+        self.assertEqual(self.session.query(Venue).filter(Venue.name == "Crypto.com Arena").count(), 1)
+
+    def test_splits_follow_saves(self):
+        """Test that saving games precomputes the attendee's splits for both teams at the venue."""
+        client = FakeClient()
+        save_game(self.session, client, GAME_DATA)
+        save_game(self.session, client, AWAY_GAME)
+        self.session.commit()
+        user_id = ensure_default_user(self.session).id
+
+        splits = venue_splits(self.session, CELTICS, user_id=user_id)
+        self.assertEqual(venue_splits(self.session, CELTICS), splits)  # every stored game: the same two
+        self.assertEqual([split['venue'] for split in splits], ["Madison Square Garden", "TD Garden"])
+        garden = splits[1]
+        self.assertTrue(garden['is_home'])
+        self.assertEqual((garden['games'], garden['wins'], garden['losses']), (1, 1, 0))
+        self.assertEqual((garden['average_minutes'], garden['average_attendance']), (134, 19156))
+        self.assertFalse(splits[0]['is_home'])
+
+        knicks = {split['venue']: split for split in venue_splits(self.session, KNICKS, user_id=user_id)}
+        self.assertEqual((knicks["TD Garden"]['wins'], knicks["TD Garden"]['losses']), (0, 1))
+        self.assertTrue(knicks["Madison Square Garden"]['is_home'])
+
+        # A refresh that changes the venue details updates that venue's splits
+        client.summary['resultSets'][4]['rowSet'][0][1] = 20000
+        refresh_game(self.session, client, GAME_DATA['game_id'], force=True)
+        self.assertEqual(venue_splits(self.session, CELTICS, user_id=user_id)[1]['average_attendance'], 20000)
+
+    def test_rebuild_venues(self):
+        """Test that a rebuild resolves stored arenas and recreates every split."""
+        save_game(self.session, FakeClient(), GAME_DATA)
+        self.session.query(VenueInfo).update({'venue_id': None})
+        self.session.query(VenueSplit).delete()
+
+        self.assertEqual(rebuild_venues(self.session), 2)
+        self.assertIsNotNone(self.session.query(VenueInfo.venue_id).scalar())
+        user_id = ensure_default_user(self.session).id
+        self.assertEqual(venue_splits(self.session, CELTICS, user_id=user_id)[0]['games'], 1)
+
+if __name__ == '__main__':
+    unittest.main()